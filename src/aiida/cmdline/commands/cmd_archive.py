@@ -129,6 +129,19 @@ def inspect(ctx, archive, version, meta_data, database):
     help='Include or exclude authentication information for computer(s) in export.',
 )
 @click.option('--compress', default=6, show_default=True, type=int, help='Level of compression to use (0-9).')
+@click.option(
+    '--skip-incompressible',
+    is_flag=True,
+    help='Store repository files that are not worth compressing, such as compressed files, without compression.',
+)
+@click.option(
+    '--base-archive',
+    'base_archives',
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help='Create an incremental archive, that only contains the entities and repository files that are not in this '
+    'archive. Can be specified multiple times, for example for a full archive and the incremental archives since.',
+)
 @click.option(
     '-b', '--batch-size', default=1000, type=int, help='Stream database rows in batches, to reduce memory usage.'
 )
@@ -157,6 +170,8 @@ def create(
     include_logs,
     include_authinfos,
     compress,
+    skip_incompressible,
+    base_archives,
     batch_size,
     test_run,
     dry_run,
@@ -209,6 +224,8 @@ def create(
         'include_logs': include_logs,
         'overwrite': force,
         'compression': compress,
+        'skip_incompressible': skip_incompressible,
+        'base_archives': base_archives,
         'batch_size': batch_size,
         'test_run': dry_run,
     }
@@ -353,6 +370,19 @@ class ExtrasImportCode(Enum):
 @click.option(
     '-b', '--batch-size', default=1000, type=int, help='Stream database rows in batches, to reduce memory usage.'
 )
+@click.option(
+    '--repository-workers',
+    type=click.IntRange(min=0),
+    help='Number of threads reading repository files from the archive, while the database rows are imported. '
+    'By default, one less than the number of CPUs, up to four. If zero, the files are added after the database rows.',
+)
+@click.option(
+    '--repository-buffer-size',
+    default=32,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Maximum size in MiB of the repository files read ahead from the archive, to limit memory usage.',
+)
 @click.option(
     '--test-run',
     is_flag=True,
@@ -371,6 +401,8 @@ def import_archive(
     include_authinfos,
     migration,
     batch_size,
+    repository_workers,
+    repository_buffer_size,
     import_group,
     group,
     test_run,
@@ -404,6 +436,8 @@ def import_archive(
         'merge_comments': comment_mode,
         'include_authinfos': include_authinfos,
         'batch_size': batch_size,
+        'repository_workers': repository_workers,
+        'repository_buffer_size': repository_buffer_size * 1024**2,
         'create_group': import_group,
         'group': group,
         'test_run': dry_run,
@@ -74,6 +74,7 @@ def verdi_process():
 @options.FAILED()
 @options.PAST_DAYS()
 @options.LIMIT()
+@options.CURSOR()
 @options.RAW()
 @click.pass_context
 @decorators.with_dbenv()
@@ -88,6 +89,7 @@ def process_list(
     failed,
     past_days,
     limit,
+    cursor,
     project,
     raw,
     order_by,
@@ -95,13 +97,14 @@ def process_list(
 ):
     """Show a list of running or terminated processes.
 
-    By default, only those that are still running are shown, but there are options to show also the finished ones.
+    By default, only those that are still running are shown, but there are options to show also the finished ones. For
+    large numbers of processes, use `--limit` to display a single page and `--cursor` to display the next one.
     """
     from tabulate import tabulate
 
     from aiida.cmdline.commands.cmd_daemon import execute_client_command
     from aiida.cmdline.utils.common import print_last_process_state_change
-    from aiida.common.exceptions import ConfigurationError
+    from aiida.common.exceptions import ConfigurationError, NotExistent
     from aiida.engine.daemon.client import get_daemon_client
     from aiida.orm import ProcessNode, QueryBuilder
     from aiida.tools.query.calculation import CalculationQueryBuilder
@@ -113,9 +116,22 @@ def process_list(
 
     builder = CalculationQueryBuilder()
     filters = builder.get_filters(all_entries, process_state, process_label, paused, exit_status, failed)
-    query_set = builder.get_query_set(
-        relationships=relationships, filters=filters, order_by={order_by: order_dir}, past_days=past_days, limit=limit
-    )
+
+    try:
+        query_set = list(
+            builder.get_query_set(
+                relationships=relationships,
+                filters=filters,
+                order_by={order_by: order_dir},
+                past_days=past_days,
+                limit=limit,
+                projections=project,
+                cursor=cursor,
+            )
+        )
+    except NotExistent as exception:
+        echo.echo_critical(f'invalid cursor: {exception}')
+
     projected = builder.get_projected(query_set, projections=project)
     headers = projected.pop(0)
 
@@ -128,6 +144,9 @@ def process_list(
     echo.echo(tabulated)
     echo.echo(f'\nTotal results: {len(projected)}\n')
 
+    if limit is not None and len(query_set) == limit:
+        echo.echo_report(f"Add the option `--cursor {query_set[-1]['process']['id']}` to display the next page.")
+
     if 'cached' in project:
         echo.echo_report('\u267b Processes marked with check-mark were not run but taken from the cache.')
         echo.echo_report('Add the option `-P pk cached_from` to the command to display cache source.')
@@ -38,6 +38,7 @@ __all__ = (
     'COMPUTER',
     'COMPUTERS',
     'CONFIG_FILE',
+    'CURSOR',
     'CallableDefaultOption',
     'ConfigFileOption',
     'DATA',
@@ -43,6 +43,7 @@ __all__ = (
     'COMPUTER',
     'COMPUTERS',
     'CONFIG_FILE',
+    'CURSOR',
     'DATA',
     'DATUM',
     'DB_BACKEND',
@@ -556,6 +557,15 @@ LIMIT = OverridableOption(
     '-l', '--limit', 'limit', type=click.INT, default=None, help='Limit the number of entries to display.'
 )
 
+CURSOR = OverridableOption(
+    '--cursor',
+    'cursor',
+    type=click.INT,
+    default=None,
+    help='Only display the entries that come after the entry with this PK in the chosen ordering. Use the PK of the '
+    'last entry of a page that was limited with `--limit` to display the next page.',
+)
+
 PROJECT = OverridableOption(
     '-P', '--project', 'project', cls=MultipleValueOption, help='Select the list of entity attributes to project.'
 )
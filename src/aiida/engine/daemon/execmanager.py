@@ -10,6 +10,11 @@
 results. These are general and contain only the main logic; where appropriate,
 the routines make reference to the suitable plugins for all
 plugin-specific operations.
+
+The routines that transfer files, i.e. uploading, stashing and retrieving, are coroutines that use the asynchronous
+API of the transport, such that the event loop of the daemon worker is not blocked while files are being copied. They
+address all remote files through absolute paths and do not change the working directory of the transport, such that
+multiple of them can use the same transport concurrently.
 """
 
 from __future__ import annotations
@@ -17,10 +22,11 @@ from __future__ import annotations
 import os
 import pathlib
 import shutil
+import time
 from collections.abc import Mapping
 from logging import LoggerAdapter
-from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from tempfile import NamedTemporaryFile, TemporaryDirectory, TemporaryFile
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Optional, Tuple, Union
 from typing import Mapping as MappingType
 
 from aiida.common import AIIDA_LOGGER, exceptions
@@ -62,7 +68,7 @@ def _find_data_node(inputs: MappingType[str, Any], uuid: str) -> Optional[Node]:
     return data_node
 
 
-def upload_calculation(
+async def upload_calculation(
     node: CalcJobNode,
     transport: Transport,
     calc_info: CalcInfo,
@@ -105,7 +111,7 @@ def upload_calculation(
     if dry_run:
         workdir = transport.getcwd()
     else:
-        remote_user = transport.whoami()
+        remote_user = await transport.whoami_async()
         remote_working_directory = computer.get_workdir().format(username=remote_user)
         if not remote_working_directory.strip():
             raise exceptions.ConfigurationError(
@@ -114,16 +120,13 @@ def upload_calculation(
             )
 
         # If it already exists, no exception is raised
-        try:
-            transport.chdir(remote_working_directory)
-        except OSError:
+        if not await transport.isdir_async(remote_working_directory):
             logger.debug(
-                f'[submission of calculation {node.pk}] Unable to '
-                f'chdir in {remote_working_directory}, trying to create it'
+                f'[submission of calculation {node.pk}] Remote working directory '
+                f'{remote_working_directory} does not exist, trying to create it'
             )
             try:
-                transport.makedirs(remote_working_directory)
-                transport.chdir(remote_working_directory)
+                await transport.makedirs_async(remote_working_directory, ignore_existing=True)
             except EnvironmentError as exc:
                 raise exceptions.ConfigurationError(
                     f'[submission of calculation {node.pk}] '
@@ -135,20 +138,21 @@ def upload_calculation(
         # in the calculation properties using _set_remote_dir
         # and I do not have to know the logic, but I just need to
         # read the absolute path from the calculation properties.
-        transport.mkdir(calc_info.uuid[:2], ignore_existing=True)
-        transport.chdir(calc_info.uuid[:2])
-        transport.mkdir(calc_info.uuid[2:4], ignore_existing=True)
-        transport.chdir(calc_info.uuid[2:4])
+        # All paths are absolute, since the transport may be used concurrently by other tasks.
+        remote_working_directory = os.path.normpath(remote_working_directory)
+        path_shard = os.path.join(remote_working_directory, calc_info.uuid[:2], calc_info.uuid[2:4])
+        await transport.makedirs_async(path_shard, ignore_existing=True)
+        workdir = os.path.join(path_shard, calc_info.uuid[4:])
 
         try:
             # The final directory may already exist, most likely because this function was already executed once, but
             # failed and as a result was rescheduled by the eninge. In this case it would be fine to delete the folder
             # and create it from scratch, except that we cannot be sure that this the actual case. Therefore, to err on
             # the safe side, we move the folder to the lost+found directory before recreating the folder from scratch
-            transport.mkdir(calc_info.uuid[4:])
+            await transport.mkdir_async(workdir)
         except OSError:
             # Move the existing directory to lost+found, log a warning and create a clean directory anyway
-            path_existing = os.path.join(transport.getcwd(), calc_info.uuid[4:])
+            path_existing = workdir
             path_lost_found = os.path.join(remote_working_directory, REMOTE_WORK_DIRECTORY_LOST_FOUND)
             path_target = os.path.join(path_lost_found, calc_info.uuid)
             logger.warning(
@@ -156,45 +160,16 @@ def upload_calculation(
             )
 
             # Make sure the lost+found directory exists, then copy the existing folder there and delete the original
-            transport.mkdir(path_lost_found, ignore_existing=True)
-            transport.copytree(path_existing, path_target)
-            transport.rmtree(path_existing)
+            await transport.mkdir_async(path_lost_found, ignore_existing=True)
+            await transport.copytree_async(path_existing, path_target)
+            await transport.rmtree_async(path_existing)
 
             # Now we can create a clean folder for this calculation
-            transport.mkdir(calc_info.uuid[4:])
-        finally:
-            transport.chdir(calc_info.uuid[4:])
+            await transport.mkdir_async(workdir)
 
         # I store the workdir of the calculation for later file retrieval
-        workdir = transport.getcwd()
         node.set_remote_workdir(workdir)
 
-    # I first create the code files, so that the code can put
-    # default files to be overwritten by the plugin itself.
-    # Still, beware! The code file itself could be overwritten...
-    # But I checked for this earlier.
-    for code in input_codes:
-        if isinstance(code, PortableCode):
-            # Note: this will possibly overwrite files
-            for root, dirnames, filenames in code.base.repository.walk():
-                # mkdir of root
-                transport.makedirs(root, ignore_existing=True)
-
-                # remotely mkdir first
-                for dirname in dirnames:
-                    transport.makedirs((root / dirname), ignore_existing=True)
-
-                # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-                # combination with the new `Transport.put_object_from_filelike`
-                # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-                for filename in filenames:
-                    with NamedTemporaryFile(mode='wb+') as handle:
-                        content = code.base.repository.get_object_content((pathlib.Path(root) / filename), mode='rb')
-                        handle.write(content)
-                        handle.flush()
-                        transport.put(handle.name, (root / filename))
-            transport.chmod(code.filepath_executable, 0o755)  # rwxr-xr-x
-
     # local_copy_list is a list of tuples, each with (uuid, dest_path, rel_path)
     # NOTE: validation of these lists are done inside calculation.presubmit()
     local_copy_list = calc_info.local_copy_list or []
@@ -208,15 +183,47 @@ def upload_calculation(
         FileCopyOperation.REMOTE,
     ]
 
+    # In bulk mode, the code files and the copy operations that precede the first remote copy operation are written to
+    # a single archive that is unpacked on the remote. If that fails, the files are copied one by one instead.
+    if not dry_run and computer.get_bulk_upload():
+        try:
+            num_bulk = file_copy_operation_order.index(FileCopyOperation.REMOTE)
+        except ValueError:
+            num_bulk = len(file_copy_operation_order)
+
+        if await _upload_files_in_bulk(
+            logger,
+            node,
+            transport,
+            workdir,
+            inputs,
+            folder,
+            input_codes,
+            file_copy_operation_order[:num_bulk],
+            local_copy_list,
+        ):
+            input_codes = []
+            file_copy_operation_order = file_copy_operation_order[num_bulk:]
+
+    # I first create the code files, so that the code can put
+    # default files to be overwritten by the plugin itself.
+    # Still, beware! The code file itself could be overwritten...
+    # But I checked for this earlier.
+    for code in input_codes:
+        if isinstance(code, PortableCode):
+            await _copy_portable_code(transport, workdir, code)
+
     for file_copy_operation in file_copy_operation_order:
         if file_copy_operation is FileCopyOperation.LOCAL:
-            _copy_local_files(logger, node, transport, inputs, local_copy_list)
+            await _copy_local_files(logger, node, transport, workdir, inputs, local_copy_list)
         elif file_copy_operation is FileCopyOperation.REMOTE:
             if not dry_run:
-                _copy_remote_files(logger, node, computer, transport, remote_copy_list, remote_symlink_list)
+                await _copy_remote_files(
+                    logger, node, computer, transport, workdir, remote_copy_list, remote_symlink_list
+                )
         elif file_copy_operation is FileCopyOperation.SANDBOX:
             if not dry_run:
-                _copy_sandbox_files(logger, node, transport, folder)
+                await _copy_sandbox_files(logger, node, transport, workdir, folder)
         else:
             raise RuntimeError(f'file copy operation {file_copy_operation} is not yet implemented.')
 
@@ -281,7 +288,30 @@ def upload_calculation(
     return None
 
 
-def _copy_remote_files(logger, node, computer, transport, remote_copy_list, remote_symlink_list):
+async def _copy_portable_code(transport, workdir, code):
+    """Copy the files of a ``PortableCode`` to the working directory and make its executable executable."""
+    # Note: this will possibly overwrite files
+    for root, dirnames, filenames in code.base.repository.walk():
+        # mkdir of root
+        await transport.makedirs_async(os.path.join(workdir, root), ignore_existing=True)
+
+        # remotely mkdir first
+        for dirname in dirnames:
+            await transport.makedirs_async(os.path.join(workdir, root, dirname), ignore_existing=True)
+
+        # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
+        # combination with the new `Transport.put_object_from_filelike`
+        # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
+        for filename in filenames:
+            with NamedTemporaryFile(mode='wb+') as handle:
+                content = code.base.repository.get_object_content((pathlib.Path(root) / filename), mode='rb')
+                handle.write(content)
+                handle.flush()
+                await transport.put_async(handle.name, os.path.join(workdir, root, filename))
+    await transport.chmod_async(os.path.join(workdir, code.filepath_executable), 0o755)  # rwxr-xr-x
+
+
+async def _copy_remote_files(logger, node, computer, transport, workdir, remote_copy_list, remote_symlink_list):
     """Perform the copy instructions of the ``remote_copy_list`` and ``remote_symlink_list``."""
     for remote_computer_uuid, remote_abs_path, dest_rel_path in remote_copy_list:
         if remote_computer_uuid == computer.uuid:
@@ -290,7 +320,7 @@ def _copy_remote_files(logger, node, computer, transport, remote_copy_list, remo
                 f'remotely, directly on the machine {computer.label}'
             )
             try:
-                transport.copy(remote_abs_path, dest_rel_path)
+                await transport.copy_async(remote_abs_path, os.path.join(workdir, dest_rel_path))
             except FileNotFoundError:
                 logger.warning(
                     f'[submission of calculation {node.pk}] Unable to copy remote '
@@ -316,8 +346,8 @@ def _copy_remote_files(logger, node, computer, transport, remote_copy_list, remo
             )
             remote_dirname = pathlib.Path(dest_rel_path).parent
             try:
-                transport.makedirs(remote_dirname, ignore_existing=True)
-                transport.symlink(remote_abs_path, dest_rel_path)
+                await transport.makedirs_async(os.path.join(workdir, remote_dirname), ignore_existing=True)
+                await transport.symlink_async(remote_abs_path, os.path.join(workdir, dest_rel_path))
             except OSError:
                 logger.warning(
                     f'[submission of calculation {node.pk}] Unable to create remote symlink '
@@ -330,19 +360,28 @@ def _copy_remote_files(logger, node, computer, transport, remote_copy_list, remo
             )
 
 
-def _copy_local_files(logger, node, transport, inputs, local_copy_list):
+def _load_local_copy_node(logger, inputs, uuid) -> Optional[Node]:
+    """Return the node with the given UUID of an entry of the ``local_copy_list`` or ``None`` if it cannot be found."""
+    try:
+        data_node = load_node(uuid=uuid)
+    except exceptions.NotExistent:
+        data_node = _find_data_node(inputs, uuid) if inputs else None
+
+    if data_node is None:
+        logger.warning(f'failed to load Node<{uuid}> specified in the `local_copy_list`')
+
+    return data_node
+
+
+async def _copy_local_files(logger, node, transport, workdir, inputs, local_copy_list):
     """Perform the copy instructions of the ``local_copy_list``."""
 
     for uuid, filename, target in local_copy_list:
         logger.debug(f'[submission of calculation {node.uuid}] copying local file/folder to {target}')
 
-        try:
-            data_node = load_node(uuid=uuid)
-        except exceptions.NotExistent:
-            data_node = _find_data_node(inputs, uuid) if inputs else None
+        data_node = _load_local_copy_node(logger, inputs, uuid)
 
         if data_node is None:
-            logger.warning(f'failed to load Node<{uuid}> specified in the `local_copy_list`')
             continue
 
         # The transport class can only copy files directly from the file system, so the files in the source node's repo
@@ -359,14 +398,18 @@ def _copy_local_files(logger, node, transport, inputs, local_copy_list):
             # The logic below takes care of an edge case where the source is a file but the target is a directory. In
             # this case, the v2.5.1 implementation would raise an `IsADirectoryError` exception, because it would try
             # to open the directory in the sandbox folder as a file when writing the contents.
-            if file_type_source == FileType.FILE and target and transport.isdir(target):
+            if (
+                file_type_source == FileType.FILE
+                and target
+                and await transport.isdir_async(os.path.join(workdir, target))
+            ):
                 raise IsADirectoryError
 
             # In case the source filename is specified and it is a directory that already exists in the remote, we
             # want to avoid nested directories in the target path to replicate the behavior of v2.5.1. This is done by
             # setting the target filename to '.', which means the contents of the node will be copied in the top level
             # of the temporary directory, whose contents are then copied into the target directory.
-            if filename and transport.isdir(filename):
+            if filename and await transport.isdir_async(os.path.join(workdir, filename)):
                 filename_target = '.'
 
             filepath_target = (dirpath / filename_target).resolve().absolute()
@@ -375,21 +418,212 @@ def _copy_local_files(logger, node, transport, inputs, local_copy_list):
             if file_type_source == FileType.DIRECTORY:
                 # If the source object is a directory, we copy its entire contents
                 data_node.base.repository.copy_tree(filepath_target, filename_source)
-                transport.put(f'{dirpath}/*', target or '.', overwrite=True)
+                await transport.put_async(f'{dirpath}/*', os.path.join(workdir, target or '.'), overwrite=True)
             else:
                 # Otherwise, simply copy the file
                 with filepath_target.open('wb') as handle:
                     with data_node.base.repository.open(filename_source, 'rb') as source:
                         shutil.copyfileobj(source, handle)
-                transport.makedirs(str(pathlib.Path(target).parent), ignore_existing=True)
-                transport.put(str(filepath_target), target)
+                await transport.makedirs_async(os.path.join(workdir, pathlib.Path(target).parent), ignore_existing=True)
+                await transport.put_async(str(filepath_target), os.path.join(workdir, target))
 
 
-def _copy_sandbox_files(logger, node, transport, folder):
+async def _copy_sandbox_files(logger, node, transport, workdir, folder):
     """Copy the contents of the sandbox folder to the working directory."""
     for filename in folder.get_content_list():
         logger.debug(f'[submission of calculation {node.pk}] copying file/folder {filename}...')
-        transport.put(folder.get_abs_path(filename), filename)
+        await transport.put_async(folder.get_abs_path(filename), os.path.join(workdir, filename))
+
+
+class _UploadArchive:
+    """Tar archive with the files to be written to the remote working directory.
+
+    The archive keeps track of the directories it contains, such that the checks that are performed against the remote
+    when copying files one by one, can be performed against the archive instead. This relies on the working directory
+    being empty before the archive is unpacked, which is the case for a newly created working directory.
+    """
+
+    def __init__(self, handle: BinaryIO):
+        """Construct a new instance.
+
+        :param handle: a binary stream to which the archive is written.
+        """
+        import tarfile
+
+        self._tarfile = tarfile.open(fileobj=handle, mode='w', format=tarfile.PAX_FORMAT)
+        self._directories: set[pathlib.PurePosixPath] = set()
+        self._mtime = time.time()
+
+    def close(self) -> None:
+        """Write the end-of-archive marker."""
+        self._tarfile.close()
+
+    def isdir(self, path: str | pathlib.PurePath) -> bool:
+        """Return whether the given relative path is a directory in the archive."""
+        path = pathlib.PurePosixPath(os.path.normpath(path))
+        return not path.parts or path in self._directories
+
+    def add_directory(self, path: str | pathlib.PurePath) -> None:
+        """Add a directory and all its parent directories to the archive.
+
+        :param path: relative path of the directory in the working directory.
+        """
+        import tarfile
+
+        path = pathlib.PurePosixPath(os.path.normpath(path))
+
+        for directory in reversed([path, *path.parents]):
+            if not directory.parts or directory in self._directories:
+                continue
+
+            tarinfo = tarfile.TarInfo(str(directory))
+            tarinfo.type = tarfile.DIRTYPE
+            tarinfo.mode = 0o755
+            tarinfo.mtime = self._mtime
+            self._tarfile.addfile(tarinfo)
+            self._directories.add(directory)
+
+    def add_file(self, handle: BinaryIO, path: str | pathlib.PurePath, mode: int = 0o644) -> None:
+        """Add a file to the archive, reading its content from a stream.
+
+        :param handle: a seekable binary stream with the content of the file.
+        :param path: relative path of the file in the working directory.
+        :param mode: the permissions of the file.
+        :raises IsADirectoryError: if ``path`` is a directory in the archive.
+        """
+        import tarfile
+
+        path = pathlib.PurePosixPath(os.path.normpath(path))
+
+        if self.isdir(path):
+            raise IsADirectoryError(f'cannot write file `{path}`: it is a directory')
+
+        self.add_directory(path.parent)
+
+        size = handle.seek(0, os.SEEK_END)
+        handle.seek(0)
+
+        tarinfo = tarfile.TarInfo(str(path))
+        tarinfo.size = size
+        tarinfo.mode = mode
+        tarinfo.mtime = self._mtime
+        self._tarfile.addfile(tarinfo, handle)
+
+    def add_portable_code(self, code: PortableCode) -> None:
+        """Add the files of a ``PortableCode``, making its executable executable."""
+        repository = code.base.repository
+        executable = pathlib.PurePosixPath(code.filepath_executable)
+
+        for root, dirnames, filenames in repository.walk():
+            for dirname in dirnames:
+                self.add_directory(root / dirname)
+            for filename in filenames:
+                with repository.open(root / filename, mode='rb') as handle:
+                    self.add_file(handle, root / filename, 0o755 if root / filename == executable else 0o644)
+
+    def add_sandbox(self, folder: Folder) -> None:
+        """Add the contents of the sandbox folder.
+
+        Like ``Transport.put``, a top-level file or directory whose name is already a directory in the archive, is added
+        inside of that directory.
+        """
+        for name in folder.get_content_list():
+            filepath = pathlib.Path(folder.get_abs_path(name))
+            target = pathlib.PurePosixPath(name) / name if self.isdir(name) else pathlib.PurePosixPath(name)
+
+            if not filepath.is_dir():
+                with filepath.open('rb') as handle:
+                    self.add_file(handle, target, filepath.stat().st_mode & 0o777)
+                continue
+
+            self.add_directory(target)
+
+            for dirpath, dirnames, filenames in os.walk(filepath, followlinks=True):
+                root = target / pathlib.Path(dirpath).relative_to(filepath).as_posix()
+                for dirname in dirnames:
+                    self.add_directory(root / dirname)
+                for filename in filenames:
+                    filepath_file = pathlib.Path(dirpath) / filename
+                    with filepath_file.open('rb') as handle:
+                        self.add_file(handle, root / filename, filepath_file.stat().st_mode & 0o777)
+
+    def add_local_copy(self, data_node: Node, filename: str | None, target: str | None) -> None:
+        """Add the file or the contents of the directory ``filename`` in the repository of ``data_node`` at ``target``.
+
+        The content is streamed directly from the repository of the node.
+        """
+        repository = data_node.base.repository
+        filename_source = filename or '.'
+        filename_target = pathlib.PurePosixPath(target or '.')
+
+        if repository.get_object(filename_source).file_type == FileType.FILE:
+            with repository.open(filename_source, 'rb') as handle:
+                self.add_file(handle, filename_target)
+            return
+
+        self.add_directory(filename_target)
+
+        for root, dirnames, filenames in repository.walk(filename_source):
+            relpath = filename_target / root.relative_to(pathlib.PurePosixPath(filename_source))
+            for dirname in dirnames:
+                self.add_directory(relpath / dirname)
+            for name in filenames:
+                with repository.open(root / name, 'rb') as handle:
+                    self.add_file(handle, relpath / name)
+
+
+async def _upload_files_in_bulk(
+    logger, node, transport, workdir, inputs, folder, input_codes, file_copy_operations, local_copy_list
+) -> bool:
+    """Upload the files of the portable codes and the given copy operations as a single archive.
+
+    The archive is written to an anonymous temporary file, with the content of nodes streamed straight from the
+    repository, and is then streamed to the standard input of ``tar`` that unpacks it in the working directory.
+
+    :return: ``True`` if the archive was unpacked successfully, ``False`` otherwise, in which case the files should be
+        copied one by one instead.
+    """
+    from aiida.common.escaping import escape_for_bash
+
+    with TemporaryFile() as handle:
+        archive = _UploadArchive(handle)
+
+        for code in input_codes:
+            if isinstance(code, PortableCode):
+                archive.add_portable_code(code)
+
+        for file_copy_operation in file_copy_operations:
+            if file_copy_operation is FileCopyOperation.LOCAL:
+                for uuid, filename, target in local_copy_list:
+                    data_node = _load_local_copy_node(logger, inputs, uuid)
+                    if data_node is not None:
+                        archive.add_local_copy(data_node, filename, target)
+            elif file_copy_operation is FileCopyOperation.SANDBOX:
+                archive.add_sandbox(folder)
+            else:
+                raise RuntimeError(f'file copy operation {file_copy_operation} cannot be uploaded in bulk.')
+
+        archive.close()
+        size = handle.tell()
+        handle.seek(0)
+
+        logger.debug(f'[submission of calculation {node.pk}] uploading archive of {size} bytes')
+
+        try:
+            retval, _, stderr = await transport.exec_command_wait_bytes_async(
+                f'tar -xf - -C {escape_for_bash(workdir)}', stdin=handle
+            )
+        except OSError as exception:
+            retval, stderr = None, str(exception).encode()
+
+    if retval != 0:
+        logger.warning(
+            f'[submission of calculation {node.pk}] failed to unpack the archive on the remote, falling back to '
+            f'copying files one by one: {stderr.decode("utf-8", errors="replace")}'
+        )
+        return False
+
+    return True
 
 
 def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str | ExitCode:
@@ -422,7 +656,7 @@ def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str |
     return result
 
 
-def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
+async def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     """Stash files from the working directory of a completed calculation to a permanent remote folder.
 
     After a calculation has been completed, optionally stash files from the work directory to a storage location on the
@@ -460,7 +694,7 @@ def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     for source_filename in source_list:
         if transport.has_magic(source_filename):
             copy_instructions = []
-            for globbed_filename in transport.glob(str(source_basepath / source_filename)):
+            for globbed_filename in await transport.glob_async(str(source_basepath / source_filename)):
                 target_filepath = target_basepath / pathlib.Path(globbed_filename).relative_to(source_basepath)
                 copy_instructions.append((globbed_filename, target_filepath))
         else:
@@ -469,10 +703,10 @@ def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
         for source_filepath, target_filepath in copy_instructions:
             # If the source file is in a (nested) directory, create those directories first in the target directory
             target_dirname = target_filepath.parent
-            transport.makedirs(str(target_dirname), ignore_existing=True)
+            await transport.makedirs_async(str(target_dirname), ignore_existing=True)
 
             try:
-                transport.copy(str(source_filepath), str(target_filepath))
+                await transport.copy_async(str(source_filepath), str(target_filepath))
             except (OSError, ValueError) as exception:
                 EXEC_LOGGER.warning(f'failed to stash {source_filepath} to {target_filepath}: {exception}')
             else:
@@ -487,7 +721,7 @@ def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     remote_stash.base.links.add_incoming(calculation, link_type=LinkType.CREATE, link_label='remote_stash')
 
 
-def retrieve_calculation(
+async def retrieve_calculation(
     calculation: CalcJobNode, transport: Transport, retrieved_temporary_folder: str
 ) -> FolderData | None:
     """Retrieve all the files of a completed job calculation using the given transport.
@@ -506,8 +740,7 @@ def retrieve_calculation(
     workdir = calculation.get_remote_workdir()
     filepath_sandbox = get_config_option('storage.sandbox') or None
 
-    EXEC_LOGGER.debug(f'Retrieving calc {calculation.pk}', extra=logger_extra)
-    EXEC_LOGGER.debug(f'[retrieval of calc {calculation.pk}] chdir {workdir}', extra=logger_extra)
+    EXEC_LOGGER.debug(f'Retrieving calc {calculation.pk} from {workdir}', extra=logger_extra)
 
     # If the calculation already has a `retrieved` folder, simply return. The retrieval was apparently already completed
     # before, which can happen if the daemon is restarted and it shuts down after retrieving but before getting the
@@ -523,21 +756,21 @@ def retrieve_calculation(
     retrieved_files = FolderData()
 
     with transport:
-        transport.chdir(workdir)
-
         # First, retrieve the files of folderdata
         retrieve_list = calculation.get_retrieve_list()
         retrieve_temporary_list = calculation.get_retrieve_temporary_list()
 
         with SandboxFolder(filepath_sandbox) as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
+            await retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list, workdir)
             # Here I retrieved everything; now I store them inside the calculation
             retrieved_files.base.repository.put_object_from_tree(folder.abspath)
 
         # Retrieve the temporary files in the retrieved_temporary_folder if any files were
         # specified in the 'retrieve_temporary_list' key
         if retrieve_temporary_list:
-            retrieve_files_from_list(calculation, transport, retrieved_temporary_folder, retrieve_temporary_list)
+            await retrieve_files_from_list(
+                calculation, transport, retrieved_temporary_folder, retrieve_temporary_list, workdir
+            )
 
             # Log the files that were retrieved in the temporary folder
             for filename in os.listdir(retrieved_temporary_folder):
@@ -588,11 +821,12 @@ def kill_calculation(calculation: CalcJobNode, transport: Transport) -> None:
             )
 
 
-def retrieve_files_from_list(
+async def retrieve_files_from_list(
     calculation: CalcJobNode,
     transport: Transport,
     folder: str,
     retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    workdir: Optional[str] = None,
 ) -> None:
     """Retrieve all the files in the retrieve_list from the remote into the
     local folder instance through the transport. The entries in the retrieve_list
@@ -612,16 +846,39 @@ def retrieve_files_from_list(
     treated as the work directory of the folder and the depth integer determines
     upto what level of the original remotepath nesting the files will be copied.
 
+    If the ``bulk_retrieve`` property of the computer is set, all patterns are resolved with a single remote command
+    and the files are transferred as a single tar archive, see :func:`_retrieve_files_in_bulk`. Items that cannot be
+    retrieved in bulk, or all of them if the remote does not support it, are retrieved one by one.
+
     :param transport: the Transport instance.
     :param folder: an absolute path to a folder that contains the files to copy.
     :param retrieve_list: the list of files to retrieve.
+    :param workdir: the absolute path of the remote directory relative to which the remote paths are resolved. Defaults
+        to the current working directory of the transport.
     """
+    computer = calculation.computer
+    workdir = workdir or transport.getcwd()
+    bulk = computer is not None and computer.get_bulk_retrieve()
+
+    patterns = []
+    for item in retrieve_list:
+        remote_name = item[0] if isinstance(item, (list, tuple)) else item
+        if transport.has_magic(remote_name) and remote_name not in patterns:
+            patterns.append(remote_name)
+
+    globbed = await _glob_in_bulk(transport, workdir, patterns) if bulk and patterns else None
+
+    if globbed is None:
+        globbed = {pattern: await _glob(transport, workdir, pattern) for pattern in patterns}
+
+    to_retrieve: list[tuple[str, str]] = []
+
     for item in retrieve_list:
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
             # if there are more than one file I do something differently
             if transport.has_magic(tmp_rname):
-                remote_names = transport.glob(tmp_rname)
+                remote_names = globbed[tmp_rname]
                 local_names = []
                 for rem in remote_names:
                     if depth is None:
@@ -639,12 +896,150 @@ def retrieve_files_from_list(
                     if not os.path.exists(new_folder):
                         os.makedirs(new_folder)
         elif transport.has_magic(item):  # it is a string
-            remote_names = transport.glob(item)
+            remote_names = globbed[item]
             local_names = [os.path.split(rem)[1] for rem in remote_names]
         else:
             remote_names = [item]
             local_names = [os.path.split(item)[1]]
 
-        for rem, loc in zip(remote_names, local_names):
-            transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+        to_retrieve.extend(zip(remote_names, local_names))
+
+    if bulk:
+        to_retrieve = await _retrieve_files_in_bulk(calculation, transport, workdir, folder, to_retrieve)
+
+    for rem, loc in to_retrieve:
+        transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
+        await transport.get_async(os.path.join(workdir, rem), os.path.join(folder, loc), ignore_nonexisting=True)
+
+
+async def _glob(transport: Transport, workdir: str, pattern: str) -> list[str]:
+    """Resolve a glob pattern on the remote relative to the given directory.
+
+    :param transport: the transport.
+    :param workdir: the absolute path of the remote directory relative to which a relative pattern is resolved.
+    :param pattern: the glob pattern to resolve.
+    :return: the matching paths, which are relative to ``workdir`` if the pattern is relative.
+    """
+    matches = await transport.glob_async(os.path.join(workdir, pattern))
+
+    if os.path.isabs(pattern):
+        return matches
+
+    return [os.path.relpath(match, workdir) for match in matches]
+
+
+_GLOB_SEPARATOR = '//aiida-glob-separator//'
+
+
+async def _glob_in_bulk(transport: Transport, workdir: str, patterns: List[str]) -> Optional[dict[str, list[str]]]:
+    """Resolve a list of glob patterns on the remote with a single command.
+
+    The patterns are expanded by the ``compgen`` builtin of ``bash`` relative to the given directory, which follows the
+    same rules as :meth:`aiida.transports.Transport.glob`: hidden files are only matched explicitly and patterns without
+    matches resolve to an empty list.
+
+    :param transport: the transport.
+    :param workdir: the absolute path of the remote directory relative to which the patterns are resolved.
+    :param patterns: the glob patterns to resolve.
+    :return: a mapping of each pattern onto the list of matching paths, or ``None`` if the remote command failed.
+    """
+    from aiida.common.escaping import escape_for_bash
+
+    command = ' ; '.join(
+        f'compgen -G {escape_for_bash(pattern)} ; echo {escape_for_bash(_GLOB_SEPARATOR)}' for pattern in patterns
+    )
+    command = f'cd {escape_for_bash(workdir)} && {{ {command} ; }}'
+    retval, stdout, stderr = await transport.exec_command_wait_async(command)
+
+    blocks = stdout.split(f'{_GLOB_SEPARATOR}\n')
+
+    if retval != 0 or len(blocks) != len(patterns) + 1 or blocks[-1]:
+        EXEC_LOGGER.warning(f'bulk resolution of the retrieve patterns failed, falling back to `glob`: {stderr}')
+        return None
+
+    return {pattern: block.splitlines() for pattern, block in zip(patterns, blocks)}
+
+
+async def _retrieve_files_in_bulk(
+    calculation: CalcJobNode, transport: Transport, workdir: str, folder: str, to_retrieve: List[Tuple[str, str]]
+) -> List[Tuple[str, str]]:
+    """Retrieve files from the remote working directory by transferring them as a single tar archive.
+
+    The existing items of ``to_retrieve`` are packed with ``tar`` in a temporary file on the remote, which is then
+    copied with a single :meth:`aiida.transports.Transport.getfile` call and unpacked locally. Symbolic links are
+    dereferenced, just like :meth:`aiida.transports.Transport.get` does by default. Only relative paths that do not
+    escape the working directory can be retrieved like this.
+
+    :param calculation: the calculation job whose files are retrieved.
+    :param transport: the transport.
+    :param workdir: the absolute path of the remote working directory.
+    :param folder: an absolute path to the local folder into which the files should be retrieved.
+    :param to_retrieve: list of tuples of the remote path and the local path relative to ``folder``.
+    :return: the items that could not be retrieved in bulk and should be retrieved one by one instead.
+    """
+    import tarfile
+
+    from aiida.common.escaping import escape_for_bash
+
+    remaining = []
+    bulk = []
+
+    for rem, loc in to_retrieve:
+        if os.path.isabs(rem) or os.path.normpath(rem).split(os.sep)[0] == os.pardir:
+            remaining.append((rem, loc))
+        else:
+            bulk.append((os.path.normpath(rem), loc))
+
+    if not bulk:
+        return remaining
+
+    names = ' '.join(escape_for_bash(name) for name in dict.fromkeys(rem for rem, _ in bulk))
+    command = (
+        f'cd {escape_for_bash(workdir)} && archive=$(mktemp) && '
+        f'{{ for name in {names} ; do [ -e "$name" ] && printf "%s\\0" "$name" ; done ; true ; }} '
+        '| tar -chf "$archive" --null -T - && echo "$archive"'
+    )
+    retval, stdout, stderr = await transport.exec_command_wait_async(command)
+    remote_archive = stdout.strip()
+
+    if retval != 0 or not remote_archive:
+        EXEC_LOGGER.warning(f'[retrieval of calc {calculation.pk}] bulk retrieval failed, falling back: {stderr}')
+        if remote_archive:
+            await transport.remove_async(remote_archive)
+        return to_retrieve
+
+    transport.logger.debug(f'[retrieval of calc {calculation.pk}] Retrieving {len(bulk)} items as a single archive')
+
+    with TemporaryDirectory() as dirpath:
+        local_archive = os.path.join(dirpath, 'retrieved.tar')
+        extracted = os.path.join(dirpath, 'extracted')
+
+        try:
+            await transport.getfile_async(remote_archive, local_archive)
+        finally:
+            await transport.remove_async(remote_archive)
+
+        with tarfile.open(local_archive) as archive:
+            members = [
+                member
+                for member in archive.getmembers()
+                if (member.isfile() or member.isdir())
+                and not os.path.isabs(member.name)
+                and os.pardir not in pathlib.PurePosixPath(member.name).parts
+            ]
+            kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+            archive.extractall(extracted, members=members, **kwargs)
+
+        for rem, loc in bulk:
+            source = os.path.join(extracted, rem)
+            target = os.path.join(folder, loc)
+
+            if os.path.isdir(target):
+                target = os.path.join(target, os.path.basename(rem))
+
+            if os.path.isdir(source):
+                shutil.copytree(source, target, dirs_exist_ok=True)
+            elif os.path.isfile(source):
+                shutil.copyfile(source, target)
+
+    return remaining
@@ -27,6 +27,10 @@ __all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader')
 LOGGER = logging.getLogger(__name__)
 OBJECT_LOADER = None
 
+# Key in a bundle of a mapping of keys onto serialized values that are stored separately from the checkpoint, such that
+# only the entries that changed since the previous checkpoint are written, see :meth:`ProcessNode.set_checkpoint`.
+CHECKPOINT_ENTRIES_KEY = 'CHECKPOINT_ENTRIES'
+
 
 class ObjectLoader(plumpy.loaders.DefaultObjectLoader):
     """Custom object loader for `aiida-core`."""
@@ -86,10 +90,23 @@ class AiiDAPersister(plumpy.persistence.Persister):
             # Couldn't create the bundle
             raise PersistenceError(f"Failed to create a bundle for '{process}': {traceback.format_exc()}")
 
+        # The checkpoint only stores the keys of the entries, which are restored from the node in ``load_checkpoint``
+        entries = bundle.get(CHECKPOINT_ENTRIES_KEY, None)
+        if entries is not None:
+            bundle[CHECKPOINT_ENTRIES_KEY] = sorted(entries)
+
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            try:
+                process.node.set_checkpoint(serialize.serialize_checkpoint(bundle), entries)
+            except NotImplementedError:
+                # The storage backend does not store the entries separately, so they are stored in the checkpoint
+                bundle[CHECKPOINT_ENTRIES_KEY] = entries
+                process.node.set_checkpoint(serialize.serialize_checkpoint(bundle))
         except Exception:
             raise PersistenceError(f"Failed to store a checkpoint for '{process}': {traceback.format_exc()}")
+        finally:
+            if entries is not None:
+                bundle[CHECKPOINT_ENTRIES_KEY] = entries
 
         return bundle
 
@@ -119,10 +136,18 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f'Calculation<{calculation.pk}> does not have a saved checkpoint')
 
         try:
-            bundle = serialize.deserialize_unsafe(checkpoint)
+            bundle = serialize.deserialize_checkpoint(checkpoint)
         except Exception:
             raise PersistenceError(f'Failed to load the checkpoint for process<{pid}>: {traceback.format_exc()}')
 
+        # The entries are only contained in the checkpoint if the storage backend does not store them separately
+        if CHECKPOINT_ENTRIES_KEY in bundle and not isinstance(bundle[CHECKPOINT_ENTRIES_KEY], dict):
+            entries = calculation.checkpoint_entries
+            missing = set(bundle[CHECKPOINT_ENTRIES_KEY]).difference(entries)
+            if missing:
+                raise PersistenceError(f'Checkpoint entries {sorted(missing)} of process<{pid}> do not exist')
+            bundle[CHECKPOINT_ENTRIES_KEY] = entries
+
         return bundle
 
     def get_checkpoints(self):
@@ -644,7 +644,9 @@ class CalcJob(Process):
             with SubmitTestFolder() as folder:
                 calc_info = self.presubmit(folder)
                 transport.chdir(folder.abspath)
-                upload_calculation(self.node, transport, calc_info, folder, inputs=self.inputs, dry_run=True)
+                self.loop.run_until_complete(
+                    upload_calculation(self.node, transport, calc_info, folder, inputs=self.inputs, dry_run=True)
+                )
                 self.node.dry_run_info = {  # type: ignore[attr-defined]
                     'folder': folder.abspath,
                     'script_filename': self.node.get_option('submit_script_filename'),
@@ -670,7 +672,9 @@ class CalcJob(Process):
                 with SandboxFolder(filepath_sandbox) as retrieved_temporary_folder:
                     self.presubmit(folder)
                     self.node.set_remote_workdir(self.inputs.remote_folder.get_remote_path())
-                    retrieved = retrieve_calculation(self.node, transport, retrieved_temporary_folder.abspath)
+                    retrieved = self.loop.run_until_complete(
+                        retrieve_calculation(self.node, transport, retrieved_temporary_folder.abspath)
+                    )
                     if retrieved is not None:
                         self.out(self.node.link_label_retrieved, retrieved)
                         self.update_outputs()
@@ -11,9 +11,13 @@
 import asyncio
 import contextlib
 import contextvars
+import functools
+import json
 import logging
+import pathlib
+import sqlite3
 import time
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
 from aiida.common import lang
 from aiida.orm import AuthInfo
@@ -24,6 +28,136 @@ if TYPE_CHECKING:
 
 __all__ = ('JobsList', 'JobManager')
 
+LOGGER = logging.getLogger(__name__)
+
+
+class JobStatesCache:
+    """Cache of the job states polled from schedulers that is shared between processes through an SQLite database file.
+
+    Each daemon worker has its own :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` and so, without
+    sharing, each worker would poll the scheduler of a computer independently, multiplying the load on the scheduler by
+    the number of workers. The ``JobsList`` instances of all workers of a profile can instead use the same instance of
+    this cache: the result of a poll by one worker is then reused by the others, as long as it is younger than the
+    minimum job poll interval of the computer.
+
+    For each ``AuthInfo`` only the result of the most recent poll is kept. Since schedulers that cannot query by user
+    are only asked for specific jobs, the job ids that were requested are stored as well and a cached result is only
+    returned if it covers all the requested jobs.
+
+    A job that is missing from the result of a poll is considered to have finished. A cached result that was polled
+    before a job was submitted, e.g. by another worker, or that does not contain one of the jobs whose state is
+    requested, is therefore not returned, such that the scheduler is polled instead.
+
+    The number of cache hits and misses are tracked by the ``hits`` and ``misses`` attributes.
+    """
+
+    def __init__(self, filepath: Union[str, pathlib.Path]):
+        """Construct a new instance.
+
+        :param filepath: the filepath of the SQLite database, which is created if it does not yet exist.
+        """
+        self._filepath = pathlib.Path(filepath)
+        self._initialised = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def filepath(self) -> pathlib.Path:
+        """Return the filepath of the SQLite database."""
+        return self._filepath
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Return a connection to the database, creating the database and its table if necessary."""
+        if not self._initialised:
+            self._filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self._filepath, timeout=10.0, isolation_level=None)
+
+        try:
+            if not self._initialised:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS job_states '
+                    '(authinfo_pk INTEGER PRIMARY KEY, polled_at REAL NOT NULL, job_ids TEXT, job_infos TEXT NOT NULL)'
+                )
+                self._initialised = True
+            yield connection
+        finally:
+            connection.close()
+
+    def get(
+        self,
+        authinfo_pk: int,
+        job_ids: Optional[List[str]],
+        max_age: float,
+        required_job_ids: Optional[List[str]] = None,
+        min_polled_at: Optional[float] = None,
+    ) -> Optional[Tuple[float, Dict[Hashable, 'JobInfo']]]:
+        """Return the most recently polled job states for the given authinfo, if still valid.
+
+        :param authinfo_pk: the pk of the ``AuthInfo``.
+        :param job_ids: the job ids that need to be covered by the cached result, or ``None`` if the result should
+            contain all jobs of the user.
+        :param max_age: the maximum age in seconds of the cached result.
+        :param required_job_ids: job ids that the cached result should contain a state for.
+        :param min_polled_at: the time, as returned by ``time.time()``, before which the cached result should not have
+            been polled, e.g. the time at which the most recent of the requested jobs was submitted.
+        :return: a tuple of the time the jobs were polled and the mapping of job ids to ``JobInfo`` instances, or
+            ``None`` if there is no valid entry.
+        """
+        from aiida.schedulers.datastructures import JobInfo
+
+        try:
+            with self._connection() as connection:
+                row = connection.execute(
+                    'SELECT polled_at, job_ids, job_infos FROM job_states WHERE authinfo_pk = ?', (authinfo_pk,)
+                ).fetchone()
+        except sqlite3.Error as exception:
+            LOGGER.warning(f'failed to read the job states cache `{self._filepath}`: {exception}')
+            row = None
+
+        if row is not None:
+            polled_at, cached_job_ids, job_infos = row
+            is_fresh = 0 <= time.time() - polled_at < max_age and (min_polled_at is None or polled_at >= min_polled_at)
+
+            if cached_job_ids is None:
+                is_covered = True
+            else:
+                is_covered = job_ids is not None and set(job_ids).issubset(json.loads(cached_job_ids))
+
+            if is_fresh and is_covered:
+                jobs = {job_id: JobInfo.load_from_dict(job_info) for job_id, job_info in json.loads(job_infos).items()}
+
+                if required_job_ids is None or set(required_job_ids).issubset(jobs):
+                    self.hits += 1
+                    return polled_at, jobs
+
+        self.misses += 1
+        return None
+
+    def set(
+        self, authinfo_pk: int, job_ids: Optional[List[str]], jobs: Dict[Hashable, 'JobInfo'], polled_at: float
+    ) -> None:
+        """Store the result of polling the scheduler for the given authinfo, replacing any previous result.
+
+        :param authinfo_pk: the pk of the ``AuthInfo``.
+        :param job_ids: the job ids that were requested from the scheduler, or ``None`` if all jobs of the user were.
+        :param jobs: the mapping of job ids to ``JobInfo`` instances returned by the scheduler.
+        :param polled_at: the time at which the scheduler was polled as returned by ``time.time()``.
+        """
+        job_infos = json.dumps({str(job_id): job_info.get_dict() for job_id, job_info in jobs.items()})
+        cached_job_ids = None if job_ids is None else json.dumps(job_ids)
+
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO job_states (authinfo_pk, polled_at, job_ids, job_infos) '
+                    'VALUES (?, ?, ?, ?)',
+                    (authinfo_pk, polled_at, cached_job_ids, job_infos),
+                )
+        except sqlite3.Error as exception:
+            LOGGER.warning(f'failed to write the job states cache `{self._filepath}`: {exception}')
+
 
 class JobsList:
     """Manager of calculation jobs submitted with a specific ``AuthInfo``, i.e. computer configured for a specific user.
@@ -39,26 +173,37 @@ class JobsList:
     and the limiting of number of calls per unit time, through the minimum polling interval, is only applicable for jobs
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
+    The exception are instances for the same authinfo in different processes, e.g. daemon workers, that share a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.JobStatesCache`: a poll by any of them counts for all of them.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
     """
 
-    def __init__(self, authinfo: AuthInfo, transport_queue: 'TransportQueue', last_updated: Optional[float] = None):
+    def __init__(
+        self,
+        authinfo: AuthInfo,
+        transport_queue: 'TransportQueue',
+        last_updated: Optional[float] = None,
+        job_states_cache: Optional[JobStatesCache] = None,
+    ):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
         :param transport_queue: A transport queue
         :param last_updated: initialize the last updated timestamp
+        :param job_states_cache: optional cache through which the polled job states are shared with other processes
 
         """
         lang.type_check(last_updated, float, allow_none=True)
 
         self._authinfo = authinfo
         self._transport_queue = transport_queue
+        self._job_states_cache = job_states_cache
         self._loop = transport_queue.loop
         self._logger = logging.getLogger(__name__)
 
         self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
+        self._job_requested_at: Dict[Hashable, float] = {}  # Mapping: {job_id: time of the first update request}
         self._last_updated = last_updated
         self._update_handle: Optional[asyncio.TimerHandle] = None
 
@@ -90,21 +235,52 @@ class JobsList:
     async def _get_jobs_from_scheduler(self) -> Dict[Hashable, 'JobInfo']:
         """Get the current jobs list from the scheduler.
 
+        If a job states cache is defined and it contains a result for the requested jobs that was polled, possibly by
+        another process, less than the minimum update interval ago, that result is returned and the scheduler is not
+        polled. The cached result should also have been polled after the first update request of each requested job,
+        which is after its submission, and contain all of them. Otherwise, a job that is missing from the result
+        because it was submitted after the poll would be considered to have finished.
+
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
 
         """
+        scheduler = self._authinfo.computer.get_scheduler()
+        requested_job_ids = self._get_jobs_with_scheduler()
+        job_ids = None if scheduler.get_feature('can_query_by_user') else requested_job_ids
+
+        if self._job_states_cache is not None:
+            requested_at = max(
+                (self._job_requested_at.get(job_id, 0.0) for job_id in self._job_update_requests), default=None
+            )
+            # The cache is an SQLite database file, so it is read in a thread to not block the event loop
+            cached = await self._loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._job_states_cache.get,
+                    self._authinfo.pk,
+                    job_ids,
+                    self.get_minimum_update_interval(),
+                    required_job_ids=requested_job_ids,
+                    min_polled_at=requested_at,
+                ),
+            )
+
+            if cached is not None:
+                self._last_updated, jobs_cache = cached
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: retrieved status of active jobs from the cache')
+                return jobs_cache
+
         with self._transport_queue.request_transport(self._authinfo) as request:
             self.logger.info('waiting for transport')
             transport = await request
 
-            scheduler = self._authinfo.computer.get_scheduler()
             scheduler.set_transport(transport)
 
             kwargs: Dict[str, Any] = {'as_dict': True}
-            if scheduler.get_feature('can_query_by_user'):
+            if job_ids is None:
                 kwargs['user'] = '$USER'
             else:
-                kwargs['jobs'] = self._get_jobs_with_scheduler()
+                kwargs['jobs'] = job_ids
 
             scheduler_response = scheduler.get_jobs(**kwargs)
 
@@ -116,6 +292,11 @@ class JobsList:
             for job_id, job_info in scheduler_response.items():
                 jobs_cache[job_id] = job_info
 
+            if self._job_states_cache is not None:
+                await self._loop.run_in_executor(
+                    None, self._job_states_cache.set, self._authinfo.pk, job_ids, jobs_cache, self._last_updated
+                )
+
             return jobs_cache
 
     async def _update_job_info(self) -> None:
@@ -146,7 +327,11 @@ class JobsList:
         else:
             for job_id, future in self._job_update_requests.items():
                 if not future.done():
-                    future.set_result(self._jobs_cache.get(job_id, None))
+                    job_info = self._jobs_cache.get(job_id, None)
+                    if job_info is None:
+                        # The job is no longer with the scheduler and will not be requested again
+                        self._job_requested_at.pop(job_id, None)
+                    future.set_result(job_info)
         finally:
             self._job_update_requests = {}
 
@@ -160,6 +345,7 @@ class JobsList:
         :return: future that will resolve to a `JobInfo` object when the job changes state
         """
         self._authinfo = authinfo
+        self._job_requested_at.setdefault(job_id, time.time())
         # Get or create the future
         request = self._job_update_requests.setdefault(job_id, asyncio.Future())
         assert not request.done(), 'Expected pending job info future, found in done state.'
@@ -256,13 +442,25 @@ class JobManager:
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
-    only hold per runner.
+    only hold per runner, unless the job managers of the runners share a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.JobStatesCache`, as is the case for the daemon workers.
     """
 
-    def __init__(self, transport_queue: 'TransportQueue') -> None:
+    def __init__(self, transport_queue: 'TransportQueue', job_states_cache: Optional[JobStatesCache] = None) -> None:
+        """Construct a new instance.
+
+        :param transport_queue: the transport queue used to poll the schedulers.
+        :param job_states_cache: optional cache through which the polled job states are shared with other processes.
+        """
         self._transport_queue = transport_queue
+        self._job_states_cache = job_states_cache
         self._job_lists: Dict[Hashable, 'JobInfo'] = {}
 
+    @property
+    def job_states_cache(self) -> Optional[JobStatesCache]:
+        """Return the cache through which the polled job states are shared with other processes, if defined."""
+        return self._job_states_cache
+
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
 
@@ -270,7 +468,9 @@ class JobManager:
         :return: a `JobsList` instance
         """
         if authinfo.pk not in self._job_lists:
-            self._job_lists[authinfo.pk] = JobsList(authinfo, self._transport_queue)
+            self._job_lists[authinfo.pk] = JobsList(
+                authinfo, self._transport_queue, job_states_cache=self._job_states_cache
+            )
 
         return self._job_lists[authinfo.pk]
 
@@ -650,21 +650,28 @@ class Process(plumpy.processes.Process):
             return
 
         outputs_flat = self._flat_outputs()
-        outputs_stored = self.node.base.links.get_outgoing(
-            link_type=(LinkType.CREATE, LinkType.RETURN)
-        ).all_link_labels()
-        outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
-
-        for link_label, output in outputs_flat.items():
-            if link_label not in outputs_new:
-                continue
+        outputs_stored = set(
+            self.node.base.links.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
+        )
+        outputs_new = {
+            link_label: output for link_label, output in outputs_flat.items() if link_label not in outputs_stored
+        }
+
+        if isinstance(self.node, orm.CalculationNode):
+            link_type = LinkType.CREATE
+        elif isinstance(self.node, orm.WorkflowNode):
+            link_type = LinkType.RETURN
+        else:
+            link_type = None
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.base.links.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.base.links.add_incoming(self.node, LinkType.RETURN, link_label)
+        # Validate and add all new links in one go and store the new outputs, together with their incoming links, in a
+        # single transaction, instead of doing a number of queries for each output separately.
+        if link_type is not None:
+            self.node.base.links.add_outgoing_many(
+                [(output, link_type, link_label) for link_label, output in outputs_new.items()]
+            )
 
-            output.store()
+        orm.store_many(outputs_new.values())
 
     def _build_process_label(self) -> str:
         """Construct the process label that should be set on ``ProcessNode`` instances for this process class.
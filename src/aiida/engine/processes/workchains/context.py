@@ -8,9 +8,10 @@
 ###########################################################################
 """Convenience functions to add awaitables to the Context of a WorkChain."""
 
-from typing import Union
+from typing import Any, Dict, Optional, Set, Union
 
-from aiida.orm import ProcessNode
+from aiida.common.extendeddicts import AttributeDict
+from aiida.orm import Computer, Group, Node, ProcessNode
 
 from .awaitable import Awaitable, AwaitableAction, construct_awaitable
 
@@ -18,6 +19,9 @@ __all__ = ('ToContext', 'assign_', 'append_')
 
 ToContext = dict
 
+# Types whose instances cannot be mutated, such that their serialized value cannot change in place
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
 
 def assign_(target: Union[Awaitable, ProcessNode]) -> Awaitable:
     """Convenience function that will construct an Awaitable for a given class instance
@@ -47,3 +51,113 @@ def append_(target: Union[Awaitable, ProcessNode]) -> Awaitable:
     awaitable = construct_awaitable(target)
     awaitable.action = AwaitableAction.APPEND
     return awaitable
+
+
+class TrackedContext(AttributeDict):
+    """Context of a ``WorkChain`` that caches the serialized values of its top-level keys.
+
+    Each key is serialized separately, and the serialized values are stored as separate checkpoint entries by the
+    ``AiiDAPersister``, which only writes the entries whose serialized value differs from the one it wrote previously.
+    The serialized value of a key is only reused by the next checkpoint if the value is immutable, e.g. a number, a
+    string or a stored node, and the key was not set or deleted since. All other values are serialized again at every
+    checkpoint, since they may have been mutated in place through any reference.
+
+    .. note:: Since each key is serialized separately, objects that are shared between multiple keys are no longer
+        shared once the context is restored from a checkpoint.
+    """
+
+    def __init__(self, dictionary: Optional[Dict[str, Any]] = None):
+        object.__setattr__(self, '_serialized', {})
+        object.__setattr__(self, '_changed', set())
+        super().__init__(dictionary)
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, Any]) -> 'TrackedContext':
+        """Construct a new instance with the items of a mapping, without converting nested mappings."""
+        context = cls()
+        dict.update(context, mapping)
+        return context
+
+    @classmethod
+    def from_serialized(cls, serialized: Dict[str, bytes]) -> 'TrackedContext':
+        """Construct a new instance from the serialized values of its keys, as returned by :meth:`serialize`."""
+        from aiida.orm.utils.serialize import unpickle_checkpoint
+
+        context = cls.from_mapping({key: unpickle_checkpoint(payload) for key, payload in serialized.items()})
+        context._serialized.update(
+            {key: payload for key, payload in serialized.items() if _is_immutable(dict.__getitem__(context, key))}
+        )
+        return context
+
+    def serialize(self) -> Dict[str, bytes]:
+        """Return the serialized values of all keys, reusing those of the immutable values that were not replaced.
+
+        :return: mapping of the keys onto their value serialized with ``aiida.orm.utils.serialize.pickle_checkpoint``.
+        """
+        from aiida.orm.utils.serialize import pickle_checkpoint
+
+        cached: Dict[str, bytes] = self._serialized
+        changed: Set[str] = self._changed
+
+        for key in list(cached):
+            if key in changed or not dict.__contains__(self, key):
+                del cached[key]
+
+        serialized = {}
+
+        for key, value in dict.items(self):
+            payload = cached.get(key)
+            if payload is None:
+                payload = pickle_checkpoint(value)
+                if _is_immutable(value):
+                    cached[key] = payload
+            serialized[key] = payload
+
+        changed.clear()
+
+        return serialized
+
+    def _mark_changed(self, *keys: Any) -> None:
+        self._changed.update(keys)
+
+    def __setitem__(self, key, value):
+        self._mark_changed(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._mark_changed(key)
+        super().__delitem__(key)
+
+    def setdefault(self, key, default=None):
+        self._mark_changed(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        self._mark_changed(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._mark_changed(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        self._mark_changed(*other)
+        super().update(other)
+
+    def clear(self):
+        self._mark_changed(*dict.keys(self))
+        super().clear()
+
+
+def _is_immutable(value: Any) -> bool:
+    """Return whether the serialized value of an object can only change by replacing the object.
+
+    Stored nodes, groups and computers are serialized through their UUID, so their serialized value never changes.
+    """
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    if isinstance(value, (Node, Group, Computer)):
+        return value.is_stored
+    return type(value) in _IMMUTABLE_TYPES
@@ -27,10 +27,12 @@ from aiida.common.lang import override
 from aiida.orm import Node, ProcessNode, WorkChainNode
 from aiida.orm.utils import load_node
 
+from ...persistence import CHECKPOINT_ENTRIES_KEY
 from ..exit_code import ExitCode
 from ..process import Process, ProcessState
 from ..process_spec import ProcessSpec
 from .awaitable import Awaitable, AwaitableAction, AwaitableTarget, construct_awaitable
+from .context import TrackedContext
 
 if t.TYPE_CHECKING:
     from aiida.engine.runners import Runner
@@ -105,6 +107,8 @@ class WorkChain(Process, metaclass=Protect):
     _spec_class = WorkChainSpec
     _STEPPER_STATE = 'stepper_state'
     _CONTEXT = 'CONTEXT'
+    # The keys of the context are stored as separate checkpoint entries, such that only the changed keys are written
+    _CONTEXT_SERIALIZED = CHECKPOINT_ENTRIES_KEY
 
     def __init__(
         self,
@@ -130,7 +134,7 @@ class WorkChain(Process, metaclass=Protect):
 
         self._stepper: Stepper | None = None
         self._awaitables: list[Awaitable] = []
-        self._context = AttributeDict()
+        self._context = TrackedContext()
 
     @classmethod
     def spec(cls) -> WorkChainSpec:
@@ -156,8 +160,8 @@ class WorkChain(Process, metaclass=Protect):
 
         """
         super().save_instance_state(out_state, save_context)
-        # Save the context
-        out_state[self._CONTEXT] = self.ctx
+        # Save the context, only serializing the keys that may have changed since the previous checkpoint
+        out_state[self._CONTEXT_SERIALIZED] = self._context.serialize()
 
         # Ask the stepper to save itself
         if self._stepper is not None:
@@ -166,8 +170,11 @@ class WorkChain(Process, metaclass=Protect):
     @override
     def load_instance_state(self, saved_state, load_context):
         super().load_instance_state(saved_state, load_context)
-        # Load the context
-        self._context = saved_state[self._CONTEXT]
+        # Load the context, which is saved in its entirety by older versions
+        if self._CONTEXT_SERIALIZED in saved_state:
+            self._context = TrackedContext.from_serialized(saved_state[self._CONTEXT_SERIALIZED])
+        else:
+            self._context = TrackedContext.from_mapping(saved_state[self._CONTEXT])
 
         # Recreate the stepper
         self._stepper = None
@@ -67,6 +67,7 @@ class Runner:
         communicator: Optional[kiwipy.Communicator] = None,
         broker_submit: bool = False,
         persister: Optional[Persister] = None,
+        job_states_cache: Optional[manager.JobStatesCache] = None,
     ):
         """Construct a new runner.
 
@@ -75,6 +76,7 @@ class Runner:
         :param communicator: the communicator to use
         :param broker_submit: if True, processes will be submitted to the broker, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
+        :param job_states_cache: optional cache to share the job states polled from schedulers with other runners
 
         """
         assert not (
@@ -86,7 +88,7 @@ class Runner:
         self._poll_interval = poll_interval
         self._broker_submit = broker_submit
         self._transport = transports.TransportQueue(self._loop)
-        self._job_manager = manager.JobManager(self._transport)
+        self._job_manager = manager.JobManager(self._transport, job_states_cache)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
 
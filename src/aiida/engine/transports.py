@@ -29,6 +29,7 @@ class TransportRequest:
     def __init__(self):
         super().__init__()
         self.future: asyncio.Future = asyncio.Future()
+        self.open_task: Optional[asyncio.Task] = None
         self.count = 0
 
 
@@ -78,28 +79,54 @@ class TransportQueue:
             transport = authinfo.get_transport()
             safe_open_interval = transport.get_safe_open_interval()
 
-            def do_open():
+            async def do_open():
                 """Actually open the transport"""
                 if transport_request.count > 0:
-                    # The user still wants the transport so open it
+                    # The user still wants the transport so open it. This is done asynchronously, such that connecting
+                    # to a slow remote does not block the event loop.
                     _LOGGER.debug('Transport request opening transport for %s', authinfo)
+                    opening = asyncio.ensure_future(transport.open_async())
                     try:
-                        transport.open()
+                        await asyncio.shield(opening)
+                    except asyncio.CancelledError:
+                        # All users gave up on the transport while it was being opened. Opening cannot necessarily be
+                        # interrupted, for example if it is performed in a worker thread, so close it once it is open
+                        opening.add_done_callback(close_opened)
+                        raise
                     except Exception as exception:
                         _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
                         transport_request.future.set_exception(exception)
 
-                        # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.pk, None)
+                        # Cleanup of the stale TransportRequest with the excepted transport future, unless it was
+                        # already replaced by a new request while the transport was being opened
+                        if self._transport_requests.get(authinfo.pk, None) is transport_request:
+                            self._transport_requests.pop(authinfo.pk, None)
                     else:
-                        transport_request.future.set_result(transport)
+                        if transport_request.count == 0:
+                            # All users gave up on the transport while it was being opened, so close it straight away
+                            _LOGGER.debug('Transport request closing transport for %s', authinfo)
+                            transport.close()
+                        else:
+                            transport_request.future.set_result(transport)
+
+            def close_opened(opening: asyncio.Future):
+                """Close the transport if it was opened successfully."""
+                if not opening.cancelled() and opening.exception() is None:
+                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
+                    transport.close()
+
+            def create_open_task():
+                """Create the task that opens the transport, keeping a reference such that it can be cancelled."""
+                transport_request.open_task = self._loop.create_task(do_open())
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
             # Note: Don't pass the Process context, since (a) it is not needed by `do_open` and (b) the transport is
             # passed around to many places, including outside aiida-core (e.g. paramiko). Anyone keeping a reference
             # to this handle would otherwise keep the Process context (and thus the process itself) in memory.
             # See https://github.com/aiidateam/aiida-core/issues/4698
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open, context=contextvars.Context())
+            open_callback_handle = self._loop.call_later(
+                safe_open_interval, create_open_task, context=contextvars.Context()
+            )
 
         try:
             transport_request.count += 1
@@ -120,7 +147,10 @@ class TransportQueue:
                 if transport_request.future.done():
                     _LOGGER.debug('Transport request closing transport for %s', authinfo)
                     transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    open_callback_handle.cancel()
+                else:
+                    if open_callback_handle is not None:
+                        open_callback_handle.cancel()
+                    if transport_request.open_task is not None:
+                        transport_request.open_task.cancel()
 
                 self._transport_requests.pop(authinfo.pk, None)
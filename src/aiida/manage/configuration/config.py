@@ -65,11 +65,26 @@ class ProfileOptionsSchema(BaseModel, defer_build=True):
         200, description='Maximum number of concurrent process tasks that each daemon worker can handle.'
     )
     daemon__recursion_limit: int = Field(3000, description='Maximum recursion depth for the daemon workers.')
+    daemon__shared_job_states: bool = Field(
+        True,
+        description='Share the job states polled from the scheduler between the daemon workers of the profile, such '
+        'that the scheduler of a computer is polled at most once per minimum job poll interval for all workers.',
+    )
     db__batch_size: int = Field(
         100000,
         description='Batch size for bulk CREATE operations in the database. Avoids hitting MaxAllocSize of PostgreSQL '
         '(1GB) when creating large numbers of database records in one go.',
     )
+    db__query_cache_size: int = Field(
+        0,
+        description='Maximum number of query results cached by the storage backend, a value of 0 disables the cache. '
+        'Cached results are invalidated by writes of the current process, but writes of other processes, such as '
+        'daemon workers, are only reflected once the results expire.',
+    )
+    db__query_cache_ttl: float = Field(
+        60.0,
+        description='Number of seconds after which the query results cached by the storage backend expire.',
+    )
     verdi__shell__auto_import: str = Field(
         ':',
         description='Additional modules/functions/classes to be automatically loaded in `verdi shell`, split by `:`.',
@@ -119,6 +134,11 @@ class ProfileOptionsSchema(BaseModel, defer_build=True):
     storage__sandbox: Optional[str] = Field(
         None, description='Absolute path to the directory to store sandbox folders.'
     )
+    storage__identity_map_size: int = Field(
+        100,
+        description='Number of the most recently loaded immutable nodes that are kept alive by the identity map of '
+        '`load_node`, per thread. Nodes that are still referenced elsewhere are returned from the map regardless.',
+    )
     caching__default_enabled: bool = Field(False, description='Enable calculation caching by default.')
     caching__enabled_for: List[str] = Field([], description='Calculation entry points to enable caching on.')
     caching__disabled_for: List[str] = Field([], description='Calculation entry points to disable caching on.')
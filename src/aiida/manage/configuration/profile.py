@@ -252,5 +252,6 @@ class Profile:
             'daemon': {
                 'log': str(DAEMON_LOG_DIR / f'aiida-{self.name}.log'),
                 'pid': str(DAEMON_DIR / f'aiida-{self.name}.pid'),
+                'job_states': str(DAEMON_DIR / f'aiida-{self.name}.job_states.sqlite'),
             },
         }
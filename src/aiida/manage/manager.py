@@ -435,9 +435,17 @@ class Manager:
         from plumpy.persistence import LoadSaveContext
 
         from aiida.engine import persistence
+        from aiida.engine.processes.calcjobs.manager import JobStatesCache
         from aiida.engine.processes.launcher import ProcessLauncher
 
-        runner = self.create_runner(broker_submit=True, loop=loop)
+        profile = self.get_profile()
+        settings: dict[str, Any] = {'broker_submit': True, 'loop': loop}
+
+        # Share the job states polled from the schedulers between all daemon workers of the profile
+        if profile is not None and self.get_option('daemon.shared_job_states'):
+            settings['job_states_cache'] = JobStatesCache(profile.filepaths['daemon']['job_states'])
+
+        runner = self.create_runner(**settings)
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
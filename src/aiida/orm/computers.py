@@ -475,6 +475,49 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
         type_check(val, bool)
         self.set_property('use_double_quotes', val)
 
+    def get_bulk_retrieve(self) -> bool:
+        """Return whether the files of completed calculation jobs on this computer should be retrieved in bulk.
+
+        In bulk mode, all the patterns of the retrieve list are resolved with a single remote command and the matching
+        files are packed in a single tar archive on the remote, which is then transferred in one go. This drastically
+        reduces the number of round trips for jobs that retrieve many small files, but requires ``bash`` and ``tar`` to
+        be available on the remote.
+
+        :returns: True if files should be retrieved in bulk, False otherwise which is also the default.
+        """
+        return self.get_property('bulk_retrieve', False)
+
+    def set_bulk_retrieve(self, val: bool) -> None:
+        """Set whether the files of completed calculation jobs on this computer should be retrieved in bulk.
+
+        :param val: True if files should be retrieved in bulk, False to retrieve them one by one.
+        """
+        from aiida.common.lang import type_check
+
+        type_check(val, bool)
+        self.set_property('bulk_retrieve', val)
+
+    def get_bulk_upload(self) -> bool:
+        """Return whether the input files of calculation jobs on this computer should be uploaded in bulk.
+
+        In bulk mode, the files of portable codes, the sandbox folder and the ``local_copy_list`` are packed in a single
+        tar archive that is streamed to the remote and unpacked there by a single command. This requires ``tar`` to be
+        available on the remote.
+
+        :returns: True if files should be uploaded in bulk, False otherwise which is also the default.
+        """
+        return self.get_property('bulk_upload', False)
+
+    def set_bulk_upload(self, val: bool) -> None:
+        """Set whether the input files of calculation jobs on this computer should be uploaded in bulk.
+
+        :param val: True if files should be uploaded in bulk, False to upload them one by one.
+        """
+        from aiida.common.lang import type_check
+
+        type_check(val, bool)
+        self.set_property('bulk_upload', val)
+
     def get_mpirun_command(self) -> List[str]:
         """Return the mpirun command. Must be a list of strings, that will be
         then joined with spaces when submitting.
@@ -10,7 +10,7 @@
 
 import abc
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from .entities import BackendCollection, BackendEntity, BackendEntityExtrasMixin
 
@@ -312,6 +312,25 @@ class BackendNode(BackendEntity, BackendEntityExtrasMixin, metaclass=abc.ABCMeta
         :return: an iterator with attribute keys
         """
 
+    def get_checkpoint_entries(self) -> Dict[str, bytes]:
+        """Return the checkpoint entries of the node, which are stored separately from its attributes.
+
+        :return: mapping of the keys of the entries onto their serialized values
+        :raises NotImplementedError: if the backend does not store checkpoint entries separately, in which case they
+            are stored in the checkpoint attribute.
+        """
+        raise NotImplementedError
+
+    def update_checkpoint_entries(self, entries: Dict[str, bytes], keys: Iterable[str]) -> None:
+        """Update the checkpoint entries of the node in a single transaction.
+
+        :param entries: mapping of the keys of the entries that were added or changed onto their serialized values
+        :param keys: the keys of all current entries, any other stored entry is deleted
+        :raises NotImplementedError: if the backend does not store checkpoint entries separately, in which case they
+            are stored in the checkpoint attribute.
+        """
+        raise NotImplementedError
+
 
 class BackendNodeCollection(BackendCollection[BackendNode]):
     """The collection of `BackendNode` entries."""
@@ -331,3 +350,44 @@ class BackendNodeCollection(BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    def bulk_store(
+        self,
+        nodes: Sequence[BackendNode],
+        links: Optional[Sequence[Sequence['LinkTriple']]] = None,
+        clean: bool = True,
+    ) -> None:
+        """Store multiple nodes, and their incoming links, in the database.
+
+        Links may have source nodes that are themselves part of ``nodes``. The base implementation stores the nodes one
+        by one. Implementations should override it to store all nodes and links in a single transaction.
+
+        :param nodes: the unstored nodes to store
+        :param links: optional sequence with, for each node, the incoming links to add
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :raises `aiida.common.IntegrityError`: if a database integrity error is raised while storing
+        """
+        node_links = links if links is not None else [[] for _ in nodes]
+
+        if len(node_links) != len(nodes):
+            raise ValueError('the number of links entries does not match the number of nodes')
+
+        for node, incoming in zip(nodes, node_links):
+            node.store(incoming, clean=clean)
+
+    def iter_by_hash(
+        self, node_type: str, node_hash: str, hash_key: str, valid_cache_key: str
+    ) -> Iterator[BackendNode]:
+        """Return an iterator over the nodes of the given type whose hash extra equals the given hash.
+
+        Nodes for which the ``valid_cache_key`` extra is explicitly set to ``False`` are excluded. Implementations
+        should perform this lookup through an index rather than a scan of the extras of all nodes.
+
+        :param node_type: the exact node type of the nodes to match
+        :param node_hash: the hash to match
+        :param hash_key: the key of the extra that stores the hash of a node
+        :param valid_cache_key: the key of the extra that marks a node as (in)valid for caching
+        :raises NotImplementedError: if the backend does not provide a dedicated lookup, in which case the caller should
+            fall back to a ``QueryBuilder`` query on the extras.
+        """
+        raise NotImplementedError
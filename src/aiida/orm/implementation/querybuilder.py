@@ -108,12 +108,22 @@ class BackendQueryBuilder(abc.ABC):
         """
 
     @abc.abstractmethod
-    def iterall(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[List[Any]]:
-        """Return an iterator over all the results of a list of lists."""
+    def iterall(self, data: QueryDictType, batch_size: Optional[int], stream: bool = False) -> Iterable[List[Any]]:
+        """Return an iterator over all the results of a list of lists.
+
+        :param stream: If True, stream the results from the database with bounded memory, independently of the
+            transaction of the storage backend, if the backend supports it.
+        """
 
     @abc.abstractmethod
-    def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
-        """Return an iterator over all the results of a list of dictionaries."""
+    def iterdict(
+        self, data: QueryDictType, batch_size: Optional[int], stream: bool = False
+    ) -> Iterable[Dict[str, Dict[str, Any]]]:
+        """Return an iterator over all the results of a list of dictionaries.
+
+        :param stream: If True, stream the results from the database with bounded memory, independently of the
+            transaction of the storage backend, if the backend supports it.
+        """
 
     def as_sql(self, data: QueryDictType, inline: bool = False) -> str:
         """Convert the query to an SQL string representation.
@@ -11,9 +11,10 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Any, ContextManager, List, Optional, Sequence, TypeVar, Union
+from typing import TYPE_CHECKING, Any, ContextManager, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 if TYPE_CHECKING:
+    from aiida.common.links import LinkType
     from aiida.manage.configuration.profile import Profile
     from aiida.orm.autogroup import AutogroupManager
     from aiida.orm.entities import EntityTypes
@@ -28,6 +29,8 @@ if TYPE_CHECKING:
         BackendUserCollection,
     )
     from aiida.orm.users import User
+    from aiida.orm.utils.identity_map import NodeIdentityMap
+    from aiida.orm.utils.links import LinkQuadruple
     from aiida.repository.backend.abstract import AbstractRepositoryBackend
 
 __all__ = ('StorageBackend',)
@@ -102,11 +105,14 @@ class StorageBackend(abc.ABC):
             if the profile's storage schema is not at the latest version (and thus should be migrated)
         :raises: :raises: :class:`aiida.common.exceptions.CorruptStorage` if the storage is internally inconsistent
         """
+        from aiida.manage import get_config_option
         from aiida.orm.autogroup import AutogroupManager
+        from aiida.orm.utils.identity_map import NodeIdentityMap
 
         self._profile = profile
         self._default_user: Optional['User'] = None
         self._autogroup = AutogroupManager(self)
+        self._node_identity_map = NodeIdentityMap(get_config_option('storage.identity_map_size'))
 
     @abc.abstractmethod
     def __str__(self) -> str:
@@ -122,6 +128,11 @@ class StorageBackend(abc.ABC):
         """Return the autogroup manager for this backend."""
         return self._autogroup
 
+    @property
+    def node_identity_map(self) -> 'NodeIdentityMap':
+        """Return the identity map of the immutable nodes loaded from this backend."""
+        return self._node_identity_map
+
     def version(self) -> str:
         """Return the schema version of the profile's storage."""
         version = self.version_profile(self.profile)
@@ -147,6 +158,7 @@ class StorageBackend(abc.ABC):
 
         self.reset_default_user()
         self._autogroup = AutogroupManager(self)
+        self._node_identity_map.clear()
 
     def reset_default_user(self) -> None:
         """Reset the default user.
@@ -263,6 +275,29 @@ class StorageBackend(abc.ABC):
         :raises: ``AssertionError`` if a transaction is not active
         """
 
+    def traverse_graph(
+        self,
+        starting_pks: Iterable[int],
+        links_forward: Iterable['LinkType'] = (),
+        links_backward: Iterable['LinkType'] = (),
+        get_links: bool = False,
+    ) -> Tuple[Set[int], Optional[Set['LinkQuadruple']]]:
+        """Return the nodes that can be reached from the starting nodes by traversing links of the given types.
+
+        Storage backends can implement this method to compute the closure in the database, for example with a recursive
+        query, instead of walking the graph with one query per step. Otherwise the graph is walked with the
+        ``QueryBuilder`` by :func:`aiida.tools.graph.graph_traversers.traverse_graph`.
+
+        :param starting_pks: the pks of the starting nodes, pks of nodes that do not exist are ignored.
+        :param links_forward: the types of the links to traverse from their input to their output node.
+        :param links_backward: the types of the links to traverse from their output to their input node.
+        :param get_links: whether to also return the traversed links.
+        :returns: the pks of the reached nodes, including the starting nodes, and the traversed links if ``get_links``
+            is ``True``, otherwise ``None``.
+        :raises NotImplementedError: if the storage backend does not support traversing the graph.
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def get_repository(self) -> 'AbstractRepositoryBackend':
         """Return the object repository configured for this backend."""
@@ -66,6 +66,7 @@ __all__ = (
     'find_bandgap',
     'has_pycifrw',
     'pycifrw_from_cif',
+    'store_many',
     'to_aiida_type',
 )
 
@@ -9,6 +9,7 @@ from aiida.common.hashing import make_hash
 from aiida.common.lang import type_check
 from aiida.common.warnings import warn_deprecation
 
+from ..entities import from_backend_entity
 from ..querybuilder import QueryBuilder
 
 if t.TYPE_CHECKING:
@@ -26,6 +27,7 @@ class NodeCaching:
     def __init__(self, node: 'Node') -> None:
         """Initialize the caching interface."""
         self._node = node
+        self._hash: str | None = None
 
     def compute_hash(self, ignore_errors: bool = True, **kwargs: t.Any) -> str | None:
         """Return the computed hash for this node based on its attributes.
@@ -42,10 +44,17 @@ class NodeCaching:
 
         This will always work, even before storing.
 
+        The objects that are hashed cannot change once the node is stored, so the hash is memoized once the node is
+        stored. The hash that is computed while storing, i.e. after the attributes have been cleaned, is also reused.
+        It is reset by :meth:`aiida.orm.nodes.node.Node.store` since the node may have been mutated before that.
+
         :param ignore_errors: return ``None`` on ``aiida.common.exceptions.HashingError`` (logging the exception)
         """
+        if self._hash is not None and self._node.is_stored and not kwargs:
+            return self._hash
+
         try:
-            return make_hash(self.get_objects_to_hash(), **kwargs)
+            node_hash = make_hash(self.get_objects_to_hash(), **kwargs)
         except exceptions.HashingError:
             if not ignore_errors:
                 raise
@@ -53,6 +62,11 @@ class NodeCaching:
                 self._node.logger.exception('Node hashing failed')
             return None
 
+        if not kwargs:
+            self._hash = node_hash
+
+        return node_hash
+
     def _get_objects_to_hash(self) -> list[t.Any]:
         warn_deprecation(
             '`NodeCaching._get_objects_to_hash` is deprecated, use `NodeCaching.get_objects_to_hash` instead', version=3
@@ -90,6 +104,10 @@ class NodeCaching:
         """Sets the stored hash of the Node to None."""
         self._node.base.extras.set(self._HASH_EXTRA_KEY, None)
 
+    def _reset_hash(self) -> None:
+        """Reset the memoized hash, such that it is computed again the next time it is requested."""
+        self._hash = None
+
     def get_cache_source(self) -> str | None:
         """Return the UUID of the node that was used in creating this node from the cache, or None if it was not cached.
 
@@ -155,14 +173,26 @@ class NodeCaching:
         if not node_hash or not self._node._cachable:
             return iter(())
 
-        builder = QueryBuilder(backend=self._node.backend)
-        builder.append(self._node.__class__, filters={f'extras.{self._HASH_EXTRA_KEY}': node_hash}, subclassing=False)
+        return (node for node in self._iter_nodes_with_hash(node_hash) if node.base.caching.is_valid_cache)
 
-        return (
-            node
-            for (node,) in builder.iterall()
-            if node.base.caching.is_valid_cache  # type: ignore[misc,union-attr]
-        )
+    def _iter_nodes_with_hash(self, node_hash: str) -> t.Iterator['Node']:
+        """Return an iterator over the stored nodes of the same class as this node with the given hash.
+
+        The lookup is delegated to the storage backend, which can use an index on the hash. Backends that do not
+        implement it fall back to filtering on the extras with the ``QueryBuilder``.
+        """
+        try:
+            backend_nodes = self._node.backend.nodes.iter_by_hash(
+                self._node.class_node_type, node_hash, self._HASH_EXTRA_KEY, self._VALID_CACHE_KEY
+            )
+        except NotImplementedError:
+            builder = QueryBuilder(backend=self._node.backend)
+            builder.append(
+                self._node.__class__, filters={f'extras.{self._HASH_EXTRA_KEY}': node_hash}, subclassing=False
+            )
+            return (node for (node,) in builder.iterall())  # type: ignore[misc]
+
+        return (from_backend_entity(self._node.__class__, backend_node) for backend_node in backend_nodes)
 
     @property
     def is_valid_cache(self) -> bool:
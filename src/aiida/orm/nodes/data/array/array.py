@@ -10,9 +10,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator
+import contextlib
+from collections import OrderedDict
+from typing import Any, BinaryIO, Iterator
 
-from numpy import ndarray
+from numpy import dtype, ndarray
 
 from ..base import to_aiida_type
 from ..data import Data
@@ -36,14 +38,22 @@ class ArrayData(Data):
         :py:meth:`.get_array` call, the array will be re-read from disk.
         If instead the ArrayData node has already been stored,
         the array is cached in memory after the first read, and the cached array
-        is used thereafter.
+        is used thereafter. The cache holds at most ``array_cache_max_bytes`` bytes,
+        evicting the least recently used arrays first.
         If too much RAM memory is used, you can clear the
         cache with the :py:meth:`.clear_internal_cache` method.
 
+    :note: Arrays can be memory-mapped instead of loaded in memory, by passing
+        ``memory_map=True`` to :py:meth:`.get_array`, parts of an array can be read
+        with :py:meth:`.get_array_slice` and an array can be iterated over in chunks
+        with :py:meth:`.iter_array_chunks`. Large arrays can be written incrementally
+        with :py:meth:`.open_array_writer`.
+
     """
 
     array_prefix = 'array|'
     default_array_name = 'default'
+    array_cache_max_bytes = 256 * 1024**2
 
     def __init__(self, arrays: ndarray | dict[str, ndarray] | None = None, **kwargs):
         """Construct a new instance and set one or multiple numpy arrays.
@@ -53,7 +63,8 @@ class ArrayData(Data):
         import numpy
 
         super().__init__(**kwargs)
-        self._cached_arrays: dict[str, ndarray] = {}
+        self._cached_arrays: OrderedDict[str, ndarray] = OrderedDict()
+        self._cached_arrays_nbytes = 0
 
         arrays = arrays if arrays is not None else {}
 
@@ -71,7 +82,8 @@ class ArrayData(Data):
 
     def initialize(self):
         super().initialize()
-        self._cached_arrays = {}
+        self._cached_arrays = OrderedDict()
+        self._cached_arrays_nbytes = 0
 
     def delete_array(self, name: str) -> None:
         """Delete an array from the node. Can only be called before storing.
@@ -120,12 +132,15 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name: str | None = None) -> ndarray:
+    def get_array(self, name: str | None = None, memory_map: bool = False) -> ndarray:
         """Return an array stored in the node
 
         :param name: The name of the array to return. The name can be omitted in case the node contains only a single
             array, which will be returned in that case. If ``name`` is ``None`` and the node contains multiple arrays or
             no arrays at all a ``ValueError`` is raised.
+        :param memory_map: If ``True``, return a read-only array that is memory-mapped from the file in the repository
+            instead of loading it in memory. If the repository does not allow the file to be memory-mapped, for example
+            because it is compressed, the array is loaded as usual.
         :raises ValueError: If ``name`` is ``None`` and the node contains more than one arrays or no arrays at all.
         """
         import numpy
@@ -152,14 +167,175 @@ class ArrayData(Data):
             with self.base.repository.open(filename, mode='rb') as handle:
                 return numpy.load(handle, allow_pickle=False)
 
+        if name in self._cached_arrays:
+            self._cached_arrays.move_to_end(name)
+            return self._cached_arrays[name]
+
+        if memory_map:
+            array = self._get_array_memory_map(name)
+            if array is not None:
+                return array
+
         # Return with proper caching if the node is stored, otherwise always re-read from disk
         if not self.is_stored:
             return get_array_from_file(self, name)
 
+        array = get_array_from_file(self, name)
+
+        if array.nbytes <= self.array_cache_max_bytes:
+            self._cached_arrays[name] = array
+            self._cached_arrays_nbytes += array.nbytes
+            while self._cached_arrays_nbytes > self.array_cache_max_bytes:
+                _, evicted = self._cached_arrays.popitem(last=False)
+                self._cached_arrays_nbytes -= evicted.nbytes
+
+        return array
+
+    def get_array_slice(self, name: str, index: Any) -> Any:
+        """Return part of an array stored in the node, without loading the entire array in memory if possible.
+
+        If the array is not cached, it is memory-mapped from the repository if possible. Otherwise, if ``index`` is an
+        integer, only the corresponding entry along the first axis is read from the file. For any other index the
+        entire array is loaded through :py:meth:`.get_array`.
+
+        :param name: The name of the array.
+        :param index: Any index that is valid for the array, for example an integer to select one entry along the first
+            axis.
+        :return: The indexed part of the array, which is a copy that does not reference the file in the repository.
+        :raises KeyError: If the array does not exist.
+        :raises IndexError: If the index is out of bounds.
+        """
+        import numbers
+
+        import numpy
+
         if name not in self._cached_arrays:
-            self._cached_arrays[name] = get_array_from_file(self, name)
+            array = self._get_array_memory_map(name)
+
+            if array is None and isinstance(index, numbers.Integral):
+                result = self._read_array_entry(name, int(index))
+                if result is not None:
+                    return result
+
+            if array is not None:
+                result = array[index]
+                return numpy.array(result) if isinstance(result, ndarray) else result
+
+        return self.get_array(name)[index]
+
+    def _get_array_memory_map(self, name: str) -> ndarray | None:
+        """Return the array memory-mapped read-only from the file in the repository.
+
+        :param name: The name of the array.
+        :return: The memory-mapped array or ``None`` if the file cannot be memory-mapped.
+        :raises KeyError: If the array does not exist.
+        """
+        import numpy
+
+        location = self.base.repository.get_object_location(self._get_array_filename(name))
+
+        if location is None:
+            return None
+
+        filepath, offset = location
+
+        with filepath.open('rb') as handle:
+            handle.seek(offset)
+            header = read_array_header(handle)
+            data_offset = handle.tell()
+
+        if header is None:
+            return None
+
+        shape, fortran_order, array_dtype = header
+
+        # A memory map of zero bytes is not allowed
+        if array_dtype.itemsize == 0 or 0 in shape:
+            return None
+
+        return numpy.memmap(
+            filepath, dtype=array_dtype, mode='r', offset=data_offset, shape=shape, order='F' if fortran_order else 'C'
+        )
+
+    def _read_array_entry(self, name: str, index: int) -> Any:
+        """Return a single entry along the first axis of an array, reading only that entry from the repository.
+
+        :param name: The name of the array.
+        :param index: The index along the first axis.
+        :return: The entry or ``None`` if it cannot be read separately, for example for an array in Fortran order.
+        :raises KeyError: If the array does not exist.
+        :raises IndexError: If the index is out of bounds.
+        """
+        import math
+
+        import numpy
 
-        return self._cached_arrays[name]
+        with self.base.repository.open(self._get_array_filename(name), mode='rb') as handle:
+            header = read_array_header(handle)
+
+            if header is None or header[1] or not header[0]:
+                return None
+
+            shape, _, array_dtype = header
+
+            if not -shape[0] <= index < shape[0]:
+                raise IndexError(f'index {index} is out of bounds for axis 0 with size {shape[0]}')
+
+            count = math.prod(shape[1:])
+            handle.seek(handle.tell() + (index % shape[0]) * count * array_dtype.itemsize)
+            entry = numpy.frombuffer(handle.read(count * array_dtype.itemsize), dtype=array_dtype, count=count)
+
+        return entry.reshape(shape[1:]).copy()[()]
+
+    def iter_array_chunks(self, name: str, chunk_size: int) -> Iterator[ndarray]:
+        """Iterate over consecutive chunks of an array along its first axis, reading a single chunk at a time.
+
+        :param name: The name of the array.
+        :param chunk_size: The maximum number of entries along the first axis of each chunk.
+        :raises KeyError: If the array does not exist.
+        :raises ValueError: If ``chunk_size`` is not positive or the array has no dimensions.
+        """
+        import math
+
+        import numpy
+
+        if chunk_size < 1:
+            raise ValueError(f'`chunk_size` should be a positive integer but got: {chunk_size}')
+
+        with self.base.repository.open(self._get_array_filename(name), mode='rb') as handle:
+            header = read_array_header(handle)
+
+            if header is not None and not header[1] and header[0]:
+                shape, _, array_dtype = header
+                count = math.prod(shape[1:])
+
+                for start in range(0, shape[0], chunk_size):
+                    length = min(chunk_size, shape[0] - start)
+                    chunk = numpy.frombuffer(handle.read(length * count * array_dtype.itemsize), dtype=array_dtype)
+                    yield chunk.reshape((length, *shape[1:])).copy()
+
+                return
+
+        array = self.get_array(name, memory_map=True)
+
+        if not array.shape:
+            raise ValueError(f'Array with name `{name}` has no dimensions and cannot be iterated over.')
+
+        for start in range(0, array.shape[0], chunk_size):
+            yield numpy.array(array[start : start + chunk_size])
+
+    def _get_array_filename(self, name: str) -> str:
+        """Return the filename of an array in the repository.
+
+        :param name: The name of the array.
+        :raises KeyError: If the array does not exist.
+        """
+        filename = f'{name}.npy'
+
+        if filename not in self.base.repository.list_object_names():
+            raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
+
+        return filename
 
     def clear_internal_cache(self) -> None:
         """Clear the internal memory cache where the arrays are stored after being
@@ -168,7 +344,8 @@ class ArrayData(Data):
         This function is useful if you want to keep the node in memory, but you
         do not want to waste memory to cache the arrays in RAM.
         """
-        self._cached_arrays = {}
+        self._cached_arrays = OrderedDict()
+        self._cached_arrays_nbytes = 0
 
     def set_array(self, name: str, array: ndarray) -> None:
         """Store a new numpy array inside the node. Possibly overwrite the array
@@ -179,7 +356,6 @@ class ArrayData(Data):
         :param name: The name of the array.
         :param array: The numpy array to store.
         """
-        import re
         import tempfile
 
         import numpy
@@ -187,12 +363,7 @@ class ArrayData(Data):
         if not isinstance(array, numpy.ndarray):
             raise TypeError('ArrayData can only store numpy arrays. Convert the object to an array first')
 
-        # Check if the name is valid
-        if not name or re.sub('[0-9a-zA-Z_]', '', name):
-            raise ValueError(
-                'The name assigned to the array ({}) is not valid,'
-                'it can only contain digits, letters and underscores'
-            )
+        self._validate_array_name(name)
 
         # Write the array to a temporary file, and then add it to the repository of the node
         with tempfile.NamedTemporaryFile() as handle:
@@ -208,6 +379,63 @@ class ArrayData(Data):
         # Store the array name and shape for querying purposes
         self.base.attributes.set(f'{self.array_prefix}{name}', list(array.shape))
 
+    @contextlib.contextmanager
+    def open_array_writer(self, name: str, dtype: Any = None) -> Iterator['ArrayWriter']:
+        """Write a new array to the node incrementally along its first axis. Possibly overwrite the array if it already
+        existed.
+
+        The entries are written to a temporary file as they are added, so only the entries that are passed to the writer
+        at once need to be kept in memory. The array is added to the node when the context exits without an exception::
+
+            with node.open_array_writer('positions') as writer:
+                for frame in frames:
+                    writer.append(frame)
+
+        :param name: The name of the array.
+        :param dtype: The data type of the array. By default it is the data type of the first entries that are written.
+        :raises `~aiida.common.exceptions.ModificationNotAllowed`: If the node is stored.
+        :raises ValueError: If the name is not valid.
+        """
+        import pathlib
+        import tempfile
+
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('the node is stored and therefore its arrays are immutable.')
+
+        self._validate_array_name(name)
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = pathlib.Path(dirpath) / f'{name}.npy'
+
+            with filepath.open('wb') as handle:
+                writer = ArrayWriter(handle, dtype)
+                yield writer
+                writer.close()
+
+            self.base.repository.put_object_from_file(str(filepath), f'{name}.npy')
+
+        cached = self._cached_arrays.pop(name, None)
+        if cached is not None:
+            self._cached_arrays_nbytes -= cached.nbytes
+        self.base.attributes.set(f'{self.array_prefix}{name}', list(writer.shape))
+
+    @staticmethod
+    def _validate_array_name(name: str) -> None:
+        """Validate the name of an array.
+
+        :param name: The name of the array.
+        :raises ValueError: If the name is empty or contains characters other than digits, letters and underscores.
+        """
+        import re
+
+        if not name or re.sub('[0-9a-zA-Z_]', '', name):
+            raise ValueError(
+                'The name assigned to the array ({}) is not valid,'
+                'it can only contain digits, letters and underscores'
+            )
+
     def _validate(self) -> bool:
         """Check if the list of .npy files stored inside the node and the
         list of properties match. Just a name check, no check on the size
@@ -255,6 +483,148 @@ class ArrayData(Data):
         return json.dumps(json_dict).encode('utf-8'), {}
 
 
+class ArrayWriter:
+    """Writer of an array in ``.npy`` format to a byte stream, incrementally along the first axis of the array.
+
+    The shape of the entries along the first axis and the data type of the array are defined by the first entries that
+    are written, unless the data type is defined explicitly. Since the final shape is only known once all entries are
+    written, space for the header is reserved at the start of the stream, and the header is written by :meth:`close`.
+    """
+
+    # The number of digits reserved in the header for the length of the first axis
+    _max_length_digits = 20
+
+    def __init__(self, handle: BinaryIO, dtype: Any = None):
+        """Construct a new instance.
+
+        :param handle: the seekable byte stream to write to.
+        :param dtype: the data type of the array, by default the data type of the first entries that are written.
+        """
+        import numpy
+
+        self._handle = handle
+        self._dtype = None if dtype is None else numpy.dtype(dtype)
+        self._entry_shape: tuple[int, ...] | None = None
+        self._length = 0
+        self._header_size = 0
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Return the shape of the array that has been written so far."""
+        if self._entry_shape is None:
+            return (0,)
+        return (self._length, *self._entry_shape)
+
+    def append(self, entry: Any) -> None:
+        """Append a single entry along the first axis of the array.
+
+        :param entry: an array, or an object that can be converted to an array, with the shape of a single entry.
+        :raises TypeError: if the data type of the entry cannot be safely cast to the data type of the array.
+        :raises ValueError: if the shape of the entry does not match the shape of the previous entries.
+        """
+        import numpy
+
+        self.extend(numpy.expand_dims(numpy.asarray(entry), 0))
+
+    def extend(self, entries: Any) -> None:
+        """Append multiple entries along the first axis of the array.
+
+        :param entries: an array, or an object that can be converted to an array, where each element along the first
+            axis is an entry.
+        :raises TypeError: if the data type of the entries cannot be safely cast to the data type of the array.
+        :raises ValueError: if the shape of the entries does not match the shape of the previous entries.
+        """
+        import numpy
+
+        entries = numpy.asarray(entries)
+
+        if not entries.shape:
+            raise ValueError('`entries` should have at least one dimension.')
+
+        if self._dtype is not None and not numpy.can_cast(entries.dtype, self._dtype, casting='same_kind'):
+            raise TypeError(f'cannot cast entries of type {entries.dtype} to the array type {self._dtype}.')
+
+        if self._entry_shape is None:
+            self._dtype = self._dtype or entries.dtype
+
+            if self._dtype.hasobject:
+                raise TypeError('ArrayData cannot store arrays of Python objects.')
+
+            self._entry_shape = entries.shape[1:]
+            self._handle.write(self._get_header((10**self._max_length_digits - 1, *self._entry_shape)))
+            self._header_size = self._handle.tell()
+
+        elif entries.shape[1:] != self._entry_shape:
+            raise ValueError(f'entries should have shape (n, {self._entry_shape}) but got: {entries.shape}')
+
+        self._handle.write(numpy.ascontiguousarray(entries, dtype=self._dtype).tobytes())
+        self._length += entries.shape[0]
+
+    def close(self) -> None:
+        """Write the header with the final shape of the array.
+
+        If no entries were written, an empty one-dimensional array is written.
+        """
+        import numpy
+
+        if self._entry_shape is None:
+            numpy.save(self._handle, numpy.empty((0,), dtype=self._dtype), allow_pickle=False)
+            return
+
+        self._handle.seek(0)
+        self._handle.write(self._get_header(self.shape, self._header_size))
+        self._handle.seek(0, 2)
+
+    def _get_header(self, shape: tuple[int, ...], size: int | None = None) -> bytes:
+        """Return the ``.npy`` header of an array with the given shape in C order and the data type of this writer.
+
+        :param shape: the shape of the array.
+        :param size: if specified, pad the header with spaces such that it has this size in bytes.
+        """
+        import io
+        import struct
+
+        from numpy.lib import format as npy_format
+
+        stream = io.BytesIO()
+        header = {'descr': npy_format.dtype_to_descr(self._dtype), 'fortran_order': False, 'shape': shape}
+        npy_format.write_array_header_1_0(stream, header)
+        content = stream.getvalue()
+
+        if size is None:
+            return content
+
+        # The header consists of the magic string, the version, the length of the header dictionary as a little-endian
+        # unsigned short, and the header dictionary itself, which is terminated by a newline and can be padded by spaces
+        padding = b' ' * (size - len(content))
+        return content[:8] + struct.pack('<H', size - 10) + content[10:-1] + padding + b'\n'
+
+
+def read_array_header(handle: BinaryIO) -> tuple[tuple[int, ...], bool, dtype] | None:
+    """Read the header of an array in ``.npy`` format from the current position of a byte stream.
+
+    After this call the stream is positioned at the start of the array data.
+
+    :param handle: the byte stream.
+    :return: tuple of the shape, whether the array is in Fortran order and the data type, or ``None`` if the format
+        version is not supported or the array contains Python objects.
+    """
+    from numpy.lib import format as npy_format
+
+    readers = {(1, 0): npy_format.read_array_header_1_0, (2, 0): npy_format.read_array_header_2_0}
+    version = npy_format.read_magic(handle)
+
+    if version not in readers:
+        return None
+
+    shape, fortran_order, array_dtype = readers[version](handle)
+
+    if array_dtype.hasobject:
+        return None
+
+    return shape, fortran_order, array_dtype
+
+
 def clean_array(array: ndarray) -> list:
     """Replacing np.nan and np.inf/-np.inf for Nones.
 
@@ -9,11 +9,12 @@
 """AiiDA class to deal with crystal structure trajectories."""
 
 import collections.abc
-from typing import List
+import contextlib
+from typing import Iterator, List
 
 from aiida.orm.fields import add_field
 
-from .array import ArrayData
+from .array import ArrayData, ArrayWriter
 
 __all__ = ('TrajectoryData',)
 
@@ -182,6 +183,46 @@ class TrajectoryData(ArrayData):
             except KeyError:
                 pass
 
+    @contextlib.contextmanager
+    def open_trajectory_writer(self, symbols) -> Iterator['TrajectoryWriter']:
+        """Write the whole trajectory step by step, for example while parsing the output of a long simulation.
+
+        The steps are written to temporary files as they are added, so they do not all need to be kept in memory. The
+        trajectory is set when the context exits without an exception, replacing any trajectory that was set before::
+
+            with trajectory.open_trajectory_writer(symbols) as writer:
+                for positions, cell in frames:
+                    writer.append_step(positions, cell=cell)
+
+        The optional arrays that are passed for the first step, have to be passed for all steps. See
+        :py:meth:`.set_trajectory` for a description of the arrays.
+
+        :param symbols: string list with dimension ``n``, where ``n`` is the number of atoms (i.e., sites).
+        :raises ValueError: if no steps were written.
+        """
+        if not isinstance(symbols, collections.abc.Iterable):
+            raise TypeError('TrajectoryData.symbols must be of type list')
+        if any(not isinstance(i, str) for i in symbols):
+            raise TypeError('TrajectoryData.symbols must be a 1d list of strings')
+
+        symbols = list(symbols)
+
+        with contextlib.ExitStack() as stack:
+            writer = TrajectoryWriter(self, stack, len(symbols))
+            yield writer
+
+            if not writer.numsteps:
+                raise ValueError('no steps were written to the trajectory')
+
+        self.base.attributes.set('symbols', symbols)
+
+        for name in ('cells', 'times', 'velocities'):
+            if name not in writer.arraynames:
+                try:
+                    self.delete_array(name)
+                except KeyError:
+                    pass
+
     def set_structurelist(self, structurelist):
         """Create trajectory from the list of
         :py:class:`aiida.orm.nodes.data.structure.StructureData` instances.
@@ -211,14 +252,21 @@ class TrajectoryData(ArrayData):
         # check dimensions, types
         from aiida.common.exceptions import ValidationError
 
+        def get_array(name):
+            # Memory-map the arrays if possible, as the validation only needs their type and shape
+            try:
+                return self.get_array(name, memory_map=True)
+            except (AttributeError, KeyError):
+                return None
+
         try:
             self._internal_validate(
-                self.get_stepids(),
-                self.get_cells(),
+                self.get_array('steps', memory_map=True),
+                get_array('cells'),
                 self.symbols,
-                self.get_positions(),
-                self.get_times(),
-                self.get_velocities(),
+                self.get_array('positions', memory_map=True),
+                get_array('times'),
+                get_array('velocities'),
             )
         # Should catch TypeErrors, ValueErrors, and KeyErrors for missing arrays
         except Exception as exception:
@@ -340,18 +388,19 @@ class TrajectoryData(ArrayData):
         if index >= self.numsteps:
             raise IndexError(f'You have only {self.numsteps} steps, but you are looking beyond (index={index})')
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time = self.get_times()
-        if time is not None:
-            time = time[index]
-        cells = self.get_cells()
-        if cells is not None:
-            cell = cells[index, :, :]
-        else:
-            cell = None
-        return (self.get_stepids()[index], time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        # Only read the given step from each array, which avoids loading the entire trajectory in memory
+        arraynames = self.get_arraynames()
+        vel = self.get_array_slice('velocities', index) if 'velocities' in arraynames else None
+        time = self.get_array_slice('times', index) if 'times' in arraynames else None
+        cell = self.get_array_slice('cells', index) if 'cells' in arraynames else None
+        return (
+            self.get_array_slice('steps', index),
+            time,
+            cell,
+            self.symbols,
+            self.get_array_slice('positions', index),
+            vel,
+        )
 
     def get_step_structure(self, index, custom_kinds=None):
         """Return an AiiDA :py:class:`aiida.orm.nodes.data.structure.StructureData` node
@@ -883,3 +932,77 @@ def plot_positions_XYZ(  # noqa: N802
         yticks[0].label1.set_visible(False)
 
     plt.show(block=not dont_block)
+
+
+class TrajectoryWriter:
+    """Writer of the steps of a trajectory, see :py:meth:`TrajectoryData.open_trajectory_writer`."""
+
+    def __init__(self, node: TrajectoryData, stack: contextlib.ExitStack, numsites: int):
+        """Construct a new instance.
+
+        :param node: the trajectory to write.
+        :param stack: the exit stack to which the writers of the arrays are added.
+        :param numsites: the number of sites of the trajectory.
+        """
+        self._node = node
+        self._stack = stack
+        self._writers: dict[str, ArrayWriter] = {}
+        self._shapes = {
+            'steps': (),
+            'positions': (numsites, 3),
+            'cells': (3, 3),
+            'times': (),
+            'velocities': (numsites, 3),
+        }
+        self.numsteps = 0
+
+    @property
+    def arraynames(self) -> List[str]:
+        """Return the names of the arrays that are written."""
+        return list(self._writers)
+
+    def append_step(self, positions, stepid=None, cell=None, time=None, velocities=None) -> None:
+        r"""Append a step to the trajectory.
+
+        :param positions: float array with dimension :math:`n \times 3`.
+        :param stepid: the integer step id, by default the index of the step.
+        :param cell: if specified, float array with dimension :math:`3 \times 3`.
+        :param time: if specified, the float timestamp of the step.
+        :param velocities: if specified, float array with dimension :math:`n \times 3`.
+        :raises TypeError: if an array has the wrong type.
+        :raises ValueError: if an array has the wrong shape, or the optional arrays differ from those of the first step.
+        """
+        import numpy
+
+        arrays = {
+            'steps': self.numsteps if stepid is None else stepid,
+            'positions': positions,
+            'cells': cell,
+            'times': time,
+            'velocities': velocities,
+        }
+        arrays = {name: numpy.asarray(value) for name, value in arrays.items() if value is not None}
+
+        if self._writers and arrays.keys() != self._writers.keys():
+            raise ValueError(
+                f'step {self.numsteps} defines the arrays {sorted(arrays)} but the first step defined '
+                f'{sorted(self._writers)}'
+            )
+
+        for name, array in arrays.items():
+            if name == 'steps' and not numpy.issubdtype(array.dtype, numpy.integer):
+                raise TypeError('TrajectoryData.stepids must be integers')
+            if name != 'steps' and array.dtype.kind not in 'iuf':
+                raise TypeError(f'TrajectoryData.{name} must be floats')
+            if array.shape != self._shapes[name]:
+                raise ValueError(f'TrajectoryData.{name} of a step must have shape {self._shapes[name]}')
+
+        if not self._writers:
+            for name in arrays:
+                dtype = int if name == 'steps' else float
+                self._writers[name] = self._stack.enter_context(self._node.open_array_writer(name, dtype=dtype))
+
+        for name, array in arrays.items():
+            self._writers[name].append(array)
+
+        self.numsteps += 1
@@ -939,11 +939,13 @@ class StructureData(Data):
         except ValueError as exc:
             raise ValidationError(f'Unable to validate the sites: {exc}')
 
+        kind_names = set(counts)
+
         for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
+            if site.kind_name not in kind_names:
                 raise ValidationError(f'A site has kind {site.kind_name}, but no specie with that name exists')
 
-        kinds_without_sites = set(k.name for k in kinds) - set(s.kind_name for s in sites)
+        kinds_without_sites = kind_names - set(s.kind_name for s in sites)
         if kinds_without_sites:
             raise ValidationError(
                 f'The following kinds are defined, but there are no sites with that kind: {list(kinds_without_sites)}'
@@ -1193,9 +1195,7 @@ class StructureData(Data):
             initial order in which the atoms were appended by the user is
             used to group and/or order the symbols in the formula
         """
-        symbol_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
-
-        return get_formula(symbol_list, mode=mode, separator=separator)
+        return get_formula(self._get_site_symbols(), mode=mode, separator=separator)
 
     def get_site_kindnames(self):
         """Return a list with length equal to the number of sites of this structure,
@@ -1207,7 +1207,7 @@ class StructureData(Data):
 
         :return: a list of strings
         """
-        return [this_site.kind_name for this_site in self.sites]
+        return [site['kind_name'] for site in self._get_raw_sites()]
 
     def get_composition(self, mode='full'):
         """Returns the chemical composition of this structure as a dictionary,
@@ -1225,19 +1225,25 @@ class StructureData(Data):
         """
         import numpy as np
 
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
-        symbols_set = set(symbols_list)
+        kinds, kind_indices, _ = self._get_site_arrays()
+        counts: dict = {}
+
+        # Count the sites of each kind at once and add up the counts of kinds with the same symbols
+        for kind, count in zip(kinds, np.bincount(kind_indices, minlength=len(kinds)).tolist()):
+            if count:
+                symbol = kind.get_symbols_string()
+                counts[symbol] = counts.get(symbol, 0) + count
 
         if mode == 'full':
-            return {symbol: symbols_list.count(symbol) for symbol in symbols_set}
+            return counts
 
         if mode == 'reduced':
-            gcd = np.gcd.reduce([symbols_list.count(symbol) for symbol in symbols_set])
-            return {symbol: (symbols_list.count(symbol) / gcd) for symbol in symbols_set}
+            gcd = np.gcd.reduce(list(counts.values()))
+            return {symbol: (count / gcd) for symbol, count in counts.items()}
 
         if mode == 'fractional':
-            sum_comp = sum(symbols_list.count(symbol) for symbol in symbols_set)
-            return {symbol: symbols_list.count(symbol) / sum_comp for symbol in symbols_set}
+            sum_comp = sum(counts.values())
+            return {symbol: count / sum_comp for symbol, count in counts.items()}
 
         raise ValueError(f'mode `{mode}` is invalid, choose from `full`, `reduced` or `fractional`.')
 
@@ -1319,7 +1325,7 @@ class StructureData(Data):
 
         new_kind = Kind(kind=kind)  # So we make a copy
 
-        if kind.name in [k.name for k in self.kinds]:
+        if kind.name in [k['name'] for k in self.base.attributes.get('kinds', [])]:
             raise ValueError(f'A kind with the same name ({kind.name}) already exists.')
 
         # If here, no exceptions have been raised, so I add the site.
@@ -1344,10 +1350,10 @@ class StructureData(Data):
 
         new_site = Site(site=site)  # So we make a copy
 
-        if site.kind_name not in [kind.name for kind in self.kinds]:
-            raise ValueError(
-                f"No kind with name '{site.kind_name}', available kinds are: {[kind.name for kind in self.kinds]}"
-            )
+        kind_names = [kind['name'] for kind in self.base.attributes.get('kinds', [])]
+
+        if site.kind_name not in kind_names:
+            raise ValueError(f"No kind with name '{site.kind_name}', available kinds are: {kind_names}")
 
         # If here, no exceptions have been raised, so I add the site.
         self.base.attributes.all.setdefault('sites', []).append(new_site.get_raw())
@@ -1479,11 +1485,69 @@ class StructureData(Data):
     @property
     def sites(self):
         """Returns a list of sites."""
+        return [Site(raw=i) for i in self._get_raw_sites()]
+
+    def _get_raw_sites(self):
+        """Return the list of sites in the raw format in which they are stored in the attributes.
+
+        .. note:: while the node is unstored, this is a reference to the attribute, so it should not be modified. Once
+            stored, the sites are copied only once and cached, since they can no longer change.
+
+        :return: list of dictionaries with the kind name and the position of each site.
+        """
+        if not self.is_stored:
+            return self.base.attributes.get('sites', [])
+
         try:
-            raw_sites = self.base.attributes.get('sites')
+            return self._raw_sites_cache
         except AttributeError:
-            raw_sites = []
-        return [Site(raw=i) for i in raw_sites]
+            self._raw_sites_cache = self.base.attributes.get('sites', [])
+            return self._raw_sites_cache
+
+    def _get_site_arrays(self):
+        """Return the kinds and arrays with the kind index and the position of each site.
+
+        The arrays are computed from the raw sites at once, without creating a ``Site`` instance for each site, and they
+        are cached once the node is stored.
+
+        :return: tuple of the list of ``Kind`` instances, an integer array with the index in that list of the kind of
+            each site and a float array with shape (number of sites, 3) with the position of each site.
+        :raise ValueError: if a site has a kind name that does not exist.
+        """
+        import numpy as np
+
+        try:
+            return self._site_arrays_cache
+        except AttributeError:
+            pass
+
+        kinds = self.kinds
+        indices = {kind.name: index for index, kind in enumerate(kinds)}
+        raw_sites = self._get_raw_sites()
+
+        try:
+            kind_indices = np.fromiter(
+                (indices[site['kind_name']] for site in raw_sites), dtype=int, count=len(raw_sites)
+            )
+        except KeyError as exception:
+            raise ValueError(f"Kind name '{exception.args[0]}' unknown")
+
+        positions = np.array([site['position'] for site in raw_sites], dtype=float).reshape((len(raw_sites), 3))
+        site_arrays = (kinds, kind_indices, positions)
+
+        if self.is_stored:
+            self._site_arrays_cache = site_arrays
+
+        return site_arrays
+
+    def _get_site_symbols(self):
+        """Return a list with the symbols string of the kind of each site.
+
+        :return: a list of strings
+        """
+        kinds, kind_indices, _ = self._get_site_arrays()
+        symbols = [kind.get_symbols_string() for kind in kinds]
+        return [symbols[index] for index in kind_indices.tolist()]
 
     @property
     def kinds(self):
@@ -1592,30 +1656,34 @@ class StructureData(Data):
         if not conserve_particle:
             raise NotImplementedError
         else:
+            import numpy as np
+
             # test consistency of th enew input
-            n_sites = len(self.sites)
+            raw_sites = self._get_raw_sites()
+            n_sites = len(raw_sites)
             if n_sites != len(new_positions) and conserve_particle:
                 raise ValueError('the new positions should be as many as the previous structure.')
 
-            new_sites = []
-            for i in range(n_sites):
+            for this_pos in new_positions:
                 try:
-                    this_pos = [float(j) for j in new_positions[i]]
-                except ValueError:
-                    raise ValueError(f'Expecting a list of floats. Found instead {new_positions[i]}')
-
-                if len(this_pos) != 3:
-                    raise ValueError(f'Expecting a list of lists of length 3. found instead {len(this_pos)}')
-
-                # now append this Site to the new_site list.
-                new_site = Site(site=self.sites[i])  # So we make a copy
-                new_site.position = copy.deepcopy(this_pos)
-                new_sites.append(new_site)
-
-            # now clear the old sites, and substitute with the new ones
-            self.clear_sites()
-            for this_new_site in new_sites:
-                self.append_site(this_new_site)
+                    length = len(this_pos)
+                except TypeError:
+                    raise ValueError(f'Expecting a list of floats. Found instead {this_pos}')
+                if length != 3:
+                    raise ValueError(f'Expecting a list of lists of length 3. found instead {length}')
+
+            # Convert all the positions at once, which also validates that they are floats
+            try:
+                positions = np.array(new_positions, dtype=float).reshape((n_sites, 3))
+            except (TypeError, ValueError):
+                raise ValueError(f'Expecting a list of floats. Found instead {new_positions}')
+
+            # now substitute the old sites with the new ones, keeping their kinds
+            new_sites = [
+                {'position': tuple(position), 'kind_name': site['kind_name']}
+                for site, position in zip(raw_sites, positions.tolist())
+            ]
+            self.base.attributes.set('sites', new_sites)
 
     @property
     def pbc(self):
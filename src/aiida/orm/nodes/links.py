@@ -16,6 +16,9 @@ from ..utils.links import LinkManager, LinkTriple
 if t.TYPE_CHECKING:
     from .node import Node
 
+#: Link types that should not introduce a cycle in the provenance graph
+LINK_TYPES_ACYCLIC = (LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK)
+
 
 class NodeLinks:
     """Interface for links of a node instance."""
@@ -62,6 +65,66 @@ class NodeLinks:
         else:
             self._add_incoming_cache(source, link_type, link_label)
 
+    def add_outgoing_many(self, links: t.Sequence[tuple['Node', LinkType, str]]) -> None:
+        """Add multiple links of the given types from ourself to the given nodes.
+
+        This is equivalent to calling ``target.base.links.add_incoming(self._node, link_type, link_label)`` for each of
+        the links, but the links are validated with a fixed number of queries and the links between stored nodes are
+        inserted in a single transaction. Targets whose links interface overrides ``validate_incoming`` are additionally
+        validated one at a time. All links are validated before any of them is added, so if any link is invalid, none
+        of the links are added.
+
+        :param links: sequence of tuples of the target node, the link type and the link label
+        :raise TypeError: if a target is not a Node instance or a link type is not a `LinkType` enum
+        :raise ValueError: if any of the proposed links is invalid
+        """
+        from aiida.orm.entities import EntityTypes
+        from aiida.orm.utils.links import validate_links
+
+        for target, link_type, link_label in links:
+            if type(target.base.links).validate_incoming is not NodeLinks.validate_incoming:
+                target.base.links.validate_incoming(self._node, link_type, link_label)
+
+        validate_links([(self._node, target, link_type, link_label) for target, link_type, link_label in links])
+        self._validate_no_cycles([target for target, link_type, _ in links if link_type in LINK_TYPES_ACYCLIC])
+
+        for target, link_type, link_label in links:
+            self.validate_outgoing(target, link_type, link_label)
+
+        rows = []
+
+        for target, link_type, link_label in links:
+            if self._node.is_stored and target.is_stored:
+                rows.append(
+                    {'input_id': self._node.pk, 'output_id': target.pk, 'label': link_label, 'type': link_type.value}
+                )
+            else:
+                target.base.links._add_incoming_cache(self._node, link_type, link_label)
+
+        if rows:
+            self._node.backend.bulk_insert(EntityTypes.LINK, rows)
+
+    def _validate_no_cycles(self, targets: t.Sequence['Node']) -> None:
+        """Validate that links from ourself to the given nodes would not introduce a cycle in the graph.
+
+        :param targets: the nodes to which the links are going
+        :raise ValueError: if any of the proposed links would generate a cycle in the graph
+        """
+        from .node import Node
+
+        target_pks = [target.pk for target in targets if target.is_stored]
+
+        if not self._node.is_stored or not target_pks:
+            return
+
+        builder = (
+            QueryBuilder(backend=self._node.backend)
+            .append(Node, filters={'id': {'in': target_pks}}, tag='parent')
+            .append(Node, filters={'id': self._node.pk}, tag='child', with_ancestors='parent')
+        )
+        if builder.count() > 0:
+            raise ValueError('the link you are attempting to create would generate a cycle in the graph')
+
     def validate_incoming(self, source: 'Node', link_type: LinkType, link_label: str) -> None:
         """Validate adding a link of the given type from a given node to ourself.
 
@@ -83,8 +146,9 @@ class NodeLinks:
 
         validate_link(source, self._node, link_type, link_label, backend=self._node.backend)
 
-        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules
-        if link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
+        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules. This can
+        # only happen if both nodes are stored, since an unstored node cannot have any stored ancestors or descendants.
+        if link_type in LINK_TYPES_ACYCLIC and source.is_stored and self._node.is_stored:
             builder = (
                 QueryBuilder(backend=self._node.backend)
                 .append(Node, filters={'id': self._node.pk}, tag='parent')
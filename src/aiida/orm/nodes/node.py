@@ -13,7 +13,21 @@ from __future__ import annotations
 from datetime import datetime
 from functools import cached_property
 from logging import Logger
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
 from aiida.common import exceptions
@@ -46,7 +60,7 @@ if TYPE_CHECKING:
     from ..implementation.nodes import BackendNode  # noqa: F401
     from .repository import NodeRepository
 
-__all__ = ('Node',)
+__all__ = ('Node', 'store_many')
 
 NodeType = TypeVar('NodeType', bound='Node')
 
@@ -75,6 +89,7 @@ class NodeCollection(EntityCollection[NodeType], Generic[NodeType]):
             raise exceptions.InvalidOperation(f'cannot delete Node<{node.pk}> because it has outgoing links')
 
         self._backend.nodes.delete(pk)
+        self._backend.node_identity_map.discard((pk,))
 
     def iter_repo_keys(
         self, filters: Optional[dict] = None, subclassing: bool = True, batch_size: int = 100
@@ -531,6 +546,10 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
             # us to set `clean=False` if we are storing normally, since the values will already have been cleaned
             self._backend_entity.clean_values()
 
+            # The node may have been mutated since the hash was last computed, so it has to be computed again. Once
+            # computed in `_get_same_node` it is reused when the hash is stored in `_store`.
+            self.base.caching._reset_hash()
+
             # Retrieve the cached node if ``should_use_cache`` returns True
             same_node = self.base.caching._get_same_node() if self.base.caching.should_use_cache() else None
 
@@ -795,3 +814,134 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
             return getattr(self.base.links, new_name)
 
         raise AttributeError(name)
+
+
+def store_many(nodes: Iterable[Node]) -> List[Node]:
+    """Store multiple nodes, with the same guarantees as calling :meth:`Node.store` on each of them.
+
+    The nodes are validated and their repository contents written one by one, after which all database rows and
+    incoming links are inserted in a single transaction. This is considerably faster than storing the nodes one by one
+    when creating many nodes, for example when importing a dataset.
+
+    Incoming links can have a source node that is stored or that is itself part of ``nodes``. Nodes that may be stored
+    from the cache, and nodes whose class overrides :meth:`Node.store`, are stored one by one, after the nodes that are
+    the source of their incoming links. Nodes that are already stored are ignored.
+
+    :param nodes: the nodes to store, which should all belong to the same storage backend.
+    :return: the list of nodes.
+    :raises ValueError: if the nodes belong to different storage backends.
+    :raises `aiida.common.exceptions.ModificationNotAllowed`: if the source node of an incoming link is not stored and
+        is not one of the nodes to store.
+    """
+    nodes = list(nodes)
+    unstored: Dict[int, Node] = {id(node): node for node in nodes if not node.is_stored}
+
+    if not unstored:
+        return nodes
+
+    backend = next(iter(unstored.values())).backend
+
+    if any(node.backend is not backend for node in unstored.values()):
+        raise ValueError('the nodes to store do not all belong to the same storage backend')
+
+    ordered = _sort_by_incoming_links(unstored)
+    batchable = {
+        id(node)
+        for node in ordered
+        if type(node).store is Node.store and not (node._cachable and node.base.caching.should_use_cache())
+    }
+
+    for node in ordered:
+        for link_triple in node.base.links.incoming_cache:
+            if not link_triple.node.is_stored and id(link_triple.node) not in unstored:
+                raise exceptions.ModificationNotAllowed(
+                    f'Cannot store because source node of link triple {link_triple} is not stored'
+                )
+
+        if id(node) in batchable:
+            node._validate_storability()
+            node._validate()
+
+    batch: List[Node] = []
+
+    for node in ordered:
+        if id(node) in batchable:
+            batch.append(node)
+            continue
+
+        # The sources of the incoming links of a node that is stored by itself have to be stored first
+        batch_ids = {id(batch_node) for batch_node in batch}
+        if any(id(link_triple.node) in batch_ids for link_triple in node.base.links.incoming_cache):
+            _store_batch(backend, batch)
+            batch = []
+
+        node.store()
+
+    if batch:
+        _store_batch(backend, batch)
+
+    return nodes
+
+
+def _sort_by_incoming_links(nodes: Dict[int, Node]) -> List[Node]:
+    """Return the nodes sorted such that the source of each cached incoming link precedes the target of the link.
+
+    :param nodes: the nodes by their ``id``, where only the links between these nodes are considered.
+    """
+    ordered: List[Node] = []
+    visited: Set[int] = set()
+
+    for root in nodes.values():
+        stack = [(root, False)]
+
+        while stack:
+            node, expanded = stack.pop()
+
+            if expanded:
+                ordered.append(node)
+                continue
+
+            if id(node) in visited:
+                continue
+
+            visited.add(id(node))
+            stack.append((node, True))
+            stack.extend(
+                (link_triple.node, False)
+                for link_triple in node.base.links.incoming_cache
+                if id(link_triple.node) in nodes and id(link_triple.node) not in visited
+            )
+
+    return ordered
+
+
+def _store_batch(backend: 'StorageBackend', batch: List[Node]) -> None:
+    """Store the given validated nodes and their incoming links in a single transaction."""
+    # The hash of a node with an incoming link from a node that is stored in this call can only be computed afterwards
+    rehash: List[Node] = []
+
+    for node in batch:
+        node._backend_entity.clean_values()
+        node.base.caching._reset_hash()
+        node.base.repository._store()
+
+        if all(link_triple.node.is_stored for link_triple in node.base.links.incoming_cache):
+            # Set the hash on the unstored node, such that it is inserted with the row instead of flushed separately
+            node.base.extras.set(node.base.caching._HASH_EXTRA_KEY, node.base.caching._compute_hash())
+        else:
+            rehash.append(node)
+
+    backend.nodes.bulk_store(
+        [node.backend_entity for node in batch], [node.base.links.incoming_cache for node in batch], clean=False
+    )
+
+    for node in batch:
+        node.base.links.incoming_cache = []
+
+    for node in rehash:
+        node.base.caching.rehash()
+
+    grouped = [node for node in batch if backend.autogroup.is_to_be_grouped(node)]
+
+    if grouped:
+        backend.autogroup.get_or_create_group().add_nodes(grouped)
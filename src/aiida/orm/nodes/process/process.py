@@ -151,6 +151,8 @@ class ProcessNode(Sealable, Node):
     _CLS_NODE_LINKS = ProcessNodeLinks
     _CLS_NODE_CACHING = ProcessNodeCaching
 
+    _checkpoint_entries: Optional[Dict[str, bytes]] = None
+
     CHECKPOINT_KEY = 'checkpoints'
     EXCEPTION_KEY = 'exception'
     EXIT_MESSAGE_KEY = 'exit_message'
@@ -559,19 +561,55 @@ class ProcessNode(Sealable, Node):
         """
         return self.base.attributes.get(self.CHECKPOINT_KEY, None)
 
-    def set_checkpoint(self, checkpoint: str) -> None:
+    @property
+    def checkpoint_entries(self) -> Dict[str, bytes]:
+        """Return the entries of the checkpoint that are stored separately from the checkpoint bundle.
+
+        :returns: mapping of the keys of the entries onto their serialized values
+        :raises NotImplementedError: if the storage backend does not store checkpoint entries separately.
+        """
+        entries = self.backend_entity.get_checkpoint_entries()
+        self._checkpoint_entries = dict(entries)
+        return entries
+
+    def set_checkpoint(self, checkpoint: str, entries: Optional[Dict[str, bytes]] = None) -> None:
         """Set the checkpoint bundle set for the process
 
-        :param state: string representation of the stepper state info
+        The ``entries`` are stored separately from the checkpoint bundle, one row per key, in the same transaction. Only
+        the entries that changed since they were last set or retrieved through this instance are written, all other
+        entries are written the first time.
+
+        :param checkpoint: string representation of the checkpoint bundle
+        :param entries: optional mapping of keys onto serialized values to store separately from the checkpoint bundle
+        :raises NotImplementedError: if ``entries`` are passed but the storage backend does not store checkpoint entries
+            separately, in which case nothing is written and the entries should be included in the checkpoint bundle.
         """
-        return self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
+        if entries is None:
+            return self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
+
+        previous = self._checkpoint_entries or {}
+        changed = {key: value for key, value in entries.items() if previous.get(key) != value}
+
+        with self.backend.transaction():
+            self.backend_entity.update_checkpoint_entries(changed, entries.keys())
+            self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
+
+        self._checkpoint_entries = dict(entries)
 
     def delete_checkpoint(self) -> None:
-        """Delete the checkpoint bundle set for the process"""
-        try:
-            self.base.attributes.delete(self.CHECKPOINT_KEY)
-        except AttributeError:
-            pass
+        """Delete the checkpoint bundle set for the process, including its separately stored entries"""
+        with self.backend.transaction():
+            try:
+                self.base.attributes.delete(self.CHECKPOINT_KEY)
+            except AttributeError:
+                pass
+            if self.is_stored:
+                try:
+                    self.backend_entity.update_checkpoint_entries({}, ())
+                except NotImplementedError:
+                    pass
+
+        self._checkpoint_entries = {}
 
     @property
     def paused(self) -> bool:
@@ -259,6 +259,20 @@ class NodeRepository:
 
         return self._repository.get_object_content(path)
 
+    def get_object_location(self, path: FilePath) -> tuple[pathlib.Path, int] | None:
+        """Return the location on the local file system of the raw content of the object identified by path.
+
+        .. note:: the file at this location should only ever be read and never be modified.
+
+        :param path: the relative path of the object within the repository.
+        :return: tuple of the path of the file containing the content and the offset at which it starts, or ``None`` if
+            the repository backend does not store the raw content contiguously on the local file system.
+        :raises TypeError: if the path is not a string and relative path.
+        :raises FileNotFoundError: if the file does not exist.
+        :raises IsADirectoryError: if the object is a directory and not a file.
+        """
+        return self._repository.get_object_location(path)
+
     def put_object_from_bytes(self, content: bytes, path: str) -> None:
         """Store the given content in the repository at the given path.
 
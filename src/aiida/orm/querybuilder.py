@@ -76,6 +76,13 @@ class Classifier(NamedTuple):
     process_type_string: Optional[str] = None
 
 
+class QueryPage(NamedTuple):
+    """A page of query results, returned by :meth:`QueryBuilder.paginate`."""
+
+    results: List[Dict[str, Dict[str, Any]]]
+    next_token: Optional[str]
+
+
 class QueryBuilder:
     """The class to query the AiiDA database.
 
@@ -1068,7 +1075,7 @@ class QueryBuilder:
         """
         return self._impl.count(self.as_dict())
 
-    def iterall(self, batch_size: Optional[int] = 100) -> Iterable[List[Any]]:
+    def iterall(self, batch_size: Optional[int] = 100, stream: bool = False) -> Iterable[List[Any]]:
         """Same as :meth:`.all`, but returns a generator.
         Be aware that this is only safe if no commit will take place during this
         transaction. You might also want to read the SQLAlchemy documentation on
@@ -1077,17 +1084,23 @@ class QueryBuilder:
         :param batch_size:
             The size of the batches to ask the backend to batch results in subcollections.
             You can optimize the speed of the query by tuning this parameter.
+        :param stream:
+            If True, the results are streamed from a server-side cursor in a separate transaction, such that only
+            ``batch_size`` rows are held in memory at once, regardless of the size of the result set. The results
+            reflect the committed state of the database when the iteration starts, and changes made while iterating
+            are committed as they are made. For storage backends that do not support server-side cursors, e.g. SQLite,
+            this has no effect.
 
         :returns: a generator of lists
         """
-        for item in self._impl.iterall(self.as_dict(), batch_size):
+        for item in self._impl.iterall(self.as_dict(), batch_size, stream=stream):
             # Convert to AiiDA frontend entities (if they are such)
             for i, item_entry in enumerate(item):
                 item[i] = self._get_aiida_entity_res(item_entry)
 
             yield item
 
-    def iterdict(self, batch_size: Optional[int] = 100) -> Iterable[Dict[str, Dict[str, Any]]]:
+    def iterdict(self, batch_size: Optional[int] = 100, stream: bool = False) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Same as :meth:`.dict`, but returns a generator.
         Be aware that this is only safe if no commit will take place during this
         transaction. You might also want to read the SQLAlchemy documentation on
@@ -1096,10 +1109,12 @@ class QueryBuilder:
         :param batch_size:
             The size of the batches to ask the backend to batch results in subcollections.
             You can optimize the speed of the query by tuning this parameter.
+        :param stream:
+            If True, the results are streamed from a server-side cursor in a separate transaction, see :meth:`.iterall`.
 
         :returns: a generator of dictionaries
         """
-        for item in self._impl.iterdict(self.as_dict(), batch_size):
+        for item in self._impl.iterdict(self.as_dict(), batch_size, stream=stream):
             for key, value in item.items():
                 item[key] = self._get_aiida_entity_res(value)
 
@@ -1193,6 +1208,158 @@ class QueryBuilder:
         """
         return list(self.iterdict(batch_size=batch_size))
 
+    def paginate(
+        self, page_size: int, order_by: Optional[OrderByType] = None, after: Optional[str] = None
+    ) -> QueryPage:
+        """Return a page of the results, using keyset pagination.
+
+        Instead of skipping the results of the previous pages with an offset, which requires the database to scan all
+        of them, the query is filtered on the values of the ordering fields of the last result of the previous page.
+        This is encoded in the page token that is returned with each page. When the ordering fields are indexed, the
+        cost of retrieving a page is therefore independent of how deep it is.
+
+        Usage::
+
+            qb = QueryBuilder().append(Node, project=['uuid'], tag='node')
+            page = qb.paginate(100, order_by={'node': {'ctime': 'desc'}})
+
+            while page.next_token is not None:
+                page = qb.paginate(100, order_by={'node': {'ctime': 'desc'}}, after=page.next_token)
+
+        .. note:: Only queries of a single vertex are supported. When other vertices are joined, a vertex can appear in
+            multiple results, which would be split over pages by a keyset on the fields of a single vertex.
+
+        :param page_size: the maximum number of results of the page.
+        :param order_by: the ordering of the results, in the format of :meth:`.order_by`. It can only reference columns
+            of the vertex, which should not be nullable. The ``id`` of the vertex is added as the last ordering field,
+            if it is not included, such that the ordering is unique. By default, the results are ordered by ``id``. The
+            ordering, limit and offset of this instance are not used.
+        :param after: the page token returned with the previous page, or ``None`` to return the first page.
+        :returns: the page, with the results in the format of :meth:`.dict` and the token of the next page, which is
+            ``None`` if there are no results after this page.
+        :raises ValueError: if the query joins multiple vertices, if the ordering is not supported or if the token does
+            not match the ordering.
+        """
+        if page_size < 1:
+            raise ValueError(f'page_size should be a positive integer, got: {page_size}')
+
+        if len(self._path) != 1:
+            raise ValueError('keyset pagination only supports queries of a single vertex')
+
+        builder = deepcopy(self)
+        builder.order_by(order_by if order_by is not None else {self._path[-1]['tag']: 'id'})
+
+        if len(builder._order_by) != 1:
+            raise ValueError('keyset pagination only supports a single ordering specification')
+
+        ((tag, order_specs),) = builder._order_by[0].items()
+        ordering: List[Tuple[str, str]] = []
+
+        for order_spec in order_specs:
+            for field, spec in order_spec.items():
+                if '.' in field or 'cast' in spec:
+                    raise ValueError(f'keyset pagination only supports ordering by columns, got: {field}')
+                ordering.append((field, spec['order']))
+
+        if 'id' not in [field for field, _ in ordering]:
+            ordering.append(('id', 'asc'))
+
+        builder.order_by({tag: [{field: direction} for field, direction in ordering]})
+        # Fetch one more result than the page size, to determine whether there is a next page
+        builder.limit(page_size + 1)
+        builder.offset(None)
+
+        if after is not None:
+            values = _decode_page_token(after, ordering)
+            builder._filters[tag] = {'and': [builder._filters[tag], _get_keyset_filters(ordering, values)]}
+
+        # Project the ordering fields, which are needed for the token of the next page, and remove them from the results
+        # if they were not projected already. If nothing is projected, make the default projection explicit.
+        if not any(builder._projections.values()):
+            builder._projections[self._path[-1]['tag']] = [{'*': {}}]
+
+        projected = builder._projections.setdefault(tag, [])
+        projected_names = {name for projection in projected for name in projection}
+        added = [] if '**' in projected_names else [field for field, _ in ordering if field not in projected_names]
+        projected.extend({field: {}} for field in added)
+
+        project_map = self._project_map.get(tag, {})
+        results = builder.dict()
+        next_token = None
+
+        if len(results) > page_size:
+            results = results[:page_size]
+            last = results[-1][tag]
+            next_token = _encode_page_token(ordering, [last[project_map.get(field, field)] for field, _ in ordering])
+
+        for result in results:
+            for field in added:
+                result[tag].pop(project_map.get(field, field))
+            if not result[tag]:
+                result.pop(tag)
+
+        return QueryPage(results, next_token)
+
+
+def _get_keyset_filters(ordering: List[Tuple[str, str]], values: List[Any]) -> Dict[str, Any]:
+    """Return the filters that select the results after the given values of the ordering fields.
+
+    For ordering fields ``f1, f2, ...`` these are ``f1 > v1 OR (f1 == v1 AND f2 > v2) OR ...``, where ``>`` is replaced
+    by ``<`` for fields in descending order.
+
+    :param ordering: list of tuples of the field and its direction.
+    :param values: the values of the fields of the last result of the previous page.
+    """
+    clauses = []
+
+    for index, (field, direction) in enumerate(ordering):
+        operator = '>' if direction == 'asc' else '<'
+        clause = [{name: {'==': value}} for (name, _), value in zip(ordering[:index], values[:index])]
+        clause.append({field: {operator: values[index]}})
+        clauses.append({'and': clause})
+
+    return {'or': clauses}
+
+
+def _encode_page_token(ordering: List[Tuple[str, str]], values: List[Any]) -> str:
+    """Encode the ordering and the values of its fields of the last result of a page into an opaque page token."""
+    import base64
+    import json
+    from datetime import datetime
+
+    serialized = []
+
+    for (field, _), value in zip(ordering, values):
+        if value is None:
+            raise ValueError(f'cannot paginate over results with a null value for the ordering field `{field}`')
+        serialized.append({'datetime': value.isoformat()} if isinstance(value, datetime) else value)
+
+    payload = json.dumps({'ordering': ordering, 'values': serialized}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def _decode_page_token(token: str, ordering: List[Tuple[str, str]]) -> List[Any]:
+    """Decode a page token and return the values of the ordering fields it contains.
+
+    :raises ValueError: if the token is invalid or was created for a different ordering.
+    """
+    import base64
+    import binascii
+    import json
+    from datetime import datetime
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        token_ordering = [tuple(entry) for entry in payload['ordering']]
+        values = payload['values']
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exception:
+        raise ValueError(f'invalid page token: {token}') from exception
+
+    if token_ordering != ordering or len(values) != len(ordering):
+        raise ValueError(f'the page token was created for the ordering {token_ordering}, not {ordering}')
+
+    return [datetime.fromisoformat(value['datetime']) if isinstance(value, dict) else value for value in values]
+
 
 def _get_ormclass(
     cls: Union[None, EntityClsType, Sequence[EntityClsType]], entity_type: Union[None, str, Sequence[str]]
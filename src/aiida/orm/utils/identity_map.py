@@ -0,0 +1,160 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Identity map of the immutable nodes loaded from a storage backend."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+import weakref
+from collections import OrderedDict
+
+if t.TYPE_CHECKING:
+    from aiida.orm import Node
+
+
+class _ThreadMap:
+    """The nodes in the identity map of a single thread.
+
+    The UUID of each node is stored alongside the weak reference, such that removing a node never has to access the
+    node itself, which may no longer be bound to a database session.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, tuple[weakref.ref['Node'], str]] = {}
+        self.uuids: dict[str, int] = {}
+        self.recent: OrderedDict[int, 'Node'] = OrderedDict()
+        self.discarded: set[int] = set()
+
+    def get(self, pk: int) -> 'Node' | None:
+        """Return the node with the given pk, if it is in the map and still alive."""
+        entry = self.nodes.get(pk)
+        return entry[0]() if entry is not None else None
+
+    def add(self, node: 'Node') -> None:
+        """Add the node, which is removed automatically once it is garbage collected."""
+        pk, uuid = node.pk, node.uuid
+
+        def remove(reference: weakref.ref['Node']) -> None:
+            entry = self.nodes.get(pk)
+            if entry is not None and entry[0] is reference:
+                self.pop(pk)
+
+        self.nodes[pk] = (weakref.ref(node, remove), uuid)
+        self.uuids[uuid] = pk
+
+    def pop(self, pk: int) -> None:
+        """Remove the node with the given pk."""
+        entry = self.nodes.pop(pk, None)
+        self.recent.pop(pk, None)
+        if entry is not None and self.uuids.get(entry[1]) == pk:
+            self.uuids.pop(entry[1], None)
+
+
+class NodeIdentityMap:
+    """Map of the stored immutable nodes loaded from a storage backend, by pk and UUID.
+
+    Loading the same node repeatedly returns the same instance from the map, without querying the storage. Only stored
+    ``Data`` nodes are kept, since their attributes and repository content can no longer change, and their mutable
+    properties, such as the extras, are refreshed from the storage by the backend entity when accessed.
+
+    The map only holds weak references to the nodes, such that a node, including any data that it caches in memory, is
+    released as soon as it is no longer referenced elsewhere. Only the ``max_size`` most recently used nodes are kept
+    alive by the map itself.
+
+    The map is local to each thread, since backend entities may be bound to the database session of a thread. Nodes that
+    are discarded, for example because they have been deleted, are removed from the maps of all threads.
+    """
+
+    def __init__(self, max_size: int = 100):
+        self._max_size = max_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._maps: weakref.WeakSet[_ThreadMap] = weakref.WeakSet()
+
+    def _get_map(self) -> _ThreadMap:
+        """Return the map of the current thread, after removing the nodes that were discarded by any thread."""
+        try:
+            thread_map = self._local.map
+        except AttributeError:
+            thread_map = self._local.map = _ThreadMap()
+            with self._lock:
+                self._maps.add(thread_map)
+
+        if thread_map.discarded:
+            with self._lock:
+                discarded, thread_map.discarded = thread_map.discarded, set()
+            for pk in discarded:
+                thread_map.pop(pk)
+
+        return thread_map
+
+    def __len__(self) -> int:
+        return len(self._get_map().nodes)
+
+    @staticmethod
+    def is_immutable(node: 'Node') -> bool:
+        """Return whether the node can be kept in the map."""
+        from aiida.orm import Data
+
+        return isinstance(node, Data) and node.is_stored
+
+    def get(self, pk: int | None = None, uuid: str | None = None) -> 'Node' | None:
+        """Return the node with the given pk or full UUID, or ``None`` if it is not in the map."""
+        thread_map = self._get_map()
+
+        if pk is None and uuid is not None:
+            pk = thread_map.uuids.get(uuid)
+
+        if pk is None:
+            return None
+
+        node = thread_map.get(pk)
+
+        if node is not None and self._max_size > 0:
+            thread_map.recent[pk] = node
+            thread_map.recent.move_to_end(pk)
+            self._evict(thread_map)
+
+        return node
+
+    def add(self, node: 'Node') -> None:
+        """Add the node to the map, if it is immutable."""
+        if not self.is_immutable(node):
+            return
+
+        thread_map = self._get_map()
+        thread_map.add(node)
+
+        if self._max_size > 0:
+            thread_map.recent[node.pk] = node
+            thread_map.recent.move_to_end(node.pk)
+            self._evict(thread_map)
+
+    def _evict(self, thread_map: _ThreadMap) -> None:
+        """Stop keeping the least recently used nodes alive once more than ``max_size`` nodes are kept."""
+        while len(thread_map.recent) > self._max_size:
+            thread_map.recent.popitem(last=False)
+
+    def discard(self, pks: t.Iterable[int]) -> None:
+        """Remove the nodes with the given pks from the map of all threads, for example because they were deleted."""
+        pks = set(pks)
+
+        with self._lock:
+            for thread_map in self._maps:
+                thread_map.discarded.update(pks)
+
+        # Remove the nodes from the map of the current thread straight away
+        self._get_map()
+
+    def clear(self) -> None:
+        """Remove all nodes from the map, for all threads."""
+        with self._lock:
+            self._local = threading.local()
+            self._maps = weakref.WeakSet()
@@ -10,7 +10,7 @@
 
 from collections import OrderedDict
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Generator, Iterator, List, NamedTuple, Optional
+from typing import TYPE_CHECKING, Generator, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
@@ -74,6 +74,58 @@ def link_triple_exists(
     return builder.count() != 0
 
 
+def _validate_link_nodes(source: 'Node', target: 'Node', link_type: 'LinkType', link_label: str) -> Tuple[str, str]:
+    """Validate the types of the nodes and the link, which does not require any information from the database.
+
+    :return: tuple of the outdegree and indegree character of the link type, see :func:`validate_link`.
+    :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
+    :raise ValueError: if the proposed link is invalid
+    """
+    from aiida.common.links import LinkType, validate_link_label
+    from aiida.orm import CalculationNode, Data, Node, WorkflowNode
+
+    type_check(link_type, LinkType, f'link_type should be a LinkType enum but got: {type(link_type)}')
+    type_check(source, Node, f'source should be a `Node` but got: {type(source)}')
+    type_check(target, Node, f'target should be a `Node` but got: {type(target)}')
+
+    if source.backend != target.backend:
+        raise ValueError(
+            f'source and target nodes must be stored in the same backend, but got {source.backend} and {target.backend}'
+        )
+
+    if source.uuid is None or target.uuid is None:  # type: ignore[redundant-expr]
+        raise ValueError('source or target node does not have a UUID')
+
+    if source.uuid == target.uuid:
+        raise ValueError('cannot add a link to oneself')
+
+    try:
+        validate_link_label(link_label)
+    except ValueError as exception:
+        raise ValueError(f'invalid link label `{link_label}`: {exception}')
+
+    # For each link type, define a tuple that defines the valid types for the source and target node, as well as
+    # the outdegree and indegree character. If the degree is `unique` that means that there can only be a single
+    # link of this type regardless of the label. If instead it is `unique_label`, an infinite amount of links of that
+    # type can be defined, as long as the link label is unique for the sub set of links of that type. Finally, for
+    # `unique_triple` the triple of node, link type and link label has to be unique.
+    link_mapping = {
+        LinkType.CALL_CALC: (WorkflowNode, CalculationNode, 'unique_triple', 'unique'),
+        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode, 'unique_triple', 'unique'),
+        LinkType.CREATE: (CalculationNode, Data, 'unique_pair', 'unique'),
+        LinkType.INPUT_CALC: (Data, CalculationNode, 'unique_triple', 'unique_pair'),
+        LinkType.INPUT_WORK: (Data, WorkflowNode, 'unique_triple', 'unique_pair'),
+        LinkType.RETURN: (WorkflowNode, Data, 'unique_pair', 'unique_triple'),
+    }
+
+    type_source, type_target, outdegree, indegree = link_mapping[link_type]
+
+    if not isinstance(source, type_source) or not isinstance(target, type_target):
+        raise ValueError(f'cannot add a {link_type} link from {type(source)} to {type(target)}')
+
+    return outdegree, indegree
+
+
 def validate_link(
     source: 'Node', target: 'Node', link_type: 'LinkType', link_label: str, backend: Optional['StorageBackend'] = None
 ) -> None:
@@ -137,47 +189,7 @@ def validate_link(
     :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
     :raise ValueError: if the proposed link is invalid
     """
-    from aiida.common.links import LinkType, validate_link_label
-    from aiida.orm import CalculationNode, Data, Node, WorkflowNode
-
-    type_check(link_type, LinkType, f'link_type should be a LinkType enum but got: {type(link_type)}')
-    type_check(source, Node, f'source should be a `Node` but got: {type(source)}')
-    type_check(target, Node, f'target should be a `Node` but got: {type(target)}')
-
-    if source.backend != target.backend:
-        raise ValueError(
-            f'source and target nodes must be stored in the same backend, but got {source.backend} and {target.backend}'
-        )
-
-    if source.uuid is None or target.uuid is None:  # type: ignore[redundant-expr]
-        raise ValueError('source or target node does not have a UUID')
-
-    if source.uuid == target.uuid:
-        raise ValueError('cannot add a link to oneself')
-
-    try:
-        validate_link_label(link_label)
-    except ValueError as exception:
-        raise ValueError(f'invalid link label `{link_label}`: {exception}')
-
-    # For each link type, define a tuple that defines the valid types for the source and target node, as well as
-    # the outdegree and indegree character. If the degree is `unique` that means that there can only be a single
-    # link of this type regardless of the label. If instead it is `unique_label`, an infinite amount of links of that
-    # type can be defined, as long as the link label is unique for the sub set of links of that type. Finally, for
-    # `unique_triple` the triple of node, link type and link label has to be unique.
-    link_mapping = {
-        LinkType.CALL_CALC: (WorkflowNode, CalculationNode, 'unique_triple', 'unique'),
-        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode, 'unique_triple', 'unique'),
-        LinkType.CREATE: (CalculationNode, Data, 'unique_pair', 'unique'),
-        LinkType.INPUT_CALC: (Data, CalculationNode, 'unique_triple', 'unique_pair'),
-        LinkType.INPUT_WORK: (Data, WorkflowNode, 'unique_triple', 'unique_pair'),
-        LinkType.RETURN: (WorkflowNode, Data, 'unique_pair', 'unique_triple'),
-    }
-
-    type_source, type_target, outdegree, indegree = link_mapping[link_type]
-
-    if not isinstance(source, type_source) or not isinstance(target, type_target):
-        raise ValueError(f'cannot add a {link_type} link from {type(source)} to {type(target)}')
+    outdegree, indegree = _validate_link_nodes(source, target, link_type, link_label)
 
     if outdegree == 'unique_triple' or indegree == 'unique_triple':
         # For a `unique_triple` degree we just have to check if an identical triple already exist, either in the cache
@@ -223,6 +235,95 @@ def validate_link(
         )
 
 
+def validate_links(
+    links: Sequence[Tuple['Node', 'Node', 'LinkType', str]], backend: Optional['StorageBackend'] = None
+) -> None:
+    """Validate adding multiple links at once.
+
+    This is equivalent to calling :func:`validate_link` for each link in turn, where each link is considered to be
+    added once it has been validated. Instead of querying the database for each link, the existing links of all the
+    stored nodes involved are retrieved at once, so the number of queries does not depend on the number of links.
+
+    .. note:: contrary to :func:`validate_link`, the link labels of the ``unique_pair`` degree are compared exactly and
+        not as a ``like`` pattern, and existing links in the incoming link cache of the target nodes are also taken into
+        account for the outdegree.
+
+    :param links: sequence of tuples of the source node, the target node, the link type and the link label
+    :raise TypeError: if a source or target is not a Node instance, or a link type is not a `LinkType` enum
+    :raise ValueError: if any of the proposed links is invalid
+    """
+    from aiida.common.links import LinkType
+    from aiida.orm import Node, QueryBuilder
+
+    degrees = [
+        _validate_link_nodes(source, target, link_type, link_label) for source, target, link_type, link_label in links
+    ]
+
+    # The existing links as tuples of source UUID, target UUID, link type and link label
+    existing = set()
+
+    for direction, pks in (
+        ('with_incoming', {source.pk for source, _, _, _ in links if source.is_stored}),
+        ('with_outgoing', {target.pk for _, target, _, _ in links if target.is_stored}),
+    ):
+        if not pks:
+            continue
+
+        builder = QueryBuilder(backend=backend)
+        builder.append(Node, filters={'id': {'in': pks}}, project=['uuid'], tag='node')
+        builder.append(Node, project=['uuid'], edge_project=['type', 'label'], **{direction: 'node'})
+
+        for node_uuid, other_uuid, link_type, link_label in builder.iterall():
+            pair = (node_uuid, other_uuid) if direction == 'with_incoming' else (other_uuid, node_uuid)
+            existing.add((*pair, LinkType(link_type), link_label))
+
+    for _, target, _, _ in links:
+        existing.update(
+            (entry.node.uuid, target.uuid, entry.link_type, entry.link_label)
+            for entry in target.base.links.incoming_cache
+        )
+
+    outgoing_types = {(source_uuid, link_type) for source_uuid, _, link_type, _ in existing}
+    outgoing_pairs = {(source_uuid, link_type, link_label) for source_uuid, _, link_type, link_label in existing}
+    incoming_types = {(target_uuid, link_type) for _, target_uuid, link_type, _ in existing}
+    incoming_pairs = {(target_uuid, link_type, link_label) for _, target_uuid, link_type, link_label in existing}
+
+    for (source, target, link_type, link_label), (outdegree, indegree) in zip(links, degrees):
+        triple = (source.uuid, target.uuid, link_type, link_label)
+
+        if outdegree == 'unique' and (source.uuid, link_type) in outgoing_types:
+            raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link')
+
+        elif outdegree == 'unique_pair' and (source.uuid, link_type, link_label) in outgoing_pairs:
+            raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link with label "{link_label}"')
+
+        elif outdegree == 'unique_triple' and triple in existing:
+            raise ValueError(
+                'node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
+                    source.uuid, link_type, link_label, target.uuid
+                )
+            )
+
+        if indegree == 'unique' and (target.uuid, link_type) in incoming_types:
+            raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link')
+
+        elif indegree == 'unique_pair' and (target.uuid, link_type, link_label) in incoming_pairs:
+            raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link with label "{link_label}"')
+
+        elif indegree == 'unique_triple' and triple in existing:
+            raise ValueError(
+                'node<{}> already has an incoming {} link with label "{}" from node<{}>'.format(
+                    target.uuid, link_type, link_label, source.uuid
+                )
+            )
+
+        existing.add(triple)
+        outgoing_types.add((source.uuid, link_type))
+        outgoing_pairs.add((source.uuid, link_type, link_label))
+        incoming_types.add((target.uuid, link_type))
+        incoming_pairs.add((target.uuid, link_type, link_label))
+
+
 class LinkManager:
     """Class to convert a list of LinkTriple tuples into an iterator.
 
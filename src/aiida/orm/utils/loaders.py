@@ -388,6 +388,20 @@ class OrmEntityLoader:
         :raises aiida.common.MultipleObjectsError: if the identifier maps onto multiple entities
         :raises aiida.common.NotExistent: if the identifier maps onto not a single entity
         """
+        from aiida.manage import get_manager
+        from aiida.orm import Node
+
+        identity_map = None
+
+        if issubclass(cls.orm_base_class, Node):
+            # Immutable nodes loaded before by ID or full UUID are returned from the identity map of the storage
+            identity_map = get_manager().get_profile_storage().node_identity_map
+            entity = cls._get_entity_from_identity_map(
+                identity_map, identifier, identifier_type, sub_classes, query_with_dashes
+            )
+            if entity is not None:
+                return entity
+
         builder, query_parameters = cls.get_query_builder(identifier, identifier_type, sub_classes, query_with_dashes)
         builder.limit(2)
 
@@ -404,6 +418,40 @@ class OrmEntityLoader:
             error = f'no {classes} found with {identifier_type}<{identifier}>: {exception}'
             raise NotExistent(error)
 
+        if identity_map is not None:
+            identity_map.add(entity)
+
+        return entity
+
+    @classmethod
+    def _get_entity_from_identity_map(cls, identity_map, identifier, identifier_type, sub_classes, query_with_dashes):
+        """Return the node that corresponds to the ID or full UUID identifier from the node identity map, if present.
+
+        :param identity_map: the :class:`~aiida.orm.utils.identity_map.NodeIdentityMap` of the storage backend
+        :returns: the node, or ``None`` if it is not in the identity map or is not an instance of the query classes
+        """
+        from uuid import UUID
+
+        if identifier_type is None:
+            identifier, identifier_type = cls.infer_identifier_type(identifier)
+
+        if identifier_type == IdentifierType.ID:
+            entity = identity_map.get(pk=int(identifier))
+        elif identifier_type == IdentifierType.UUID and query_with_dashes:
+            try:
+                uuid = str(UUID(identifier))
+            except ValueError:
+                return None
+            # Only a UUID that the query would match exactly, i.e. one that only differs in the dashes
+            if uuid.replace('-', '') != identifier.replace('-', ''):
+                return None
+            entity = identity_map.get(uuid=uuid)
+        else:
+            return None
+
+        if entity is None or not isinstance(entity, cls.get_query_classes(sub_classes)):
+            return None
+
         return entity
 
     @classmethod
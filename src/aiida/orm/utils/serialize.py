@@ -15,7 +15,11 @@ for new types though.
 
 from __future__ import annotations
 
+import base64
 import inspect
+import io
+import pickle
+import zlib
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 from functools import partial
@@ -250,3 +254,150 @@ def deserialize_unsafe(serialized: str) -> Any:
     :return: the deserialized data structure
     """
     return yaml.load(serialized, Loader=AiiDALoader)
+
+
+CHECKPOINT_HEADER = 'aiida-checkpoint'
+CHECKPOINT_VERSION = 1
+_CHECKPOINT_PICKLE_PROTOCOL = 4
+_CHECKPOINT_COMPRESSION_NONE = 'none'
+_CHECKPOINT_COMPRESSION_ZLIB = 'zlib'
+_PERSISTENT_NODE = 'node'
+_PERSISTENT_NODE_LINKS_MANAGER = 'node_links_manager'
+_PERSISTENT_GROUP = 'group'
+_PERSISTENT_COMPUTER = 'computer'
+
+
+def _bundle_from_mapping(mapping: dict) -> Bundle:
+    """Construct an `plumpy.Bundle` from a plain mapping without calling its constructor."""
+    bundle = Bundle.__new__(Bundle)
+    bundle.update(mapping)
+    return bundle
+
+
+class AiiDAPickler(pickle.Pickler):
+    """Pickler for process checkpoints that stores AiiDA entities by reference.
+
+    Nodes, groups and computers are stored through their UUID, just like they are by the ``AiiDADumper``, such that
+    they are loaded from the database when the checkpoint is deserialized.
+    """
+
+    def persistent_id(self, obj: Any) -> tuple | None:
+        if isinstance(obj, orm.Node):
+            if not obj.is_stored:
+                raise ValueError(f'node {type(obj)}<{obj.uuid}> cannot be represented because it is not stored')
+            return (_PERSISTENT_NODE, obj.uuid)
+        if isinstance(obj, NodeLinksManager):
+            return (_PERSISTENT_NODE_LINKS_MANAGER, obj._node.uuid, obj._link_type.value, obj._incoming)
+        if isinstance(obj, orm.Group):
+            if not obj.is_stored:
+                raise ValueError(f'group {obj} cannot be represented because it is not stored')
+            return (_PERSISTENT_GROUP, obj.uuid)
+        if isinstance(obj, orm.Computer):
+            if not obj.is_stored:
+                raise ValueError(f'computer {obj} cannot be represented because it is not stored')
+            return (_PERSISTENT_COMPUTER, obj.uuid)
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        # The mappings that resolve attribute access through their keys are rebuilt from a plain dictionary, since
+        # their ``__getattr__`` would be called before their state is restored when unpickled through ``__dict__``.
+        if isinstance(obj, Bundle):
+            return _bundle_from_mapping, (dict(obj),)
+        if isinstance(obj, (AttributeDict, AttributesFrozendict)):
+            return type(obj), (dict(obj),)
+        return NotImplemented
+
+
+class AiiDAUnpickler(pickle.Unpickler):
+    """Unpickler for process checkpoints written by the ``AiiDAPickler``.
+
+    .. note:: The `AiiDAUnpickler` should only be used on trusted input, since unpickling can execute arbitrary code.
+        When importing a shared database, we strip all process node checkpoints to avoid this being a security risk.
+    """
+
+    def persistent_load(self, pid: tuple) -> Any:
+        from aiida.common.links import LinkType
+
+        if pid[0] == _PERSISTENT_NODE:
+            return orm.load_node(uuid=pid[1])
+        if pid[0] == _PERSISTENT_NODE_LINKS_MANAGER:
+            _, uuid, link_type, incoming = pid
+            return NodeLinksManager(node=orm.load_node(uuid=uuid), link_type=LinkType(link_type), incoming=incoming)
+        if pid[0] == _PERSISTENT_GROUP:
+            return orm.load_group(uuid=pid[1])
+        if pid[0] == _PERSISTENT_COMPUTER:
+            return orm.Computer.collection.get(uuid=pid[1])
+        raise pickle.UnpicklingError(f'unsupported persistent reference `{pid[0]}`')
+
+
+def pickle_checkpoint(data: Any) -> bytes:
+    """Pickle the given data structure with the ``AiiDAPickler``, storing AiiDA entities by reference.
+
+    :param data: the general data to pickle
+    :return: the pickled data structure
+    """
+    stream = io.BytesIO()
+    AiiDAPickler(stream, protocol=_CHECKPOINT_PICKLE_PROTOCOL).dump(data)
+    return stream.getvalue()
+
+
+def unpickle_checkpoint(payload: bytes) -> Any:
+    """Unpickle a data structure that was pickled with :func:`pickle_checkpoint`.
+
+    .. note:: This function should not be used on untrusted input, since it is built upon `pickle` which is unsafe.
+
+    :param payload: the pickled data structure
+    :return: the unpickled data structure
+    """
+    return AiiDAUnpickler(io.BytesIO(payload)).load()
+
+
+def serialize_checkpoint(data: Any, compress: bool = True) -> str:
+    """Serialize the given data structure into a versioned, binary checkpoint.
+
+    The data is pickled, with AiiDA entities stored by reference, optionally compressed and base64 encoded, such that
+    the result can be stored as a node attribute. The encoding is prefixed with a header of the form
+    ``aiida-checkpoint:<version>:<compression>:`` which is used by :func:`deserialize_checkpoint` to distinguish it from
+    the yaml checkpoints written by older versions.
+
+    :param data: the general data to serialize
+    :param compress: whether to compress the serialized data with zlib
+    :return: string representation of the serialized data structure
+    """
+    payload = pickle_checkpoint(data)
+
+    if compress:
+        compression = _CHECKPOINT_COMPRESSION_ZLIB
+        payload = zlib.compress(payload, level=1)
+    else:
+        compression = _CHECKPOINT_COMPRESSION_NONE
+
+    return f'{CHECKPOINT_HEADER}:{CHECKPOINT_VERSION}:{compression}:{base64.b64encode(payload).decode("ascii")}'
+
+
+def deserialize_checkpoint(serialized: str) -> Any:
+    """Deserialize a checkpoint that was serialized with :func:`serialize_checkpoint` or :func:`serialize`.
+
+    .. note:: This function should not be used on untrusted input, since it is built upon `pickle` and `yaml.Loader`
+        which are unsafe.
+
+    :param serialized: a serialized checkpoint
+    :return: the deserialized data structure
+    :raises ValueError: if the checkpoint was written with an unsupported version or compression
+    """
+    if not serialized.startswith(f'{CHECKPOINT_HEADER}:'):
+        return deserialize_unsafe(serialized)
+
+    _, version, compression, encoded = serialized.split(':', 3)
+
+    if int(version) > CHECKPOINT_VERSION:
+        raise ValueError(f'checkpoint version {version} is newer than the supported version {CHECKPOINT_VERSION}')
+
+    payload = base64.b64decode(encoded)
+
+    if compression == _CHECKPOINT_COMPRESSION_ZLIB:
+        payload = zlib.decompress(payload)
+    elif compression != _CHECKPOINT_COMPRESSION_NONE:
+        raise ValueError(f'unsupported checkpoint compression `{compression}`')
+
+    return unpickle_checkpoint(payload)
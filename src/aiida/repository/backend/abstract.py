@@ -10,7 +10,7 @@ import contextlib
 import hashlib
 import io
 import pathlib
-from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from aiida.common.hashing import chunked_file_hash
 
@@ -96,6 +96,62 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with open(filepath, mode='rb') as handle:
             return self.put_object_from_filelike(handle)
 
+    def put_objects_from_repository(
+        self,
+        repository: 'AbstractRepositoryBackend',
+        keys: List[str],
+        callback: Optional[Callable[[str, Any], None]] = None,
+        exclusive: bool = False,
+    ) -> List[str]:
+        """Store the objects with the given keys in another repository in this repository.
+
+        :param repository: the repository to copy the objects from.
+        :param keys: fully qualified identifiers for the objects within ``repository``.
+        :param callback: a callback to report on the progress, see
+            :func:`aiida.common.progress_reporter.create_callback`.
+        :param exclusive: whether the caller has exclusive access to this repository, see
+            :meth:`~aiida.repository.backend.abstract.AbstractRepositoryBackend.put_object_streams`.
+        :return: the generated fully qualified identifiers for the objects within this repository, in the same order as
+            the keys provided.
+        """
+        new_keys = self.put_object_streams(repository.iter_object_streams(keys), len(keys), callback, exclusive)
+        return [new_keys[key] for key in keys]
+
+    def put_object_streams(
+        self,
+        streams: Iterable[Tuple[str, BinaryIO]],
+        total: int,
+        callback: Optional[Callable[[str, Any], None]] = None,
+        exclusive: bool = False,
+    ) -> Dict[str, str]:
+        """Store the objects of the given streams in this repository.
+
+        The objects are stored one by one, but implementations can override this method to store them in bulk. Each
+        stream is only read before the next one is requested, such that the streams can be yielded by
+        :meth:`~aiida.repository.backend.abstract.AbstractRepositoryBackend.iter_object_streams` of another repository.
+
+        :param streams: the keys of the objects in another repository and their byte streams.
+        :param total: the number of streams.
+        :param callback: a callback to report on the progress, see
+            :func:`aiida.common.progress_reporter.create_callback`.
+        :param exclusive: whether the caller has exclusive access to this repository, e.g. by holding the lock of
+            :meth:`aiida.manage.profile_access.ProfileAccessManager.lock`. Implementations may then store the objects in
+            a way that is not safe while other processes use the repository.
+        :return: a mapping of the keys of the objects in the other repository to the generated fully qualified
+            identifiers for the objects within this repository.
+        """
+        new_keys: Dict[str, str] = {}
+
+        if callback:
+            callback('init', {'total': total, 'description': 'Storing objects'})
+
+        for key, handle in streams:
+            new_keys[key] = self.put_object_from_filelike(handle)
+            if callback:
+                callback('update', 1)
+
+        return new_keys
+
     @abc.abstractmethod
     def has_objects(self, keys: List[str]) -> List[bool]:
         """Return whether the repository has an object with the given key.
@@ -170,6 +226,20 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:
             return handle.read()
 
+    def get_object_location(self, key: str) -> Optional[Tuple[pathlib.Path, int]]:
+        """Return the location on the local file system of the raw content of the object identified by key.
+
+        This allows the content of an object to be memory-mapped instead of being read through a stream. Backends that
+        do not store the raw content of an object contiguously in a file on the local file system return ``None``.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: tuple of the path of the file containing the content and the offset at which it starts, or ``None``.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        if not self.has_object(key):
+            raise FileNotFoundError(f'object with key `{key}` does not exist.')
+        return None
+
     @abc.abstractmethod
     def iter_object_streams(self, keys: List[str]) -> Iterator[Tuple[str, BinaryIO]]:
         """Return an iterator over the (read-only) byte streams of objects identified by key.
@@ -2,6 +2,7 @@
 
 import contextlib
 import dataclasses
+import pathlib
 import shutil
 import typing as t
 
@@ -90,6 +91,38 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
         with self._container as container:
             return container.add_streamed_object(handle)
 
+    def put_object_streams(
+        self,
+        streams: t.Iterable[t.Tuple[str, t.BinaryIO]],
+        total: int,
+        callback: t.Optional[t.Callable[[str, t.Any], None]] = None,
+        exclusive: bool = False,
+    ) -> t.Dict[str, str]:
+        """Store the objects of the given streams in this repository.
+
+        With exclusive access, the objects are written directly to pack files, rather than as loose files that need to
+        be packed later. Writing to pack files directly is a maintenance operation of the container, that is not safe
+        while other processes use it. Without exclusive access, the objects are therefore stored as loose files.
+        """
+        if not exclusive:
+            return super().put_object_streams(streams, total, callback)
+
+        streams = iter(streams)
+        keys: t.List[str] = []
+
+        @contextlib.contextmanager
+        def open_next_stream() -> t.Iterator[t.BinaryIO]:
+            key, stream = next(streams)
+            keys.append(key)
+            yield stream
+
+        with self._container as container:
+            new_keys = container.add_streamed_objects_to_pack(
+                [open_next_stream() for _ in range(total)], open_streams=True, callback=callback
+            )
+
+        return dict(zip(keys, new_keys))
+
     def has_objects(self, keys: t.List[str]) -> t.List[bool]:
         with self._container as container:
             return container.has_objects(keys)
@@ -112,6 +145,35 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
             with container.get_object_stream(key) as handle:
                 yield handle  # type: ignore[misc]
 
+    def get_object_location(self, key: str) -> t.Optional[t.Tuple[pathlib.Path, int]]:
+        """Return the location on the local file system of the raw content of the object identified by key.
+
+        Loose objects are returned as the path of the loose file. Packed objects are returned as the path of the pack
+        and the offset within it, unless the object is compressed, in which case ``None`` is returned.
+
+        .. note:: a loose object may be packed and removed by a maintenance operation after its location is returned.
+            A file that is opened or memory-mapped before that remains readable on POSIX systems.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        from disk_objectstore import ObjectType
+        from disk_objectstore.exceptions import NotExistent
+
+        with self._container as container:
+            try:
+                meta = container.get_object_meta(key)
+            except NotExistent as exception:
+                raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+
+            if meta.type == ObjectType.LOOSE:
+                return container._get_loose_path_from_hashkey(key), 0
+
+            if meta.pack_compressed or meta.pack_id is None or meta.pack_offset is None:
+                return None
+
+            return container._get_pack_path_from_pack_id(meta.pack_id), meta.pack_offset
+
     def iter_object_streams(self, keys: t.List[str]) -> t.Iterator[t.Tuple[str, t.BinaryIO]]:
         with self._container.get_objects_stream_and_meta(keys) as triplets:
             for key, stream, _ in triplets:
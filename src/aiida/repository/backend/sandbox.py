@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import os
 import pathlib
 import shutil
@@ -26,6 +27,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         """
         self._sandbox: SandboxFolder | None = None
         self._filepath: str | None = filepath
+        self._object_hashes: dict[str, str] = {}
 
     def __str__(self) -> str:
         """Return the string representation of this repository."""
@@ -79,6 +81,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
                 pass
             finally:
                 self._sandbox = None
+                self._object_hashes.clear()
 
     def _put_object_from_filelike(self, handle: t.BinaryIO) -> str:
         """Store the byte contents of a file in the repository.
@@ -89,9 +92,15 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         """
         key = str(uuid.uuid4())
         filepath = os.path.join(self.sandbox.abspath, key)
+        hasher = hashlib.sha256()
 
+        # The hash is computed while writing the content, such that ``get_object_hash`` does not have to read it again
         with open(filepath, 'wb') as target:
-            shutil.copyfileobj(handle, target)
+            while chunk := handle.read(shutil.COPY_BUFSIZE):
+                hasher.update(chunk)
+                target.write(chunk)
+
+        self._object_hashes[key] = hasher.hexdigest()
 
         return key
 
@@ -109,6 +118,22 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         with self.sandbox.open(key, mode='rb') as handle:
             yield handle
 
+    def get_object_location(self, key: str) -> tuple[pathlib.Path, int] | None:
+        super().get_object_location(key)
+        return pathlib.Path(self.sandbox.abspath) / key, 0
+
+    def get_object_hash(self, key: str) -> str:
+        """Return the SHA-256 hash of an object stored under the given key.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :raise FileNotFoundError: if the file does not exist.
+        :raise OSError: if the file could not be opened.
+        """
+        try:
+            return self._object_hashes[key]
+        except KeyError:
+            return super().get_object_hash(key)
+
     def iter_object_streams(self, keys: list[str]) -> t.Iterator[tuple[str, t.BinaryIO]]:
         for key in keys:
             with self.open(key) as handle:
@@ -118,6 +143,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         super().delete_objects(keys)
         for key in keys:
             os.remove(os.path.join(self.sandbox.abspath, key))
+            self._object_hashes.pop(key, None)
 
     def list_objects(self) -> t.Iterable[str]:
         return self.sandbox.get_content_list()
@@ -407,6 +407,20 @@ class Repository:
         assert key is not None, 'Expected FileType.File to have a key'
         return self.backend.get_object_content(key)
 
+    def get_object_location(self, path: FilePath) -> Optional[Tuple[pathlib.Path, int]]:
+        """Return the location on the local file system of the raw content of the object identified by path.
+
+        :param path: the relative path of the object within the repository.
+        :return: tuple of the path of the file containing the content and the offset at which it starts, or ``None`` if
+            the backend does not store the raw content contiguously on the local file system.
+        :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
+        :raises FileNotFoundError: if the file does not exist.
+        :raises IsADirectoryError: if the object is a directory and not a file.
+        """
+        key = self.get_file(path).key
+        assert key is not None, 'Expected FileType.File to have a key'
+        return self.backend.get_object_location(key)
+
     def delete_object(self, path: FilePath, hard_delete: bool = False) -> None:
         """Soft delete the object from the repository.
 
@@ -9,9 +9,10 @@
 """Util methods"""
 
 import urllib.parse
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 
-from flask import jsonify
+from flask import Response, current_app, jsonify, stream_with_context
 from flask.json.provider import DefaultJSONProvider
 from wrapt import decorator
 
@@ -24,6 +25,10 @@ from aiida.restapi.common.exceptions import RestInputValidationError, RestValida
 PK_DBSYNONYM = 'id'
 # Example uuid (version 4)
 UUID_REF = 'd55082b6-76dc-426b-af89-0e08b59524d2'
+# Minimum number of characters of a chunk of a streamed JSON response
+STREAM_CHUNK_SIZE = 64 * 1024
+# Minimum number of results of a response for its JSON body to be streamed
+STREAM_MIN_RESULTS = 100
 
 
 ########################## Classes #####################
@@ -214,7 +219,14 @@ class Utils:
         return (resource_type, page, node_id, query_type)
 
     def validate_request(
-        self, limit=None, offset=None, perpage=None, page=None, query_type=None, is_querystring_defined=False
+        self,
+        limit=None,
+        offset=None,
+        perpage=None,
+        page=None,
+        query_type=None,
+        is_querystring_defined=False,
+        cursor=None,
     ):
         """Performs various checks on the consistency of the request.
         Add here all the checks that you want to do, except validity of the page
@@ -236,6 +248,12 @@ class Utils:
         # 4. No querystring if query type = projectable_properties'
         if query_type in ('projectable_properties',) and is_querystring_defined:
             raise RestInputValidationError('projectable_properties requests do not allow specifying a query string')
+        # 5. cursor pagination replaces pages and offsets, and applies only to lists of entities: the links of a node
+        # are excluded, since keyset pagination does not support queries with joins
+        if cursor is not None and (page is not None or offset is not None):
+            raise RestValidationError('cursor key is incompatible with pages and offset')
+        if cursor is not None and query_type != 'default':
+            raise RestValidationError('cursor key is only supported for lists of entities')
 
     def paginate(self, page, perpage, total_count):
         """Calculates limit and offset for the reults of a query,
@@ -301,21 +319,23 @@ class Utils:
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    def build_headers(self, rel_pages=None, url=None, total_count=None, next_cursor=None):
         """Construct the header dictionary for an HTTP response. It includes related
         pages, total count of results (before pagination).
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param total_count: the total number of results, or ``None`` if they were not counted, as for cursor pagination
+        :param next_cursor: the cursor of the next page of results, with cursor pagination, if there is one
         """
         ## Type validation
-        # mandatory parameters
-        try:
-            total_count = int(total_count)
-        except ValueError:
-            raise InputValidationError('total_count must be a long integer')
-
         # non mandatory parameters
+        if total_count is not None:
+            try:
+                total_count = int(total_count)
+            except ValueError:
+                raise InputValidationError('total_count must be a long integer')
+
         if rel_pages is not None and not isinstance(rel_pages, dict):
             raise InputValidationError('rel_pages must be a dictionary')
 
@@ -326,16 +346,17 @@ class Utils:
                 raise InputValidationError('url must be a string')
 
         ## Input consistency
-        # rel_pages cannot be defined without url
-        if rel_pages is not None and url is None:
-            raise InputValidationError("'rel_pages' parameter requires 'url' parameter to be defined")
+        # rel_pages and next_cursor cannot be defined without url
+        if (rel_pages is not None or next_cursor is not None) and url is None:
+            raise InputValidationError("'rel_pages' and 'next_cursor' parameters require 'url' parameter to be defined")
 
         headers = {}
+        expose_header = []
 
-        ## Setting mandatory headers
         # set X-Total-Count
-        headers['X-Total-Count'] = total_count
-        expose_header = ['X-Total-Count']
+        if total_count is not None:
+            headers['X-Total-Count'] = total_count
+            expose_header.append('X-Total-Count')
 
         ## Two auxiliary functions
         def split_url(url):
@@ -369,11 +390,30 @@ class Utils:
             else:
                 pass
 
+        # set the cursor of, and the link to, the next page of cursor pagination
+        if next_cursor is not None:
+            (path, query_string, _) = split_url(url)
+            fields = [field for field in query_string.split('&') if field and not field.startswith('cursor=')]
+            fields.append('cursor=' + urllib.parse.quote(f'"{next_cursor}"'))
+            headers['X-Next-Cursor'] = next_cursor
+            headers['Link'] = f"<{path}?{'&'.join(fields)}>; rel=next"
+            expose_header.extend(['X-Next-Cursor', 'Link'])
+
         # to expose header access in cross-domain requests
         headers['Access-Control-Expose-Headers'] = ','.join(expose_header)
 
         return headers
 
+    def get_num_results(self, total_count, limit=None, offset=None):
+        """Return the number of results returned by a query with the given limit and offset.
+
+        :param total_count: the total number of results of the query, without limit and offset
+        :param limit: the maximum number of results, which defaults to ``limit_default`` as for the translators
+        :param offset: the number of results that are skipped
+        """
+        limit = self.limit_default if limit is None else int(limit)
+        return max(0, min(total_count - int(offset or 0), limit))
+
     @staticmethod
     def build_response(status=200, headers=None, data=None):
         """Build the response
@@ -410,6 +450,63 @@ class Utils:
 
         return response
 
+    @staticmethod
+    def build_streamed_response(status=200, headers=None, data=None, num_results=None):
+        """Build a response whose JSON body is serialized while it is sent.
+
+        Lists of results in ``data`` can be passed as iterators, e.g. over the rows of a query, which are only consumed
+        when the body is sent. Neither all the results nor the complete serialized body are therefore held in memory.
+        The body is the same as that of :meth:`build_response` for the same data.
+
+        Iterating over query results may use the storage session of the thread after the resource method returned and
+        its connection was released by :func:`close_thread_connection`, so it is released again once the body is sent.
+
+        Since the status and headers are sent before the body, an exception raised while iterating over the results
+        truncates the body, which is then not valid JSON, of a response with status 200. Responses with fewer than
+        ``STREAM_MIN_RESULTS`` results, which are cheap to hold in memory, or without iterators in ``data`` are
+        therefore built by :meth:`build_response` instead, such that errors give a response with an error status.
+
+        :param status: status of the response, e.g. 200=OK, 400=bad request
+        :param headers: dictionary for additional header k,v pairs
+        :param data: a dictionary with the data returned by the Resource, where lists may be replaced by iterators
+        :param num_results: the number of results in ``data``, if it is known
+
+        :return: a Flask response object
+        """
+        if not isinstance(data, dict):
+            raise InputValidationError('data must be a dictionary')
+
+        if headers is not None and not isinstance(headers, dict):
+            raise InputValidationError('header must be a dictionary')
+
+        if not _contains_iterator(data) or (num_results is not None and num_results < STREAM_MIN_RESULTS):
+            return Utils.build_response(status=status, headers=headers, data=_materialize(data))
+
+        dumps = current_app.json.dumps
+
+        def generate():
+            chunk = []
+            size = 0
+            try:
+                for part in _iter_json(data, dumps):
+                    chunk.append(part)
+                    size += len(part)
+                    if size >= STREAM_CHUNK_SIZE:
+                        yield ''.join(chunk)
+                        chunk = []
+                        size = 0
+                yield ''.join(chunk) + '\n'
+            finally:
+                get_manager().get_profile_storage().get_session().close()
+
+        response = Response(stream_with_context(generate()), status=int(status), mimetype='application/json')
+
+        if headers is not None:
+            for key, val in headers.items():
+                response.headers[key] = val
+
+        return response
+
     @staticmethod
     def build_datetime_filter(dtobj):
         """This function constructs a filter for a datetime object to be in a
@@ -469,6 +566,7 @@ class Utils:
         extras = None
         extras_filter = None
         full_type = None
+        cursor = None
         profile = None
 
         # io tree limit parameters
@@ -523,6 +621,8 @@ class Utils:
             raise RestInputValidationError('You cannot specify extras_filter more than once')
         if 'full_type' in field_counts and field_counts['full_type'] > 1:
             raise RestInputValidationError('You cannot specify full_type more than once')
+        if 'cursor' in field_counts and field_counts['cursor'] > 1:
+            raise RestInputValidationError('You cannot specify cursor more than once')
         if 'profile' in field_counts and field_counts['profile'] > 1:
             raise RestInputValidationError('You cannot specify profile more than once')
 
@@ -533,6 +633,11 @@ class Utils:
                     profile = field[2]
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'profile'")
+            elif field[0] == 'cursor':
+                if field[1] == '=':
+                    cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'cursor'")
             elif field[0] == 'limit':
                 if field[1] == '=':
                     limit = field[2]
@@ -661,6 +766,7 @@ class Utils:
             extras,
             extras_filter,
             full_type,
+            cursor,
             profile,
         )
 
@@ -827,6 +933,45 @@ class Utils:
         return self.build_translator_parameters(field_list)
 
 
+def _iter_json(obj, dumps):
+    """Yield the parts of the JSON serialization of an object, whose lists may be replaced by iterators.
+
+    Only the dictionaries containing iterators are serialized part by part, other values are serialized at once.
+
+    :param obj: the object to serialize.
+    :param dumps: the function serializing a value.
+    """
+    if isinstance(obj, Iterator):
+        yield '['
+        for index, item in enumerate(obj):
+            yield f',{dumps(item)}' if index else dumps(item)
+        yield ']'
+    elif isinstance(obj, dict) and _contains_iterator(obj):
+        yield '{'
+        for index, key in enumerate(sorted(obj)):
+            yield f',{dumps(key)}:' if index else f'{dumps(key)}:'
+            yield from _iter_json(obj[key], dumps)
+        yield '}'
+    else:
+        yield dumps(obj)
+
+
+def _materialize(obj):
+    """Return a copy of a dictionary whose iterators, also in nested dictionaries, are replaced by lists."""
+    if isinstance(obj, Iterator):
+        return list(obj)
+    if isinstance(obj, dict):
+        return {key: _materialize(value) for key, value in obj.items()}
+    return obj
+
+
+def _contains_iterator(obj):
+    """Return whether the values of a dictionary are, or nested dictionaries contain, iterators."""
+    return any(
+        isinstance(value, Iterator) or (isinstance(value, dict) and _contains_iterator(value)) for value in obj.values()
+    )
+
+
 def list_routes():
     """List available routes"""
     from flask import current_app
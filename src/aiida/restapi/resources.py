@@ -10,7 +10,7 @@
 
 from urllib.parse import unquote
 
-from flask import make_response, request
+from flask import Response, make_response, request
 from flask_restful import Resource
 
 from aiida.common.lang import classproperty
@@ -177,6 +177,7 @@ class BaseResource(Resource):
         perpage = parameters[2]
         orderby = parameters[3]
         filters = parameters[4]
+        cursor = parameters[-2]
         profile = parameters[-1]
 
         try:
@@ -204,8 +205,12 @@ class BaseResource(Resource):
             page=page,
             query_type=query_type,
             is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
         )
 
+        ## The number of results is only known for counted lists of entities
+        num_results = None
+
         ## Treat the projectable_properties case which does not imply access to the DataBase
         if query_type == 'projectable_properties':
             ## Retrieve the projectable properties
@@ -218,20 +223,27 @@ class BaseResource(Resource):
             ## Set the query, and initialize qb object
             self.trans.set_query(filters=filters, orders=orderby, node_id=node_id)
 
-            ## Count results
-            total_count = self.trans.get_total_count()
+            ## Cursor pagination (if required), which does not count the results
+            if cursor is not None:
+                results, next_cursor = self.trans.get_page(limit or self.utils.perpage_default, cursor)
+                headers = self.utils.build_headers(url=request.url, next_cursor=next_cursor)
 
-            ## Pagination (if required)
-            if page is not None:
-                (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
-                self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
             else:
-                self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
-
-            ## Retrieve results
-            results = self.trans.get_results()
+                ## Count results
+                total_count = self.trans.get_total_count()
+
+                ## Pagination (if required)
+                if page is not None:
+                    (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
+                    self.trans.set_limit_offset(limit=limit, offset=offset)
+                    headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+                else:
+                    self.trans.set_limit_offset(limit=limit, offset=offset)
+                    headers = self.utils.build_headers(url=request.url, total_count=total_count)
+
+                ## Retrieve results, which are streamed while the response is sent if there are many
+                num_results = self.utils.get_num_results(total_count, limit, offset)
+                results = self.trans.iter_results()
 
         ## Build response and return it
         data = dict(
@@ -245,7 +257,7 @@ class BaseResource(Resource):
             data=results,
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self.utils.build_streamed_response(status=200, headers=headers, data=data, num_results=num_results)
 
 
 class QueryBuilder(BaseResource):
@@ -425,6 +437,7 @@ class Node(BaseResource):
             extras,
             extras_filter,
             full_type,
+            cursor,
             profile,
         ) = self.parse_query_string(query_string)
 
@@ -453,8 +466,12 @@ class Node(BaseResource):
             page=page,
             query_type=query_type,
             is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
         )
 
+        ## The number of results is only known for counted lists of entities
+        num_results = None
+
         ## Treat the projectable properties case which does not imply access to the DataBase
         if query_type == 'projectable_properties':
             ## Retrieve the projectable properties
@@ -511,26 +528,36 @@ class Node(BaseResource):
                 full_type=full_type,
             )
 
-            ## Count results
-            total_count = self.trans.get_total_count()
+            ## Cursor pagination (if required), which does not count the results
+            if cursor is not None:
+                results, next_cursor = self.trans.get_page(limit or self.utils.perpage_default, cursor)
+                headers = self.utils.build_headers(url=request.url, next_cursor=next_cursor)
 
             ## Pagination (if required)
-            if page is not None:
+            elif page is not None:
+                ## Count results
+                total_count = self.trans.get_total_count()
+
                 (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
 
-                ## Retrieve results
-                results = self.trans.get_results()
+                ## Retrieve results, which are streamed while the response is sent if there are many
+                num_results = self.utils.get_num_results(total_count, limit, offset)
+                results = self.trans.iter_results()
 
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
             else:
+                ## Count results
+                total_count = self.trans.get_total_count()
+
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                ## Retrieve results
-                results = self.trans.get_results()
+                ## Retrieve results, which are streamed while the response is sent if there are many
+                num_results = self.utils.get_num_results(total_count, limit, offset)
+                results = self.trans.iter_results()
 
-                if query_type == 'repo_contents' and results:
-                    response = make_response(results)
-                    response.headers['content-type'] = 'application/octet-stream'
+                if query_type == 'repo_contents':
+                    # The file is read in chunks while it is sent
+                    response = Response(results, mimetype='application/octet-stream')
                     response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
                     return response
 
@@ -549,22 +576,10 @@ class Node(BaseResource):
                 headers = self.utils.build_headers(url=request.url, total_count=total_count)
 
             if attributes_filter is not None and attributes:
-                for node in results['nodes']:
-                    node['attributes'] = {}
-                    if not isinstance(attributes_filter, list):
-                        attributes_filter = [attributes_filter]
-                    for attr in attributes_filter:
-                        node['attributes'][str(attr)] = node[f'attributes.{attr!s}']
-                        del node[f'attributes.{attr!s}']
+                results['nodes'] = self.nest_projections(results['nodes'], 'attributes', attributes_filter)
 
             if extras_filter is not None and extras:
-                for node in results['nodes']:
-                    node['extras'] = {}
-                    if not isinstance(extras_filter, list):
-                        extras_filter = [extras_filter]
-                    for extra in extras_filter:
-                        node['extras'][str(extra)] = node[f'extras.{extra!s}']
-                        del node[f'extras.{extra!s}']
+                results['nodes'] = self.nest_projections(results['nodes'], 'extras', extras_filter)
 
         ## Build response
         data = dict(
@@ -578,7 +593,27 @@ class Node(BaseResource):
             data=results,
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self.utils.build_streamed_response(status=200, headers=headers, data=data, num_results=num_results)
+
+    @staticmethod
+    def nest_projections(nodes, name, keys):
+        """Nest the projected attributes or extras of the nodes, while they are iterated over.
+
+        The projections ``<name>.<key>`` of each node are moved to the dictionary ``<name>`` of the node.
+
+        :param nodes: iterable of the nodes
+        :param name: either ``attributes`` or ``extras``
+        :param keys: a key, or list of keys, of the projections
+        :return: iterator over the nodes
+        """
+        if not isinstance(keys, list):
+            keys = [keys]
+
+        for node in nodes:
+            node[name] = {}
+            for key in keys:
+                node[name][str(key)] = node.pop(f'{name}.{key!s}')
+            yield node
 
 
 class Computer(BaseResource):
@@ -17,7 +17,7 @@ from flask_cors import CORS
 from . import api as api_classes
 from .common.config import API_CONFIG, APP_CONFIG, CLI_DEFAULTS
 
-__all__ = ('run_api', 'configure_api')
+__all__ = ('run_api', 'configure_api', 'configure_asgi_api')
 
 
 def run_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **kwargs):
@@ -104,3 +104,36 @@ def configure_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **k
 
     # Instantiate and return a Flask RESTful API by associating its app
     return flask_api(app, posting=posting, **config_module.API_CONFIG, profile=profile)
+
+
+def configure_asgi_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, workers=10, **kwargs):
+    """Configures a flask.Flask instance and returns it wrapped in an ASGI adapter.
+
+    This requires the ``rest-asgi`` extra. The adapter only allows the API to be served by an ASGI server, e.g. with::
+
+        uvicorn --factory aiida.restapi.run_api:configure_asgi_api
+
+    The requests are not handled asynchronously: each request is still handled synchronously by the WSGI application
+    of Flask in one of a fixed pool of ``workers`` threads. The number of requests that are handled concurrently is
+    therefore limited by the number of threads, as with a threaded WSGI server.
+
+    :param flask_app: Class inheriting from flask app class
+    :type flask_app: :py:class:`flask.Flask`
+    :param flask_api: flask_restful API class to be used to wrap the app
+    :type flask_api: :py:class:`flask_restful.Api`
+    :param workers: the number of threads handling requests concurrently
+    :param kwargs: the parameters of :func:`configure_api`
+
+    :returns: ASGI application
+    """
+    try:
+        from a2wsgi import WSGIMiddleware
+    except ImportError as exception:
+        raise ImportError(
+            'Failed to import modules required for the ASGI adapter of the REST API. '
+            'You may need to install the `rest-asgi` extra, e.g. via `pip install aiida-core[rest-asgi]`.'
+        ) from exception
+
+    api = configure_api(flask_app, flask_api, **kwargs)
+
+    return WSGIMiddleware(api.app, workers=workers)
@@ -368,6 +368,32 @@ class BaseTranslator:
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
+    def format_result(self, row, label):
+        """Extract the entity tagged as "label" out of a row of the query results.
+
+        :param row: a row of the query results, in the format of ``QueryBuilder.dict``.
+        :param label: the tag of the entity to be extracted out of the row.
+        :return: the entity
+        """
+        entity = row[label]
+
+        # Note: In code cleanup and design change, remove this node dependant part
+        # from base class and move it to node translator.
+        if self._result_type in ['with_outgoing', 'with_incoming']:
+            entity['link_type'] = row[f'{self.__label__}--{label}']['type']
+            entity['link_label'] = row[f'{self.__label__}--{label}']['label']
+
+        return entity
+
+    def get_result_name(self):
+        """Return the name of the list of results in the response."""
+        # TODO think how to make it less hardcoded
+        if self._result_type == 'with_outgoing':
+            return 'incoming'
+        if self._result_type == 'with_incoming':
+            return 'outgoing'
+        return self.__label__
+
     def get_formatted_result(self, label):
         """Runs the query and retrieves results tagged as "label".
 
@@ -381,25 +407,9 @@ class BaseTranslator:
 
         results = []
         if self._total_count > 0:
-            for res in self.qbobj.dict():
-                tmp = res[label]
-
-                # Note: In code cleanup and design change, remove this node dependant part
-                # from base class and move it to node translator.
-                if self._result_type in ['with_outgoing', 'with_incoming']:
-                    tmp['link_type'] = res[f'{self.__label__}--{label}']['type']
-                    tmp['link_label'] = res[f'{self.__label__}--{label}']['label']
-                results.append(tmp)
-
-        # TODO think how to make it less hardcoded
-        if self._result_type == 'with_outgoing':
-            result = {'incoming': results}
-        elif self._result_type == 'with_incoming':
-            result = {'outgoing': results}
-        else:
-            result = {self.__label__: results}
+            results = [self.format_result(row, label) for row in self.qbobj.dict()]
 
-        return result
+        return {self.get_result_name(): results}
 
     def get_results(self):
         """Returns either list of nodes or details of single node from database.
@@ -419,6 +429,66 @@ class BaseTranslator:
         data = self.get_formatted_result(self._result_type)
         return data
 
+    def iter_results(self):
+        """Returns the same data as ``get_results``, but with the list of results replaced by an iterator.
+
+        The rows are streamed from the database while the iterator is consumed, so that only a batch of them is held in
+        memory at once. The query is only executed once the iteration starts, so it should have been validated before,
+        e.g. by counting its results, which this method does if not done already.
+
+        :return: a dictionary with an iterator over the results
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        if self._total_count is None:
+            self.count()
+
+        label = self._result_type
+
+        if self._total_count > 0:
+            results = (self.format_result(row, label) for row in self.qbobj.iterdict(stream=True))
+        else:
+            results = iter(())
+
+        return {self.get_result_name(): results}
+
+    def get_page(self, page_size, cursor=None):
+        """Returns a page of the results with keyset pagination, without counting the results of the query.
+
+        The page is selected on the values of the ordering fields of the last result of the previous page, which are
+        encoded in its cursor. Contrary to ``set_limit_offset``, the rows of the previous pages are therefore not
+        scanned by the database, see :meth:`aiida.orm.querybuilder.QueryBuilder.paginate`.
+
+        :param page_size: the maximum number of results of the page.
+        :param cursor: the cursor returned with the previous page, or ``None`` (or an empty string) for the first page.
+        :return: tuple of the results, in the format of ``get_results``, and the cursor of the next page, which is
+            ``None`` if this is the last page.
+        :raise RestValidationError: if the page size or the cursor is invalid, or the ordering is not supported.
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise InputValidationError('Limit value must be an integer')
+        if page_size > self.limit_default:
+            raise RestValidationError(f'Limit and perpage cannot be bigger than {self.limit_default}')
+
+        # Copy the ordering, since the ``QueryBuilder`` normalizes it in place
+        order_by = {tag: dict(columns) for tag, columns in self._query_help['order_by'].items()} or None
+
+        try:
+            page = self.qbobj.paginate(page_size, order_by=order_by, after=cursor or None)
+        except ValueError as exception:
+            raise RestValidationError(str(exception))
+
+        label = self._result_type
+        results = [self.format_result(row, label) for row in page.results]
+
+        return {self.get_result_name(): results}, page.next_token
+
     def _check_id_validity(self, node_id):
         """Checks whether id corresponds to an object of the expected type,
         whenever type is a valid column of the database (ex. for nodes,
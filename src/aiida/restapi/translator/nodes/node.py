@@ -27,6 +27,7 @@ from aiida.common.exceptions import (
 from aiida.manage import get_manager
 from aiida.orm import Data, Node
 from aiida.plugins.entry_point import get_entry_point_names, load_entry_point
+from aiida.repository import FileType
 from aiida.restapi.common.exceptions import RestFeatureNotAvailable, RestInputValidationError, RestValidationError
 from aiida.restapi.common.identifiers import (
     construct_full_type,
@@ -36,6 +37,9 @@ from aiida.restapi.common.identifiers import (
 )
 from aiida.restapi.translator.base import BaseTranslator
 
+# Size in bytes of the chunks in which files of node repositories are sent
+REPO_CHUNK_SIZE = 1024 * 1024
+
 
 class NodeTranslator(BaseTranslator):
     """Translator relative to resource 'nodes' and aiida class Node"""
@@ -281,8 +285,8 @@ class NodeTranslator(BaseTranslator):
             data = {self._content_type: self.get_repo_list(node, self._filename)}
 
         elif self._content_type == 'repo_contents':
-            # return the contents of single file from node file repository
-            data = self.get_repo_contents(node, self._filename)
+            # return the contents of single file from node file repository, read in chunks while it is sent
+            data = self.iter_repo_contents(node, self._filename)
 
         elif self._content_type == 'comments':
             # return the node comments
@@ -490,6 +494,35 @@ class NodeTranslator(BaseTranslator):
                 raise RestInputValidationError('No such file is present')
         raise RestValidationError('filename is not provided')
 
+    @staticmethod
+    def iter_repo_contents(node, filename='', chunk_size=REPO_CHUNK_SIZE):
+        """Return an iterator over the content of a file of the repository of a node, in chunks.
+
+        Contrary to ``get_repo_contents``, the file is not read into memory at once, but while the iterator is consumed.
+        The file is looked up immediately, such that a missing file raises before the iteration starts.
+
+        :param node: node object
+        :param filename: file name
+        :param chunk_size: the maximum size in bytes of the chunks
+        :return: iterator over the chunks of the file content in bytes
+        """
+        if not filename:
+            raise RestValidationError('filename is not provided')
+
+        try:
+            file_object = node.base.repository.get_object(filename)
+        except FileNotFoundError:
+            raise RestInputValidationError('No such file is present')
+
+        if file_object.file_type != FileType.FILE:
+            raise RestInputValidationError(f'{filename} is not a file in this repository')
+
+        def iter_chunks():
+            with node.base.repository.open(filename, mode='rb') as handle:
+                yield from iter(lambda: handle.read(chunk_size), b'')
+
+        return iter_chunks()
+
     @staticmethod
     def get_comments(node):
         """:param node: node object
@@ -540,32 +573,33 @@ class NodeTranslator(BaseTranslator):
 
         return super().get_results()
 
-    def get_formatted_result(self, label):
-        """Runs the query and retrieves results tagged as "label".
+    def iter_results(self):
+        """Returns either an iterator over the nodes or the details of a single node from the database
 
-        :param label: the tag of the results to be extracted out of
-          the query rows.
-        :type label: str
-        :return: a list of the query results
+        :return: either a dictionary with an iterator over the nodes or the details of a single node from the database
         """
-        results = super().get_formatted_result(label)
+        if self._content_type is not None:
+            return self._get_content()
 
-        if self._result_type == 'with_outgoing':
-            result_name = 'incoming'
-        elif self._result_type == 'with_incoming':
-            result_name = 'outgoing'
-        else:
-            result_name = self.__label__
-
-        for node_entry in results[result_name]:
-            # construct full_type and add it to every node
-            node_entry['full_type'] = (
-                construct_full_type(node_entry.get('node_type'), node_entry.get('process_type'))
-                if node_entry.get('node_type') or node_entry.get('process_type')
-                else None
-            )
+        return super().iter_results()
 
-        return results
+    def format_result(self, row, label):
+        """Extract the node tagged as "label" out of a row of the query results and add its full type.
+
+        :param row: a row of the query results, in the format of ``QueryBuilder.dict``.
+        :param label: the tag of the node to be extracted out of the row.
+        :return: the node
+        """
+        node_entry = super().format_result(row, label)
+
+        # construct full_type and add it to every node
+        node_entry['full_type'] = (
+            construct_full_type(node_entry.get('node_type'), node_entry.get('process_type'))
+            if node_entry.get('node_type') or node_entry.get('process_type')
+            else None
+        )
+
+        return node_entry
 
     def get_statistics(self, user_pk=None):
         """Return statistics for a given node"""
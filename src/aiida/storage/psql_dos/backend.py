@@ -12,11 +12,11 @@ import functools
 import gc
 import pathlib
 from contextlib import contextmanager, nullcontext
-from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Set, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from disk_objectstore import Container, backup_utils
 from pydantic import BaseModel, Field
-from sqlalchemy import column, insert, update
+from sqlalchemy import column, event, insert, inspect, update
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from aiida.common import exceptions
@@ -32,8 +32,12 @@ from aiida.storage.psql_dos.models import base
 from .orm import authinfos, comments, computers, convert, groups, logs, nodes, querybuilder, users
 
 if TYPE_CHECKING:
+    from aiida.common.links import LinkType
+    from aiida.orm.utils.links import LinkQuadruple
     from aiida.repository.backend import DiskObjectStoreRepositoryBackend
 
+    from .orm.querybuilder.cache import QueryCache
+
 __all__ = ('PsqlDosBackend',)
 
 LOGGER = AIIDA_LOGGER.getChild(__file__)
@@ -141,8 +145,12 @@ class PsqlDosBackend(StorageBackend):
 
         self._session_factory: Optional[scoped_session] = None
         self._initialise_session()
+        session_factory = self._session_factory.session_factory  # type: ignore[union-attr]
+        for identifier in ('persistent_to_detached', 'persistent_to_deleted', 'persistent_to_transient'):
+            event.listen(session_factory, identifier, self._discard_from_node_identity_map)
         # save the URL of the database, for use in the __str__ method
         self._db_url = self.get_session().get_bind().url  # type: ignore[union-attr]
+        self._query_cache = self._initialise_query_cache()
 
         self._authinfos = authinfos.SqlaAuthInfoCollection(self)
         self._comments = comments.SqlaCommentCollection(self)
@@ -175,6 +183,44 @@ class PsqlDosBackend(StorageBackend):
         engine = create_sqlalchemy_engine(self._profile.storage_config)  # type: ignore[arg-type]
         self._session_factory = scoped_session(sessionmaker(bind=engine, future=True, expire_on_commit=True))
 
+    def _initialise_query_cache(self) -> Optional['QueryCache']:
+        """Initialise the cache of query results, if enabled by the ``db.query_cache_size`` option of the profile.
+
+        The cache is invalidated by the writes executed through the engine of the session factory.
+        """
+        from aiida.manage.configuration import get_config_option
+
+        from .orm.querybuilder.cache import QueryCache
+
+        max_entries = self._profile.get_option('db.query_cache_size', get_config_option('db.query_cache_size'))
+        ttl = self._profile.get_option('db.query_cache_ttl', get_config_option('db.query_cache_ttl'))
+
+        if max_entries <= 0:
+            return None
+
+        query_cache = QueryCache(max_entries, ttl)
+        query_cache.watch(self.get_session().get_bind())  # type: ignore[arg-type]
+        return query_cache
+
+    def _discard_from_node_identity_map(self, session: Session, instance: base.Base) -> None:
+        """Remove the node of a model that is no longer persistent in the session from the node identity map.
+
+        The node would otherwise be returned with a model that is detached from the session, or no longer exists.
+        """
+        if getattr(instance, '__tablename__', None) != 'db_dbnode':
+            return
+
+        identity = inspect(instance).identity
+        pk = identity[0] if identity else instance.__dict__.get('id')
+
+        if pk is not None:
+            self.node_identity_map.discard((pk,))
+
+    @property
+    def query_cache(self) -> Optional['QueryCache']:
+        """Return the cache of query results, or ``None`` if it is disabled."""
+        return self._query_cache
+
     def get_session(self) -> Session:
         """Return an SQLAlchemy session bound to the current thread."""
         if self._session_factory is None:
@@ -193,6 +239,8 @@ class PsqlDosBackend(StorageBackend):
         self._session_factory.close()
         self._session_factory = None
 
+        self._query_cache = None
+
         # Without this, sqlalchemy keeps a weakref to a session
         # in sqlalchemy.orm.session._sessions
         gc.collect()
@@ -212,6 +260,9 @@ class PsqlDosBackend(StorageBackend):
             # Clear out all references to database model instances which are now invalid.
             self.get_session().expunge_all()
 
+            if self._query_cache is not None:
+                self._query_cache.invalidate()
+
             # Now reset and reinitialise the repository
             migrator.reset_repository()
             migrator.initialise_repository()
@@ -396,6 +447,28 @@ class PsqlDosBackend(StorageBackend):
         # Delete the actual nodes
         session.query(DbNode).filter(DbNode.id.in_(list(pks_to_delete))).delete(synchronize_session='fetch')
 
+    def traverse_graph(
+        self,
+        starting_pks: Iterable[int],
+        links_forward: Iterable['LinkType'] = (),
+        links_backward: Iterable['LinkType'] = (),
+        get_links: bool = False,
+    ) -> Tuple[Set[int], Optional[Set['LinkQuadruple']]]:
+        from aiida.storage.psql_dos.graph import traverse_graph
+
+        node_mapper, _ = self._get_mapper_from_entity(EntityTypes.NODE, True)
+        link_mapper, _ = self._get_mapper_from_entity(EntityTypes.LINK, True)
+
+        return traverse_graph(
+            self.get_session(),
+            node_mapper.class_,
+            link_mapper.class_,
+            starting_pks,
+            links_forward,
+            links_backward,
+            get_links,
+        )
+
     def get_backend_entity(self, model: base.Base) -> BackendEntity:
         """Return the backend entity that corresponds to the given Model instance
 
@@ -481,6 +554,8 @@ class PsqlDosBackend(StorageBackend):
     def get_info(self, detailed: bool = False) -> dict:
         results = super().get_info(detailed=detailed)
         results['repository'] = self.get_repository().get_info(detailed)
+        if self._query_cache is not None:
+            results['query_cache'] = self._query_cache.statistics
         return results
 
     def _backup_storage(
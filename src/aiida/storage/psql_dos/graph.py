@@ -0,0 +1,102 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Traversal of the provenance graph with a recursive query."""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session
+
+from aiida.orm.utils.links import LinkQuadruple
+
+if TYPE_CHECKING:
+    from aiida.common.links import LinkType
+
+__all__ = ('traverse_graph',)
+
+
+def traverse_graph(
+    session: Session,
+    node_model: Any,
+    link_model: Any,
+    starting_pks: Iterable[int],
+    links_forward: Iterable['LinkType'] = (),
+    links_backward: Iterable['LinkType'] = (),
+    get_links: bool = False,
+) -> Tuple[Set[int], Optional[Set[LinkQuadruple]]]:
+    """Return the nodes that can be reached from the starting nodes by traversing links of the given types.
+
+    The closure is computed by the database with a single recursive common table expression, which is supported by both
+    PostgreSQL and SQLite. The links that may be traversed are collected in a subquery with one row per link and
+    direction, from its ``source_id`` to its ``target_id``, and the recursive term follows them from the nodes reached
+    so far. Since the results are combined with ``UNION``, nodes that were already reached are discarded and the
+    recursion terminates, also if the links form cycles.
+
+    :param session: the session to execute the query with.
+    :param node_model: the model of the nodes table.
+    :param link_model: the model of the links table.
+    :param starting_pks: the pks of the starting nodes, pks of nodes that do not exist are ignored.
+    :param links_forward: the types of the links to traverse from their input to their output node.
+    :param links_backward: the types of the links to traverse from their output to their input node.
+    :param get_links: whether to also return the traversed links.
+    :returns: the pks of the reached nodes, including the starting nodes, and the traversed links if ``get_links`` is
+        ``True``, otherwise ``None``.
+    """
+    node, link = node_model, link_model
+    edges = []
+
+    types_forward = [link_type.value for link_type in links_forward]
+    types_backward = [link_type.value for link_type in links_backward]
+
+    if types_forward:
+        edges.append(
+            select(link.input_id.label('source_id'), link.output_id.label('target_id'), link.id.label('link_id')).where(
+                link.type.in_(types_forward)
+            )
+        )
+
+    if types_backward:
+        edges.append(
+            select(link.output_id.label('source_id'), link.input_id.label('target_id'), link.id.label('link_id')).where(
+                link.type.in_(types_backward)
+            )
+        )
+
+    reachable = select(node.id.label('id')).where(node.id.in_(set(starting_pks))).cte('reachable', recursive=True)
+
+    if edges:
+        edge = (union_all(*edges) if len(edges) > 1 else edges[0]).subquery('edge')
+        reachable = reachable.union(
+            select(edge.c.target_id).join(reachable, edge.c.source_id == reachable.c.id)  # type: ignore[arg-type]
+        )
+
+    if not get_links:
+        return set(session.execute(select(reachable.c.id)).scalars()), None
+
+    if not edges:
+        return set(session.execute(select(reachable.c.id)).scalars()), set()
+
+    # The nodes and the links traversed from each of them are returned in one round trip, nodes without any traversed
+    # links are returned once with ``NULL`` for the link columns
+    query = (
+        select(reachable.c.id, link.input_id, link.output_id, link.type, link.label)
+        .select_from(reachable)
+        .outerjoin(edge, edge.c.source_id == reachable.c.id)
+        .outerjoin(link, link.id == edge.c.link_id)
+    )
+
+    nodes: Set[int] = set()
+    links: Set[LinkQuadruple] = set()
+
+    for pk, source_id, target_id, link_type, link_label in session.execute(query):
+        nodes.add(pk)
+        if source_id is not None:
+            links.add(LinkQuadruple(source_id, target_id, link_type, link_label))
+
+    return nodes, links
@@ -0,0 +1,42 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add an index on the ``_aiida_hash`` extra of ``DbNode``.
+
+The caching mechanism looks up nodes by their hash every time a cachable node is stored. Without an index this is a
+sequential scan over the ``db_dbnode`` table.
+
+Revision ID: main_0003
+Revises: main_0002
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0003'
+down_revision = 'main_0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_extras_aiida_hash',
+        'db_dbnode',
+        [sa.text("(extras ->> '_aiida_hash')")],
+        unique=False,
+        postgresql_using='btree',
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_extras_aiida_hash', table_name='db_dbnode')
@@ -0,0 +1,50 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add indexes on the ``process_state`` and ``process_label`` attributes of ``DbNode``.
+
+Listing processes, e.g. with ``verdi process list``, filters on these attributes. Without an index this is a sequential
+scan over the ``db_dbnode`` table.
+
+Revision ID: main_0004
+Revises: main_0003
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0004'
+down_revision = 'main_0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_attributes_process_state',
+        'db_dbnode',
+        [sa.text("(attributes ->> 'process_state')")],
+        unique=False,
+        postgresql_using='btree',
+    )
+    op.create_index(
+        'ix_db_dbnode_attributes_process_label',
+        'db_dbnode',
+        [sa.text("(attributes ->> 'process_label')")],
+        unique=False,
+        postgresql_using='btree',
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_attributes_process_label', table_name='db_dbnode')
+    op.drop_index('ix_db_dbnode_attributes_process_state', table_name='db_dbnode')
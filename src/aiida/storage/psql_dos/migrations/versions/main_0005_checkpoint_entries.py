@@ -0,0 +1,50 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add the ``checkpoint_entry`` table.
+
+The table stores entries of the checkpoint of a running process, such as the keys of the context of a ``WorkChain``, in
+separate rows, such that a checkpoint only has to write the entries that changed since the previous checkpoint.
+
+Revision ID: main_0005
+Revises: main_0004
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0005'
+down_revision = 'main_0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_table(
+        'checkpoint_entry',
+        sa.Column('id', sa.Integer(), nullable=False, primary_key=True),
+        sa.Column('dbnode_id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('value', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['dbnode_id'],
+            ['db_dbnode.id'],
+            ondelete='CASCADE',
+            initially='DEFERRED',
+            deferrable=True,
+        ),
+        sa.UniqueConstraint('dbnode_id', 'key'),
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_table('checkpoint_entry')
@@ -10,9 +10,9 @@
 
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import backref, relationship
-from sqlalchemy.schema import Column
+from sqlalchemy.schema import Column, UniqueConstraint
 from sqlalchemy.sql.schema import ForeignKey, Index
-from sqlalchemy.types import DateTime, Integer, String, Text
+from sqlalchemy.types import DateTime, Integer, LargeBinary, String, Text
 
 from aiida.common import timezone
 from aiida.common.utils import get_new_uuid
@@ -104,6 +104,11 @@ class DbNode(Base):
             postgresql_using='btree',
             postgresql_ops={'process_type': 'varchar_pattern_ops'},
         ),
+        # used by the caching mechanism to look up nodes by their hash, see ``SqlaNodeCollection.iter_by_hash``
+        Index('ix_db_dbnode_extras_aiida_hash', extras['_aiida_hash'].astext, postgresql_using='btree'),
+        # used by ``verdi process list`` to filter processes on their state and label
+        Index('ix_db_dbnode_attributes_process_state', attributes['process_state'].astext, postgresql_using='btree'),
+        Index('ix_db_dbnode_attributes_process_label', attributes['process_label'].astext, postgresql_using='btree'),
     )
 
     @property
@@ -198,3 +203,27 @@ class DbLink(Base):
             self.output.get_simple_name(invalid_result='Unknown node'),
             self.output.pk,
         )
+
+
+class DbCheckpointEntry(Base):
+    """Database model to store the entries of the checkpoint of a running process that are stored separately.
+
+    Large and independently changing parts of a checkpoint, such as the keys of the context of a ``WorkChain``, are
+    stored in one row per key, such that a new checkpoint only has to write the rows of the entries that changed.
+
+    The entries are runtime state of a process rather than provenance, so the table is not part of the schema of
+    archives, hence it does not share the ``db_`` prefix of the tables that they mirror.
+    """
+
+    __tablename__ = 'checkpoint_entry'
+
+    id = Column(Integer, primary_key=True)
+    dbnode_id = Column(
+        Integer,
+        ForeignKey('db_dbnode.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+        nullable=False,
+    )
+    key = Column(String(255), nullable=False)
+    value = Column(LargeBinary, nullable=False)
+
+    __table_args__ = (UniqueConstraint('dbnode_id', 'key'),)
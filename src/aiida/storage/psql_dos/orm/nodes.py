@@ -8,10 +8,12 @@
 ###########################################################################
 """SqlAlchemy implementation of the `BackendNode` and `BackendNodeCollection` classes."""
 
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Dict, Iterable, Tuple, Type
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Type
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import delete, insert, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
 from aiida.common import exceptions
@@ -34,6 +36,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
     USER_CLASS = SqlaUser
     COMPUTER_CLASS = SqlaComputer
     LINK_CLASS = models.DbLink
+    CHECKPOINT_ENTRY_CLASS: Optional[Type[models.DbCheckpointEntry]] = models.DbCheckpointEntry
 
     def __init__(
         self,
@@ -304,6 +307,32 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
         for key in self.model.attributes.keys():
             yield key
 
+    def get_checkpoint_entries(self) -> Dict[str, bytes]:
+        model = self.CHECKPOINT_ENTRY_CLASS
+        if model is None:
+            raise NotImplementedError
+        session = self.backend.get_session()
+        return dict(session.query(model.key, model.value).filter(model.dbnode_id == self.pk).all())
+
+    def update_checkpoint_entries(self, entries: Dict[str, bytes], keys: Iterable[str]) -> None:
+        model = self.CHECKPOINT_ENTRY_CLASS
+        if model is None:
+            raise NotImplementedError
+        session = self.backend.get_session()
+
+        with nullcontext() if self.backend.in_transaction else self.backend.transaction():
+            # Delete the entries that were removed or that are replaced, since an upsert is not portable across dialects
+            session.execute(
+                delete(model).where(
+                    model.dbnode_id == self.pk, or_(model.key.not_in(list(keys)), model.key.in_(list(entries)))
+                )
+            )
+            if entries:
+                session.execute(
+                    insert(model),
+                    [{'dbnode_id': self.pk, 'key': key, 'value': value} for key, value in entries.items()],
+                )
+
 
 class SqlaNodeCollection(BackendNodeCollection):
     """The collection of Node entries."""
@@ -329,3 +358,82 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent(f"Node with pk '{pk}' not found") from NoResultFound
+
+    def bulk_store(
+        self,
+        nodes: Sequence[SqlaNode],  # type: ignore[override]
+        links: Optional[Sequence[Sequence[Any]]] = None,
+        clean: bool = True,
+    ) -> None:
+        """Store multiple nodes, and their incoming links, in a single transaction.
+
+        The rows are added to the session together such that SQLAlchemy inserts them with batched statements. The
+        session is flushed once to assign the primary keys, which are needed for the links, and committed once.
+
+        :raises `aiida.common.IntegrityError`: if a database integrity error is raised while storing, in which case none
+            of the nodes and links are stored.
+        """
+        node_links = links if links is not None else [[] for _ in nodes]
+
+        if len(node_links) != len(nodes):
+            raise ValueError('the number of links entries does not match the number of nodes')
+
+        for node in nodes:
+            type_check(node, self.ENTITY_CLASS)
+
+        with sqla_utils.disable_expire_on_commit(self.backend.get_session()) as session:
+            nested = session.in_nested_transaction()
+
+            try:
+                for node in nodes:
+                    if clean:
+                        node.clean_values()
+                    session.add(node.bare_model)
+
+                session.flush()
+
+                session.add_all(
+                    node.LINK_CLASS(input_id=source.pk, output_id=node.pk, label=link_label, type=link_type.value)
+                    for node, incoming in zip(nodes, node_links)
+                    for source, link_type, link_label in incoming
+                )
+
+                if nested:
+                    session.flush()
+                else:
+                    session.commit()
+            except IntegrityError as exception:
+                if not nested:
+                    session.rollback()
+                raise exceptions.IntegrityError(str(exception)) from exception
+            except SQLAlchemyError:
+                if not nested:
+                    session.rollback()
+                raise
+
+    def iter_by_hash(self, node_type: str, node_hash: str, hash_key: str, valid_cache_key: str) -> Iterator[SqlaNode]:
+        """Return an iterator over the nodes of the given type whose hash extra equals the given hash.
+
+        The hash is compared as text such that the query can use the ``ix_db_dbnode_extras_aiida_hash`` index.
+        """
+        model = self.ENTITY_CLASS.MODEL_CLASS
+        query = (
+            self.backend.get_session()
+            .query(model)
+            .filter(
+                self._get_extra_as_text(model, hash_key) == node_hash,
+                model.node_type == node_type,
+                model.extras[valid_cache_key].as_boolean().is_not(False),
+            )
+        )
+        for dbmodel in query:
+            yield self.ENTITY_CLASS.from_dbmodel(dbmodel, self.backend)
+
+    @staticmethod
+    def _get_extra_as_text(model, key: str):
+        """Return the expression of the extra with the given key cast to text.
+
+        For PostgreSQL this is ``extras ->> key``, which is the expression of the ``ix_db_dbnode_extras_aiida_hash``
+        index.
+        """
+        return model.extras[key].astext
@@ -0,0 +1,258 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Cache of the results of queries of the ``SqlaQueryBuilder``.
+
+The same queries are often executed many times, for example to load a ``Code`` or ``Computer`` by its label. The cache
+keeps the results of the most recently used queries, together with the tables that each query reads from. Every write
+to a table through the engine of the storage backend invalidates the results that depend on it. Writes by other
+processes are not detected, so results expire after a time-to-live.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, NamedTuple, Optional
+
+from sqlalchemy import Table, event, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import InstanceState
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.dml import Insert, UpdateBase
+from sqlalchemy.sql.elements import ClauseElement, ReleaseSavepointClause, RollbackToSavepointClause, SavepointClause
+from sqlalchemy.sql.selectable import Select
+
+__all__ = ('QueryCache',)
+
+# Key in the ``info`` of a connection that marks that it has written to the database in the current transaction
+DIRTY_CONNECTION_KEY = 'aiida_query_cache_dirty'
+
+# Statements that do not write to the database themselves
+READ_ONLY_STATEMENTS = (Select, SavepointClause, ReleaseSavepointClause, RollbackToSavepointClause)
+
+# Statements starting with these keywords are considered not to write to the database
+READ_ONLY_KEYWORDS = ('SELECT', 'EXPLAIN', 'SHOW', 'PRAGMA')
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    tables: FrozenSet[str]
+    expires: float
+
+
+class QueryCache:
+    """Least-recently-used cache of query results that expire after a time-to-live.
+
+    The cache is shared by all threads using the storage backend, so its methods are thread-safe.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, max_rows: int = 1000):
+        """Construct a new instance.
+
+        :param max_entries: the maximum number of query results to keep.
+        :param ttl: the number of seconds after which a query result expires.
+        :param max_rows: the maximum number of rows of a query result to be cached.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._max_rows = max_rows
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_rows(self) -> int:
+        """Return the maximum number of rows of a query result to be cached."""
+        return self._max_rows
+
+    @property
+    def version(self) -> int:
+        """Return the number of times that the cache was invalidated.
+
+        A result computed by a query that started before an invalidation may be outdated. Passing the version from
+        before the query was executed to :meth:`set` ensures that such a result is not cached.
+        """
+        return self._version
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Return the counters of the cache, e.g. for monitoring its hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self._max_entries,
+                'ttl': self._ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached result for the given key, or ``default`` if it is not cached or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, tables: Iterable[str], version: Optional[int] = None) -> None:
+        """Cache the result for the given key.
+
+        :param value: the query result, which should not be mutated after it is cached.
+        :param tables: the names of the tables the query reads from.
+        :param version: the :attr:`version` of the cache before the query was executed. If the cache was invalidated
+            since, the result is not cached.
+        """
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+
+            self._entries[key] = _CacheEntry(value, frozenset(tables), time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the result for the given key, if it is cached."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None) -> None:
+        """Remove the results of the queries that read from any of the given tables.
+
+        :param tables: the names of the tables that were written to, or ``None`` to remove all results.
+        """
+        with self._lock:
+            self._version += 1
+
+            if tables is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                return
+
+            tables = set(tables)
+            keys = [key for key, entry in self._entries.items() if not entry.tables.isdisjoint(tables)]
+
+            for key in keys:
+                del self._entries[key]
+
+            self.invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Remove all results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def watch(self, engine: Engine) -> None:
+        """Invalidate the cache on the writes executed by connections of the given engine.
+
+        Connections that executed a write are marked as dirty until the end of their transaction, see :func:`is_dirty`.
+        """
+        event.listen(engine, 'after_execute', self._on_after_execute)
+        event.listen(engine, 'commit', self._on_end_transaction)
+        event.listen(engine, 'rollback', self._on_end_transaction)
+        event.listen(engine, 'reset', self._on_reset)
+
+    def _on_after_execute(self, connection: Connection, statement: Any, *args: Any) -> None:
+        """Invalidate the results that depend on the tables written to by the executed statement."""
+        if isinstance(statement, READ_ONLY_STATEMENTS):
+            return
+
+        if isinstance(statement, UpdateBase):
+            table = statement.table  # type: ignore[attr-defined]
+            if not isinstance(table, Table):
+                tables = None
+            elif isinstance(statement, Insert):
+                tables = {table.name}
+            else:
+                tables = get_referencing_tables(table)
+        elif str(statement).lstrip().upper().startswith(READ_ONLY_KEYWORDS):
+            return
+        else:
+            tables = None
+
+        connection.info[DIRTY_CONNECTION_KEY] = True
+        self.invalidate(tables)
+
+    @staticmethod
+    def _on_end_transaction(connection: Connection) -> None:
+        """Mark the connection as clean at the end of its transaction."""
+        connection.info.pop(DIRTY_CONNECTION_KEY, None)
+
+    @staticmethod
+    def _on_reset(dbapi_connection: Any, connection_record: Any, reset_state: Any) -> None:
+        """Mark the connection as clean when its transaction is rolled back on returning it to the pool."""
+        connection_record.info.pop(DIRTY_CONNECTION_KEY, None)
+
+
+def is_dirty(connection: Connection) -> bool:
+    """Return whether the connection has written to the database in its current transaction.
+
+    Results computed by such a connection may contain uncommitted changes, and cached results may not contain them, so
+    the cache should not be used.
+    """
+    return connection.info.get(DIRTY_CONNECTION_KEY, False)
+
+
+def is_model_instance(value: Any) -> bool:
+    """Return whether the value is an instance of a database model, which is bound to a session and so not cached.
+
+    The models of the ``core.sqlite_dos`` storage do not share the base class of those of ``core.psql_dos``, so the
+    value is inspected instead.
+    """
+    return isinstance(inspect(value, raiseerr=False), InstanceState)
+
+
+def get_tables(statement: ClauseElement) -> FrozenSet[str]:
+    """Return the names of the tables that the statement reads from."""
+    return frozenset(element.name for element in visitors.iterate(statement) if isinstance(element, Table))
+
+
+@functools.lru_cache(maxsize=None)
+def get_referencing_tables(table: Table) -> FrozenSet[str]:
+    """Return the names of the table and of the tables that reference it through foreign keys, recursively.
+
+    Deleting or updating rows of the table may delete or update rows of the referencing tables through cascades, which
+    are not executed as separate statements.
+    """
+    names = {table.name}
+    referred = [table]
+
+    while referred:
+        target = referred.pop()
+        for other in table.metadata.tables.values():
+            if other.name not in names and any(foreign_key.references(target) for foreign_key in other.foreign_keys):
+                names.add(other.name)
+                referred.append(other)
+
+    return frozenset(names)
@@ -9,13 +9,14 @@
 # ruff: noqa: N802
 """Sqla query builder implementation"""
 
+import copy
 import uuid
 import warnings
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
-from sqlalchemy import and_, not_, or_
+from sqlalchemy import and_, not_, or_, select
 from sqlalchemy import func as sa_func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Row
@@ -34,12 +35,19 @@ from aiida.common.exceptions import NotExistent
 from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation.querybuilder import QUERYBUILD_LOGGER, BackendQueryBuilder, QueryDictType
 
+from .cache import QueryCache, get_tables, is_dirty, is_model_instance
 from .joiner import JoinReturn, SqlaJoiner
 
 jsonb_typeof = sa_func.jsonb_typeof
 jsonb_array_length = sa_func.jsonb_array_length
 array_length = sa_func.array_length
 
+# The default number of rows fetched at once from a server-side cursor when streaming results
+STREAM_BATCH_SIZE = 1000
+
+# Marks a result that is not in the query cache, since ``None`` is a valid result
+_MISSING = object()
+
 PROJECT_MAP = {
     'db_dbauthinfo': {
         'pk': 'id',
@@ -71,6 +79,13 @@ PROJECT_MAP = {
 }
 
 
+class _ModelReference(NamedTuple):
+    """Reference to a database model in a cached result row, which is resolved when the result is retrieved."""
+
+    cls: type
+    pk: int
+
+
 @dataclass
 class BuiltQuery:
     """A class to store the query and the corresponding projections."""
@@ -179,40 +194,71 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
     def count(self, data: QueryDictType) -> int:
         with self.query_session(data) as build:
-            result = build.query.count()
-        return result
+            result_cache = self._get_result_cache()
+            key = ('count', self._query_hash)
+            result = _MISSING if result_cache is None else result_cache.get(key, _MISSING)
+
+            if result is _MISSING:
+                version = None if result_cache is None else result_cache.version
+                result = build.query.count()
+                if result_cache is not None:
+                    result_cache.set(key, result, get_tables(build.query.statement), version)
+
+        return result  # type: ignore[return-value]
 
     def first(self, data: QueryDictType) -> Optional[List[Any]]:
         with self.query_session(data) as build:
-            result = build.query.first()
-
-        if result is None:
-            return result
+            result_cache = self._get_result_cache()
+            key = ('first', self._query_hash)
+            rows = self._get_cached_rows(result_cache, key)
+
+            if rows is None:
+                version = None if result_cache is None else result_cache.version
+                result = build.query.first()
+                # SQLA will return a Row, if only certain columns are requested,
+                # or a database model if that is requested
+                rows = [] if result is None else [result if isinstance(result, Row) else (result,)]
+                if result_cache is not None:
+                    frozen = [self._freeze_row(row) for row in rows]
+                    result_cache.set(key, frozen, get_tables(build.query.statement), version)
+
+        if not rows:
+            return None
+
+        return [self.to_backend(r) for r in rows[0]]
+
+    def iterall(self, data: QueryDictType, batch_size: Optional[int], stream: bool = False) -> Iterable[List[Any]]:
+        """Return an iterator over all the results of a list of lists."""
+        rows = self._iter_stream(data, batch_size) if stream else self._iter_rows(data, batch_size)
+        for _, row in rows:
+            yield [self.to_backend(rowitem) for rowitem in row]
 
-        # SQLA will return a Row, if only certain columns are requested,
-        # or a database model if that is requested
-        if not isinstance(result, Row):
-            result = (result,)
+    def iterdict(
+        self, data: QueryDictType, batch_size: Optional[int], stream: bool = False
+    ) -> Iterable[Dict[str, Dict[str, Any]]]:
+        """Return an iterator over all the results of a list of dictionaries."""
+        rows = self._iter_stream(data, batch_size) if stream else self._iter_rows(data, batch_size)
+        for build, row in rows:
+            yield self._row_to_dict(build, row)
 
-        return [self.to_backend(r) for r in result]
+    def _iter_rows(self, data: QueryDictType, batch_size: Optional[int]) -> Iterator[Tuple[BuiltQuery, Any]]:
+        """Yield the result rows of the built query.
 
-    def iterall(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[List[Any]]:
-        """Return an iterator over all the results of a list of lists."""
+        If the query cache of the storage backend is enabled, the rows are retrieved from the cache if possible, and
+        otherwise cached once the iteration completes, unless there are more than ``QueryCache.max_rows`` of them.
+        """
         with self.query_session(data) as build:
-            stmt = build.query.statement.execution_options(yield_per=batch_size)
-            session = self.get_session()
+            result_cache = self._get_result_cache()
+            key = ('rows', self._query_hash)
+            rows = self._get_cached_rows(result_cache, key)
 
-            # Open a session transaction unless already inside one. This prevents the `ModelWrapper` from calling commit
-            # on the session when a yielded row is mutated. This would reset the cursor invalidating it and causing an
-            # exception to be raised in the next batch of rows in the iteration.
-            # See https://github.com/python/mypy/issues/10109 for the reason of the type warning.
-            with nullcontext() if session.in_nested_transaction() else self._backend.transaction():  # type: ignore[attr-defined]
-                for resultrow in session.execute(stmt):
-                    yield [self.to_backend(rowitem) for rowitem in resultrow]
+            if rows is not None:
+                for row in rows:
+                    yield build, row
+                return
 
-    def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
-        """Return an iterator over all the results of a list of dictionaries."""
-        with self.query_session(data) as build:
+            version = None if result_cache is None else result_cache.version
+            frozen: Optional[List[Tuple[Any, ...]]] = None if result_cache is None else []
             stmt = build.query.statement.execution_options(yield_per=batch_size)
             session = self.get_session()
 
@@ -221,26 +267,135 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             # exception to be raised in the next batch of rows in the iteration.
             # See https://github.com/python/mypy/issues/10109 for the reason of the type warning.
             with nullcontext() if session.in_nested_transaction() else self._backend.transaction():  # type: ignore[attr-defined]
-                for row in self.get_session().execute(stmt):
-                    # build the yield result
-                    yield_result: Dict[str, Dict[str, Any]] = {}
-                    for (
-                        tag,
-                        projected_entities_dict,
-                    ) in build.tag_to_projected.items():
-                        yield_result[tag] = {}
-                        for attrkey, project_index in projected_entities_dict.items():
-                            alias = build.tag_to_alias.get(tag)
-                            if alias is None:
-                                raise ValueError(f'No alias found for tag {tag}')
-                            field_name = get_corresponding_property(
-                                get_table_name(alias),
-                                attrkey,
-                                self.inner_to_outer_schema,
-                            )
-                            key = self._data['project_map'].get(tag, {}).get(field_name, field_name)
-                            yield_result[tag][key] = self.to_backend(row[project_index])
-                    yield yield_result
+                for row in session.execute(stmt):
+                    if frozen is not None and len(frozen) < result_cache.max_rows:  # type: ignore[union-attr]
+                        # The row is copied before it is yielded, since the caller may mutate it
+                        frozen.append(self._freeze_row(row))
+                    elif frozen is not None:
+                        frozen = None
+                    yield build, row
+
+            if frozen is not None:
+                result_cache.set(key, frozen, get_tables(build.query.statement), version)  # type: ignore[union-attr]
+
+    def _get_result_cache(self) -> Optional[QueryCache]:
+        """Return the query cache of the storage backend, or ``None`` if it is disabled or cannot be used.
+
+        Pending changes of the session are flushed first, as executing the query would. If the current transaction has
+        written to the database, its queries may return uncommitted changes, so the cache is neither read nor written.
+        """
+        result_cache = getattr(self._backend, 'query_cache', None)
+
+        if result_cache is None:
+            return None
+
+        session = self.get_session()
+
+        if session.autoflush:
+            session.flush()
+
+        if is_dirty(session.connection()):
+            return None
+
+        return result_cache
+
+    def _get_cached_rows(self, result_cache: Optional[QueryCache], key: Tuple[str, Any]) -> Optional[List[Tuple]]:
+        """Return the cached result rows for the given key, with the references to database models resolved.
+
+        The models are loaded from the session, with a single query per model class. If one of them no longer exists,
+        the cached result is discarded and ``None`` is returned.
+        """
+        if result_cache is None:
+            return None
+
+        rows = result_cache.get(key, _MISSING)
+
+        if rows is _MISSING:
+            return None
+
+        session = self.get_session()
+        references: Dict[type, Set[int]] = {}
+
+        for row in rows:
+            for item in row:
+                if isinstance(item, _ModelReference):
+                    references.setdefault(item.cls, set()).add(item.pk)
+
+        models: Dict[Tuple[type, int], Any] = {}
+
+        for cls, pks in references.items():
+            for model in session.scalars(select(cls).where(cls.id.in_(pks))):  # type: ignore[attr-defined]
+                models[(cls, model.id)] = model
+
+        try:
+            return [
+                tuple(models[item] if isinstance(item, _ModelReference) else copy.deepcopy(item) for item in row)
+                for row in rows
+            ]
+        except KeyError:
+            result_cache.discard(key)
+            return None
+
+    @staticmethod
+    def _freeze_row(row) -> Tuple[Any, ...]:
+        """Return a copy of the result row to be cached, with database models replaced by references."""
+        return tuple(
+            _ModelReference(type(item), item.id) if is_model_instance(item) else copy.deepcopy(item) for item in row
+        )
+
+    def _row_to_dict(self, build: BuiltQuery, row) -> Dict[str, Dict[str, Any]]:
+        """Return the dictionary of a result row of the built query, mapping tags onto their projections."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for tag, projected_entities_dict in build.tag_to_projected.items():
+            result[tag] = {}
+            for attrkey, project_index in projected_entities_dict.items():
+                alias = build.tag_to_alias.get(tag)
+                if alias is None:
+                    raise ValueError(f'No alias found for tag {tag}')
+                field_name = get_corresponding_property(
+                    get_table_name(alias),
+                    attrkey,
+                    self.inner_to_outer_schema,
+                )
+                key = self._data['project_map'].get(tag, {}).get(field_name, field_name)
+                result[tag][key] = self.to_backend(row[project_index])
+        return result
+
+    def _iter_stream(self, data: QueryDictType, batch_size: Optional[int]) -> Iterator[Tuple[BuiltQuery, Any]]:
+        """Yield the result rows of the built query, streamed from a server-side cursor.
+
+        The query is executed in a dedicated session, with its own connection and transaction, such that the cursor is
+        not affected by commits of the session of the storage backend while iterating. Only ``batch_size`` rows are held
+        in memory at once. Database models in the rows are detached from the dedicated session and merged into the
+        session of the storage backend, so they can be used and modified as usual.
+
+        For dialects that do not support server-side cursors, i.e. SQLite, where the cursor already fetches rows on
+        demand and a second connection could not see an in-memory database, this falls back to the default iteration.
+        """
+        from aiida.storage.psql_dos.models.base import Model
+
+        session = self.get_session()
+        batch_size = batch_size or STREAM_BATCH_SIZE
+
+        with self.query_session(data) as build:
+            stmt = build.query.statement.execution_options(stream_results=True, yield_per=batch_size)
+
+            if session.bind.dialect.name != 'postgresql':  # type: ignore[union-attr]
+                with nullcontext() if session.in_nested_transaction() else self._backend.transaction():  # type: ignore[attr-defined]
+                    for row in session.execute(stmt):
+                        yield build, row
+                return
+
+            with Session(bind=session.get_bind(), future=True) as stream_session, stream_session.begin():
+                for row in stream_session.execute(stmt):
+                    items = []
+                    for item in row:
+                        if isinstance(item, Model):
+                            stream_session.expunge(item)
+                            items.append(session.merge(item, load=False))
+                        else:
+                            items.append(item)
+                    yield build, items
 
     def get_query(self, data: QueryDictType) -> BuiltQuery:
         """Return the built query.
@@ -705,6 +860,21 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             )
         else:
             raise ValueError(f'Unknown operator {operator} for filters in JSON field')
+
+        # The type-checking ``CASE`` expressions cannot use an index. For string comparisons on a top-level key, the
+        # ``CASE`` implies the plain text comparison, so adding it as a conjunct does not change the result, also not
+        # when negated, but it allows the planner to use an expression index on ``column ->> key``, if one exists.
+        if len(attr_key) == 1 and operator in ('==', 'like', 'in'):
+            values = value if operator == 'in' else [value]
+            if values and all(isinstance(entry, str) for entry in values):
+                text_entity = column[attr_key[0]].astext
+                if operator == '==':
+                    expr = and_(text_entity == value, expr)
+                elif operator == 'like':
+                    expr = and_(text_entity.like(value), expr)
+                else:
+                    expr = and_(text_entity.in_(value), expr)
+
         return expr
 
     @staticmethod
@@ -14,6 +14,7 @@ The content of the zip file is::
     |- storage.zip
         |- metadata.json
         |- db.sqlite3
+        |- repo_index.bin
         |- repo/
             |- hashkey1
             |- hashkey2
@@ -22,6 +23,8 @@ The content of the zip file is::
 For quick access, the metadata (such as the version) is stored in a `metadata.json` file,
 at the "top" of the zip file, with the sqlite database, just below it, then the repository files.
 Repository files are named by their SHA256 content hash.
+The optional `repo_index.bin` file, just below the database, indexes the location of the repository files,
+so that they can be read without reading the whole central directory of the zip file.
 
 This storage method is primarily intended for the AiiDA archive,
 as a read-only storage method.
@@ -10,14 +10,17 @@
 
 from __future__ import annotations
 
+import io
 import json
+import mmap
 import shutil
 import tempfile
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
-from typing import BinaryIO, Iterable, Iterator, Optional, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Mapping, Optional, Sequence, Set, Tuple, cast
 from zipfile import ZipFile, is_zipfile
 
 from pydantic import BaseModel, Field, field_validator
@@ -32,16 +35,22 @@ from aiida.orm.implementation import StorageBackend
 from aiida.repository.backend.abstract import AbstractRepositoryBackend
 
 from . import orm
+from .repo_index import SUPPORTED_COMPRESSION, RepoIndex, ZipObjectInfo, ZipObjectStream, get_data, locate_zip_member
 from .utils import (
     DB_FILENAME,
     META_FILENAME,
     REPO_FOLDER,
+    REPO_INDEX_FILENAME,
     ReadOnlyError,
     create_sqla_engine,
     extract_metadata,
     read_version,
 )
 
+if TYPE_CHECKING:
+    from aiida.common.links import LinkType
+    from aiida.orm.utils.links import LinkQuadruple
+
 __all__ = ('SqliteZipBackend',)
 
 LOGGER = AIIDA_LOGGER.getChild(__file__)
@@ -304,6 +313,21 @@ class SqliteZipBackend(StorageBackend):
     def delete_nodes_and_connections(self, pks_to_delete: Sequence[int]):
         raise ReadOnlyError()
 
+    def traverse_graph(
+        self,
+        starting_pks: Iterable[int],
+        links_forward: Iterable[LinkType] = (),
+        links_backward: Iterable[LinkType] = (),
+        get_links: bool = False,
+    ) -> Tuple[Set[int], Optional[Set[LinkQuadruple]]]:
+        from aiida.storage.psql_dos.graph import traverse_graph
+
+        from .models import DbLink, DbNode
+
+        return traverse_graph(
+            self.get_session(), DbNode, DbLink, starting_pks, links_forward, links_backward, get_links
+        )
+
     def get_global_variable(self, key: str):
         raise NotImplementedError
 
@@ -384,16 +408,31 @@ class ZipfileBackendRepository(_RoBackendRepository):
 
     The zip file should contain repository files with the key format: ``repo/<sha256 hash>``,
     i.e. files named by the sha256 hash of the file contents, inside a ``repo`` directory.
+
+    The zip file is memory-mapped and the files are read directly by their offset in it. Their offsets are read from
+    the index of the repository files in the zip file, if it has one, and otherwise from its central directory.
     """
 
     def __init__(self, path: str | Path):
         super().__init__(path)
         self._folder = REPO_FOLDER
         self.__zipfile: None | ZipFile = None
+        self.__zipfile_lock = threading.Lock()
+        self.__handle: None | BinaryIO = None
+        self.__mmap: None | mmap.mmap = None
+        self.__objects: None | Mapping[str, ZipObjectInfo] = None
 
     def close(self) -> None:
-        if self._zipfile:
-            self._zipfile.close()
+        with self.__zipfile_lock:
+            if isinstance(self.__objects, RepoIndex):
+                self.__objects.close()
+            if self.__mmap is not None:
+                self.__mmap.close()
+            if self.__handle is not None:
+                self.__handle.close()
+            if self.__zipfile is not None:
+                self.__zipfile.close()
+            self.__objects = self.__mmap = self.__handle = self.__zipfile = None
         super().close()
 
     @property
@@ -401,36 +440,79 @@ class ZipfileBackendRepository(_RoBackendRepository):
         """Return the open zip file."""
         if self._closed:
             raise ClosedStorage(f'repository is closed: {self._path}')
-        if self.__zipfile is None:
-            try:
-                self.__zipfile = ZipFile(self._path, mode='r')
-            except Exception as exc:
-                raise CorruptStorage(f'repository could not be read {self._path}: {exc}') from exc
+        # the objects may be read concurrently by multiple threads, which should share the same open zip file
+        with self.__zipfile_lock:
+            if self.__zipfile is None:
+                try:
+                    self.__zipfile = ZipFile(self._path, mode='r')
+                except Exception as exc:
+                    raise CorruptStorage(f'repository could not be read {self._path}: {exc}') from exc
         return self.__zipfile
 
+    @property
+    def _mmap(self) -> mmap.mmap:
+        """Return the memory-mapped zip file."""
+        if self._closed:
+            raise ClosedStorage(f'repository is closed: {self._path}')
+        with self.__zipfile_lock:
+            if self.__mmap is None:
+                try:
+                    self.__handle = self._path.open('rb')
+                    self.__mmap = mmap.mmap(self.__handle.fileno(), 0, access=mmap.ACCESS_READ)
+                except Exception as exc:
+                    raise CorruptStorage(f'repository could not be read {self._path}: {exc}') from exc
+        return self.__mmap
+
+    @property
+    def _objects(self) -> Mapping[str, ZipObjectInfo]:
+        """Return the mapping of the keys of the objects to their location in the zip file."""
+        if self.__objects is not None:
+            return self.__objects
+
+        data = self._mmap
+        objects: Mapping[str, ZipObjectInfo]
+        # the index is written just below the metadata and database files in the central directory
+        info = locate_zip_member(data, REPO_INDEX_FILENAME, search_limit=4)
+        if info is not None:
+            objects = RepoIndex(data, info)
+        else:
+            prefix = f'{self._folder}/'
+            objects = {
+                zinfo.filename[len(prefix) :]: ZipObjectInfo(
+                    zinfo.header_offset, zinfo.compress_size, zinfo.file_size, zinfo.CRC, zinfo.compress_type
+                )
+                for zinfo in self._zipfile.infolist()
+                if zinfo.filename.startswith(prefix) and zinfo.filename[len(prefix) :]
+            }
+
+        with self.__zipfile_lock:
+            if self.__objects is None:
+                self.__objects = objects
+            elif isinstance(objects, RepoIndex):
+                # another thread read the locations of the objects first
+                objects.close()
+            return self.__objects
+
     def has_object(self, key: str) -> bool:
-        try:
-            self._zipfile.getinfo(f'{self._folder}/{key}')
-        except KeyError:
-            return False
-        return True
+        return key in self._objects
 
     def list_objects(self) -> Iterable[str]:
-        prefix = f'{self._folder}/'
-        prefix_len = len(prefix)
-        for name in self._zipfile.namelist():
-            if name.startswith(prefix) and name[prefix_len:]:
-                yield name[prefix_len:]
+        yield from self._objects
 
     @contextmanager
     def open(self, key: str) -> Iterator[BinaryIO]:
         try:
-            handle = self._zipfile.open(f'{self._folder}/{key}')
-            yield cast(BinaryIO, handle)
+            info = self._objects[key]
         except KeyError:
             raise FileNotFoundError(f'object with key `{key}` does not exist.')
-        finally:
-            handle.close()
+        name = f'{self._folder}/{key}'
+        if info.compress_type not in SUPPORTED_COMPRESSION:
+            with self._zipfile.open(name) as handle:
+                yield cast(BinaryIO, handle)
+            return
+        # the stream is buffered, such that it is a byte stream as those of ``ZipFile.open``
+        with io.BufferedReader(ZipObjectStream(get_data(self._mmap, info, name), info, name)) as handle:
+            yield cast(BinaryIO, handle)
 
 
 class FolderBackendRepository(_RoBackendRepository):
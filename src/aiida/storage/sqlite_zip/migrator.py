@@ -33,7 +33,16 @@ from aiida.storage.log import MIGRATE_LOGGER
 from .migrations.legacy import FINAL_LEGACY_VERSION, LEGACY_MIGRATE_FUNCTIONS
 from .migrations.legacy_to_main import LEGACY_TO_MAIN_REVISION, perform_v1_migration
 from .migrations.utils import copy_tar_to_zip, copy_zip_to_zip, update_metadata
-from .utils import DB_FILENAME, META_FILENAME, REPO_FOLDER, create_sqla_engine, extract_metadata, read_version
+from .repo_index import create_repo_index
+from .utils import (
+    DB_FILENAME,
+    META_FILENAME,
+    REPO_FOLDER,
+    REPO_INDEX_FILENAME,
+    create_sqla_engine,
+    extract_metadata,
+    read_version,
+)
 
 
 def get_schema_version_head() -> str:
@@ -194,7 +203,7 @@ def migrate(
             name_to_info=central_dir,
             # this ensures that the metadata and database files are written above the repository files,
             # in in the central directory, so that they can be accessed easily
-            info_order=(META_FILENAME, DB_FILENAME),
+            info_order=(META_FILENAME, DB_FILENAME, REPO_INDEX_FILENAME),
         ) as new_zip:
             written_repo = False
             if current_version == FINAL_LEGACY_VERSION:
@@ -253,6 +262,10 @@ def migrate(
 
             MIGRATE_LOGGER.report('Finalising the migration ...')
 
+            # write the index of the repository files to the new zip file, which is read in place, so not compressed
+            with (new_zip / REPO_INDEX_FILENAME).open(mode='wb', compression=zipfile.ZIP_STORED, level=0) as handle:
+                handle.write(create_repo_index(central_dir.values()))
+
             # write the final database file to the new zip file
             (new_zip / DB_FILENAME).putfile(db_path)
 
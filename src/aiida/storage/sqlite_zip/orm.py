@@ -133,11 +133,17 @@ class SqliteNode(SqliteEntityOverride, nodes.SqlaNode):
     USER_CLASS = SqliteUser
     COMPUTER_CLASS = SqliteComputer
     LINK_CLASS = models.DbLink
+    # the checkpoint entries are not part of the sqlite schema, so they are stored in the checkpoint itself
+    CHECKPOINT_ENTRY_CLASS = None
 
 
 class SqliteNodeCollection(nodes.SqlaNodeCollection):
     ENTITY_CLASS = SqliteNode
 
+    @staticmethod
+    def _get_extra_as_text(model, key: str):
+        return model.extras[key].as_string()
+
 
 class SqliteQueryBuilder(SqlaQueryBuilder):
     """QueryBuilder to use with SQLAlchemy-backend, adapted for SQLite."""
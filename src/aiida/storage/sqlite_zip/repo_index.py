@@ -0,0 +1,317 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Random access to the repository files of a zip file, by their offset in the zip file.
+
+The zip file can contain an index of the repository files, which is stored without compression. It consists of
+:data:`INDEX_MAGIC` followed by a record per repository file, sorted by the key of the file, with the (binary) sha256
+hash of the file, the offset of its local header in the zip file, its compressed and uncompressed size, its CRC-32 and
+its compression method.
+
+Like the metadata and database files, the index is among the first entries of the central directory, so that it can be
+located without reading the whole central directory. A repository file is then found by a binary search in the index,
+which is memory-mapped together with the rest of the zip file.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import struct
+import zipfile
+import zlib
+from collections.abc import Mapping
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from aiida.common.exceptions import CorruptStorage
+
+from .utils import REPO_FOLDER, REPO_INDEX_FILENAME
+
+__all__ = ('ZipObjectInfo', 'RepoIndex', 'ZipObjectStream', 'create_repo_index', 'get_data', 'locate_zip_member')
+
+INDEX_MAGIC = b'AIIDARI1'
+"""The bytes the index starts with, which include the version of its format."""
+
+INDEX_RECORD = struct.Struct('<32sQQQIH')
+"""The format of a record of the index: hash, header offset, compressed size, size, CRC-32 and compression method."""
+
+SUPPORTED_COMPRESSION = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+"""The compression methods of the objects that can be read by offset."""
+
+# Size of the chunks of compressed data that are decompressed at once
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+# Value of the sizes and offsets in a central directory record, that are stored in its zip64 extra field instead
+ZIP64_LIMIT = 0xFFFFFFFF
+
+
+class ZipObjectInfo(NamedTuple):
+    """The location of a file in a zip file."""
+
+    header_offset: int
+    compress_size: int
+    file_size: int
+    crc: int
+    compress_type: int
+
+
+def create_repo_index(infos: Iterable[zipfile.ZipInfo]) -> bytes:
+    """Return the index of the repository files, from the information of the files written to the zip file.
+
+    :param infos: the information of all files written to the zip file, of which those of repository files are indexed
+    """
+    prefix = f'{REPO_FOLDER}/'
+    records = sorted(
+        (bytes.fromhex(info.filename[len(prefix) :]), info)
+        for info in infos
+        if info.filename.startswith(prefix) and info.filename[len(prefix) :]
+    )
+    index = bytearray(INDEX_MAGIC)
+    for digest, info in records:
+        index += INDEX_RECORD.pack(
+            digest, info.header_offset, info.compress_size, info.file_size, info.CRC, info.compress_type
+        )
+    return bytes(index)
+
+
+def _find_end_of_central_directory(data: mmap.mmap) -> Optional[tuple[int, int]]:
+    """Return the offset and the number of entries of the central directory, or ``None`` if these cannot be read."""
+    # the end of central directory record is at the end of the file, only followed by a comment of at most 64 KiB
+    position = data.rfind(zipfile.stringEndArchive, max(0, len(data) - zipfile.sizeEndCentDir - 0xFFFF))
+    if position < 0:
+        return None
+    record = data[position : position + zipfile.sizeEndCentDir]
+    _, _, _, _, count, size, offset, _ = struct.unpack(zipfile.structEndArchive, record)
+
+    if offset == ZIP64_LIMIT or count == 0xFFFF:
+        locator = position - zipfile.sizeEndCentDir64Locator
+        if locator < 0:
+            return None
+        record = data[locator : locator + zipfile.sizeEndCentDir64Locator]
+        signature, _, position, _ = struct.unpack(zipfile.structEndArchive64Locator, record)
+        record = data[position : position + zipfile.sizeEndCentDir64]
+        if signature != zipfile.stringEndArchive64Locator or len(record) != zipfile.sizeEndCentDir64:
+            return None
+        signature, _, _, _, _, _, _, count, size, offset = struct.unpack(zipfile.structEndArchive64, record)
+        if signature != zipfile.stringEndArchive64:
+            return None
+
+    # the zip file should not be preceded by other data, since the offsets would be relative to that
+    if position != offset + size:
+        return None
+    return offset, count
+
+
+def _parse_zip64_extra(extra: bytes, file_size: int, compress_size: int, header_offset: int) -> tuple[int, int, int]:
+    """Return the sizes and header offset of a file, which are stored in the zip64 extra field if they are too large."""
+    while len(extra) >= 4:
+        header_id, length = struct.unpack('<HH', extra[:4])
+        if header_id == 0x0001:
+            values = list(struct.unpack(f'<{length // 8}Q', extra[4 : 4 + length - length % 8]))
+            if file_size == ZIP64_LIMIT:
+                file_size = values.pop(0)
+            if compress_size == ZIP64_LIMIT:
+                compress_size = values.pop(0)
+            if header_offset == ZIP64_LIMIT:
+                header_offset = values.pop(0)
+            break
+        extra = extra[4 + length :]
+    return file_size, compress_size, header_offset
+
+
+def locate_zip_member(data: mmap.mmap, name: str, search_limit: int) -> Optional[ZipObjectInfo]:
+    """Return the location of a file in a zip file, by searching the first records of the central directory.
+
+    :param data: the memory-mapped zip file
+    :param name: the name of the file in the zip file
+    :param search_limit: the maximum number of records of the central directory to search
+    :return: the location of the file, or ``None`` if it is not found
+    """
+    end = _find_end_of_central_directory(data)
+    if end is None:
+        return None
+    position, count = end
+    for _ in range(min(count, search_limit)):
+        record = struct.unpack(zipfile.structCentralDir, data[position : position + zipfile.sizeCentralDir])
+        if record[0] != zipfile.stringCentralDir:
+            raise CorruptStorage(f'invalid central directory record at offset {position}')
+        name_length, extra_length, comment_length = record[12:15]
+        start = position + zipfile.sizeCentralDir
+        position = start + name_length + extra_length + comment_length
+        if data[start : start + name_length].decode('utf8') != name:
+            continue
+        extra = data[start + name_length : start + name_length + extra_length]
+        file_size, compress_size, header_offset = _parse_zip64_extra(extra, record[11], record[10], record[18])
+        return ZipObjectInfo(header_offset, compress_size, file_size, record[9], record[6])
+    return None
+
+
+def get_data(data: mmap.mmap, info: ZipObjectInfo, name: str) -> memoryview:
+    """Return a view of the (compressed) data of a file in a zip file, after checking its local header.
+
+    :param data: the memory-mapped zip file
+    :param info: the location of the file
+    :param name: the name of the file, which should be the name in its local header
+    """
+    offset = info.header_offset
+    header = struct.unpack(zipfile.structFileHeader, data[offset : offset + zipfile.sizeFileHeader])
+    if header[0] != zipfile.stringFileHeader:
+        raise CorruptStorage(f'invalid local header of {name!r} at offset {offset}')
+    name_length, extra_length = header[10:12]
+    start = offset + zipfile.sizeFileHeader
+    if data[start : start + name_length] != name.encode('utf8'):
+        raise CorruptStorage(f'local header at offset {offset} is not that of {name!r}')
+    start += name_length + extra_length
+    if start + info.compress_size > len(data):
+        raise CorruptStorage(f'data of {name!r} extends beyond the end of the zip file')
+    with memoryview(data) as view:
+        return view[start : start + info.compress_size]
+
+
+class RepoIndex(Mapping):
+    """Read-only mapping of the keys of the repository files in a zip file to their location, read from its index."""
+
+    def __init__(self, data: mmap.mmap, info: ZipObjectInfo):
+        """Construct a new instance.
+
+        :param data: the memory-mapped zip file
+        :param info: the location of the index in the zip file
+        """
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise CorruptStorage(f'the repository index {REPO_INDEX_FILENAME!r} is compressed')
+        self._view = get_data(data, info, REPO_INDEX_FILENAME)
+        if self._view[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise CorruptStorage(f'the repository index {REPO_INDEX_FILENAME!r} has an unknown format')
+        self._count, remainder = divmod(len(self._view) - len(INDEX_MAGIC), INDEX_RECORD.size)
+        if remainder:
+            raise CorruptStorage(f'the repository index {REPO_INDEX_FILENAME!r} is truncated')
+
+    def close(self) -> None:
+        """Release the view of the index, such that the memory map can be closed."""
+        self._view.release()
+
+    def _record(self, index: int) -> tuple:
+        return INDEX_RECORD.unpack_from(self._view, len(INDEX_MAGIC) + index * INDEX_RECORD.size)
+
+    def _digest(self, index: int) -> bytes:
+        start = len(INDEX_MAGIC) + index * INDEX_RECORD.size
+        return self._view[start : start + 32].tobytes()
+
+    def __getitem__(self, key: str) -> ZipObjectInfo:
+        try:
+            digest = bytes.fromhex(key)
+        except ValueError:
+            raise KeyError(key) from None
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._digest(middle) < digest:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._count or self._digest(low) != digest:
+            raise KeyError(key)
+        return ZipObjectInfo(*self._record(low)[1:])
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._digest(index).hex()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class ZipObjectStream(io.RawIOBase):
+    """Stream of a file in a zip file, which is read from a view of its (compressed) data."""
+
+    def __init__(self, data: memoryview, info: ZipObjectInfo, name: str):
+        """Construct a new instance.
+
+        :param data: the view of the data of the file, see :func:`get_data`
+        :param info: the location of the file
+        :param name: the name of the file
+        """
+        if info.compress_type not in SUPPORTED_COMPRESSION:
+            raise ValueError(f'unsupported compression method {info.compress_type} of {name!r}')
+        self._data = data
+        self._info = info
+        self._name = name
+        self._reset()
+
+    def _reset(self) -> None:
+        """Go to the start of the file."""
+        self._offset = 0
+        self._position = 0
+        self._crc = 0
+        self._verify = True
+        self._pending = b''
+        self._decompressor = zlib.decompressobj(-15) if self._info.compress_type == zipfile.ZIP_DEFLATED else None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._data.release()
+        super().close()
+
+    def readinto(self, buffer) -> int:
+        if not len(buffer):
+            return 0
+        if self._decompressor is None:
+            chunk = self._data[self._offset : self._offset + len(buffer)]
+            self._offset += len(chunk)
+        else:
+            while not self._pending and not self._decompressor.eof:
+                tail = self._decompressor.unconsumed_tail
+                if not tail:
+                    tail = self._data[self._offset : self._offset + DECOMPRESS_CHUNK_SIZE]
+                    self._offset += len(tail)
+                if not tail:
+                    # all the compressed data is read, but the decompressor may still hold some of the output
+                    self._pending = self._decompressor.flush()
+                    break
+                self._pending = self._decompressor.decompress(tail, DECOMPRESS_CHUNK_SIZE)
+            chunk, self._pending = self._pending[: len(buffer)], self._pending[len(buffer) :]
+        nbytes = len(chunk)
+        buffer[:nbytes] = chunk
+        self._crc = zlib.crc32(chunk, self._crc)
+        self._position += nbytes
+        if not nbytes and self._verify and (self._position != self._info.file_size or self._crc != self._info.crc):
+            raise CorruptStorage(f'data of {self._name!r} is corrupt')
+        return nbytes
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._info.file_size
+        offset = max(0, min(offset, self._info.file_size))
+        if offset == self._position:
+            return offset
+        if self._decompressor is None:
+            # the checksum can only be verified if all the data is read
+            self._reset()
+            self._offset = self._position = offset
+            self._verify = offset == 0
+            return offset
+        # the compressed data can only be read forwards, from the start of the file
+        if offset < self._position:
+            self._reset()
+        buffer = bytearray(DECOMPRESS_CHUNK_SIZE)
+        while self._position < offset:
+            with memoryview(buffer) as view:
+                if not self.readinto(view[: offset - self._position]):
+                    break
+        return self._position
@@ -27,6 +27,9 @@ DB_FILENAME = 'db.sqlite3'
 REPO_FOLDER = 'repo'
 """The name of the folder containing the repository files."""
 
+REPO_INDEX_FILENAME = 'repo_index.bin'
+"""The filename of the index of the repository files, see :mod:`aiida.storage.sqlite_zip.repo_index`."""
+
 
 def sqlite_enforce_foreign_keys(dbapi_connection, _):
     """Enforce foreign key constraints, when using sqlite backend (off by default).
@@ -8,14 +8,24 @@
 ###########################################################################
 """Shared resources for the archive."""
 
+import collections
+import io
+import threading
 import urllib.parse
 import urllib.request
 from html.parser import HTMLParser
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+from typing import Any, BinaryIO, Callable, Deque, Dict, Generator, Iterable, List, Optional, Tuple, Type, cast
 
 from aiida.orm import AuthInfo, Comment, Computer, Entity, Group, Log, Node, User
 from aiida.orm.entities import EntityTypes
 
+# Size of the chunks in which repository objects are read ahead, and the maximum size of the chunks read ahead
+PREFETCH_CHUNK_SIZE = 1024 * 1024
+PREFETCH_BUFFER_SIZE = 32 * 1024 * 1024
+
+# Marker put in the chunks of an object after its last chunk
+_END_OF_OBJECT = object()
+
 # Mapping from entity names to AiiDA classes
 entity_type_to_orm: Dict[EntityTypes, Type[Entity]] = {
     EntityTypes.AUTHINFO: AuthInfo,
@@ -52,6 +62,207 @@ def batch_iter(
         yield length, current
 
 
+class _ObjectPrefetcher:
+    """Read the objects of a repository ahead in worker threads, while they are consumed in another thread.
+
+    The workers read batches of the keys with ``iter_object_streams`` of the repository, and split the objects in
+    chunks. The objects are consumed in the order in which the workers started reading them. The chunks that were
+    read ahead, but not yet consumed, are limited to ``max_buffer_size`` bytes in total. Only the worker reading the
+    object that is being consumed may exceed it, by a single chunk, so that it can never be blocked by the others.
+    """
+
+    def __init__(self, repository, keys: Iterable[str], num_workers: int, max_buffer_size: int):
+        keys = list(keys)
+        batch_size = max(1, min(1000, -(-len(keys) // num_workers)))
+        self._batches = iter([keys[index : index + batch_size] for index in range(0, len(keys), batch_size)])
+        self._repository = repository
+        self._max_buffer_size = max_buffer_size
+        self._condition = threading.Condition()
+        self._objects: Dict[int, Tuple[Optional[str], Deque[Any]]] = {}
+        self._started = 0
+        self._consumed = 0
+        self._buffered = 0
+        self._running = num_workers
+        self._stopped = False
+        self._workers = [
+            threading.Thread(target=self._read_objects, name=f'archive-prefetch-{index}', daemon=True)
+            for index in range(num_workers)
+        ]
+
+    def iter_object_streams(self) -> Generator[Tuple[str, BinaryIO], None, None]:
+        """Start the workers and yield the keys and streams of the objects, in the order they are started to be read."""
+        for worker in self._workers:
+            worker.start()
+
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._consumed < self._started or not self._running)
+                    if self._consumed == self._started:
+                        return
+                    key, chunks = self._objects[self._consumed]
+
+                if key is None:
+                    raise chunks[0]
+
+                stream = _PrefetchedStream(self, chunks)
+                yield key, cast(BinaryIO, stream)
+                stream.drain()
+
+                with self._condition:
+                    del self._objects[self._consumed]
+                    self._consumed += 1
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+            for worker in self._workers:
+                if worker.is_alive():
+                    worker.join()
+
+    def _start_object(self, key: Optional[str], *items: Any) -> Tuple[int, Deque[Any]]:
+        """Register an object that is started to be read, and return its index and the deque of its chunks."""
+        with self._condition:
+            index, chunks = self._started, collections.deque(items)
+            self._objects[index] = (key, chunks)
+            self._started += 1
+            self._condition.notify_all()
+        return index, chunks
+
+    def _put(self, index: int, chunks: Deque[Any], item: Any, size: int = 0) -> bool:
+        """Append an item to the chunks of an object, once the buffer allows it, and return whether to continue."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self._stopped
+                    or self._buffered + size <= self._max_buffer_size
+                    or (index == self._consumed and not chunks)
+                )
+            )
+            if self._stopped:
+                return False
+            chunks.append(item)
+            self._buffered += size
+            self._condition.notify_all()
+        return True
+
+    def _get(self, chunks: Deque[Any]) -> Any:
+        """Return the next chunk of an object that is being consumed, once it has been read."""
+        with self._condition:
+            self._condition.wait_for(lambda: chunks)
+            chunk = chunks.popleft()
+            if isinstance(chunk, bytes):
+                self._buffered -= len(chunk)
+                self._condition.notify_all()
+        return chunk
+
+    def _read_objects(self) -> None:
+        """Read the objects of the batches of keys that are not yet taken by another worker."""
+        current: Optional[Tuple[int, Deque[Any]]] = None
+        try:
+            while True:
+                with self._condition:
+                    batch = None if self._stopped else next(self._batches, None)
+                if batch is None:
+                    return
+                for key, stream in self._repository.iter_object_streams(batch):
+                    current = self._start_object(key)
+                    while chunk := stream.read(PREFETCH_CHUNK_SIZE):
+                        if not self._put(*current, chunk, len(chunk)):
+                            return
+                    if not self._put(*current, _END_OF_OBJECT):
+                        return
+                    current = None
+        except BaseException as exception:
+            # An exception while reading an object is raised when its stream is read, otherwise it is raised when the
+            # next object is requested
+            if current is None:
+                self._start_object(None, exception)
+            else:
+                self._put(*current, exception)
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._condition.notify_all()
+
+
+class _PrefetchedStream(io.RawIOBase):
+    """Stream of a repository object, whose chunks are read ahead by another thread."""
+
+    def __init__(self, prefetcher: _ObjectPrefetcher, chunks: Deque[Any]):
+        self._prefetcher = prefetcher
+        self._chunks = chunks
+        self._chunk = memoryview(b'')
+        self._exhausted = False
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self) -> memoryview:
+        """Return the remainder of the current chunk, after waiting for the next chunk if it was read entirely."""
+        while not self._chunk and not self._exhausted:
+            chunk = self._prefetcher._get(self._chunks)
+            if chunk is _END_OF_OBJECT:
+                self._exhausted = True
+            elif isinstance(chunk, BaseException):
+                raise chunk
+            else:
+                self._chunk = memoryview(chunk)
+        return self._chunk
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+
+        # the chunks are returned without copying them if they are read entirely, as by the repository backends
+        chunk = self._next_chunk()
+        nbytes = min(size, len(chunk))
+        if nbytes == len(chunk) == len(cast(bytes, chunk.obj)):
+            data = cast(bytes, chunk.obj)
+        else:
+            data = chunk[:nbytes].tobytes()
+        self._chunk = chunk[nbytes:]
+        self.size += nbytes
+        return data
+
+    def readinto(self, buffer) -> int:
+        chunk = self._next_chunk()
+        nbytes = min(len(buffer), len(chunk))
+        buffer[:nbytes] = chunk[:nbytes]
+        self._chunk = chunk[nbytes:]
+        self.size += nbytes
+        return nbytes
+
+    def drain(self) -> int:
+        """Read the remainder of the object, which is discarded, and return the size of the object."""
+        buffer = bytearray(PREFETCH_CHUNK_SIZE)
+        while self.readinto(buffer):
+            pass
+        return self.size
+
+
+def iter_prefetched_object_streams(
+    repository, keys: Iterable[str], num_workers: int = 1, max_buffer_size: int = PREFETCH_BUFFER_SIZE
+) -> Generator[Tuple[str, BinaryIO], None, None]:
+    """Yield the keys and streams of the repository objects, while the objects are read ahead by worker threads.
+
+    Reading, and for compressed archives decompressing, the objects then overlaps with processing them in the current
+    thread, and with each other if there are multiple workers. The objects are yielded in the order in which they are
+    read, which is not necessarily the order of the keys. A stream is only valid until the next one is requested, at
+    which point the part of it that was not read is drained.
+
+    :param repository: the repository to read the objects from.
+    :param keys: the keys of the objects to read.
+    :param num_workers: the number of threads reading the objects.
+    :param max_buffer_size: the maximum size in bytes of the chunks of the objects that are read ahead.
+    """
+    if num_workers < 1:
+        raise ValueError(f'the number of workers should be at least 1, got {num_workers}')
+    return _ObjectPrefetcher(repository, keys, num_workers, max_buffer_size).iter_object_streams()
+
+
 class HTMLGetLinksParser(HTMLParser):
     """If a filter_extension is passed, only links with extension matching
     the given one will be returned.
@@ -14,9 +14,10 @@ stored in a single file.
 
 import shutil
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from tabulate import tabulate
 
@@ -33,7 +34,7 @@ from aiida.orm.utils.links import LinkQuadruple
 from aiida.tools.graph.graph_traversers import get_nodes_export, validate_traversal_rules
 
 from .abstract import ArchiveFormatAbstract, ArchiveWriterAbstract
-from .common import batch_iter, entity_type_to_orm
+from .common import batch_iter, entity_type_to_orm, iter_prefetched_object_streams
 from .exceptions import ArchiveExportError, ExportValidationError
 from .implementations.sqlite_zip import ArchiveFormatSqlZip
 
@@ -57,6 +58,8 @@ def create_archive(
     strip_checkpoints: bool = True,
     batch_size: int = 1000,
     compression: int = 6,
+    skip_incompressible: bool = False,
+    base_archives: Optional[Sequence[Union[str, Path]]] = None,
     test_run: bool = False,
     backend: Optional[StorageBackend] = None,
     **traversal_rules: bool,
@@ -133,8 +136,16 @@ def create_archive(
 
     :param compression: level of compression to use (integer from 0 to 9)
 
+    :param skip_incompressible: store repository files that are not worth compressing, such as files that are already
+        compressed, without compression.
+
     :param batch_size: batch database query results in sub-collections to reduce memory usage
 
+    :param base_archives: create an incremental archive, which only contains the nodes, links, groups, comments, logs
+        and repository files that are not in any of these archives. Nodes and groups that are in these archives are
+        still included if they are needed by the new links, group memberships, comments or logs, but without their
+        repository files. The incremental archive should therefore be imported after the base archives.
+
     :param test_run: if True, do not write to file
 
     :param backend: the backend to export from. If not specified, the default backend is used.
@@ -173,6 +184,17 @@ def create_archive(
     archive_format = archive_format or ArchiveFormatSqlZip()
     type_check(archive_format, ArchiveFormatAbstract)
 
+    # check base archives, for an incremental archive
+    base_archives = [Path(path) for path in base_archives or []]
+    for path in base_archives:
+        if not path.is_file():
+            raise ArchiveExportError(f"The base archive '{path}' does not exist")
+        if archive_format.read_version(path) != archive_format.latest_version:
+            raise ArchiveExportError(
+                f"The base archive '{path}' has version {archive_format.read_version(path)!r}, "
+                f'migrate it to the latest version {archive_format.latest_version!r} first'
+            )
+
     # check traversal rules
     validate_traversal_rules(GraphTraversalRules.EXPORT, **traversal_rules)
     full_traversal_rules = {
@@ -252,6 +274,13 @@ def create_archive(
             batch_size,
         )
 
+    # for an incremental archive, remove the entities that are already in the base archives
+    base_keys: Set[str] = set()
+    if base_archives:
+        group_nodes, link_data, base_keys = _exclude_base_entities(
+            querybuilder, archive_format, base_archives, entity_ids, group_nodes, link_data, batch_size
+        )
+
     # now all the nodes have been retrieved, perform some checks
     if entity_ids[EntityTypes.NODE]:
         EXPORT_LOGGER.report('Validating Nodes')
@@ -272,7 +301,7 @@ def create_archive(
             keys = set(
                 orm.Node.get_collection(backend).iter_repo_keys(filters={'id': {'in': node_ids}}, batch_size=batch_size)
             )
-            count_summary.append(['Repository Files', len(keys)])
+            count_summary.append(['Repository Files', len(keys - base_keys)])
         else:
             count_summary.append(['Repository Files', 0])
         EXPORT_LOGGER.report(f'Archive would be created with:\n{tabulate(count_summary)}')
@@ -285,7 +314,9 @@ def create_archive(
     # so that the user cannot end up with a half written archive on errors
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_filename = Path(tmpdir) / 'export.zip'
-        with archive_format.open(tmp_filename, mode='x', compression=compression) as writer:
+        with archive_format.open(
+            tmp_filename, mode='x', compression=compression, skip_incompressible=skip_incompressible
+        ) as writer:
             # add metadata
             writer.update_metadata(
                 {
@@ -298,6 +329,7 @@ def create_archive(
                         'include_comments': include_comments,
                         'include_logs': include_logs,
                         'graph_traversal_rules': full_traversal_rules,
+                        'base_archives': [_get_base_archive_info(archive_format, path) for path in base_archives],
                     },
                 }
             )
@@ -359,7 +391,9 @@ def create_archive(
 
             # stream node repository files to the archive
             if entity_ids[EntityTypes.NODE]:
-                _stream_repo_files(archive_format.key_format, writer, entity_ids[EntityTypes.NODE], backend, batch_size)
+                _stream_repo_files(
+                    archive_format.key_format, writer, entity_ids[EntityTypes.NODE], backend, batch_size, base_keys
+                )
 
             EXPORT_LOGGER.report('Finalizing archive creation...')
 
@@ -631,13 +665,137 @@ def _collect_required_entities(
     return group_nodes, link_data
 
 
+def _get_base_archive_info(archive_format: ArchiveFormatAbstract, path: Path) -> Dict[str, Any]:
+    """Return the information on a base archive that is written to the metadata of an incremental archive."""
+    with archive_format.open(path, mode='r') as reader:
+        metadata = reader.get_metadata()
+    return {'name': path.name, 'ctime': metadata.get('ctime')}
+
+
+def _exclude_base_entities(
+    querybuilder: QbType,
+    archive_format: ArchiveFormatAbstract,
+    base_archives: List[Path],
+    entity_ids: Dict[EntityTypes, Set[int]],
+    group_nodes: List[Tuple[int, int]],
+    link_data: Set[LinkQuadruple],
+    batch_size: int,
+) -> Tuple[List[Tuple[int, int]], Set[LinkQuadruple], Set[str]]:
+    """Exclude the entities that are in the base archives, except those needed by the remaining entities.
+
+    Nodes, groups, comments and logs are compared by their UUID, links by the UUIDs of their nodes, their type and
+    label, and group memberships by the UUIDs of the group and node. Users, computers and authinfos are always kept.
+
+    :returns: (group_id_to_node_id, link_data, repository keys of the base archives) and updates entity_ids
+    """
+    base_uuids: Dict[EntityTypes, Set[str]] = {
+        etype: set() for etype in (EntityTypes.NODE, EntityTypes.GROUP, EntityTypes.COMMENT, EntityTypes.LOG)
+    }
+    base_links: Set[Tuple[str, str, str, str]] = set()
+    base_group_nodes: Set[Tuple[str, str]] = set()
+    base_keys: Set[str] = set()
+
+    with get_progress_reporter()(desc='Collecting base archive entities', total=len(base_archives)) as progress:
+        for path in base_archives:
+            with archive_format.open(path, mode='r') as reader:
+                for etype, uuids in base_uuids.items():
+                    uuids.update(
+                        reader.querybuilder()
+                        .append(entity_type_to_orm[etype], project='uuid')
+                        .all(batch_size=batch_size, flat=True)
+                    )
+                base_links.update(
+                    tuple(row)
+                    for row in reader.querybuilder()
+                    .append(orm.Node, tag='incoming', project='uuid')
+                    .append(orm.Node, with_incoming='incoming', project='uuid', edge_project=['type', 'label'])
+                    .iterall(batch_size=batch_size)
+                )
+                base_group_nodes.update(
+                    tuple(row)
+                    for row in reader.querybuilder()
+                    .append(orm.Group, tag='group', project='uuid')
+                    .append(orm.Node, with_group='group', project='uuid')
+                    .iterall(batch_size=batch_size)
+                )
+                base_keys.update(reader.get_backend().get_repository().list_objects())
+            progress.update()
+
+    def get_uuids(etype: EntityTypes) -> Dict[int, str]:
+        if not entity_ids[etype]:
+            return {}
+        return dict(
+            querybuilder()
+            .append(entity_type_to_orm[etype], filters={'id': {'in': list(entity_ids[etype])}}, project=['id', 'uuid'])
+            .iterall(batch_size=batch_size)
+        )
+
+    node_uuids = get_uuids(EntityTypes.NODE)
+    group_uuids = get_uuids(EntityTypes.GROUP)
+
+    link_data = {
+        link
+        for link in link_data
+        if (node_uuids[link.source_id], node_uuids[link.target_id], link.link_type, link.link_label) not in base_links
+    }
+    group_nodes = [
+        (group_id, node_id)
+        for group_id, node_id in group_nodes
+        if (group_uuids[group_id], node_uuids[node_id]) not in base_group_nodes
+    ]
+
+    # the nodes and groups that are in the base archives are kept if the remaining entities reference them
+    required_node_ids = {node_id for link in link_data for node_id in (link.source_id, link.target_id)}
+    required_node_ids.update(node_id for _, node_id in group_nodes)
+    required_group_ids = {group_id for group_id, _ in group_nodes}
+
+    for etype, relationship in ((EntityTypes.COMMENT, 'with_comment'), (EntityTypes.LOG, 'with_log')):
+        if not entity_ids[etype]:
+            continue
+        remaining_ids = set()
+        for entity_id, uuid, node_id in (
+            querybuilder()
+            .append(
+                entity_type_to_orm[etype],
+                filters={'id': {'in': list(entity_ids[etype])}},
+                tag='entity',
+                project=['id', 'uuid'],
+            )
+            .append(orm.Node, project='id', **{relationship: 'entity'})
+            .iterall(batch_size=batch_size)
+        ):
+            if uuid not in base_uuids[etype]:
+                remaining_ids.add(entity_id)
+                required_node_ids.add(node_id)
+        entity_ids[etype] = remaining_ids
+
+    entity_ids[EntityTypes.NODE] = {
+        node_id
+        for node_id, uuid in node_uuids.items()
+        if uuid not in base_uuids[EntityTypes.NODE] or node_id in required_node_ids
+    }
+    entity_ids[EntityTypes.GROUP] = {
+        group_id
+        for group_id, uuid in group_uuids.items()
+        if uuid not in base_uuids[EntityTypes.GROUP] or group_id in required_group_ids
+    }
+
+    return group_nodes, link_data, base_keys
+
+
 def _stream_repo_files(
-    key_format: str, writer: ArchiveWriterAbstract, node_ids: Set[int], backend: StorageBackend, batch_size: int
+    key_format: str,
+    writer: ArchiveWriterAbstract,
+    node_ids: Set[int],
+    backend: StorageBackend,
+    batch_size: int,
+    exclude_keys: Set[str],
 ) -> None:
-    """Collect all repository object keys from the nodes, then stream the files to the archive."""
+    """Collect the repository object keys of the nodes, except those excluded, then stream the files to the archive."""
     keys = set(
         orm.Node.get_collection(backend).iter_repo_keys(filters={'id': {'in': list(node_ids)}}, batch_size=batch_size)
     )
+    keys -= exclude_keys
 
     repository = backend.get_repository()
     if not repository.key_format == key_format:
@@ -645,12 +803,22 @@ def _stream_repo_files(
         raise NotImplementedError(
             f'Backend repository key format incompatible: {repository.key_format!r} != {key_format!r}'
         )
+    start = time.monotonic()
+    reported = start
+    size = 0
+
     with get_progress_reporter()(desc='Archiving files: ', total=len(keys)) as progress:
-        for key, stream in repository.iter_object_streams(keys):  # type: ignore[arg-type]
+        for key, stream in iter_prefetched_object_streams(repository, keys):
             # to-do should we use assume the key here is correct, or always re-compute and check?
             writer.put_object(stream, key=key)
+            size += stream.drain()
             progress.update()
 
+            now = time.monotonic()
+            if now - reported > 1:
+                progress.set_description_str(f'Archiving files: {size / (now - start) / 1024**2:.1f} MiB/s')
+                reported = now
+
 
 def _check_unsealed_nodes(querybuilder: QbType, node_ids: Set[int], batch_size: int) -> None:
     """Check no process nodes are unsealed, i.e. all processes have completed."""
@@ -9,11 +9,13 @@
 """AiiDA archive writer implementation."""
 
 import hashlib
+import io
 import json
 import os
 import shutil
 import tempfile
 import zipfile
+import zlib
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
@@ -30,14 +32,45 @@ from aiida.common.hashing import chunked_file_hash
 from aiida.common.progress_reporter import get_progress_reporter
 from aiida.orm.entities import EntityTypes
 from aiida.storage.sqlite_zip import models, utils
+from aiida.storage.sqlite_zip.repo_index import create_repo_index
 from aiida.tools.archive.abstract import ArchiveFormatAbstract, ArchiveWriterAbstract
 
+# Signatures of file formats whose content is already compressed
+COMPRESSED_SIGNATURES = (
+    b'\x1f\x8b',  # gzip
+    b'PK\x03\x04',  # zip, and formats based on it
+    b'BZh',  # bzip2
+    b'\xfd7zXZ\x00',  # xz
+    b'\x28\xb5\x2f\xfd',  # zstandard
+    b"7z\xbc\xaf'\x1c",  # 7-zip
+    b'\x89PNG\r\n\x1a\n',  # png
+    b'\xff\xd8\xff',  # jpeg
+)
+
+# Number of bytes read from the start of an object to determine whether it is worth compressing
+COMPRESSIBILITY_SAMPLE_SIZE = 64 * 1024
+
+# Maximum ratio of the compressed to the original size of the sample, for an object to be compressed
+COMPRESSIBILITY_THRESHOLD = 0.9
+
+
+def is_compressible(sample: bytes) -> bool:
+    """Return whether an object, of which ``sample`` are the first bytes, is worth compressing.
+
+    Objects in a format that is already compressed are not, and otherwise the sample is compressed with the fastest
+    compression level to check that this reduces its size sufficiently.
+    """
+    if sample.startswith(COMPRESSED_SIGNATURES):
+        return False
+    return len(zlib.compress(sample, 1)) <= COMPRESSIBILITY_THRESHOLD * len(sample)
+
 
 class ArchiveWriterSqlZip(ArchiveWriterAbstract):
     """AiiDA archive writer implementation."""
 
     meta_name = utils.META_FILENAME
     db_name = utils.DB_FILENAME
+    index_name = utils.REPO_INDEX_FILENAME
 
     def __init__(
         self,
@@ -47,11 +80,18 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         mode: Literal['x', 'w', 'a'] = 'x',
         compression: int = 6,
         work_dir: Optional[Path] = None,
+        skip_incompressible: bool = False,
         _debug: bool = False,
         _enforce_foreign_keys: bool = True,
     ):
+        """Construct a new instance.
+
+        :param skip_incompressible: store repository objects that are not worth compressing, such as files that are
+            already compressed, without compression, see :func:`is_compressible`.
+        """
         super().__init__(path, fmt, mode=mode, compression=compression)
         self._init_work_dir = work_dir
+        self._skip_incompressible = skip_incompressible
         self._in_context = False
         self._enforce_foreign_keys = _enforce_foreign_keys
         self._debug = _debug
@@ -81,7 +121,7 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
             mode=self._mode,
             compression=zipfile.ZIP_DEFLATED if self._compression else zipfile.ZIP_STORED,
             compresslevel=self._compression,
-            info_order=(self.meta_name, self.db_name),
+            info_order=(self.meta_name, self.db_name, self.index_name),
             name_to_info=self._central_dir,
         )
         engine = utils.create_sqla_engine(
@@ -98,6 +138,7 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
             self._conn.commit()
             self._conn.close()
         assert self._work_dir is not None
+        self._write_repo_index()
         with (self._work_dir / self.db_name).open('rb') as handle:
             self._stream_binary(self.db_name, handle)
         self._stream_binary(
@@ -152,12 +193,14 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         buffer_size: Optional[int] = None,
         compression: Optional[int] = None,
         comment: Optional[bytes] = None,
+        head: bytes = b'',
     ) -> None:
         """Add a binary stream to the archive.
 
         :param buffer_size: Number of bytes to buffer
         :param compression: Override global compression level
         :param comment: A binary meta comment about the object
+        :param head: Bytes that were already read from the stream, which are written before the rest of the stream
         """
         self._assert_in_context()
         assert self._zip_path is not None
@@ -170,25 +213,42 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         try:
             position = handle.tell()
             handle.seek(0, os.SEEK_END)
-            kwargs['file_size'] = handle.tell()
+            kwargs['file_size'] = len(head) + handle.tell() - position
             handle.seek(position)
-        except NotImplementedError:
-            # the disk-objectstore PackedObjectReader handler, does not support SEEK_END,
-            # so for these objects we always use ZIP64 to be safe
+        except (NotImplementedError, io.UnsupportedOperation):
+            # the disk-objectstore PackedObjectReader handler, does not support SEEK_END, and streams that are read
+            # while they are being produced cannot seek at all, so for these objects we always use ZIP64 to be safe
             kwargs['force_zip64'] = True
 
         with self._zip_path.joinpath(name).open(mode='wb', **kwargs) as zip_handle:
+            zip_handle.write(head)
             if buffer_size is None:
                 shutil.copyfileobj(handle, zip_handle)
             else:
                 shutil.copyfileobj(handle, zip_handle, length=buffer_size)
 
+    def _write_repo_index(self) -> None:
+        """Add the index of the repository files that have been written to the archive."""
+        self._stream_binary(
+            self.index_name,
+            BytesIO(create_repo_index(self._central_dir.values())),
+            compression=0,  # the index is read in place, so it should not be compressed
+        )
+
     def put_object(self, stream: BinaryIO, *, buffer_size: Optional[int] = None, key: Optional[str] = None) -> str:
         if key is None:
             key = chunked_file_hash(stream, hashlib.sha256)
             stream.seek(0)
         if f'{utils.REPO_FOLDER}/{key}' not in self._central_dir:
-            self._stream_binary(f'{utils.REPO_FOLDER}/{key}', stream, buffer_size=buffer_size)
+            compression = None
+            head = b''
+            if self._skip_incompressible and self._compression:
+                head = stream.read(COMPRESSIBILITY_SAMPLE_SIZE)
+                if not is_compressible(head):
+                    compression = 0
+            self._stream_binary(
+                f'{utils.REPO_FOLDER}/{key}', stream, buffer_size=buffer_size, compression=compression, head=head
+            )
         return key
 
     def delete_object(self, key: str) -> None:
@@ -230,7 +290,7 @@ class ArchiveAppenderSqlZip(ArchiveWriterSqlZip):
             mode='w',
             compression=zipfile.ZIP_DEFLATED if self._compression else zipfile.ZIP_STORED,
             compresslevel=self._compression,
-            info_order=(self.meta_name, self.db_name),
+            info_order=(self.meta_name, self.db_name, self.index_name),
             name_to_info=self._central_dir,
         )
         # extract the database to the work folder
@@ -264,8 +324,9 @@ class ArchiveAppenderSqlZip(ArchiveWriterSqlZip):
             BytesIO(json.dumps(self._metadata).encode('utf8')),
             compression=0,
         )
-        # finalise the new archive
+        # finalise the new archive, indexing both the new and the copied repository files
         self._copy_old_zip_files()
+        self._write_repo_index()
         if self._zip_path is not None:
             self._zip_path.close()
         self._central_dir = {}
@@ -287,6 +348,8 @@ class ArchiveAppenderSqlZip(ArchiveWriterSqlZip):
                 for subpath in old_archive.glob('**/*', include_virtual=False):
                     if subpath.at in self._central_dir or subpath.at in self._deleted_paths:
                         continue
+                    if subpath.at == self.index_name:
+                        continue
                     new_path_sub = self._zip_path.joinpath(subpath.at)
                     if subpath.is_dir():
                         new_path_sub.mkdir(exist_ok=True)
@@ -8,27 +8,31 @@
 ###########################################################################
 """Import an archive."""
 
+import os
+import threading
+from contextlib import ExitStack, closing, contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Literal, Optional, Set, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Literal, Optional, Set, Tuple, Union
 
 from tabulate import tabulate
 
 from aiida import orm
 from aiida.common import timezone
-from aiida.common.exceptions import IncompatibleStorageSchema
+from aiida.common.exceptions import IncompatibleStorageSchema, LockedProfileError, LockingProfileError
 from aiida.common.lang import type_check
 from aiida.common.links import LinkType
 from aiida.common.log import AIIDA_LOGGER
-from aiida.common.progress_reporter import get_progress_reporter
+from aiida.common.progress_reporter import create_callback, get_progress_reporter
 from aiida.manage import get_manager
 from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation import StorageBackend
 from aiida.orm.querybuilder import QueryBuilder
 from aiida.repository import Repository
+from aiida.repository.backend.abstract import AbstractRepositoryBackend
 
 from .abstract import ArchiveFormatAbstract
-from .common import batch_iter, entity_type_to_orm
+from .common import PREFETCH_BUFFER_SIZE, batch_iter, entity_type_to_orm, iter_prefetched_object_streams
 from .exceptions import ImportTestRun, ImportUniquenessError, ImportValidationError
 from .implementations.sqlite_zip import ArchiveFormatSqlZip
 
@@ -72,6 +76,8 @@ def import_archive(
     group: Optional[orm.Group] = None,
     test_run: bool = False,
     backend: Optional[StorageBackend] = None,
+    repository_workers: Optional[int] = None,
+    repository_buffer_size: int = PREFETCH_BUFFER_SIZE,
 ) -> Optional[int]:
     """Import an archive into the AiiDA backend.
 
@@ -99,6 +105,13 @@ def import_archive(
         If None, one will be auto-generated.
     :param test_run: if True, do not write to file
     :param backend: the backend to import to. If not specified, the default backend is used.
+    :param repository_workers: Number of threads reading the repository files from the archive, while the database
+        rows are imported. If zero, the files are added after the database rows, in the current thread. If not
+        specified, one less than the number of CPUs is used, up to four.
+    :param repository_buffer_size: Maximum size in bytes of the repository files read ahead from the archive
+
+    If the profile is not used by any other process, it is locked for exclusive access while the repository files are
+    added, such that they can be written directly to pack files. Otherwise, they are added as loose files.
 
     :returns: Primary Key of the import Group
 
@@ -121,10 +134,16 @@ def import_archive(
         raise ValueError(f"merge_comments not in {('leave', 'newest', 'overwrite')!r}")
     type_check(group, orm.Group, allow_none=True)
     type_check(test_run, bool)
+    type_check(repository_workers, int, allow_none=True)
+    type_check(repository_buffer_size, int)
     backend = backend or get_manager().get_profile_storage()
     type_check(backend, StorageBackend)
     query_params = QueryParams(batch_size=batch_size, filter_size=filter_size)
 
+    if repository_workers is None:
+        # with a single CPU, the threads would only compete with the import of the database rows
+        repository_workers = min(4, (os.cpu_count() or 1) - 1)
+
     if group and not group.is_stored:
         group.store()
 
@@ -165,43 +184,63 @@ def import_archive(
         # To ensure we do not corrupt the backend database on a faulty import,
         # Every addition/update is made in a single transaction, which is commited on exit
         with backend.transaction():
-            user_ids_archive_backend = _import_users(backend_from, backend, query_params)
-            computer_ids_archive_backend = _import_computers(backend_from, backend, query_params)
-            if include_authinfos:
-                _import_authinfos(
-                    backend_from, backend, query_params, user_ids_archive_backend, computer_ids_archive_backend
-                )
-            node_ids_archive_backend = _import_nodes(
+            new_repo_keys = _get_new_object_keys(archive_format.key_format, backend_from, backend, query_params)
+            base_archives = reader.get_metadata().get('creation_parameters', {}).get('base_archives')
+            if base_archives:
+                _check_base_archives_imported(backend_from, new_repo_keys, base_archives, query_params)
+
+            # the repository files are added while the database rows are imported, but before the transaction is
+            # commited. If the commit fails, this is not so much an issue, since the files can be removed on repo
+            # maintenance. On a test run, nothing is added.
+            with _add_files_to_repo(
                 backend_from,
                 backend,
-                query_params,
-                user_ids_archive_backend,
-                computer_ids_archive_backend,
-                import_new_extras,
-                merge_extras,
-            )
-            _import_logs(backend_from, backend, query_params, node_ids_archive_backend)
-            _import_comments(
-                backend_from, backend, query_params, user_ids_archive_backend, node_ids_archive_backend, merge_comments
-            )
-            _import_links(backend_from, backend, query_params, node_ids_archive_backend)
-            group_labels = _import_groups(
-                backend_from, backend, query_params, user_ids_archive_backend, node_ids_archive_backend
-            )
-            import_group_id = None
-            if create_group:
-                import_group_id = _make_import_group(
-                    group, group_labels, node_ids_archive_backend, backend, query_params
+                set() if test_run else new_repo_keys,
+                repository_workers,
+                repository_buffer_size,
+            ):
+                user_ids_archive_backend = _import_users(backend_from, backend, query_params)
+                computer_ids_archive_backend = _import_computers(backend_from, backend, query_params)
+                if include_authinfos:
+                    _import_authinfos(
+                        backend_from, backend, query_params, user_ids_archive_backend, computer_ids_archive_backend
+                    )
+                node_ids_archive_backend = _import_nodes(
+                    backend_from,
+                    backend,
+                    query_params,
+                    user_ids_archive_backend,
+                    computer_ids_archive_backend,
+                    import_new_extras,
+                    merge_extras,
                 )
-            new_repo_keys = _get_new_object_keys(archive_format.key_format, backend_from, backend, query_params)
-
-            if test_run:
-                # exit before we write anything to the database or repository
-                raise ImportTestRun('test run complete')
+                _import_logs(backend_from, backend, query_params, node_ids_archive_backend)
+                _import_comments(
+                    backend_from,
+                    backend,
+                    query_params,
+                    user_ids_archive_backend,
+                    node_ids_archive_backend,
+                    merge_comments,
+                )
+                _import_links(backend_from, backend, query_params, node_ids_archive_backend)
+                group_labels = _import_groups(
+                    backend_from,
+                    backend,
+                    query_params,
+                    user_ids_archive_backend,
+                    node_ids_archive_backend,
+                    extend_existing=bool(base_archives),
+                )
+                import_group_id = None
+                if create_group:
+                    import_group_id = _make_import_group(
+                        group, group_labels, node_ids_archive_backend, backend, query_params
+                    )
 
-            # now the transaction has been successfully populated, but not committed, we add the repository files
-            # if the commit fails, this is not so much an issue, since the files can be removed on repo maintenance
-            _add_files_to_repo(backend_from, backend, new_repo_keys)
+                if test_run:
+                    # exit before we write anything to the database or repository
+                    raise ImportTestRun('test run complete')
 
             IMPORT_LOGGER.report('Committing transaction to database...')
 
@@ -1000,9 +1039,13 @@ def _import_groups(
     query_params: QueryParams,
     user_ids_archive_backend: Dict[int, int],
     node_ids_archive_backend: Dict[int, int],
+    extend_existing: bool = False,
 ) -> Set[str]:
     """Import groups from the input backend, and add group -> node records.
 
+    :param extend_existing: also add the nodes of existing groups that they do not contain yet, as for an incremental
+        archive, whose groups may be in its base archives.
+
     :returns: Set of labels
     """
     # get the records from the input backend
@@ -1028,6 +1071,7 @@ def _import_groups(
 
     new_groups = len(input_id_uuid) - len(backend_uuid_id)
     new_uuids = set(input_id_uuid.values()).difference(backend_uuid_id.keys())
+    existing_uuids = set(backend_uuid_id.keys())
     existing_groups = len(backend_uuid_id)
 
     if existing_groups:
@@ -1071,9 +1115,59 @@ def _import_groups(
                     backend_to.bulk_insert(EntityTypes.GROUP_NODE, rows)
                     progress.update(nrows)
 
+    if existing_groups and extend_existing:
+        _extend_existing_groups(
+            backend_from, backend_to, query_params, existing_uuids, backend_uuid_id, node_ids_archive_backend
+        )
+
     return labels
 
 
+def _extend_existing_groups(
+    backend_from: StorageBackend,
+    backend_to: StorageBackend,
+    query_params: QueryParams,
+    existing_uuids: Set[str],
+    backend_uuid_id: Dict[str, int],
+    node_ids_archive_backend: Dict[int, int],
+) -> None:
+    """Add the nodes of the groups of the input backend to the existing groups that do not contain them yet."""
+    group_id_archive_backend = {
+        group_id: backend_uuid_id[uuid]
+        for group_id, uuid in QueryBuilder(backend=backend_from)
+        .append(orm.Group, project=['id', 'uuid'], filters={'uuid': {'in': list(existing_uuids)}})
+        .iterall(batch_size=query_params.batch_size)
+    }
+
+    existing_rows = {
+        tuple(row)
+        for row in QueryBuilder(backend=backend_to)
+        .append(orm.Group, project='id', filters={'uuid': {'in': list(existing_uuids)}}, tag='group')
+        .append(orm.Node, project='id', with_group='group')
+        .iterall(batch_size=query_params.batch_size)
+    }
+
+    rows = []
+    for archive_group_id, archive_node_id in (
+        QueryBuilder(backend=backend_from)
+        .append(orm.Group, project='id', filters={'uuid': {'in': list(existing_uuids)}}, tag='group')
+        .append(orm.Node, project='id', with_group='group')
+        .iterall(batch_size=query_params.batch_size)
+    ):
+        group_id = group_id_archive_backend[archive_group_id]
+        try:
+            node_id = node_ids_archive_backend[archive_node_id]
+        except KeyError as exc:
+            raise ImportValidationError(f'Archive Group {group_id} has unknown Node: {exc}')
+        if (group_id, node_id) not in existing_rows:
+            rows.append({'dbgroup_id': group_id, 'dbnode_id': node_id})
+
+    if rows:
+        IMPORT_LOGGER.report(f'Adding {len(rows)} Node(s) to existing Group(s)')
+        for _, batch in batch_iter(rows, query_params.batch_size):
+            backend_to.bulk_insert(EntityTypes.GROUP_NODE, batch)
+
+
 def _make_import_group(
     group: Optional[orm.Group],
     labels: Set[str],
@@ -1155,14 +1249,18 @@ def _get_new_object_keys(
             archive_hashkeys.update(key for key in Repository.flatten(repository_metadata).values() if key is not None)
             progress.update()
 
-    IMPORT_LOGGER.report('Checking keys against repository ...')
-
     repository = backend_to.get_repository()
     if not repository.key_format == key_format:
         raise NotImplementedError(
             f'Backend repository key format incompatible: {repository.key_format!r} != {key_format!r}'
         )
-    new_hashkeys = archive_hashkeys.difference(repository.list_objects())
+
+    # check the keys in batches, rather than listing all the objects in the repository, which may be many more
+    new_hashkeys: Set[str] = set()
+    with get_progress_reporter()(desc='Checking keys against repository', total=len(archive_hashkeys)) as progress:
+        for nkeys, keys in batch_iter(archive_hashkeys, query_params.filter_size):
+            new_hashkeys.update(key for key, exists in zip(keys, repository.has_objects(keys)) if not exists)
+            progress.update(nkeys)
 
     existing_count = len(archive_hashkeys) - len(new_hashkeys)
     if existing_count:
@@ -1173,18 +1271,166 @@ def _get_new_object_keys(
     return new_hashkeys
 
 
-def _add_files_to_repo(backend_from: StorageBackend, backend_to: StorageBackend, new_keys: Set[str]) -> None:
-    """Add the new files to the repository."""
+def _check_base_archives_imported(
+    backend_from: StorageBackend, new_keys: Set[str], base_archives: List[Dict[str, Any]], query_params: QueryParams
+) -> None:
+    """Check that the base archives of an incremental archive have been imported.
+
+    An incremental archive does not contain the repository files that are in its base archives, so these files should
+    already be in the repository.
+    """
+    repository = backend_from.get_repository()
+    for _, keys in batch_iter(new_keys, query_params.filter_size):
+        if not all(repository.has_objects(keys)):
+            names = ', '.join(repr(base.get('name')) for base in base_archives)
+            raise ImportValidationError(
+                f'Archive is incremental and its repository files are not all in the profile: import its base archives '
+                f'{names} first'
+            )
+
+
+@contextmanager
+def _add_files_to_repo(
+    backend_from: StorageBackend,
+    backend_to: StorageBackend,
+    new_keys: Set[str],
+    num_workers: int,
+    max_buffer_size: int,
+) -> Iterator[None]:
+    """Add the new files to the repository, while the database rows are imported within the context.
+
+    The files are read from the archive by ``num_workers`` threads, and added to the repository by another thread, so
+    that decompressing the files, adding them to the repository and importing the database rows are all concurrent.
+    If there are no workers, the files are added on exiting the context instead.
+
+    If the profile is not used by any other process, it is locked for exclusive access within the context, such that the
+    repository can store the files in the most efficient way, e.g. directly in pack files. Otherwise, the files are
+    stored in a way that is safe while other processes use the repository, e.g. as loose files.
+    """
     if not new_keys:
-        return None
+        yield
+        return
+
+    with ExitStack() as stack:
+        exclusive = _lock_profile(backend_to, stack)
+        yield from _add_files(backend_from, backend_to, sorted(new_keys), num_workers, max_buffer_size, exclusive)
+
+
+def _lock_profile(backend: StorageBackend, stack: ExitStack) -> bool:
+    """Lock the profile of the backend for exclusive access until the stack is closed, if it is not used by others.
+
+    :return: whether the profile was locked.
+    """
+    from aiida.manage.profile_access import ProfileAccessManager
 
+    try:
+        stack.enter_context(ProfileAccessManager(backend.profile).lock())
+    except (LockedProfileError, LockingProfileError):
+        IMPORT_LOGGER.report('The profile is in use by another process, the archive files are stored as loose files')
+        return False
+
+    return True
+
+
+def _add_files(
+    backend_from: StorageBackend,
+    backend_to: StorageBackend,
+    keys: List[str],
+    num_workers: int,
+    max_buffer_size: int,
+    exclusive: bool,
+) -> Iterator[None]:
+    """Add the files to the repository, while yielding once to import the database rows, see ``_add_files_to_repo``."""
     repository_to = backend_to.get_repository()
     repository_from = backend_from.get_repository()
-    with get_progress_reporter()(desc='Adding archive files to repository', total=len(new_keys)) as progress:
-        for key, handle in repository_from.iter_object_streams(new_keys):  # type: ignore[arg-type]
-            backend_key = repository_to.put_object_from_filelike(handle)
-            if backend_key != key:
-                raise ImportValidationError(
-                    f'Archive repository key is different to backend key: {key!r} != {backend_key!r}'
-                )
-            progress.update()
+
+    if num_workers < 1:
+        yield
+        with get_progress_reporter()(desc='Adding archive files to repository', total=len(keys)) as progress:
+            backend_keys = repository_to.put_objects_from_repository(
+                repository_from, keys, callback=create_callback(progress), exclusive=exclusive
+            )
+        _validate_new_object_keys(keys, dict(zip(keys, backend_keys)))
+        return
+
+    thread = _AddFilesThread(repository_from, repository_to, keys, num_workers, max_buffer_size, exclusive)
+    thread.start()
+
+    try:
+        yield
+    except BaseException:
+        thread.cancel()
+        raise
+
+    with get_progress_reporter()(desc='Adding archive files to repository', total=len(keys)) as progress:
+        added = 0
+        while thread.is_alive():
+            thread.join(0.1)
+            progress.update(thread.added - added)
+            added = thread.added
+
+    if thread.exception is not None:
+        raise thread.exception
+
+    _validate_new_object_keys(keys, thread.backend_keys)
+
+
+class _AddFilesThread(threading.Thread):
+    """Thread adding files from the archive to the repository, while they are read ahead by worker threads."""
+
+    def __init__(
+        self,
+        repository_from: AbstractRepositoryBackend,
+        repository_to: AbstractRepositoryBackend,
+        keys: List[str],
+        num_workers: int,
+        max_buffer_size: int,
+        exclusive: bool,
+    ):
+        super().__init__(name='archive-import-files', daemon=True)
+        self._repository_from = repository_from
+        self._repository_to = repository_to
+        self._keys = keys
+        self._num_workers = num_workers
+        self._max_buffer_size = max_buffer_size
+        self._exclusive = exclusive
+        self._cancelled = threading.Event()
+        self.added = 0
+        self.backend_keys: Dict[str, str] = {}
+        self.exception: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            self.backend_keys = self._repository_to.put_object_streams(
+                self._iter_object_streams(), len(self._keys), self._callback, self._exclusive
+            )
+        except BaseException as exception:
+            self.exception = exception
+
+    def cancel(self) -> None:
+        """Stop adding files to the repository, and wait for the thread to finish."""
+        self._cancelled.set()
+        self.join()
+
+    def _iter_object_streams(self) -> Iterator[Tuple[str, BinaryIO]]:
+        streams = iter_prefetched_object_streams(
+            self._repository_from, self._keys, self._num_workers, self._max_buffer_size
+        )
+        with closing(streams):
+            for key, stream in streams:
+                if self._cancelled.is_set():
+                    raise RuntimeError('adding the archive files to the repository was cancelled')
+                yield key, stream
+
+    def _callback(self, action: str, value: Any) -> None:
+        if action == 'update':
+            self.added += value
+
+
+def _validate_new_object_keys(keys: List[str], backend_keys: Dict[str, str]) -> None:
+    """Validate that the files were added to the repository with the same keys as in the archive."""
+    for key in keys:
+        if backend_keys.get(key) != key:
+            raise ImportValidationError(
+                f'Archive repository key is different to backend key: {key!r} != {backend_keys.get(key)!r}'
+            )
@@ -16,6 +16,7 @@ from numpy import inf
 from aiida import orm
 from aiida.common import exceptions
 from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.manage import get_manager
 from aiida.orm.utils.links import LinkQuadruple
 from aiida.tools.graph.age_entities import Basket
 from aiida.tools.graph.age_rules import RuleSaveWalkers, RuleSequence, RuleSetWalkers, UpdateRule
@@ -200,7 +201,10 @@ def traverse_graph(
 
     :param max_iterations:
         The number of iterations to apply the set of rules (a value of 'None' will
-        iterate until no new nodes are added).
+        iterate until no new nodes are added). Without a maximum, the traversal is
+        performed by the storage backend if it supports it, see
+        :meth:`aiida.orm.implementation.storage_backend.StorageBackend.traverse_graph`,
+        which computes the result in a single query.
 
     :param get_links: Pass True to also return the links between all nodes (found + initial).
 
@@ -209,11 +213,16 @@ def traverse_graph(
 
     :param missing_callback: A callback to handle missing starting_pks or if None raise NotExistent
     """
+    traverse_in_backend = max_iterations is None
+
     if max_iterations is None:
         max_iterations = cast(int, inf)
     elif not (isinstance(max_iterations, int) or max_iterations is inf):
         raise TypeError('Max_iterations has to be an integer or infinity')
 
+    links_forward = list(links_forward)
+    links_backward = list(links_backward)
+
     linktype_list = []
     for linktype in links_forward:
         if not isinstance(linktype, LinkType):
@@ -251,6 +260,15 @@ def traverse_graph(
     elif missing_pks and missing_callback is not None:
         missing_callback(missing_pks)
 
+    if traverse_in_backend:
+        storage = backend or get_manager().get_profile_storage()
+        try:
+            nodes, links = storage.traverse_graph(existing_pks, links_forward, links_backward, get_links)
+        except NotImplementedError:
+            pass
+        else:
+            return {'nodes': nodes, 'links': links}
+
     rules = []
     basket = Basket(nodes=existing_pks)
 
@@ -19,6 +19,8 @@ class CalculationQueryBuilder:
     # This tuple serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
     # have to be manually projected from composing its individual projection constituents
     _compound_projections = ('state',)
+    # The projections whose attributes the formatter of each compound projection reads
+    _compound_projection_dependencies = {'state': ('process_state', 'paused', 'exit_status')}
     _default_projections = ('pk', 'ctime', 'process_label', 'cached', 'state', 'process_status')
     _valid_projections = (
         'pk',
@@ -119,7 +121,16 @@ class CalculationQueryBuilder:
 
         return filters
 
-    def get_query_set(self, relationships=None, filters=None, order_by=None, past_days=None, limit=None):
+    def get_query_set(
+        self,
+        relationships=None,
+        filters=None,
+        order_by=None,
+        past_days=None,
+        limit=None,
+        projections=None,
+        cursor=None,
+    ):
         """Return the query set of calculations for the given filters and query parameters.
 
         :param relationships: A mapping of relationships to join on, e.g. {'with_node': Group} to join on a Group. The
@@ -129,6 +140,11 @@ class CalculationQueryBuilder:
         :param order_by: Order the query set by this criterion.
         :param past_days: Only include entries from the last past days.
         :param limit: Limit the query set to this number of entries.
+        :param projections: Only project the attributes needed to format these projections. By default all valid
+            projections are projected.
+        :param cursor: Only include the entries that come after the entry with this pk in the order of the query set.
+            Together with ``limit``, this allows to page through the query set without offsetting, where the pk of the
+            last entry of a page is the cursor of the next page.
         :return: The query set, a list of dictionaries.
         """
         import datetime
@@ -136,20 +152,38 @@ class CalculationQueryBuilder:
         from aiida import orm
         from aiida.common import timezone
 
-        # Define the list of projections for the QueryBuilder, which are all valid minus the compound projections
-        projected_attributes = [
-            self.mapper.get_attribute(projection)
-            for projection in self._valid_projections
-            if projection not in self._compound_projections
-        ]
-        unique_projections = list(set(projected_attributes))
+        if projections is None:
+            projections = self._valid_projections
+
+        # Define the list of projections for the QueryBuilder, which are the requested ones, where compound projections
+        # are replaced by their constituents, and the pk, which is needed to determine the cursor of the next page
+        projected_attributes = [self.mapper.get_attribute('pk')]
+
+        for projection in projections:
+            if projection in self._compound_projections:
+                dependencies = self._compound_projection_dependencies.get(projection, ())
+                projected_attributes.extend(self.mapper.get_attribute(dependency) for dependency in dependencies)
+            else:
+                projected_attributes.append(self.mapper.get_attribute(projection))
+
+        unique_projections = list(dict.fromkeys(projected_attributes))
 
         if filters is None:
             filters = {}
 
+        if order_by is None:
+            order_by = {'ctime': 'asc'}
+
+        # Break ties on the pk, such that the order is well defined and the cursor determines a unique position
+        ((order_field, order_direction),) = order_by.items()
+        ordering = [order_by] if order_field == 'id' else [order_by, {'id': order_direction}]
+
         if past_days is not None:
             filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
 
+        if cursor is not None:
+            filters = {'and': [filters, self._get_cursor_filters(cursor, order_field, order_direction)]}
+
         builder = orm.QueryBuilder()
         builder.append(cls=orm.ProcessNode, filters=filters, project=unique_projections, tag='process')
 
@@ -157,16 +191,37 @@ class CalculationQueryBuilder:
             for tag, entity in relationships.items():
                 builder.append(cls=type(entity), filters={'id': entity.pk}, **{tag: 'process'})
 
-        if order_by is not None:
-            builder.order_by({'process': order_by})
-        else:
-            builder.order_by({'process': {'ctime': 'asc'}})
+        builder.order_by({'process': ordering})
 
         if limit is not None:
             builder.limit(limit)
 
         return builder.iterdict()
 
+    @staticmethod
+    def _get_cursor_filters(cursor, order_field, order_direction):
+        """Return the filters that select the entries that come after the cursor in the given order.
+
+        :param cursor: The pk of the last entry of the previous page.
+        :param order_field: The field the query set is ordered by, which is either ``id`` or ``ctime``.
+        :param order_direction: The direction of the ordering, either ``asc`` or ``desc``.
+        :raises `~aiida.common.exceptions.NotExistent`: If no process with the cursor as pk exists.
+        """
+        from aiida import orm
+        from aiida.common.exceptions import NotExistent
+
+        operator = '>' if order_direction == 'asc' else '<'
+
+        if order_field == 'id':
+            return {'id': {operator: cursor}}
+
+        value = orm.QueryBuilder().append(orm.ProcessNode, filters={'id': cursor}, project=order_field).first(flat=True)
+
+        if value is None:
+            raise NotExistent(f'no process with pk<{cursor}> exists')
+
+        return {'or': [{order_field: {operator: value}}, {order_field: value, 'id': {operator: cursor}}]}
+
     def get_projected(self, query_set, projections):
         """Project the query set for the given set of projections."""
         header = [self.mapper.get_label(projection) for projection in projections]
@@ -16,6 +16,7 @@
 ### we should instead keep track internally of the 'current working directory'
 ### in the exact same way as paramiko does already.
 
+import asyncio
 import contextlib
 import errno
 import glob
@@ -86,6 +87,14 @@ class LocalTransport(Transport):
             raise InvalidOperation('Cannot close the transport: it is already closed')
         self._is_open = False
 
+    async def open_async(self):
+        """Opens a local transport channel, which does not require any I/O so it is done in the event loop."""
+        return self.open()
+
+    async def close_async(self):
+        """Closes the local transport channel, which does not require any I/O so it is done in the event loop."""
+        return self.close()
+
     def __str__(self):
         """Return a description as a string."""
         return f"local [{'OPEN' if self._is_open else 'CLOSED'}]"
@@ -776,6 +785,44 @@ class LocalTransport(Transport):
 
         return retval, output_text, stderr_text
 
+    async def exec_command_wait_bytes_async(self, command, stdin=None, **kwargs):
+        """Executes the specified command as an ``asyncio`` subprocess and waits for it to finish.
+
+        Contrary to :meth:`exec_command_wait_bytes` this does not block the event loop while the command is running.
+
+        :param command: the command to execute
+        :param stdin: (optional,default=None) can be a string, bytes or a file-like object.
+
+        :return: a tuple with (return_value, stdout, stderr) where stdout and stderr
+            are both bytes and the return_value is an int.
+        """
+        from aiida.common.escaping import escape_for_bash
+
+        if stdin is None:
+            stdin_bytes = None
+        elif isinstance(stdin, str):
+            stdin_bytes = stdin.encode('utf-8')
+        elif isinstance(stdin, bytes):
+            stdin_bytes = stdin
+        elif isinstance(stdin, io.TextIOBase):
+            stdin_bytes = stdin.read().encode('utf-8')
+        elif isinstance(stdin, io.BufferedIOBase):
+            stdin_bytes = stdin.read()
+        else:
+            raise ValueError('You can only pass strings, bytes, BytesIO or StringIO objects')
+
+        process = await asyncio.create_subprocess_shell(
+            f'{self._bash_command_str}-c {escape_for_bash(command)}',
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.getcwd(),
+            start_new_session=True,
+        )
+        output_text, stderr_text = await process.communicate(stdin_bytes)
+
+        return process.returncode, output_text, stderr_text
+
     def gotocomputer_command(self, remotedir):
         """Return a string to be run using os.system in order to connect
         via the transport to the remote directory.
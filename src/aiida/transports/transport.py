@@ -9,7 +9,10 @@
 """Transport interface."""
 
 import abc
+import asyncio
+import contextlib
 import fnmatch
+import functools
 import os
 import re
 import sys
@@ -97,6 +100,7 @@ class Transport(abc.ABC):
         self._logger_extra = None
         self._is_open = False
         self._enters = 0
+        self._exclusive_lock = None
 
         # for accessing the identity of the underlying machine
         self.hostname = kwargs.get('machine')
@@ -759,6 +763,150 @@ class Transport(abc.ABC):
     def has_magic(self, string):
         return self._MAGIC_CHECK.search(string) is not None
 
+    @contextlib.asynccontextmanager
+    async def exclusive_access(self):
+        """Asynchronous context manager that grants the calling task exclusive use of this transport.
+
+        A single open transport is shared by all the tasks of an event loop that requested it for the same authinfo.
+        Operations such as :meth:`chdir` change state that is shared by all those tasks, so a task that awaits a series
+        of transport operations that depend on that state, should do so while holding this context::
+
+            async with transport.exclusive_access():
+                await transport.chdir_async(workdir)
+                await transport.get_async('output.txt', localpath)
+
+        Only tasks that hold this context exclude each other. The transport tasks of calculation jobs do not hold it,
+        since they address all remote files through absolute paths, such that their file transfers can overlap.
+
+        The lock is bound to the event loop in which it is first acquired.
+        """
+        if self._exclusive_lock is None:
+            self._exclusive_lock = asyncio.Lock()
+
+        async with self._exclusive_lock:
+            yield self
+
+    async def _run_blocking(self, method, *args, **kwargs):
+        """Run a blocking method of this transport in a worker thread and await its result.
+
+        This is the default implementation of the asynchronous API for transport plugins that are implemented with
+        blocking calls. It allows the calling event loop to continue processing other tasks while the operation, for
+        example a large file transfer, is in progress. Plugins that can perform an operation natively with ``asyncio``
+        should override the corresponding ``*_async`` method instead.
+
+        :param method: the bound method to call.
+        :return: the return value of the method.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
+
+    async def open_async(self):
+        """Asynchronous counterpart of :meth:`open`."""
+        return await self._run_blocking(self.open)
+
+    async def close_async(self):
+        """Asynchronous counterpart of :meth:`close`."""
+        return await self._run_blocking(self.close)
+
+    async def chdir_async(self, path):
+        """Asynchronous counterpart of :meth:`chdir`."""
+        return await self._run_blocking(self.chdir, path)
+
+    async def chmod_async(self, path, mode):
+        """Asynchronous counterpart of :meth:`chmod`."""
+        return await self._run_blocking(self.chmod, path, mode)
+
+    async def copy_async(self, remotesource, remotedestination, dereference=False, recursive=True):
+        """Asynchronous counterpart of :meth:`copy`."""
+        return await self._run_blocking(self.copy, remotesource, remotedestination, dereference, recursive)
+
+    async def copytree_async(self, remotesource, remotedestination, dereference=False):
+        """Asynchronous counterpart of :meth:`copytree`."""
+        return await self._run_blocking(self.copytree, remotesource, remotedestination, dereference)
+
+    async def exec_command_wait_bytes_async(self, command, stdin=None, **kwargs):
+        """Asynchronous counterpart of :meth:`exec_command_wait_bytes`."""
+        return await self._run_blocking(self.exec_command_wait_bytes, command, stdin=stdin, **kwargs)
+
+    async def exec_command_wait_async(self, command, stdin=None, encoding='utf-8', **kwargs):
+        """Asynchronous counterpart of :meth:`exec_command_wait`."""
+        retval, stdout_bytes, stderr_bytes = await self.exec_command_wait_bytes_async(
+            command=command, stdin=stdin, **kwargs
+        )
+        return (retval, stdout_bytes.decode(encoding), stderr_bytes.decode(encoding))
+
+    async def get_async(self, remotepath, localpath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`get`."""
+        return await self._run_blocking(self.get, remotepath, localpath, *args, **kwargs)
+
+    async def getfile_async(self, remotepath, localpath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`getfile`."""
+        return await self._run_blocking(self.getfile, remotepath, localpath, *args, **kwargs)
+
+    async def gettree_async(self, remotepath, localpath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`gettree`."""
+        return await self._run_blocking(self.gettree, remotepath, localpath, *args, **kwargs)
+
+    async def glob_async(self, pathname):
+        """Asynchronous counterpart of :meth:`glob`."""
+        return await self._run_blocking(self.glob, pathname)
+
+    async def isdir_async(self, path):
+        """Asynchronous counterpart of :meth:`isdir`."""
+        return await self._run_blocking(self.isdir, path)
+
+    async def isfile_async(self, path):
+        """Asynchronous counterpart of :meth:`isfile`."""
+        return await self._run_blocking(self.isfile, path)
+
+    async def listdir_async(self, path='.', pattern=None):
+        """Asynchronous counterpart of :meth:`listdir`."""
+        return await self._run_blocking(self.listdir, path, pattern)
+
+    async def makedirs_async(self, path, ignore_existing=False):
+        """Asynchronous counterpart of :meth:`makedirs`."""
+        return await self._run_blocking(self.makedirs, path, ignore_existing)
+
+    async def mkdir_async(self, path, ignore_existing=False):
+        """Asynchronous counterpart of :meth:`mkdir`."""
+        return await self._run_blocking(self.mkdir, path, ignore_existing)
+
+    async def path_exists_async(self, path):
+        """Asynchronous counterpart of :meth:`path_exists`."""
+        return await self._run_blocking(self.path_exists, path)
+
+    async def put_async(self, localpath, remotepath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`put`."""
+        return await self._run_blocking(self.put, localpath, remotepath, *args, **kwargs)
+
+    async def putfile_async(self, localpath, remotepath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`putfile`."""
+        return await self._run_blocking(self.putfile, localpath, remotepath, *args, **kwargs)
+
+    async def puttree_async(self, localpath, remotepath, *args, **kwargs):
+        """Asynchronous counterpart of :meth:`puttree`."""
+        return await self._run_blocking(self.puttree, localpath, remotepath, *args, **kwargs)
+
+    async def remove_async(self, path):
+        """Asynchronous counterpart of :meth:`remove`."""
+        return await self._run_blocking(self.remove, path)
+
+    async def rename_async(self, oldpath, newpath):
+        """Asynchronous counterpart of :meth:`rename`."""
+        return await self._run_blocking(self.rename, oldpath, newpath)
+
+    async def rmtree_async(self, path):
+        """Asynchronous counterpart of :meth:`rmtree`."""
+        return await self._run_blocking(self.rmtree, path)
+
+    async def symlink_async(self, remotesource, remotedestination):
+        """Asynchronous counterpart of :meth:`symlink`."""
+        return await self._run_blocking(self.symlink, remotesource, remotedestination)
+
+    async def whoami_async(self):
+        """Asynchronous counterpart of :meth:`whoami`."""
+        return await self._run_blocking(self.whoami)
+
     def _gotocomputer_string(self, remotedir):
         """Command executed when goto computer."""
         connect_string = (
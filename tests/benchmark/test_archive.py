@@ -106,3 +106,56 @@ def test_import(aiida_profile, benchmark, tmp_path, depth, breadth, num_objects)
 
     benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=12, warmup_rounds=1)
     load_node(root_uuid)
+
+
+@pytest.mark.benchmark(group='import-export')
+def test_import_populated_repository(aiida_profile, benchmark, tmp_path):
+    """Benchmark importing a provenance graph into a profile whose repository already contains many objects."""
+    from aiida.manage import get_manager
+
+    aiida_profile.reset_storage()
+    root_node = Dict()
+    recursive_provenance(root_node, depth=4, breadth=3, num_objects=2)
+    root_uuid = root_node.uuid
+    out_path = tmp_path / 'test.aiida'
+    kwargs = get_export_kwargs(filename=str(out_path))
+    create_archive([root_node], **kwargs)
+
+    def _setup():
+        aiida_profile.reset_storage()
+        repository = get_manager().get_profile_storage().get_repository()
+        repository._container.add_objects_to_pack([f'object {index}'.encode() for index in range(100_000)])
+
+    def _run():
+        import_archive(str(out_path))
+
+    benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=3, warmup_rounds=0)
+    load_node(root_uuid)
+
+
+WORKERS = {'serial': 0, 'pipelined': 4}
+
+
+@pytest.mark.parametrize('repository_workers', WORKERS.values(), ids=WORKERS.keys())
+@pytest.mark.benchmark(group='import-repository')
+def test_import_repository_workers(aiida_profile, benchmark, tmp_path, repository_workers):
+    """Benchmark importing nodes with distinct repository files, whose files are read from the archive by workers."""
+    aiida_profile.reset_storage()
+    nodes = []
+    for index in range(500):
+        node = Dict(dict={str(i): i for i in range(10)})
+        node.base.repository.put_object_from_bytes(b'%d' % index + bytes(range(256)) * 1024, 'file')
+        nodes.append(node.store())
+    out_path = tmp_path / 'test.aiida'
+    kwargs = get_export_kwargs(filename=str(out_path))
+    node_uuid = nodes[0].uuid
+    create_archive(nodes, **kwargs)
+
+    def _setup():
+        aiida_profile.reset_storage()
+
+    def _run():
+        import_archive(str(out_path), repository_workers=repository_workers)
+
+    benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=6, warmup_rounds=1)
+    load_node(node_uuid)
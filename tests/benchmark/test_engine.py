@@ -12,6 +12,9 @@ The purpose of these tests is to benchmark and compare processes,
 which are executed *via* both a local runner and the daemon.
 """
 
+import pathlib
+import shutil
+
 import pytest
 from aiida.engine import WorkChain, run_get_node, while_
 from aiida.orm import InstalledCode, Int
@@ -143,3 +146,81 @@ def test_workchain_daemon(benchmark, submit_and_await, aiida_localhost, workchai
 
     assert result.is_finished_ok, (result.exit_status, result.exit_message)
     assert len(result.base.links.get_outgoing().all()) == outgoing
+
+
+@pytest.mark.parametrize('num_files', (1000, pytest.param(10000, marks=pytest.mark.nightly)))
+@pytest.mark.parametrize('bulk_retrieve', (False, True), ids=('per-item', 'bulk'))
+@pytest.mark.benchmark(group='retrieve')
+def test_retrieve_files_from_list(benchmark, event_loop, tmp_path, aiida_localhost, bulk_retrieve, num_files):
+    """Benchmark the retrieval of many small files from the working directory of a calculation job."""
+    from aiida.engine.daemon.execmanager import retrieve_files_from_list
+    from aiida.orm import CalcJobNode
+    from aiida.transports.plugins.local import LocalTransport
+
+    source = tmp_path / 'source'
+    (source / 'output').mkdir(parents=True)
+
+    for index in range(num_files):
+        (source / 'output' / f'file_{index}.dat').write_text(f'content {index}')
+
+    aiida_localhost.set_bulk_retrieve(bulk_retrieve)
+    node = CalcJobNode(computer=aiida_localhost)
+    retrieve_list = [('output/*.dat', '.', 0)]
+
+    def _run():
+        target = tmp_path / 'target'
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+
+        with LocalTransport() as transport:
+            transport.chdir(str(source))
+            event_loop.run_until_complete(retrieve_files_from_list(node, transport, str(target), retrieve_list))
+
+        return target
+
+    target = benchmark.pedantic(_run, iterations=1, rounds=3, warmup_rounds=1)
+
+    assert len(list(target.iterdir())) == num_files
+
+
+@pytest.mark.parametrize('bulk_upload', (False, True), ids=('per-item', 'bulk'))
+@pytest.mark.benchmark(group='upload')
+def test_upload_calculation(benchmark, event_loop, tmp_path, aiida_localhost, bulk_upload):
+    """Benchmark the upload of many small files from the sandbox and the local copy list of a calculation job."""
+    from aiida.common.datastructures import CalcInfo, CodeInfo
+    from aiida.common.folders import Folder
+    from aiida.engine.daemon.execmanager import upload_calculation
+    from aiida.orm import CalcJobNode, FolderData
+
+    sandbox = tmp_path / 'sandbox'
+    (sandbox / 'kpoints').mkdir(parents=True)
+
+    for index in range(100):
+        (sandbox / 'kpoints' / f'file_{index}.dat').write_text(f'content {index}')
+
+    pseudos = tmp_path / 'pseudos'
+    pseudos.mkdir()
+
+    for index in range(100):
+        (pseudos / f'element_{index}.upf').write_text(f'pseudo {index}')
+
+    pseudos = FolderData(tree=pseudos).store()
+    code = InstalledCode(computer=aiida_localhost, filepath_executable='/bin/bash').store()
+    aiida_localhost.set_bulk_upload(bulk_upload)
+
+    def _run():
+        node = CalcJobNode(computer=aiida_localhost).store()
+        calc_info = CalcInfo()
+        calc_info.uuid = node.uuid
+        calc_info.codes_info = [CodeInfo()]
+        calc_info.codes_info[0].code_uuid = code.uuid
+        calc_info.local_copy_list = [(pseudos.uuid, None, 'pseudo')]
+
+        with aiida_localhost.get_transport() as transport:
+            event_loop.run_until_complete(upload_calculation(node, transport, calc_info, Folder(str(sandbox))))
+
+        return node
+
+    node = benchmark.pedantic(_run, iterations=1, rounds=5, warmup_rounds=1)
+
+    assert len(list((pathlib.Path(node.get_remote_workdir()) / 'pseudo').iterdir())) == 100
@@ -0,0 +1,67 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for the traversal of the provenance graph.
+
+The purpose of these tests is to compare the traversal of the graph by the storage backend,
+with a single recursive query, to iterating the rules of the AiiDA graph explorer.
+"""
+
+import pytest
+from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcFunctionNode, Dict
+from aiida.tools.graph.graph_traversers import traverse_graph, validate_traversal_rules
+from numpy import inf
+
+
+def recursive_provenance(in_node, depth, breadth):
+    """Recursively build a provenance tree."""
+    if not in_node.is_stored:
+        in_node.store()
+    if depth < 1:
+        return
+    depth -= 1
+    for _ in range(breadth):
+        calcfunc = CalcFunctionNode()
+        calcfunc.set_process_state(ProcessState.FINISHED)
+        calcfunc.set_exit_status(0)
+        calcfunc.base.links.add_incoming(in_node, link_type=LinkType.INPUT_CALC, link_label='input')
+        calcfunc.store()
+
+        out_node = Dict(dict={str(i): i for i in range(10)})
+        out_node.base.links.add_incoming(calcfunc, link_type=LinkType.CREATE, link_label='output')
+        out_node.store()
+
+        calcfunc.seal()
+
+        recursive_provenance(out_node, depth, breadth)
+
+
+ENGINES = {'storage-backend': None, 'graph-explorer': inf}
+
+
+@pytest.mark.parametrize('max_iterations', ENGINES.values(), ids=ENGINES.keys())
+@pytest.mark.benchmark(group='graph-traversal')
+def test_traverse_delete(benchmark, max_iterations):
+    """Benchmark computing the nodes to delete with the root of a provenance tree."""
+    root_node = Dict()
+    recursive_provenance(root_node, depth=5, breadth=3)
+    traverse_links = validate_traversal_rules(GraphTraversalRules.DELETE)
+
+    def _run():
+        return traverse_graph(
+            [root_node.pk],
+            max_iterations=max_iterations,
+            get_links=True,
+            links_forward=traverse_links['forward'],
+            links_backward=traverse_links['backward'],
+        )
+
+    result = benchmark.pedantic(_run, iterations=1, rounds=12, warmup_rounds=1)
+    assert len(result['nodes']) == 1 + 2 * (3 + 3**2 + 3**3 + 3**4 + 3**5)
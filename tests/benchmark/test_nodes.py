@@ -16,9 +16,11 @@ from io import StringIO
 
 import pytest
 from aiida.common import NotExistent
-from aiida.orm import Data, load_node
+from aiida.orm import Data, load_node, store_many
 
 GROUP_NAME = 'node'
+GROUP_NAME_MANY = 'node-many'
+NUM_NODES = 100
 
 
 def get_data_node(store=True):
@@ -74,6 +76,32 @@ def test_store_with_object(benchmark):
     assert node_dict['node'].is_stored, node_dict
 
 
+def get_data_nodes():
+    """A function to create a list of unstored data nodes, each with an object."""
+    nodes = [get_data_node_and_object(store=False)[1]['node'] for _ in range(NUM_NODES)]
+    return (nodes,), {}
+
+
+@pytest.mark.benchmark(group=GROUP_NAME_MANY)
+def test_store_loop(benchmark):
+    """Benchmark for storing many nodes one by one."""
+
+    def _run(nodes):
+        for node in nodes:
+            node.store()
+        return nodes
+
+    nodes = benchmark.pedantic(_run, setup=get_data_nodes, iterations=1, rounds=10, warmup_rounds=1)
+    assert all(node.is_stored for node in nodes)
+
+
+@pytest.mark.benchmark(group=GROUP_NAME_MANY)
+def test_store_many(benchmark):
+    """Benchmark for storing many nodes with ``store_many``."""
+    nodes = benchmark.pedantic(store_many, setup=get_data_nodes, iterations=1, rounds=10, warmup_rounds=1)
+    assert all(node.is_stored for node in nodes)
+
+
 @pytest.mark.benchmark(group=GROUP_NAME)
 def test_delete_backend(benchmark):
     """Benchmark for deleting a stored node directly,
@@ -0,0 +1,64 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for process checkpoints.
+
+The purpose of these tests is to compare the serialization of checkpoints
+to yaml with the binary checkpoint format, for a work chain with a large context.
+"""
+
+import pytest
+from aiida.common import AttributeDict
+from aiida.orm import Int
+from aiida.orm.utils import serialize
+from plumpy import Bundle
+
+GROUP_NAME = 'checkpoint'
+
+FORMATS = {
+    'yaml': (serialize.serialize, serialize.deserialize_unsafe),
+    'binary': (serialize.serialize_checkpoint, serialize.deserialize_checkpoint),
+    'binary-uncompressed': (
+        lambda data: serialize.serialize_checkpoint(data, compress=False),
+        serialize.deserialize_checkpoint,
+    ),
+}
+
+
+@pytest.fixture
+def bundle():
+    """Return a bundle resembling the checkpoint of a work chain with a context of 1000 entries."""
+    nodes = [Int(index).store() for index in range(10)]
+    context = AttributeDict(
+        {
+            f'entry_{index}': {'value': index, 'label': f'label_{index}', 'node': nodes[index % 10]}
+            for index in range(1000)
+        }
+    )
+    bundle = Bundle.__new__(Bundle)
+    bundle.update({'CONTEXT': context, 'INPUTS': {'x': nodes[0]}, 'STEPPER_STATE': {'pos': [0, 1]}})
+    return bundle
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+@pytest.mark.benchmark(group=f'{GROUP_NAME}-save')
+def test_save(benchmark, bundle, fmt):
+    """Benchmark the serialization of a checkpoint."""
+    serializer, _ = FORMATS[fmt]
+    serialized = benchmark(serializer, bundle)
+    assert isinstance(serialized, str)
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+@pytest.mark.benchmark(group=f'{GROUP_NAME}-load')
+def test_load(benchmark, bundle, fmt):
+    """Benchmark the deserialization of a checkpoint."""
+    serializer, deserializer = FORMATS[fmt]
+    serialized = serializer(bundle)
+    deserialized = benchmark(deserializer, serialized)
+    assert len(deserialized['CONTEXT']) == 1000
@@ -0,0 +1,58 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for iterating over query results.
+
+The purpose of these tests is to benchmark and compare iterating over large query sets, with and without streaming the
+results from a server-side cursor.
+"""
+
+import tracemalloc
+
+import pytest
+from aiida.orm import Data, QueryBuilder, store_many
+
+GROUP_NAME = 'querybuilder-iterall'
+NUM_NODES = 20000
+
+
+@pytest.fixture(scope='module')
+def nodes(aiida_profile):
+    """Create a synthetic database with many nodes with a few attributes each."""
+    aiida_profile.reset_storage()
+    nodes = []
+
+    for index in range(NUM_NODES):
+        node = Data()
+        node.base.attributes.set_many({str(i): index * i for i in range(10)})
+        nodes.append(node)
+
+    store_many(nodes)
+    return len(nodes)
+
+
+@pytest.mark.parametrize('stream', (False, True))
+@pytest.mark.parametrize('project', ('id', '*'))
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_iterall(benchmark, nodes, project, stream):
+    """Benchmark for iterating over all nodes, reporting the peak memory allocated while iterating."""
+
+    def _run():
+        count = 0
+        tracemalloc.start()
+        try:
+            for _ in QueryBuilder().append(Data, project=project).iterall(batch_size=100, stream=stream):
+                count += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info['peak_memory_mb'] = peak / 1024**2
+        return count
+
+    count = benchmark.pedantic(_run, iterations=1, rounds=3)
+    assert count == nodes
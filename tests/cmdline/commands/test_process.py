@@ -183,6 +183,39 @@ class TestVerdiProcess:
             result = run_cli_command(cmd_process.process_list, ['-r', '-X', flag, 'exit_message'])
             assert Process.exit_codes.ERROR_UNSPECIFIED.message in result.output
 
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    @pytest.mark.parametrize('order_by', ('id', 'ctime'))
+    @pytest.mark.parametrize('order_dir', ('asc', 'desc'))
+    def test_list_cursor(self, run_cli_command, order_by, order_dir):
+        """Test that the list command pages through the processes with the ``--limit`` and ``--cursor`` options."""
+        for _ in range(5):
+            node = WorkFunctionNode()
+            node.set_process_state(ProcessState.RUNNING)
+            node.store()
+
+        options = ['-r', '-P', 'pk', '-O', order_by, '-D', order_dir]
+        expected = run_cli_command(cmd_process.process_list, options).output_lines
+        assert len(expected) == 5
+
+        pks = []
+        cursor = []
+
+        while True:
+            result = run_cli_command(cmd_process.process_list, [*options, '--limit', '2', *cursor])
+            if not result.output_lines:
+                break
+            pks.extend(result.output_lines)
+            cursor = ['--cursor', result.output_lines[-1]]
+
+        assert pks == expected
+
+        # Without the raw option, the command should report the cursor of the next page if the page is full
+        result = run_cli_command(cmd_process.process_list, ['-O', order_by, '-D', order_dir, '--limit', '2'])
+        assert f'--cursor {expected[1]}' in result.output
+
+        result = run_cli_command(cmd_process.process_list, ['-O', order_by, '--cursor', '-1'], raises=True)
+        assert 'invalid cursor' in result.output
+
     def test_process_show(self, run_cli_command):
         """Test verdi process show"""
         workchain_one = WorkChainNode()
@@ -449,7 +449,7 @@ def runner(manager):
 
 
 @pytest.fixture
-def event_loop(manager):
+def event_loop(aiida_profile, manager):
     """Get the event loop instance of the currently loaded profile.
 
     This is automatically called as a fixture for any test marked with ``@pytest.mark.asyncio``.
@@ -15,7 +15,7 @@ import pytest
 from aiida.common.datastructures import CalcInfo, CodeInfo, FileCopyOperation
 from aiida.common.folders import SandboxFolder
 from aiida.engine.daemon import execmanager
-from aiida.orm import CalcJobNode, FolderData, RemoteData, SinglefileData
+from aiida.orm import CalcJobNode, FolderData, PortableCode, RemoteData, SinglefileData
 from aiida.plugins import entry_point
 from aiida.transports.plugins.local import LocalTransport
 
@@ -110,25 +110,31 @@ def test_hierarchy_utility(file_hierarchy, tmp_path, create_file_hierarchy, seri
         (['file_a.txt', 'file_u.txt', 'path/file_u.txt', ('path/sub/file_u.txt', '.', 3)], {'file_a.txt': 'file_a'}),
     ),
 )
-def test_retrieve_files_from_list(
+@pytest.mark.parametrize('bulk_retrieve', (False, True))
+@pytest.mark.asyncio
+async def test_retrieve_files_from_list(
     tmp_path_factory,
+    aiida_localhost,
     generate_calculation_node,
     file_hierarchy,
     retrieve_list,
     expected_hierarchy,
+    bulk_retrieve,
     create_file_hierarchy,
     serialize_file_hierarchy,
 ):
-    """Test the `retrieve_files_from_list` function."""
+    """Test the `retrieve_files_from_list` function, both retrieving items one by one and in bulk."""
     source = tmp_path_factory.mktemp('source')
     target = tmp_path_factory.mktemp('target')
 
     create_file_hierarchy(file_hierarchy, source)
+    aiida_localhost.set_bulk_retrieve(bulk_retrieve)
 
     with LocalTransport() as transport:
         node = generate_calculation_node()
+        node.computer = aiida_localhost
         transport.chdir(source)
-        execmanager.retrieve_files_from_list(node, transport, target, retrieve_list)
+        await execmanager.retrieve_files_from_list(node, transport, target, retrieve_list)
 
     assert serialize_file_hierarchy(target, read_bytes=False) == expected_hierarchy
 
@@ -146,13 +152,16 @@ def test_retrieve_files_from_list(
         (['sub', 'target'], {'target': {'b': 'file_b'}}),
     ),
 )
-def test_upload_local_copy_list(
+@pytest.mark.parametrize('bulk_upload', (False, True))
+@pytest.mark.asyncio
+async def test_upload_local_copy_list(
     fixture_sandbox,
     node_and_calc_info,
     file_hierarchy_simple,
     tmp_path,
     local_copy_list,
     expected_hierarchy,
+    bulk_upload,
     create_file_hierarchy,
     serialize_file_hierarchy,
 ):
@@ -163,10 +172,11 @@ def test_upload_local_copy_list(
     folder.store()
 
     node, calc_info = node_and_calc_info
+    node.computer.set_bulk_upload(bulk_upload)
     calc_info.local_copy_list = [[folder.uuid] + local_copy_list]
 
     with node.computer.get_transport() as transport:
-        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+        await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
     # Check that none of the files were written to the repository of the calculation node, since they were communicated
     # through the ``local_copy_list``.
@@ -177,7 +187,8 @@ def test_upload_local_copy_list(
     assert written_hierarchy == expected_hierarchy
 
 
-def test_upload_local_copy_list_files_folders(
+@pytest.mark.asyncio
+async def test_upload_local_copy_list_files_folders(
     fixture_sandbox, node_and_calc_info, file_hierarchy, tmp_path, create_file_hierarchy, serialize_file_hierarchy
 ):
     """Test the ``local_copy_list`` functionality in ``upload_calculation``.
@@ -203,7 +214,7 @@ def test_upload_local_copy_list_files_folders(
     ]
 
     with node.computer.get_transport() as transport:
-        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+        await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
     # Check that none of the files were written to the repository of the calculation node, since they were communicated
     # through the ``local_copy_list``.
@@ -218,7 +229,8 @@ def test_upload_local_copy_list_files_folders(
     assert expected_hierarchy == written_hierarchy
 
 
-def test_upload_remote_symlink_list(
+@pytest.mark.asyncio
+async def test_upload_remote_symlink_list(
     fixture_sandbox, node_and_calc_info, file_hierarchy, tmp_path, create_file_hierarchy
 ):
     """Test the ``remote_symlink_list`` functionality in ``upload_calculation``.
@@ -234,7 +246,7 @@ def test_upload_remote_symlink_list(
     ]
 
     with node.computer.get_transport() as transport:
-        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+        await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
     filepath_workdir = pathlib.Path(node.get_remote_workdir())
     assert (filepath_workdir / 'file_a.txt').is_symlink()
@@ -265,9 +277,12 @@ def test_upload_remote_symlink_list(
         ),
     ),
 )
-def test_upload_file_copy_operation_order(node_and_calc_info, tmp_path, order, expected):
+@pytest.mark.parametrize('bulk_upload', (False, True))
+@pytest.mark.asyncio
+async def test_upload_file_copy_operation_order(node_and_calc_info, tmp_path, order, expected, bulk_upload):
     """Test the ``CalcInfo.file_copy_operation_order`` controls the copy order."""
     node, calc_info = node_and_calc_info
+    node.computer.set_bulk_upload(bulk_upload)
 
     dirpath_remote = tmp_path / 'remote'
     dirpath_remote.mkdir()
@@ -298,7 +313,7 @@ def test_upload_file_copy_operation_order(node_and_calc_info, tmp_path, order, e
         calc_info.file_copy_operation_order = order
 
     with node.computer.get_transport() as transport:
-        execmanager.upload_calculation(node, transport, calc_info, sandbox, inputs)
+        await execmanager.upload_calculation(node, transport, calc_info, sandbox, inputs)
         filepath = pathlib.Path(node.get_remote_workdir()) / 'file.txt'
         assert filepath.is_file()
         assert filepath.read_text() == expected
@@ -506,7 +521,9 @@ def test_upload_file_copy_operation_order(node_and_calc_info, tmp_path, order, e
         ),
     ],
 )
-def test_upload_combinations(
+@pytest.mark.parametrize('bulk_upload', (False, True))
+@pytest.mark.asyncio
+async def test_upload_combinations(
     fixture_sandbox,
     node_and_calc_info,
     tmp_path,
@@ -515,6 +532,7 @@ def test_upload_combinations(
     remote_copy_list,
     expected_hierarchy,
     expected_exception,
+    bulk_upload,
     create_file_hierarchy,
     serialize_file_hierarchy,
 ):
@@ -536,6 +554,7 @@ def test_upload_combinations(
     create_file_hierarchy(sandbox_hierarchy, fixture_sandbox)
 
     node, calc_info = node_and_calc_info
+    node.computer.set_bulk_upload(bulk_upload)
 
     calc_info.local_copy_list = []
 
@@ -573,15 +592,71 @@ def test_upload_combinations(
     if expected_exception is not None:
         with pytest.raises(expected_exception):
             with node.computer.get_transport() as transport:
-                execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+                await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
             filepath_workdir = pathlib.Path(node.get_remote_workdir())
 
             assert serialize_file_hierarchy(filepath_workdir, read_bytes=False) == expected_hierarchy
     else:
         with node.computer.get_transport() as transport:
-            execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+            await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
         filepath_workdir = pathlib.Path(node.get_remote_workdir())
 
         assert serialize_file_hierarchy(filepath_workdir, read_bytes=False) == expected_hierarchy
+
+
+@pytest.mark.parametrize('node_and_calc_info', ['core.local'], indirect=True)
+@pytest.mark.parametrize('bulk_upload', (False, True))
+@pytest.mark.asyncio
+async def test_upload_portable_code(
+    fixture_sandbox, node_and_calc_info, tmp_path, bulk_upload, create_file_hierarchy, serialize_file_hierarchy
+):
+    """Test that the files of a ``PortableCode`` are uploaded and that its executable is made executable.
+
+    A directory of the sandbox that already exists in the working directory is copied inside of it.
+    """
+    create_file_hierarchy({'run.sh': '#!/bin/bash', 'data': {'input.dat': 'data'}}, tmp_path)
+    code = PortableCode(filepath_executable='run.sh', filepath_files=tmp_path).store()
+    create_file_hierarchy({'data': {'input.dat': 'sandbox'}}, fixture_sandbox)
+
+    node, calc_info = node_and_calc_info
+    node.computer.set_bulk_upload(bulk_upload)
+    calc_info.codes_info[0].code_uuid = code.uuid
+
+    with node.computer.get_transport() as transport:
+        await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    filepath_workdir = pathlib.Path(node.get_remote_workdir())
+    assert serialize_file_hierarchy(filepath_workdir, read_bytes=False) == {
+        'run.sh': '#!/bin/bash',
+        'data': {'input.dat': 'data', 'data': {'input.dat': 'sandbox'}},
+    }
+    assert (filepath_workdir / 'run.sh').stat().st_mode & 0o777 == 0o755
+
+
+@pytest.mark.parametrize('node_and_calc_info', ['core.local'], indirect=True)
+@pytest.mark.asyncio
+async def test_upload_bulk_fallback(
+    fixture_sandbox, node_and_calc_info, tmp_path, monkeypatch, create_file_hierarchy, serialize_file_hierarchy
+):
+    """Test that files are copied one by one if the archive cannot be unpacked on the remote."""
+    create_file_hierarchy({'pseudo': {'Ba.upf': 'Ba pseudo'}}, fixture_sandbox)
+    single_file = SinglefileData(io.BytesIO(b'Ti pseudo'), filename='Ti.upf').store()
+
+    node, calc_info = node_and_calc_info
+    node.computer.set_bulk_upload(True)
+    calc_info.local_copy_list = [(single_file.uuid, single_file.filename, 'pseudo/Ti.upf')]
+
+    async def exec_command_wait_bytes_async(self, command, stdin=None, **kwargs):
+        return 127, b'', b'tar: command not found'
+
+    monkeypatch.setattr(LocalTransport, 'exec_command_wait_bytes_async', exec_command_wait_bytes_async)
+
+    with node.computer.get_transport() as transport:
+        await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    filepath_workdir = pathlib.Path(node.get_remote_workdir())
+    assert serialize_file_hierarchy(filepath_workdir, read_bytes=False) == {
+        'pseudo': {'Ba.upf': 'Ba pseudo', 'Ti.upf': 'Ti pseudo'}
+    }
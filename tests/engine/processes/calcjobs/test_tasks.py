@@ -0,0 +1,73 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.engine.processes.calcjobs.tasks` module."""
+
+import asyncio
+import io
+import pathlib
+import types
+
+from aiida.common.datastructures import CalcInfo, CodeInfo
+from aiida.engine.processes.calcjobs.tasks import task_upload_job
+from aiida.engine.transports import TransportQueue
+from aiida.engine.utils import InterruptableFuture
+from aiida.orm import CalcJobNode
+from aiida.transports.plugins.local import LocalTransport
+
+
+def test_task_upload_job_concurrent(aiida_localhost, aiida_code_installed, monkeypatch):
+    """Test that the uploads of calculation jobs that share a transport overlap and write to their own directory."""
+    code = aiida_code_installed(default_calc_job_plugin='core.arithmetic.add', filepath_executable='/bin/bash').store()
+    put_async = LocalTransport.put_async
+    started = asyncio.Event()
+    overlapped = []
+
+    async def put_async_overlapping(self, localpath, remotepath, *args, **kwargs):
+        """Only copy the file once both uploads are copying or the timeout expired, recording which is the case."""
+        index = len(overlapped)
+        overlapped.append(False)
+        if index > 0:
+            started.set()
+        try:
+            await asyncio.wait_for(started.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            overlapped[index] = True
+        await put_async(self, localpath, remotepath, *args, **kwargs)
+
+    monkeypatch.setattr(LocalTransport, 'put_async', put_async_overlapping)
+
+    def create_process(content):
+        """Return a minimal stand-in for a ``CalcJob`` that writes a single input file with the given content."""
+        node = CalcJobNode(computer=aiida_localhost).store()
+        code_info = CodeInfo()
+        code_info.code_uuid = code.uuid
+        calc_info = CalcInfo()
+        calc_info.uuid = node.uuid
+        calc_info.codes_info = [code_info]
+
+        def presubmit(folder):
+            folder.create_file_from_filelike(io.BytesIO(content.encode()), 'input.txt')
+            return calc_info
+
+        return types.SimpleNamespace(node=node, presubmit=presubmit, out=lambda *args: None)
+
+    processes = [create_process('a'), create_process('b')]
+    queue = TransportQueue()
+
+    async def upload():
+        await asyncio.gather(*(task_upload_job(process, queue, InterruptableFuture()) for process in processes))
+
+    queue.loop.run_until_complete(upload())
+
+    assert overlapped == [True, True]
+
+    for process, content in zip(processes, ('a', 'b')):
+        assert (pathlib.Path(process.node.get_remote_workdir()) / 'input.txt').read_text() == content
@@ -0,0 +1,84 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.engine.processes.workchains.context` module."""
+
+from aiida import orm
+from aiida.common.extendeddicts import AttributeDict
+from aiida.engine.processes.workchains.context import TrackedContext
+
+
+def test_serialize_immutable():
+    """Test that immutable values that were not replaced since the previous serialization are not serialized again."""
+    node = orm.Data().store()
+    context = TrackedContext({'a': 1, 'b': ('c', 2), 'node': node})
+    serialized = context.serialize()
+    assert set(serialized) == {'a', 'b', 'node'}
+
+    reserialized = context.serialize()
+    assert all(reserialized[key] is serialized[key] for key in serialized)
+
+
+def test_serialize_mutable():
+    """Test that mutable values are serialized again at every serialization."""
+    context = TrackedContext({'a': [1], 'b': ('c', [2]), 'd': {'e': 3}})
+    serialized = context.serialize()
+
+    reserialized = context.serialize()
+    assert all(reserialized[key] is not serialized[key] for key in serialized)
+    assert reserialized == serialized
+
+
+def test_serialize_changed():
+    """Test that keys that are set or deleted are serialized again."""
+    context = TrackedContext({'a': 1, 'b': 2, 'c': 3})
+    serialized = context.serialize()
+
+    context.a = 4
+    del context['c']
+    context.d = 5
+    reserialized = context.serialize()
+
+    assert set(reserialized) == {'a', 'b', 'd'}
+    assert reserialized['a'] is not serialized['a']
+    assert reserialized['b'] is serialized['b']
+    assert TrackedContext.from_serialized(reserialized) == {'a': 4, 'b': 2, 'd': 5}
+
+
+def test_serialize_external_reference():
+    """Test that a value mutated through a reference obtained before the previous serialization is serialized."""
+    context = TrackedContext({'a': [1]})
+    reference = context.a
+    context.serialize()
+
+    reference.append(2)
+    assert TrackedContext.from_serialized(context.serialize()).a == [1, 2]
+
+
+def test_from_serialized():
+    """Test that a context restored from its serialized keys does not serialize unchanged immutable keys again."""
+    node = orm.Data().store()
+    context = TrackedContext({'node': node, 'nested': {'value': 1}})
+    serialized = context.serialize()
+
+    restored = TrackedContext.from_serialized(serialized)
+    assert restored['node'].uuid == node.uuid
+    assert isinstance(restored['nested'], AttributeDict)
+    assert restored.nested.value == 1
+
+    restored = TrackedContext.from_serialized(serialized)
+    reserialized = restored.serialize()
+    assert reserialized == serialized
+    assert reserialized['node'] is serialized['node']
+    assert reserialized['nested'] is not serialized['nested']
+
+
+def test_from_mapping():
+    """Test that nested mappings are not converted when constructing the context from a mapping."""
+    context = TrackedContext.from_mapping({'a': {'b': 1}})
+    assert not isinstance(context['a'], AttributeDict)
@@ -12,9 +12,10 @@ import asyncio
 import time
 
 import pytest
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, JobStatesCache
 from aiida.engine.transports import TransportQueue
 from aiida.orm import User
+from aiida.schedulers.datastructures import JobInfo, JobState
 
 
 class TestJobManager:
@@ -70,3 +71,119 @@ class TestJobsList:
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         assert jobs_list.last_updated == last_updated
+
+
+class TestJobStatesCache:
+    """Test the `aiida.engine.processes.calcjobs.manager.JobStatesCache` class."""
+
+    @pytest.fixture(autouse=True)
+    def init_profile(self, aiida_localhost, tmp_path):
+        """Initialize the profile."""
+        self.loop = asyncio.get_event_loop()
+        self.computer = aiida_localhost
+        self.auth_info = self.computer.get_authinfo(User.collection.get_default())
+        self.cache = JobStatesCache(tmp_path / 'job_states.sqlite')
+
+    @staticmethod
+    def get_job_info(job_id):
+        """Return a ``JobInfo`` instance for the given job id."""
+        job_info = JobInfo()
+        job_info.job_id = job_id
+        job_info.job_state = JobState.RUNNING
+        return job_info
+
+    def test_get_set(self):
+        """Test the `JobStatesCache.get` and `JobStatesCache.set` methods."""
+        assert self.cache.get(self.auth_info.pk, None, max_age=10) is None
+
+        polled_at = time.time()
+        self.cache.set(self.auth_info.pk, None, {'1': self.get_job_info('1')}, polled_at)
+
+        cached = self.cache.get(self.auth_info.pk, None, max_age=10)
+        assert cached is not None
+        assert cached[0] == polled_at
+        assert list(cached[1].keys()) == ['1']
+        assert cached[1]['1'].job_state == JobState.RUNNING
+
+        # A result that was obtained for all jobs of the user covers specific job ids
+        assert self.cache.get(self.auth_info.pk, ['1', '2'], max_age=10) is not None
+
+        # Results that are too old or are for another authinfo are never returned
+        assert self.cache.get(self.auth_info.pk, None, max_age=0) is None
+        assert self.cache.get(self.auth_info.pk + 1, None, max_age=10) is None
+
+        assert self.cache.hits == 2
+        assert self.cache.misses == 3
+
+    def test_job_ids_coverage(self):
+        """Test that a result obtained for specific job ids is only returned if it covers all requested jobs."""
+        self.cache.set(self.auth_info.pk, ['1', '2'], {'1': self.get_job_info('1')}, time.time())
+
+        assert self.cache.get(self.auth_info.pk, ['1'], max_age=10) is not None
+        assert self.cache.get(self.auth_info.pk, ['2', '1'], max_age=10) is not None
+        assert self.cache.get(self.auth_info.pk, ['1', '3'], max_age=10) is None
+        assert self.cache.get(self.auth_info.pk, None, max_age=10) is None
+
+    def test_shared_between_jobs_lists(self, monkeypatch):
+        """Test that the jobs lists of different job managers sharing a cache poll the scheduler only once."""
+        interval = self.computer.get_minimum_job_poll_interval()
+        self.computer.set_minimum_job_poll_interval(60)
+
+        try:
+            polling = JobsList(self.auth_info, TransportQueue(self.loop), job_states_cache=self.cache)
+            cached = JobsList(self.auth_info, TransportQueue(self.loop), job_states_cache=self.cache)
+
+            def request_transport(authinfo):
+                raise AssertionError('the scheduler should not be polled when the cache contains a valid result')
+
+            monkeypatch.setattr(cached._transport_queue, 'request_transport', request_transport)
+
+            jobs = self.loop.run_until_complete(polling._get_jobs_from_scheduler())
+            assert self.loop.run_until_complete(cached._get_jobs_from_scheduler()).keys() == jobs.keys()
+            assert cached.last_updated == polling.last_updated
+            assert self.cache.hits == 1
+        finally:
+            self.computer.set_minimum_job_poll_interval(interval)
+
+    def test_required_jobs(self):
+        """Test that a result is not returned if it misses a job or was polled before the job was requested."""
+        polled_at = time.time()
+        self.cache.set(self.auth_info.pk, None, {'1': self.get_job_info('1')}, polled_at)
+
+        assert self.cache.get(self.auth_info.pk, None, max_age=10, required_job_ids=['1']) is not None
+        assert self.cache.get(self.auth_info.pk, None, max_age=10, required_job_ids=['1', '2']) is None
+        assert self.cache.get(self.auth_info.pk, None, max_age=10, min_polled_at=polled_at) is not None
+        assert self.cache.get(self.auth_info.pk, None, max_age=10, min_polled_at=polled_at + 1) is None
+
+    def test_job_submitted_after_poll(self, monkeypatch):
+        """Test that the scheduler is polled for a job that was submitted after the cached poll.
+
+        Since a job that is missing from the result of a poll is considered to have finished, returning the cached
+        result would cause the job to be retrieved while it is still with the scheduler.
+        """
+        interval = self.computer.get_minimum_job_poll_interval()
+        self.computer.set_minimum_job_poll_interval(60)
+
+        class PolledError(Exception):
+            """Raised when the scheduler is polled."""
+
+        try:
+            # Another worker polled the scheduler, when the job was not yet submitted
+            self.cache.set(self.auth_info.pk, None, {}, time.time() - 1)
+
+            jobs_list = JobsList(self.auth_info, TransportQueue(self.loop), job_states_cache=self.cache)
+
+            def request_transport(authinfo):
+                raise PolledError()
+
+            monkeypatch.setattr(jobs_list._transport_queue, 'request_transport', request_transport)
+            monkeypatch.setattr(jobs_list, '_ensure_updating', lambda: None)
+
+            with jobs_list.request_job_info_update(self.auth_info, '1') as future:
+                with pytest.raises(PolledError):
+                    self.loop.run_until_complete(jobs_list._update_job_info())
+                assert isinstance(future.exception(), PolledError)
+
+            assert self.cache.hits == 0
+        finally:
+            self.computer.set_minimum_job_poll_interval(interval)
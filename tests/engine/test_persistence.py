@@ -10,12 +10,25 @@
 
 import plumpy
 import pytest
-from aiida.engine import Process, run
-from aiida.engine.persistence import AiiDAPersister
+from aiida.engine import Process, WorkChain, run
+from aiida.engine.persistence import CHECKPOINT_ENTRIES_KEY, AiiDAPersister
+from aiida.orm.utils.serialize import deserialize_checkpoint
 
 from tests.utils.processes import DummyProcess
 
 
+class ContextWorkChain(WorkChain):
+    """Work chain whose context is stored in checkpoint entries."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        pass
+
+
 @pytest.mark.requires_rmq
 class TestProcess:
     """Test the basic saving and loading of process states."""
@@ -58,6 +71,52 @@ class TestAiiDAPersister:
 
         assert bundle_saved == bundle_loaded
 
+    def test_load_checkpoint_yaml(self):
+        """Test that a checkpoint serialized to yaml by older versions can still be loaded."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess()
+        bundle_saved = self.persister.save_checkpoint(process)
+        process.node.set_checkpoint(serialize.serialize(bundle_saved))
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+
+        assert bundle_saved == bundle_loaded
+
+    def test_save_load_checkpoint_entries(self):
+        """Test that the context of a work chain is stored in checkpoint entries, separately from the checkpoint."""
+        process = ContextWorkChain()
+        process.ctx.value = [1]
+        process.ctx.other = 2
+        bundle_saved = self.persister.save_checkpoint(process)
+
+        assert deserialize_checkpoint(process.node.checkpoint)[CHECKPOINT_ENTRIES_KEY] == ['other', 'value']
+        assert set(process.node.checkpoint_entries) == {'other', 'value'}
+
+        del process.ctx.other
+        process.ctx.value.append(2)
+        bundle_saved = self.persister.save_checkpoint(process)
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+
+        assert bundle_saved == bundle_loaded
+        assert set(process.node.checkpoint_entries) == {'value'}
+        assert bundle_loaded.unbundle().ctx == {'value': [1, 2]}
+
+    def test_save_load_checkpoint_entries_not_supported(self, monkeypatch):
+        """Test that the context is stored in the checkpoint if the backend does not store checkpoint entries."""
+        process = ContextWorkChain()
+        monkeypatch.setattr(type(process.node.backend_entity), 'CHECKPOINT_ENTRY_CLASS', None)
+        process.ctx.value = [1]
+        self.persister.save_checkpoint(process)
+
+        assert set(deserialize_checkpoint(process.node.checkpoint)[CHECKPOINT_ENTRIES_KEY]) == {'value'}
+
+        process.ctx.value.append(2)
+        bundle_saved = self.persister.save_checkpoint(process)
+        bundle_loaded = self.persister.load_checkpoint(process.node.pk)
+
+        assert bundle_saved == bundle_loaded
+        assert bundle_loaded.unbundle().ctx == {'value': [1, 2]}
+
     def test_delete_checkpoint(self):
         """Test checkpoint deletion."""
         process = DummyProcess()
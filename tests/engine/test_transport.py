@@ -130,3 +130,50 @@ class TestTransportQueue:
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval
+
+    def test_exclusive_access(self):
+        """Test that ``Transport.exclusive_access`` serializes tasks that share the same transport."""
+        queue = TransportQueue()
+        loop = queue.loop
+        events = []
+
+        async def task(name):
+            with queue.request_transport(self.authinfo) as request:
+                trans = await request
+                async with trans.exclusive_access():
+                    events.append(f'{name}-start')
+                    await trans.exec_command_wait_async('true')
+                    events.append(f'{name}-end')
+
+        loop.run_until_complete(asyncio.gather(task('a'), task('b')))
+        assert events in (['a-start', 'a-end', 'b-start', 'b-end'], ['b-start', 'b-end', 'a-start', 'a-end'])
+
+    def test_open_cancelled(self, monkeypatch):
+        """Test that the transport is closed if all users gave up on it while it was being opened."""
+        queue = TransportQueue()
+        loop = queue.loop
+        transport_class = self.authinfo.get_transport().__class__
+        open_async = transport_class.open_async
+        opened = []
+
+        async def slow_open_async(trans):
+            await asyncio.sleep(0.1)
+            await open_async(trans)
+            opened.append(trans)
+
+        monkeypatch.setattr(transport_class, 'open_async', slow_open_async)
+
+        async def test():
+            with queue.request_transport(self.authinfo) as request:
+                transport_request = queue._transport_requests[self.authinfo.pk]
+                # Give the transport queue the chance to start opening the transport
+                await asyncio.sleep(0.05)
+                assert transport_request.open_task is not None
+
+            await asyncio.sleep(0.2)
+            assert transport_request.open_task.cancelled()
+            assert not request.done()
+            assert len(opened) == 1
+            assert not opened[0].is_open
+
+        loop.run_until_complete(test())
@@ -15,7 +15,7 @@ import inspect
 import plumpy
 import pytest
 from aiida import orm
-from aiida.common import exceptions
+from aiida.common import AttributeDict, exceptions
 from aiida.common.links import LinkType
 from aiida.common.utils import Capturing
 from aiida.engine import ExitCode, Process, ToContext, WorkChain, append_, calcfunction, if_, launch, return_, while_
@@ -771,6 +771,22 @@ class TestWorkchain:
 
         runner.loop.run_until_complete(run_async(wc))
 
+    def test_context_legacy_checkpoint(self):
+        """Test that a work chain can be loaded from a checkpoint that stores the context in its entirety."""
+        workchain = IfTest()
+        workchain.ctx.s1 = True
+        bundle = plumpy.Bundle(workchain)
+        workchain.close()
+
+        bundle.pop(WorkChain._CONTEXT_SERIALIZED)
+        bundle[WorkChain._CONTEXT] = AttributeDict({'s1': True, 'nested': {'value': 1}})
+
+        loaded = bundle.unbundle()
+        assert loaded.ctx.s1
+        assert loaded.ctx.nested == {'value': 1}
+        assert set(plumpy.Bundle(loaded)[WorkChain._CONTEXT_SERIALIZED]) == {'s1', 'nested'}
+        loaded.close()
+
     def test_report_dbloghandler(self):
         """Test whether the WorkChain, through its Process, has a logger
         set for which the DbLogHandler has been attached. Because if this
@@ -765,3 +765,57 @@ class TestBackendNode:
         # Reload the node yet again and verify that the `attribute_three` attribute is still there
         rereloaded = self.backend.nodes.get(node.pk)
         assert 'attribute_three' in rereloaded.attributes.keys()
+
+    def test_iter_by_hash(self):
+        """Test that ``iter_by_hash`` matches the node type and hash and skips nodes that are marked invalid."""
+        node_type = 'data.core.Data.'
+        hash_key, valid_cache_key = '_aiida_hash', '_aiida_valid_cache'
+
+        def create_node(node_type, extras):
+            node = self.backend.nodes.create(node_type=node_type, user=self.user).store()
+            node.set_extra_many(extras)
+            return node
+
+        matching = create_node(node_type, {hash_key: 'abc'})
+        valid = create_node(node_type, {hash_key: 'abc', valid_cache_key: True})
+        create_node(node_type, {hash_key: 'abc', valid_cache_key: False})
+        create_node(node_type, {hash_key: 'def'})
+        create_node('data.core.int.Int.', {hash_key: 'abc'})
+
+        pks = {node.pk for node in self.backend.nodes.iter_by_hash(node_type, 'abc', hash_key, valid_cache_key)}
+        assert pks == {matching.pk, valid.pk}
+
+    def test_bulk_store(self):
+        """Test that ``bulk_store`` stores the nodes and links, including links between the nodes being stored."""
+        from aiida.common.links import LinkType
+        from aiida.orm import load_node
+
+        source = self.create_node()
+        target = self.backend.nodes.create(node_type='process.workflow.WorkflowNode.', user=self.user)
+        stored = self.create_node().store()
+        links = [(stored, LinkType.INPUT_WORK, 'stored'), (source, LinkType.INPUT_WORK, 'unstored')]
+
+        self.backend.nodes.bulk_store([source, target], [[], links])
+
+        assert source.is_stored
+        assert target.is_stored
+        incoming = {entry.link_label: entry.node.pk for entry in load_node(target.pk).base.links.get_incoming().all()}
+        assert incoming == {'stored': stored.pk, 'unstored': source.pk}
+
+        with pytest.raises(ValueError, match='does not match'):
+            self.backend.nodes.bulk_store([self.create_node()], [])
+
+    def test_bulk_store_integrity_error(self):
+        """Test that ``bulk_store`` raises ``IntegrityError`` and stores nothing if a node has a duplicate UUID."""
+        from aiida.orm import Node, QueryBuilder
+
+        stored = self.create_node().store()
+        node = self.create_node()
+        duplicate = self.create_node()
+        duplicate.bare_model.uuid = stored.uuid
+
+        with pytest.raises(exceptions.IntegrityError):
+            self.backend.nodes.bulk_store([node, duplicate], [[], []])
+
+        assert not node.is_stored
+        assert QueryBuilder().append(Node, filters={'uuid': node.uuid}).count() == 0
@@ -0,0 +1,153 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for :mod:`aiida.storage.psql_dos.orm.querybuilder.cache`."""
+
+import pytest
+from aiida import orm
+from aiida.storage.psql_dos.orm.querybuilder import cache
+from aiida.storage.psql_dos.orm.querybuilder.cache import QueryCache
+
+
+def test_query_cache_lru():
+    """Test that the least-recently-used results are evicted."""
+    query_cache = QueryCache(max_entries=2, ttl=60)
+    query_cache.set('a', 1, ['db_dbnode'])
+    query_cache.set('b', 2, ['db_dbnode'])
+    assert query_cache.get('a') == 1
+    query_cache.set('c', 3, ['db_dbnode'])
+
+    assert query_cache.get('b') is None
+    assert query_cache.get('a') == 1
+    assert query_cache.get('c') == 3
+    assert query_cache.statistics == {
+        'entries': 2,
+        'max_entries': 2,
+        'ttl': 60,
+        'hits': 3,
+        'misses': 1,
+        'hit_rate': 0.75,
+        'evictions': 1,
+        'invalidations': 0,
+    }
+
+
+def test_query_cache_ttl(monkeypatch):
+    """Test that results expire after the time-to-live."""
+    now = 100.0
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now)
+    query_cache = QueryCache(max_entries=10, ttl=5)
+    query_cache.set('a', None, ['db_dbnode'])
+    assert query_cache.get('a', default=0) is None
+
+    now += 10
+    assert query_cache.get('a', default=0) == 0
+    assert len(query_cache) == 0
+
+
+def test_query_cache_invalidate():
+    """Test that only the results that read from the written tables are invalidated."""
+    query_cache = QueryCache(max_entries=10, ttl=60)
+    query_cache.set('nodes', 1, ['db_dbnode'])
+    query_cache.set('groups', 2, ['db_dbgroup', 'db_dbgroup_dbnodes'])
+
+    query_cache.invalidate(['db_dbgroup_dbnodes'])
+    assert query_cache.get('nodes') == 1
+    assert query_cache.get('groups') is None
+
+    query_cache.invalidate()
+    assert query_cache.get('nodes') is None
+    assert query_cache.statistics['invalidations'] == 2
+
+
+def test_query_cache_version():
+    """Test that a result is not cached if the cache was invalidated since the query was executed."""
+    query_cache = QueryCache(max_entries=10, ttl=60)
+    version = query_cache.version
+    query_cache.invalidate(['db_dblog'])
+    query_cache.set('a', 1, ['db_dbnode'], version)
+    assert query_cache.get('a') is None
+
+
+@pytest.fixture
+def storage(aiida_profile_clean, manager):
+    """Return a storage backend for the test profile with the query cache enabled."""
+    profile = manager.get_profile()
+    profile.set_option('db.query_cache_size', 10)
+    try:
+        storage = type(manager.get_profile_storage())(profile)
+    finally:
+        profile.unset_option('db.query_cache_size')
+    yield storage
+    storage.close()
+
+
+def test_query_cache_disabled(aiida_profile_clean, manager):
+    """Test that the query cache is disabled by default."""
+    assert manager.get_profile_storage().query_cache is None
+
+
+def test_query_cache_querybuilder(storage):
+    """Test that the results of the ``QueryBuilder`` are cached until the tables they depend on are written to."""
+    node = orm.Data(backend=storage).store()
+    builder = orm.QueryBuilder(backend=storage).append(orm.Data, project=['id', 'attributes'])
+    hits = storage.query_cache.hits
+
+    assert builder.all() == [[node.pk, {}]]
+    assert builder.count() == 1
+    assert storage.query_cache.hits == hits
+
+    # Mutating a result should not affect the cached result
+    results = builder.all()
+    results[0][1]['key'] = 'value'
+    assert builder.all() == [[node.pk, {}]]
+    assert builder.count() == 1
+    assert storage.query_cache.hits == hits + 3
+
+    # Users are stored in a different table, so the results are not invalidated
+    orm.User(email='other@localhost', backend=storage).store()
+    assert builder.count() == 1
+    assert storage.query_cache.hits == hits + 4
+
+    other = orm.Data(backend=storage).store()
+    assert builder.count() == 2
+    assert sorted(builder.all()) == sorted([[node.pk, {}], [other.pk, {}]])
+
+
+def test_query_cache_models(storage):
+    """Test that cached results that project entities return the entities of the current session."""
+    node = orm.Data(backend=storage).store()
+    builder = orm.QueryBuilder(backend=storage).append(orm.Data)
+    hits = storage.query_cache.hits
+
+    assert builder.first(flat=True).pk == node.pk
+    assert builder.first(flat=True).pk == node.pk
+    assert [entity.pk for entity in builder.all(flat=True)] == [node.pk]
+    assert [entity.pk for entity in builder.all(flat=True)] == [node.pk]
+    assert storage.query_cache.hits == hits + 2
+
+    assert orm.QueryBuilder(backend=storage).append(orm.Data, filters={'id': -1}).first() is None
+    assert orm.QueryBuilder(backend=storage).append(orm.Data, filters={'id': -1}).first() is None
+    assert storage.query_cache.hits == hits + 3
+
+
+def test_query_cache_transaction(storage):
+    """Test that the cache is not used by a transaction that wrote to the database until it is committed."""
+    builder = orm.QueryBuilder(backend=storage).append(orm.Data)
+    assert builder.count() == 0
+    hits = storage.query_cache.hits
+
+    with storage.transaction():
+        orm.Data(backend=storage).store()
+        assert builder.count() == 1
+        assert builder.count() == 1
+        assert storage.query_cache.hits == hits
+
+    assert builder.count() == 1
+    assert builder.count() == 1
+    assert storage.query_cache.hits == hits + 1
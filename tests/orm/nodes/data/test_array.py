@@ -10,6 +10,7 @@
 
 import numpy
 import pytest
+from aiida.common import exceptions
 from aiida.orm import ArrayData, load_node
 
 
@@ -60,3 +61,130 @@ def test_get_array():
 
     node = ArrayData(numpy.array([1, 2]))
     assert (node.get_array() == numpy.array([1, 2])).all()
+
+
+def test_get_array_memory_map():
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:get_array` with ``memory_map=True``."""
+    array = numpy.arange(12, dtype=numpy.float64).reshape(4, 3)
+    node = ArrayData({'a': array, 'b': numpy.asfortranarray(array), 'c': numpy.array([])})
+
+    assert isinstance(node.get_array('a', memory_map=True), numpy.memmap)
+
+    node.store()
+    loaded = load_node(node.pk)
+
+    for name in ('a', 'b'):
+        mapped = loaded.get_array(name, memory_map=True)
+        assert isinstance(mapped, numpy.memmap)
+        assert not mapped.flags.writeable
+        assert numpy.array_equal(mapped, array)
+
+    # Empty arrays cannot be memory-mapped and are loaded instead
+    assert loaded.get_array('c', memory_map=True).size == 0
+    assert loaded._cached_arrays == {'c': loaded.get_array('c')}
+
+
+def test_get_array_cache(monkeypatch):
+    """Test that the cache of loaded arrays is bounded, evicting the least recently used array first."""
+    arrays = {name: numpy.zeros(10, dtype=numpy.int64) for name in ('a', 'b', 'c')}
+    node = ArrayData(arrays).store()
+    monkeypatch.setattr(ArrayData, 'array_cache_max_bytes', 160)
+
+    node.get_array('a')
+    node.get_array('b')
+    node.get_array('a')
+    node.get_array('c')
+    assert list(node._cached_arrays) == ['a', 'c']
+    assert node._cached_arrays_nbytes == 160
+
+    monkeypatch.setattr(ArrayData, 'array_cache_max_bytes', 40)
+    node.clear_internal_cache()
+    assert numpy.array_equal(node.get_array('a'), arrays['a'])
+    assert not node._cached_arrays
+    assert node._cached_arrays_nbytes == 0
+
+
+@pytest.mark.parametrize('memory_map', (True, False))
+def test_get_array_slice(monkeypatch, memory_map):
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:get_array_slice`."""
+    array = numpy.arange(24).reshape(4, 3, 2)
+    node = ArrayData({'a': array, 'b': numpy.asfortranarray(array), 'c': numpy.arange(4)})
+
+    assert numpy.array_equal(node.get_array_slice('a', 1), array[1])
+
+    node.store()
+
+    if not memory_map:
+        monkeypatch.setattr(node.base.repository, 'get_object_location', lambda path: None)
+
+    for index in (0, 3, -1):
+        result = node.get_array_slice('a', index)
+        assert not isinstance(result, numpy.memmap)
+        assert numpy.array_equal(result, array[index])
+
+    assert node.get_array_slice('c', 2) == 2
+    assert not node._cached_arrays
+
+    # Indices other than integers, or arrays in Fortran order, require the whole array if it cannot be memory-mapped
+    for index in (1, (slice(1, 3), 0)):
+        assert numpy.array_equal(node.get_array_slice('b', index), array[index])
+        assert numpy.array_equal(node.get_array_slice('a', index), array[index])
+
+    with pytest.raises(IndexError):
+        node.get_array_slice('a', 4)
+
+    with pytest.raises(KeyError):
+        node.get_array_slice('d', 0)
+
+
+def test_open_array_writer():
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:open_array_writer`."""
+    array = numpy.arange(24, dtype=numpy.float32).reshape(4, 3, 2)
+    node = ArrayData({'a': numpy.array([1])})
+
+    with node.open_array_writer('a') as writer:
+        writer.append(array[0])
+        writer.extend(array[1:3])
+        writer.append(array[3].tolist())
+
+        with pytest.raises(ValueError, match='shape'):
+            writer.append(array[0, 0])
+
+        with pytest.raises(TypeError):
+            writer.append(array[0].astype(complex))
+
+    with node.open_array_writer('empty', dtype=int):
+        pass
+
+    assert node.get_shape('a') == (4, 3, 2)
+    assert node.get_array('a').dtype == numpy.float32
+    assert numpy.array_equal(node.get_array('a'), array)
+    assert node.get_array('empty').shape == (0,)
+
+    with pytest.raises(ValueError):
+        with node.open_array_writer('invalid-name'):
+            pass
+
+    node.store()
+    assert numpy.array_equal(node.get_array('a', memory_map=True), array)
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        with node.open_array_writer('b'):
+            pass
+
+
+def test_iter_array_chunks():
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:iter_array_chunks`."""
+    array = numpy.arange(10).reshape(5, 2)
+    node = ArrayData({'a': array, 'b': numpy.asfortranarray(array), 'c': numpy.array(1)}).store()
+
+    for name in ('a', 'b'):
+        chunks = list(node.iter_array_chunks(name, 2))
+        assert [chunk.shape for chunk in chunks] == [(2, 2), (2, 2), (1, 2)]
+        assert numpy.array_equal(numpy.concatenate(chunks), array)
+
+    with pytest.raises(ValueError):
+        list(node.iter_array_chunks('a', 0))
+
+    with pytest.raises(ValueError):
+        list(node.iter_array_chunks('c', 1))
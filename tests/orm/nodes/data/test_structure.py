@@ -46,3 +46,48 @@ def test_get_composition(mode, expected):
         structure.append_atom(name=symbol, symbols=[symbol], position=[0, 0, 0])
 
     assert structure.get_composition(mode=mode) == expected
+
+
+def test_get_composition_shared_symbols():
+    """Test that ``get_composition`` sums the sites of distinct kinds with the same symbols."""
+    structure = StructureData(cell=((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)))
+    structure.append_atom(name='Fe1', symbols='Fe', position=(0.0, 0.0, 0.0))
+    structure.append_atom(name='Fe2', symbols='Fe', position=(0.5, 0.5, 0.5))
+    structure.append_atom(name='O', symbols='O', position=(0.5, 0.0, 0.0))
+
+    assert structure.get_composition() == {'Fe': 2, 'O': 1}
+    assert structure.get_formula() == 'Fe2O'
+    assert structure.get_site_kindnames() == ['Fe1', 'Fe2', 'O']
+
+
+def test_reset_sites_positions():
+    """Test ``StructureData.reset_sites_positions``."""
+    structure = StructureData(cell=((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)))
+    structure.append_atom(symbols='Ba', position=(0.0, 0.0, 0.0))
+    structure.append_atom(symbols='O', position=(0.5, 0.0, 0.0))
+
+    structure.reset_sites_positions([(0.1, 0.2, 0.3), (0.4, 0.5, 0.6)])
+    assert [site.position for site in structure.sites] == [(0.1, 0.2, 0.3), (0.4, 0.5, 0.6)]
+    assert structure.get_site_kindnames() == ['Ba', 'O']
+
+    with pytest.raises(ValueError):
+        structure.reset_sites_positions([(0.0, 0.0, 0.0)])
+
+    with pytest.raises(ValueError):
+        structure.reset_sites_positions([(0.0, 0.0), (0.0, 0.0, 0.0)])
+
+
+def test_stored_sites():
+    """Test that the site properties of a stored structure match those before storing."""
+    structure = StructureData(cell=((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)))
+    for index, symbol in enumerate(['Ba', 'Zr', 'O', 'O', 'O']):
+        structure.append_atom(symbols=symbol, position=(0.25 * index, 0.0, 0.0))
+
+    formula = structure.get_formula()
+    composition = structure.get_composition()
+    positions = [site.position for site in structure.sites]
+    structure.store()
+
+    assert structure.get_formula() == formula
+    assert structure.get_composition() == composition
+    assert [site.position for site in structure.sites] == positions
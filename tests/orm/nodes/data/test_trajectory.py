@@ -140,3 +140,56 @@ class TestTrajectory:
 
         with pytest.raises(IndexError):
             trajectory.get_step_structure(500)
+
+    def test_open_trajectory_writer(self, trajectory_data):
+        """Test writing a trajectory step by step with ``open_trajectory_writer``."""
+        trajectory = TrajectoryData()
+
+        with trajectory.open_trajectory_writer(trajectory_data['symbols']) as writer:
+            for index, stepid in enumerate(trajectory_data['stepids']):
+                writer.append_step(
+                    trajectory_data['positions'][index],
+                    stepid=stepid,
+                    cell=trajectory_data['cells'][index],
+                    time=trajectory_data['times'][index],
+                )
+
+        trajectory.store()
+        loaded = load_node(trajectory.pk)
+
+        assert loaded.symbols == trajectory_data['symbols']
+        assert sorted(loaded.get_arraynames()) == ['cells', 'positions', 'steps', 'times']
+        assert loaded.get_shape('positions') == trajectory_data['positions'].shape
+        for name, key in (('steps', 'stepids'), ('positions', 'positions'), ('cells', 'cells'), ('times', 'times')):
+            assert np.array_equal(loaded.get_array(name), trajectory_data[key])
+
+        chunks = list(loaded.iter_array_chunks('positions', 64))
+        assert [len(chunk) for chunk in chunks] == [64, 64, 64, 8]
+        assert np.array_equal(np.concatenate(chunks), trajectory_data['positions'])
+
+    def test_open_trajectory_writer_invalid(self, trajectory_data):
+        """Test that ``open_trajectory_writer`` validates the steps and keeps the existing trajectory on failure."""
+        trajectory = TrajectoryData()
+        trajectory.set_trajectory(symbols=trajectory_data['symbols'], positions=trajectory_data['positions'])
+        symbols = trajectory_data['symbols']
+        positions = trajectory_data['positions'][0]
+
+        with pytest.raises(ValueError, match='first step'):
+            with trajectory.open_trajectory_writer(symbols) as writer:
+                writer.append_step(positions, cell=trajectory_data['cells'][0])
+                writer.append_step(positions)
+
+        with pytest.raises(ValueError, match='shape'):
+            with trajectory.open_trajectory_writer(symbols) as writer:
+                writer.append_step(positions[:5])
+
+        with pytest.raises(TypeError):
+            with trajectory.open_trajectory_writer(symbols) as writer:
+                writer.append_step(positions, stepid=0.5)
+
+        with pytest.raises(ValueError, match='no steps'):
+            with trajectory.open_trajectory_writer(symbols):
+                pass
+
+        assert trajectory.numsteps == 200
+        assert np.array_equal(trajectory.get_positions(), trajectory_data['positions'])
@@ -2,7 +2,7 @@
 
 import pytest
 from aiida.engine import ExitCode, ProcessState, launch
-from aiida.orm import Int
+from aiida.orm import Int, load_node
 from aiida.orm.nodes.caching import NodeCaching
 from aiida.orm.nodes.process.process import ProcessNode
 from aiida.orm.nodes.process.workflow import WorkflowNode
@@ -86,3 +86,48 @@ def test_get_builder_restart(aiida_code_installed):
     }
     _, node = launch.run_get_node(ArithmeticAddCalculation, inputs)
     assert node.get_builder_restart()._inputs(prune=True) == inputs
+
+
+@pytest.mark.requires_psql
+def test_checkpoint_entries(monkeypatch):
+    """Test that only the checkpoint entries that changed since the previous checkpoint are written."""
+    node = WorkflowNode().store()
+    node.set_checkpoint('checkpoint', {'a': b'a', 'b': b'b'})
+    assert node.checkpoint_entries == {'a': b'a', 'b': b'b'}
+
+    updates = []
+    update_checkpoint_entries = node.backend_entity.update_checkpoint_entries
+
+    def spy(entries, keys):
+        updates.append((entries, set(keys)))
+        update_checkpoint_entries(entries, keys)
+
+    monkeypatch.setattr(node.backend_entity, 'update_checkpoint_entries', spy)
+    node.set_checkpoint('updated', {'a': b'a', 'c': b'c'})
+
+    assert updates == [({'c': b'c'}, {'a', 'c'})]
+    loaded = load_node(node.pk)
+    assert loaded.checkpoint == 'updated'
+    assert loaded.checkpoint_entries == {'a': b'a', 'c': b'c'}
+
+    node.delete_checkpoint()
+    assert node.checkpoint is None
+    assert load_node(node.pk).checkpoint_entries == {}
+
+
+def test_checkpoint_entries_not_supported(monkeypatch):
+    """Test that nothing is written if the storage backend does not store checkpoint entries separately."""
+    node = WorkflowNode().store()
+    monkeypatch.setattr(type(node.backend_entity), 'CHECKPOINT_ENTRY_CLASS', None)
+
+    with pytest.raises(NotImplementedError):
+        node.set_checkpoint('checkpoint', {'a': b'a'})
+
+    assert node.checkpoint is None
+
+    with pytest.raises(NotImplementedError):
+        node.checkpoint_entries
+
+    node.set_checkpoint('checkpoint')
+    node.delete_checkpoint()
+    assert node.checkpoint is None
@@ -10,13 +10,14 @@
 
 import logging
 import os
+import uuid
 from decimal import Decimal
 from io import BytesIO
 
 import pytest
 from aiida.common import LinkType, exceptions, timezone
 from aiida.manage import get_manager
-from aiida.orm import CalculationNode, Computer, Data, Int, Log, Node, User, WorkflowNode, load_node
+from aiida.orm import CalculationNode, Computer, Data, Int, Log, Node, User, WorkflowNode, load_node, store_many
 from aiida.orm.utils.links import LinkTriple
 
 
@@ -724,6 +725,89 @@ class TestNodeLinks:
         uuids_expected = set([data_one.uuid, data_two.uuid])
         assert uuids_outgoing == uuids_expected
 
+    def test_add_outgoing_many(self):
+        """Test the `add_outgoing_many` method for stored and unstored target nodes."""
+        workflow = WorkflowNode().store()
+        returned = [Data().store() for _ in range(3)]
+
+        workflow.base.links.add_outgoing_many([(node, LinkType.RETURN, f'out_{i}') for i, node in enumerate(returned)])
+
+        link_triples = workflow.base.links.get_outgoing(link_type=LinkType.RETURN).all()
+        assert {(triple.node.uuid, triple.link_label) for triple in link_triples} == {
+            (node.uuid, f'out_{i}') for i, node in enumerate(returned)
+        }
+
+        calculation = CalculationNode().store()
+        created = [Data() for _ in range(3)]
+
+        calculation.base.links.add_outgoing_many(
+            [(node, LinkType.CREATE, f'out_{i}') for i, node in enumerate(created)]
+        )
+
+        for i, node in enumerate(created):
+            assert node.base.links.incoming_cache == [LinkTriple(calculation, LinkType.CREATE, f'out_{i}')]
+
+        store_many(created)
+        assert {node.uuid for node in calculation.base.links.get_outgoing().all_nodes()} == {
+            node.uuid for node in created
+        }
+
+    def test_add_outgoing_many_invalid(self):
+        """Test that `add_outgoing_many` validates the links against existing links and each other."""
+        workflow = WorkflowNode().store()
+        data = Data().store()
+        data.base.links.add_incoming(workflow, LinkType.RETURN, 'result')
+
+        with pytest.raises(ValueError, match='already has an outgoing'):
+            workflow.base.links.add_outgoing_many([(data, LinkType.RETURN, 'result')])
+
+        target = Data()
+
+        with pytest.raises(ValueError, match='already has an incoming'):
+            CalculationNode().base.links.add_outgoing_many(
+                [(target, LinkType.CREATE, 'one'), (target, LinkType.CREATE, 'two')]
+            )
+
+        with pytest.raises(TypeError):
+            CalculationNode().base.links.add_outgoing_many([(target, LinkType.CREATE.value, 'one')])
+
+        with pytest.raises(ValueError):
+            WorkflowNode().base.links.add_outgoing_many([(target, LinkType.RETURN, 'unstored')])
+
+        assert target.base.links.incoming_cache == []
+
+    def test_add_outgoing_many_invalid_last(self):
+        """Test that `add_outgoing_many` adds none of the links if the last one is invalid.
+
+        The first target overrides ``validate_incoming``, which should not cause its link to be added before the other
+        links are validated.
+        """
+        workflow = WorkflowNode().store()
+        called = WorkflowNode()
+        returned = Data().store()
+
+        with pytest.raises(ValueError):
+            workflow.base.links.add_outgoing_many(
+                [
+                    (called, LinkType.CALL_WORK, 'called'),
+                    (returned, LinkType.RETURN, 'result'),
+                    (Data(), LinkType.RETURN, 'unstored'),
+                ]
+            )
+
+        assert called.base.links.incoming_cache == []
+        assert workflow.base.links.get_outgoing().all() == []
+
+    def test_add_outgoing_many_cycle(self):
+        """Test that `add_outgoing_many` does not allow introducing a cycle in the graph."""
+        data = Data().store()
+        calculation = CalculationNode()
+        calculation.base.links.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        calculation.store()
+
+        with pytest.raises(ValueError, match='cycle'):
+            calculation.base.links.add_outgoing_many([(data, LinkType.CREATE, 'output')])
+
     def test_get_node_by_label(self):
         """Test the get_node_by_label() method of the `LinkManager`
 
@@ -991,7 +1075,8 @@ class TestNodeCaching:
         """Tests that ``compute_hash`` fails in an expected manner."""
         from aiida.orm.nodes.caching import NodeCaching
 
-        node = Data().store()
+        # Load a new instance since the hash computed when storing the node is memoized
+        node = load_node(Data().store().pk)
 
         # monkeypatch `get_objects_to_hash` to raise a fake error
         monkeypatch.setattr(
@@ -1007,6 +1092,48 @@ class TestNodeCaching:
             result = node.base.caching.compute_hash(ignore_errors=False)
         assert result is None
 
+    def test_compute_hash_memoized(self, monkeypatch):
+        """Test that the hash that is computed when storing a node is memoized."""
+        from aiida.orm.nodes.caching import NodeCaching
+
+        node = Data()
+        node.base.attributes.set('key', 'value')
+        node.store()
+        node_hash = node.base.caching.get_hash()
+
+        monkeypatch.setattr(
+            NodeCaching,
+            'get_objects_to_hash',
+            lambda _: (_ for _ in ()).throw(exceptions.HashingError('fake hashing error')),
+        )
+        assert node.base.caching.compute_hash() == node_hash
+
+    def test_compute_hash_mutated_before_store(self):
+        """Test that mutations of an unstored node after its hash was computed are accounted for when storing it."""
+        node = Data()
+        node.base.attributes.set('key', 'value')
+        unstored_hash = node.base.caching._compute_hash()
+
+        node.base.attributes.set('key', 'other')
+        node.store()
+
+        assert node.base.caching.get_hash() != unstored_hash
+        assert node.base.caching.get_hash() == load_node(node.pk).base.caching.compute_hash()
+
+    def test_iter_nodes_with_hash_query_builder_fallback(self, monkeypatch):
+        """Test that nodes are looked up by hash with the ``QueryBuilder`` if the backend does not implement it."""
+        from aiida.orm.implementation.nodes import BackendNodeCollection
+
+        node = Data()
+        node.base.attributes.set('key', uuid.uuid4().hex)
+        node.store()
+        node_hash = node.base.caching.get_hash()
+
+        assert [n.uuid for n in node.base.caching._iter_nodes_with_hash(node_hash)] == [node.uuid]
+
+        monkeypatch.setattr(type(node.backend.nodes), 'iter_by_hash', BackendNodeCollection.iter_by_hash)
+        assert [n.uuid for n in node.base.caching._iter_nodes_with_hash(node_hash)] == [node.uuid]
+
     def test_uuid_equality_fallback(self):
         """Tests the fallback mechanism of checking equality by comparing uuids and hash."""
         node_0 = Data().store()
@@ -1049,3 +1176,82 @@ def test_iter_repo_keys():
         '3c9683017f9e4bf33d0fbedd26bf143fd72de9b9dd145441b75f0604047ea28e',
         '89dc6ae7f06a9f46b565af03eab0ece0bf6024d3659b7e3a1d03573cfeb0b59d',
     }
+
+
+class TestStoreMany:
+    """Tests for :func:`aiida.orm.nodes.node.store_many`."""
+
+    def test_store_many(self):
+        """Test that all nodes are stored with their hash and repository contents."""
+        nodes = []
+        for index in range(5):
+            node = Data()
+            node.base.attributes.set('index', index)
+            node.base.repository.put_object_from_filelike(BytesIO(f'content{index}'.encode()), 'file.txt')
+            nodes.append(node)
+
+        assert store_many(nodes) == nodes
+
+        for index, node in enumerate(nodes):
+            assert node.is_stored
+            loaded = load_node(node.pk)
+            assert loaded.base.attributes.get('index') == index
+            assert loaded.base.repository.get_object_content('file.txt', mode='rb') == f'content{index}'.encode()
+            assert loaded.base.caching.get_hash() == loaded.base.caching.compute_hash()
+
+    def test_store_many_links(self):
+        """Test that incoming links are stored, including those whose source node is stored in the same call."""
+        stored = Data().store()
+        source = Data()
+        target = WorkflowNode()
+        target.base.links.add_incoming(stored, LinkType.INPUT_WORK, 'stored')
+        target.base.links.add_incoming(source, LinkType.INPUT_WORK, 'unstored')
+
+        other = WorkflowNode()
+        other.base.links.add_incoming(stored, LinkType.INPUT_WORK, 'stored')
+
+        store_many([target, source, other])
+
+        incoming = {entry.link_label: entry.node.uuid for entry in target.base.links.get_incoming().all()}
+        assert incoming == {'stored': stored.uuid, 'unstored': source.uuid}
+        assert target.base.links.incoming_cache == []
+
+        for node in (target, other):
+            assert load_node(node.pk).base.caching.get_hash() == load_node(node.pk).base.caching.compute_hash()
+
+    def test_store_many_unstored_source(self):
+        """Test that nothing is stored if the source node of an incoming link is neither stored nor being stored."""
+        node = Data()
+        target = WorkflowNode()
+        target.base.links.add_incoming(Data(), LinkType.INPUT_WORK, 'input')
+
+        with pytest.raises(exceptions.ModificationNotAllowed):
+            store_many([node, target])
+
+        assert not node.is_stored
+        assert not target.is_stored
+
+    @pytest.mark.parametrize('use_cache', (False, True))
+    def test_store_many_stored_individually(self, use_cache):
+        """Test that nodes stored individually are stored after the sources of their incoming links, in any order."""
+        from aiida.manage.caching import disable_caching, enable_caching
+
+        source = Data()
+        calculation = CalculationNode()
+        calculation.base.links.add_incoming(source, LinkType.INPUT_CALC, 'input')
+        output = Data()
+        output.base.links.add_incoming(calculation, LinkType.CREATE, 'output')
+
+        with enable_caching() if use_cache else disable_caching():
+            store_many([output, calculation, source])
+
+        assert all(node.is_stored for node in (source, calculation, output))
+        assert load_node(calculation.pk).base.links.get_incoming().one().node.uuid == source.uuid
+        assert load_node(output.pk).base.links.get_incoming().one().node.uuid == calculation.uuid
+
+    def test_store_many_already_stored(self):
+        """Test that stored nodes are ignored."""
+        stored = Data().store()
+        unstored = Data()
+        store_many([stored, unstored])
+        assert unstored.is_stored
@@ -985,6 +985,108 @@ class TestQueryBuilderLimitOffsets:
         assert res == tuple(range(4, 1, -1))
 
 
+class TestQueryBuilderPaginate:
+    @staticmethod
+    def paginate(qb, page_size, **kwargs):
+        """Return the concatenated results of all pages and the number of pages."""
+        results = []
+        pages = 0
+        token = None
+
+        while True:
+            page = qb.paginate(page_size, after=token, **kwargs)
+            results.extend(page.results)
+            pages += 1
+            if page.next_token is None:
+                return results, pages
+            token = page.next_token
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    @pytest.mark.parametrize(
+        'order_by, key',
+        (
+            (None, lambda node: node.pk),
+            ({'node': {'id': 'desc'}}, lambda node: -node.pk),
+            ({'node': 'ctime'}, lambda node: (node.ctime, node.pk)),
+            ({'node': [{'label': 'desc'}, {'ctime': 'asc'}]}, lambda node: (-int(node.label), node.ctime, node.pk)),
+        ),
+    )
+    def test_paginate(self, order_by, key):
+        """Test that paging through the results returns all of them in the requested order."""
+        nodes = []
+
+        for index in range(10):
+            nodes.append(orm.Data(label=str(index % 3)).store())
+
+        qb = orm.QueryBuilder().append(orm.Data, project=['uuid'], tag='node')
+        kwargs = {} if order_by is None else {'order_by': order_by}
+        results, pages = self.paginate(qb, 3, **kwargs)
+
+        assert pages == 4
+        assert results == [{'node': {'uuid': node.uuid}} for node in sorted(nodes, key=key)]
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_paginate_projections(self):
+        """Test that the projections of the results are the same as those of ``QueryBuilder.dict``."""
+        orm.Data().store()
+
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project=['*', 'id'])
+        assert qb.paginate(10).results == qb.dict()
+
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project='**')
+        assert qb.paginate(10).results == qb.dict()
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_paginate_exact_multiple(self):
+        """Test that the last page has no next token if the number of results is a multiple of the page size."""
+        for _ in range(4):
+            orm.Data().store()
+
+        qb = orm.QueryBuilder().append(orm.Data, project=['id'], tag='node')
+        first = qb.paginate(2)
+        second = qb.paginate(2, after=first.next_token)
+
+        assert len(second.results) == 2
+        assert second.next_token is None
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_paginate_joins(self):
+        """Test that queries that join vertices raise, since a page boundary could split the results of a vertex."""
+        data = orm.Data().store()
+
+        for _ in range(2):
+            calculation = orm.CalculationNode()
+            calculation.base.links.add_incoming(data, LinkType.INPUT_CALC, 'input')
+            calculation.store()
+
+        qb = orm.QueryBuilder().append(orm.Data, tag='data').append(orm.CalculationNode, with_incoming='data')
+        assert qb.count() == 2
+
+        with pytest.raises(ValueError, match='only supports queries of a single vertex'):
+            qb.paginate(1, order_by={'data': 'id'})
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_paginate_invalid(self):
+        """Test that unsupported orderings and invalid tokens raise."""
+        for _ in range(2):
+            orm.Data().store()
+
+        qb = orm.QueryBuilder().append(orm.Data, tag='data')
+        token = qb.paginate(1).next_token
+
+        with pytest.raises(ValueError, match='page_size'):
+            qb.paginate(0)
+
+        with pytest.raises(ValueError, match='only supports ordering by columns'):
+            qb.paginate(1, order_by={'data': 'attributes.value'})
+
+        with pytest.raises(ValueError, match='the page token was created for the ordering'):
+            qb.paginate(1, order_by={'data': 'ctime'}, after=token)
+
+        with pytest.raises(ValueError, match='invalid page token'):
+            qb.paginate(1, after='invalid')
+
+
 class TestQueryBuilderJoins:
     def test_joins_node_incoming(self):
         # Creating n1, who will be a parent:
@@ -1484,6 +1586,40 @@ class TestConsistency:
         for pk in pks:
             assert orm.load_node(pk).base.extras.get('key') == 'value'
 
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_iterall_stream(self):
+        """Test that ``QueryBuilder.iterall`` and ``QueryBuilder.iterdict`` yield the same results when streaming."""
+        for index in range(10):
+            orm.Int(index).store()
+
+        for project in ('*', ['id', 'attributes.value'], ['*', 'uuid']):
+            builder = orm.QueryBuilder().append(orm.Int, project=project, tag='int').order_by({'int': 'id'})
+            assert list(builder.iterall(batch_size=3, stream=True)) == list(builder.iterall(batch_size=3))
+            assert list(builder.iterdict(batch_size=3, stream=True)) == list(builder.iterdict(batch_size=3))
+
+    def test_iterall_stream_with_mutation(self):
+        """Test that nodes can be mutated and stored while streaming them using ``QueryBuilder.iterall``."""
+        count = 10
+        pks = []
+        pks_clone = []
+
+        for index in range(count):
+            node = orm.Int(index).store()
+            node.base.extras.set('stream', True)
+            pks.append(node.pk)
+
+        builder = orm.QueryBuilder().append(orm.Int, filters={'extras.stream': True})
+
+        # Ensure that batch size is smaller than the total rows yielded
+        for [node] in builder.iterall(batch_size=2, stream=True):
+            node.base.extras.set('key', 'value')
+            pks_clone.append(orm.Int(node.value).store().pk)
+
+        assert len(pks_clone) == count
+
+        for pk in pks:
+            assert orm.load_node(pk).base.extras.get('key') == 'value'
+
     # TODO: This test seems to hang (or takes a looong time), specifically in
     # pydantic/_internal/_core_utils.py:400
     @pytest.mark.requires_psql
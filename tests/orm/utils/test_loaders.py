@@ -8,6 +8,9 @@
 ###########################################################################
 """Module to test orm utilities to load nodes, codes etc."""
 
+import gc
+import threading
+
 import pytest
 from aiida.common.exceptions import NotExistent
 from aiida.orm import Data, Group, Node
@@ -212,3 +215,66 @@ class TestOrmUtils:
 
         with pytest.raises(NotExistent):
             load_group('non-existent-uuid')
+
+    def test_load_node_identity_map(self):
+        """Test that ``load_node`` returns the same instance for a stored immutable node until it is deleted."""
+        from aiida.orm import CalculationNode, Int
+        from aiida.orm.utils.identity_map import NodeIdentityMap
+
+        node = Data().store()
+        loaded_node = load_node(node.pk)
+        assert load_node(node.pk) is loaded_node
+        assert load_node(uuid=node.uuid) is loaded_node
+        assert load_node(node.uuid.replace('-', '')) is loaded_node
+
+        # A partial UUID always queries the storage
+        assert load_node(uuid=node.uuid[:8]) is not loaded_node
+
+        # The node is not returned if it is not an instance of the requested sub classes
+        with pytest.raises(NotExistent):
+            load_node(node.pk, sub_classes=(Int,))
+
+        # Mutable nodes are not kept in the map
+        process = CalculationNode().store()
+        assert load_node(process.pk) is not load_node(process.pk)
+
+        Node.collection.delete(node.pk)
+        with pytest.raises(NotExistent):
+            load_node(node.pk)
+
+        # Only the most recently used nodes are kept alive by the map itself
+        identity_map = NodeIdentityMap(max_size=1)
+        nodes = [Data().store(), Data().store()]
+        pks = [node.pk for node in nodes]
+        for node in nodes:
+            identity_map.add(node)
+        assert len(identity_map) == 2
+        del node, nodes
+        gc.collect()
+        assert len(identity_map) == 1
+        assert identity_map.get(pk=pks[0]) is None
+        assert identity_map.get(pk=pks[1]) is not None
+
+    def test_node_identity_map_discard_threads(self):
+        """Test that discarding nodes from the identity map removes them from the map of all threads."""
+        from aiida.orm.utils.identity_map import NodeIdentityMap
+
+        identity_map = NodeIdentityMap()
+        node = Data().store()
+        results = []
+
+        def add_and_get():
+            identity_map.add(node)
+            added.set()
+            discarded.wait()
+            results.append(identity_map.get(pk=node.pk))
+
+        added, discarded = threading.Event(), threading.Event()
+        thread = threading.Thread(target=add_and_get)
+        thread.start()
+        added.wait()
+        identity_map.discard((node.pk,))
+        discarded.set()
+        thread.join()
+
+        assert results == [None]
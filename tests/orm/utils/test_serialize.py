@@ -189,3 +189,63 @@ def test_serialize_node_links_manager():
     assert deserialized._node.uuid == node.uuid
     assert deserialized._link_type == LinkType.CREATE
     assert deserialized._incoming is False
+
+
+@pytest.mark.parametrize('compress', (True, False))
+def test_serialize_checkpoint_round_trip(aiida_localhost, compress):
+    """Test the serialization of a data structure with AiiDA entities into a binary checkpoint."""
+    from aiida.common.extendeddicts import AttributeDict
+    from plumpy.utils import AttributesFrozendict
+
+    node = orm.Data().store()
+    group = orm.Group(label=uuid.uuid4().hex).store()
+
+    data = {
+        'node': node,
+        'group': group,
+        'computer': aiida_localhost,
+        'enum': LinkType.RETURN,
+        'dataclass': DataClass(1),
+        'attribute_dict': AttributeDict({'nested': {'a': 2}}),
+        'frozendict': AttributesFrozendict({'b': 3}),
+        'array': np.array([1, 2, 3]),
+    }
+
+    serialized = serialize.serialize_checkpoint(data, compress=compress)
+    assert serialized.startswith(f'{serialize.CHECKPOINT_HEADER}:{serialize.CHECKPOINT_VERSION}:')
+
+    deserialized = serialize.deserialize_checkpoint(serialized)
+    assert deserialized['node'].uuid == node.uuid
+    assert deserialized['group'].uuid == group.uuid
+    assert deserialized['computer'].uuid == aiida_localhost.uuid
+    assert deserialized['enum'] == LinkType.RETURN
+    assert deserialized['dataclass'] == DataClass(1)
+    assert isinstance(deserialized['attribute_dict'], AttributeDict)
+    assert deserialized['attribute_dict'].nested == {'a': 2}
+    assert isinstance(deserialized['frozendict'], AttributesFrozendict)
+    assert deserialized['frozendict'].b == 3
+    assert np.all(deserialized['array'] == data['array'])
+
+
+def test_serialize_checkpoint_unstored_node():
+    """Test that you can't serialize an unstored node into a checkpoint."""
+    with pytest.raises(ValueError):
+        serialize.serialize_checkpoint(orm.Data())
+
+
+def test_deserialize_checkpoint_yaml():
+    """Test that checkpoints serialized to yaml by older versions can still be deserialized."""
+    node = orm.Data().store()
+    deserialized = serialize.deserialize_checkpoint(serialize.serialize({'node': node}))
+    assert deserialized['node'].uuid == node.uuid
+
+
+def test_deserialize_checkpoint_unsupported_version():
+    """Test that a checkpoint written with a newer version raises."""
+    serialized = serialize.serialize_checkpoint({})
+    _, _, remainder = serialized.partition(f':{serialize.CHECKPOINT_VERSION}:')
+
+    with pytest.raises(ValueError, match='checkpoint version'):
+        serialize.deserialize_checkpoint(
+            f'{serialize.CHECKPOINT_HEADER}:{serialize.CHECKPOINT_VERSION + 1}:{remainder}'
+        )
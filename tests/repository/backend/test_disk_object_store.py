@@ -146,6 +146,27 @@ def test_iter_object_streams(repository):
         assert stream.read() == b'content'
 
 
+@pytest.mark.parametrize('exclusive', (True, False))
+def test_put_objects_from_repository(repository, tmp_path_factory, exclusive):
+    """Test the ``Repository.put_objects_from_repository`` method writes the objects directly to packs.
+
+    This is only done with exclusive access to the repository, otherwise the objects are stored as loose files.
+    """
+    from disk_objectstore import Container
+
+    source = DiskObjectStoreRepositoryBackend(container=Container(tmp_path_factory.mktemp('source')))
+    source.initialise()
+    keys = [source.put_object_from_filelike(io.BytesIO(f'content {index}'.encode())) for index in range(3)]
+
+    repository.initialise()
+    assert repository.put_objects_from_repository(source, keys, exclusive=exclusive) == keys
+    count = repository._container.count_objects()
+    assert (count.packed, count.loose) == ((3, 0) if exclusive else (0, 3))
+
+    for index, key in enumerate(keys):
+        assert repository.get_object_content(key) == f'content {index}'.encode()
+
+
 def test_delete_object(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
@@ -188,6 +209,40 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_location(repository):
+    """Test the ``Repository.get_object_location`` method for loose, packed and compressed objects."""
+    repository.initialise()
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_location('non_existant')
+
+    key = repository.put_object_from_filelike(io.BytesIO(b'loose'))
+    filepath, offset = repository.get_object_location(key)
+    assert filepath.read_bytes()[offset:] == b'loose'
+
+    repository._container.pack_all_loose(compress=False)
+    repository._container.clean_storage()
+    filepath, offset = repository.get_object_location(key)
+    assert filepath.read_bytes()[offset : offset + 5] == b'loose'
+
+    key = repository.put_object_from_filelike(io.BytesIO(b'compressed'))
+    repository._container.pack_all_loose(compress=True)
+    repository._container.clean_storage()
+    assert repository.get_object_location(key) is None
+
+
+def test_get_object_location_container_api():
+    """Test that the private methods of the container used by ``get_object_location`` still exist.
+
+    There is no public API to get the location of an object, so the range of supported ``disk-objectstore`` versions is
+    pinned. This test fails if a new version drops the methods, in which case the pin cannot be relaxed as is.
+    """
+    from disk_objectstore import Container
+
+    assert callable(getattr(Container, '_get_loose_path_from_hashkey', None))
+    assert callable(getattr(Container, '_get_pack_path_from_pack_id', None))
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
@@ -161,6 +161,18 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hash_does_not_read(repository, generate_directory, monkeypatch):
+    """Test the ``Repository.get_object_hash`` does not read the content, which is hashed when it is written."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content'})
+
+    with open(directory / 'file_a', 'rb') as handle:
+        key = repository.put_object_from_filelike(handle)
+
+    monkeypatch.setattr(repository, 'open', lambda key: pytest.fail('the object content should not be read'))
+    assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
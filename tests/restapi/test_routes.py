@@ -441,6 +441,51 @@ class TestRestApi:
         expected_error = 'Non existent page requested. The page range is [1 : ' '3]'
         self.process_test('computers', '/computers/page/4?perpage=2&orderby=+id', expected_errormsg=expected_error)
 
+    @pytest.mark.parametrize('orderby', ('+id', '-id'))
+    def test_computers_list_cursor(self, orderby):
+        """Page through the computers with cursor pagination, following the links to the next pages."""
+        url = f'{self.get_url_prefix()}/computers?cursor=""&limit=2&orderby={orderby}'
+        uuids = []
+        pages = 0
+
+        with self.app.test_client() as client:
+            while url is not None:
+                response = client.get(url)
+                assert response.status_code == 200
+                assert 'X-Total-Count' not in response.headers
+                uuids.extend(computer['uuid'] for computer in json.loads(response.data)['data']['computers'])
+                pages += 1
+
+                if 'X-Next-Cursor' in response.headers:
+                    link, rel = response.headers['Link'].split('; ')
+                    assert rel == 'rel=next'
+                    assert 'X-Next-Cursor' in response.headers['Access-Control-Expose-Headers']
+                    url = link.strip('<>')
+                else:
+                    url = None
+
+        expected_uuids = [computer['uuid'] for computer in self.get_dummy_data()['computers']]
+        assert uuids == (expected_uuids if orderby == '+id' else expected_uuids[::-1])
+        assert pages == 3
+
+    def test_computers_list_cursor_offset(self):
+        """Cursor pagination cannot be combined with an offset."""
+        expected_error = 'cursor key is incompatible with pages and offset'
+        self.process_test('computers', '/computers?cursor=""&offset=2&orderby=+id', expected_errormsg=expected_error)
+
+    def test_computers_list_cursor_invalid(self):
+        """An invalid cursor returns an error message."""
+        expected_error = 'invalid page token: invalid'
+        self.process_test('computers', '/computers?cursor="invalid"&orderby=+id', expected_errormsg=expected_error)
+
+    def test_calculation_inputs_cursor(self):
+        """Cursor pagination is not supported for the links of a node."""
+        node_uuid = self.get_dummy_data()['calculations'][1]['uuid']
+        expected_error = 'cursor key is only supported for lists of entities'
+        self.process_test(
+            'nodes', f'/nodes/{node_uuid!s}/links/incoming?cursor=""&orderby=id', expected_errormsg=expected_error
+        )
+
     ############### list filters ########################
     def test_computers_filter_id1(self):
         """Add filter on the id of computer and get the filtered computer
@@ -858,6 +903,31 @@ class TestRestApi:
             for node in response['data']['nodes']:
                 assert list(node['extras'].keys()) == expected_extra
 
+    ############### node attributes_filter and extras_filter of a streamed response #############
+    @pytest.mark.parametrize('streamed', (True, False))
+    def test_node_filters_streamed(self, monkeypatch, streamed):
+        """Check that the attributes and extras filters are applied to the nodes of a streamed response, and that
+        responses with few results are not streamed.
+        """
+        from aiida.restapi.common import utils
+
+        if streamed:
+            monkeypatch.setattr(utils, 'STREAM_MIN_RESULTS', 0)
+
+        url = (
+            f'{self.get_url_prefix()}/nodes?orderby=id&attributes=true&attributes_filter=resources,cell'
+            '&extras=true&extras_filter=extra1,extra2'
+        )
+        with self.app.test_client() as client:
+            response_value = client.get(url)
+            assert ('Content-Length' not in response_value.headers) is streamed
+            response = json.loads(response_value.data)
+            assert len(response['data']['nodes']) != 0
+            for node in response['data']['nodes']:
+                assert set(node['attributes']) == {'resources', 'cell'}
+                assert set(node['extras']) == {'extra1', 'extra2'}
+                assert not any(key.startswith(('attributes.', 'extras.')) for key in node)
+
     ############### node full_type filter #############
     def test_nodes_full_type_filter(self):
         """Get the list of nodes filtered by full_type"""
@@ -1021,6 +1091,11 @@ class TestRestApi:
             input_file = load_node(node_uuid).base.repository.get_object_content('calcjob_inputs/aiida.in', mode='rb')
             assert response_obj.data == input_file
 
+        url = f'{self.get_url_prefix()}/nodes/{node_uuid!s}/repo/contents?filename="calcjob_inputs"'
+        with self.app.test_client() as client:
+            response = json.loads(client.get(url).data)
+            assert response['message'] == 'calcjob_inputs is not a file in this repository'
+
     def test_process_report(self):
         """Test process report"""
         node_uuid = self.get_dummy_data()['calculations'][1]['uuid']
@@ -12,6 +12,8 @@ Threaded mode is the default (and only) way to run the AiiDA REST API (see `aiid
 This test file's layout is inspired by https://gist.github.com/prschmid/4643738
 """
 
+import asyncio
+import json
 import time
 from threading import Thread
 
@@ -130,3 +132,41 @@ def test_run_without_close_session(restapi_server, server_url, aiida_localhost,
 
     captured = capfd.readouterr()
     assert 'sqlalchemy.exc.TimeoutError: QueuePool limit of size ' in captured.err
+
+
+def test_run_asgi_app(aiida_localhost):
+    """Perform a request to the ASGI application of the REST API."""
+    pytest.importorskip('a2wsgi')
+    from aiida.restapi.common.config import API_CONFIG
+    from aiida.restapi.run_api import configure_asgi_api
+
+    app = configure_asgi_api(catch_internal_server=True)
+    path = f"{API_CONFIG['PREFIX']}/computers/{aiida_localhost.uuid}"
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'localhost')],
+        'server': ('localhost', 80),
+        'client': ('127.0.0.1', 12345),
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    assert messages[0]['type'] == 'http.response.start'
+    assert messages[0]['status'] == 200
+    body = b''.join(message.get('body', b'') for message in messages[1:])
+    assert json.loads(body)['data']['computers'][0]['uuid'] == aiida_localhost.uuid
@@ -0,0 +1,106 @@
+"""Tests for :mod:`aiida.storage.sqlite_zip.repo_index`."""
+
+import hashlib
+import io
+import mmap
+import os
+import zipfile
+
+import pytest
+from aiida.common.exceptions import CorruptStorage
+from aiida.storage.sqlite_zip.backend import ZipfileBackendRepository
+from aiida.storage.sqlite_zip.repo_index import (
+    RepoIndex,
+    ZipObjectStream,
+    create_repo_index,
+    get_data,
+    locate_zip_member,
+)
+from aiida.storage.sqlite_zip.utils import REPO_INDEX_FILENAME
+
+
+@pytest.fixture
+def contents():
+    """Return the contents of repository objects, which are compressed or not, by their key."""
+    contents = [b'', b'compressible' * 10000, os.urandom(100000)]
+    return {hashlib.sha256(content).hexdigest(): content for content in contents}
+
+
+def write_zipfile(filepath, contents, index: bool):
+    """Write the repository objects to a zip file, with an index of the objects or not."""
+    with zipfile.ZipFile(filepath, 'w') as handle:
+        for key, content in contents.items():
+            info = zipfile.ZipInfo(f'repo/{key}')
+            info.compress_type = zipfile.ZIP_DEFLATED if content.startswith(b'compressible') else zipfile.ZIP_STORED
+            handle.writestr(info, content)
+        if index:
+            handle.writestr(REPO_INDEX_FILENAME, create_repo_index(handle.infolist()))
+
+
+@pytest.fixture
+def zip_data(tmp_path, contents):
+    """Yield the memory-mapped zip file with the repository objects and their index."""
+    write_zipfile(tmp_path / 'archive.zip', contents, index=True)
+    with (tmp_path / 'archive.zip').open('rb') as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+@pytest.mark.parametrize('index', (True, False))
+def test_repository(tmp_path, contents, index):
+    """Test reading the objects of a zip file, whose locations are read from the index or the central directory."""
+    write_zipfile(tmp_path / 'archive.zip', contents, index)
+    repository = ZipfileBackendRepository(tmp_path / 'archive.zip')
+
+    assert isinstance(repository._objects, RepoIndex) is index
+    assert sorted(repository.list_objects()) == sorted(contents)
+    assert repository.has_objects([*contents, 'a' * 64]) == [True] * len(contents) + [False]
+    for key, content in contents.items():
+        assert repository.get_object_content(key) == content
+
+    with pytest.raises(FileNotFoundError):
+        with repository.open('a' * 64):
+            pass
+
+    repository.close()
+
+
+def test_locate_zip_member(zip_data, contents):
+    """Test that the index is only located within the first records of the central directory."""
+    assert locate_zip_member(zip_data, REPO_INDEX_FILENAME, search_limit=len(contents)) is None
+    info = locate_zip_member(zip_data, REPO_INDEX_FILENAME, search_limit=len(contents) + 1)
+    assert info is not None
+    index = RepoIndex(zip_data, info)
+    assert sorted(index) == sorted(contents)
+    index.close()
+
+
+def test_stream_seek(zip_data, contents):
+    """Test seeking in the streams of both compressed and uncompressed objects."""
+    index = RepoIndex(zip_data, locate_zip_member(zip_data, REPO_INDEX_FILENAME, search_limit=len(contents) + 1))
+    for key, content in contents.items():
+        info = index[key]
+        with ZipObjectStream(get_data(zip_data, info, f'repo/{key}'), info, f'repo/{key}') as stream:
+            assert stream.read(10) == content[:10]
+            assert stream.seek(5) == min(5, len(content))
+            assert stream.read(3) == content[5:8]
+            stream.seek(-4, io.SEEK_END)
+            assert stream.read() == content[-4:]
+            stream.seek(0)
+            assert stream.read() == content
+    index.close()
+
+
+def test_stream_corrupt(zip_data, contents):
+    """Test that reading an object whose checksum does not match raises."""
+    index = RepoIndex(zip_data, locate_zip_member(zip_data, REPO_INDEX_FILENAME, search_limit=len(contents) + 1))
+    key = next(key for key, content in contents.items() if content)
+    info = index[key]._replace(crc=0)
+
+    with pytest.raises(CorruptStorage, match='is not that of'):
+        get_data(zip_data, info, 'repo/other')
+
+    with ZipObjectStream(get_data(zip_data, info, f'repo/{key}'), info, f'repo/{key}') as stream:
+        with pytest.raises(CorruptStorage, match='is corrupt'):
+            stream.read()
+    index.close()
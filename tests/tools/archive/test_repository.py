@@ -8,11 +8,18 @@
 ###########################################################################
 """Test the export for nodes with files in the repository."""
 
+import gzip
+import io
+import itertools
 import os
+import threading
+import zipfile
 
+import pytest
 from aiida import orm
 from aiida.manage import get_manager
 from aiida.tools.archive import create_archive, import_archive
+from aiida.tools.archive.common import PREFETCH_CHUNK_SIZE, iter_prefetched_object_streams
 
 
 def test_export_repository(aiida_profile_clean, tmp_path):
@@ -36,6 +43,72 @@ def test_export_repository(aiida_profile_clean, tmp_path):
     assert loaded.base.repository.get_object_content('relative/file_b', mode='rb') == b'file_b'
 
 
+@pytest.mark.parametrize('in_use', (False, True))
+def test_import_repository_exclusive(aiida_profile_clean, tmp_path, monkeypatch, in_use):
+    """Test that the files are imported directly into packs only while the profile is locked for exclusive access."""
+    from aiida.common.exceptions import LockingProfileError
+    from aiida.manage.profile_access import ProfileAccessManager
+
+    node = orm.Data()
+    node.base.repository.put_object_from_bytes(b'file_a', 'file_a')
+    node.store()
+    node_uuid = node.uuid
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive([node], filename=filepath)
+    aiida_profile_clean.reset_storage()
+
+    repository = get_manager().get_profile_storage().get_repository()
+    put_object_streams = type(repository).put_object_streams
+    locked = []
+
+    def mock_put_object_streams(self, *args, **kwargs):
+        locked.append(ProfileAccessManager(aiida_profile_clean).is_locked())
+        return put_object_streams(self, *args, **kwargs)
+
+    def mock_lock(self):
+        raise LockingProfileError('the profile is in use')
+
+    monkeypatch.setattr(type(repository), 'put_object_streams', mock_put_object_streams)
+    if in_use:
+        monkeypatch.setattr(ProfileAccessManager, 'lock', mock_lock)
+
+    import_archive(filepath)
+
+    count = repository._container.count_objects()
+    assert (count.packed, count.loose) == ((0, 1) if in_use else (1, 0))
+    assert locked == [not in_use]
+    assert not ProfileAccessManager(aiida_profile_clean).is_locked()
+    assert orm.load_node(uuid=node_uuid).base.repository.get_object_content('file_a', mode='rb') == b'file_a'
+
+
+def test_export_repository_index(aiida_profile_clean, tmp_path):
+    """Test that the archive contains an index of its repository files, from which they are read."""
+    from aiida.storage.sqlite_zip.repo_index import RepoIndex
+    from aiida.storage.sqlite_zip.utils import REPO_INDEX_FILENAME
+    from aiida.tools.archive.abstract import get_format
+
+    node = orm.Data()
+    node.base.repository.put_object_from_bytes(b'compressible' * 1000, 'file_a')
+    node.base.repository.put_object_from_bytes(os.urandom(1000), 'file_b')
+    node.store()
+    contents = {name: node.base.repository.get_object_content(name, mode='rb') for name in ('file_a', 'file_b')}
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive([node], filename=filepath)
+
+    with zipfile.ZipFile(filepath) as handle:
+        assert REPO_INDEX_FILENAME in handle.namelist()[:3]
+
+    with get_format().open(filepath, 'r') as reader:
+        repository = reader.get_backend().get_repository()
+        assert isinstance(repository._objects, RepoIndex)
+        assert len(list(repository.list_objects())) == 2
+        loaded = reader.get(orm.Node, uuid=node.uuid)
+        for name, content in contents.items():
+            assert loaded.base.repository.get_object_content(name, mode='rb') == content
+
+
 def test_export_repository_after_maintain(aiida_profile_clean, tmp_path):
     """Test exporting a node with files in the repository after maintenance.
 
@@ -59,3 +132,107 @@ def test_export_repository_after_maintain(aiida_profile_clean, tmp_path):
     loaded = orm.load_node(uuid=node_uuid)
     assert loaded.base.repository.get_object_content('file_a', mode='rb') == b'file_a'
     assert loaded.base.repository.get_object_content('relative/file_b', mode='rb') == b'file_b'
+
+
+def test_export_repository_skip_incompressible(aiida_profile_clean, tmp_path):
+    """Test that files that are not worth compressing are stored without compression with ``skip_incompressible``."""
+    content_text = b'text' * 10000
+    content_gzip = gzip.compress(os.urandom(10000))
+    content_large = os.urandom(3 * PREFETCH_CHUNK_SIZE + 1)
+
+    node = orm.Data()
+    node.base.repository.put_object_from_bytes(content_text, 'text')
+    node.base.repository.put_object_from_bytes(content_gzip, 'gzip')
+    node.base.repository.put_object_from_bytes(content_large, 'large')
+    node.store()
+    node_uuid = node.uuid
+    keys = {name: node.base.repository.metadata['o'][name]['k'] for name in ('text', 'gzip', 'large')}
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive([node], filename=filepath, skip_incompressible=True)
+
+    with zipfile.ZipFile(filepath) as archive:
+        compress_types = {name: archive.getinfo(f'repo/{key}').compress_type for name, key in keys.items()}
+    assert compress_types == {'text': zipfile.ZIP_DEFLATED, 'gzip': zipfile.ZIP_STORED, 'large': zipfile.ZIP_STORED}
+
+    aiida_profile_clean.reset_storage()
+    import_archive(filepath)
+
+    loaded = orm.load_node(uuid=node_uuid)
+    assert loaded.base.repository.get_object_content('text', mode='rb') == content_text
+    assert loaded.base.repository.get_object_content('gzip', mode='rb') == content_gzip
+    assert loaded.base.repository.get_object_content('large', mode='rb') == content_large
+
+
+def test_prefetched_object_streams_exception():
+    """Test that an exception while reading the repository objects ahead is raised when iterating the streams."""
+
+    class Repository:
+        def iter_object_streams(self, keys):
+            for key in sorted(keys):
+                yield key, io.BytesIO(key.encode())
+            raise OSError('corrupt')
+
+    streams = iter_prefetched_object_streams(Repository(), {'a', 'b'})
+    assert [(key, stream.read()) for key, stream in itertools.islice(streams, 2)] == [('a', b'a'), ('b', b'b')]
+
+    with pytest.raises(OSError, match='corrupt'):
+        next(streams)
+
+
+@pytest.mark.parametrize('num_workers', (1, 4))
+def test_prefetched_object_streams_workers(num_workers):
+    """Test reading the repository objects ahead with multiple workers and a buffer smaller than the objects."""
+    contents = {str(index): os.urandom(index * PREFETCH_CHUNK_SIZE // 2) for index in range(10)}
+
+    class Repository:
+        def iter_object_streams(self, keys):
+            for key in keys:
+                yield key, io.BytesIO(contents[key])
+
+    streams = iter_prefetched_object_streams(Repository(), contents, num_workers=num_workers, max_buffer_size=1)
+    assert {key: stream.read() for key, stream in streams} == contents
+
+
+@pytest.mark.parametrize('repository_workers', (0, 2))
+def test_import_repository_workers(aiida_profile_clean, tmp_path, repository_workers):
+    """Test importing the repository files after, or concurrently with, the database rows."""
+    nodes = []
+    for index in range(5):
+        node = orm.Data()
+        node.base.repository.put_object_from_bytes(f'content {index}'.encode(), 'file')
+        nodes.append(node.store())
+    node_uuids = [node.uuid for node in nodes]
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive(nodes, filename=filepath)
+
+    aiida_profile_clean.reset_storage()
+    import_archive(filepath, repository_workers=repository_workers)
+
+    for index, node_uuid in enumerate(node_uuids):
+        loaded = orm.load_node(uuid=node_uuid)
+        assert loaded.base.repository.get_object_content('file', mode='rb') == f'content {index}'.encode()
+
+
+def test_import_repository_cancelled(aiida_profile_clean, tmp_path, monkeypatch):
+    """Test that adding the repository files is stopped if importing the database rows fails."""
+    from aiida.tools.archive import imports
+
+    node = orm.Data()
+    node.base.repository.put_object_from_bytes(b'content', 'file')
+    node.store()
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive([node], filename=filepath)
+    aiida_profile_clean.reset_storage()
+
+    def _import_links(*args, **kwargs):
+        raise RuntimeError('failed')
+
+    monkeypatch.setattr(imports, '_import_links', _import_links)
+
+    with pytest.raises(RuntimeError, match='failed'):
+        import_archive(filepath, repository_workers=2)
+
+    assert not any(thread.name.startswith('archive-') for thread in threading.enumerate())
@@ -9,6 +9,7 @@
 """Simple tests for the export and import routines"""
 
 import functools
+import hashlib
 import json
 
 import pytest
@@ -153,3 +154,51 @@ def test_control_of_licenses(tmp_path):
 
     with pytest.raises(LicensingException):
         create_archive([struct], test_run=True, forbidden_licenses=crashing_filter)
+
+
+def test_incremental_archive(aiida_profile_clean, tmp_path):
+    """Test creating an archive that only contains the entities that are not in a base archive, and importing it."""
+    from aiida.tools.archive.abstract import get_format
+    from aiida.tools.archive.exceptions import ImportValidationError
+
+    data_in = orm.Data()
+    data_in.base.repository.put_object_from_bytes(b'input', 'file')
+    data_in.store()
+    group = orm.Group(label='group').store()
+    group.add_nodes(data_in)
+
+    base_filename = tmp_path / 'base.aiida'
+    create_archive(None, filename=base_filename)
+
+    calc = orm.CalculationNode()
+    calc.base.links.add_incoming(data_in, link_type=LinkType.INPUT_CALC, link_label='input')
+    calc.store()
+    data_out = orm.Data()
+    data_out.base.repository.put_object_from_bytes(b'output', 'file')
+    data_out.base.links.add_incoming(calc, link_type=LinkType.CREATE, link_label='output')
+    data_out.store()
+    calc.seal()
+    group.add_nodes(data_out)
+    uuids = {'data_in': data_in.uuid, 'calc': calc.uuid, 'data_out': data_out.uuid}
+
+    filename = tmp_path / 'incremental.aiida'
+    create_archive(None, filename=filename, base_archives=[base_filename])
+
+    with get_format().open(filename, 'r') as reader:
+        assert reader.get_metadata()['creation_parameters']['base_archives'][0]['name'] == 'base.aiida'
+        # the input node is in the base archive, but is still needed by the new link
+        assert set(reader.querybuilder().append(orm.Node, project='uuid').all(flat=True)) == set(uuids.values())
+        assert reader.querybuilder().append(orm.Group, project='label').all(flat=True) == ['group']
+        assert list(reader.get_backend().get_repository().list_objects()) == [hashlib.sha256(b'output').hexdigest()]
+
+    aiida_profile_clean.reset_storage()
+
+    with pytest.raises(ImportValidationError, match='base.aiida'):
+        import_archive(filename)
+
+    import_archive(base_filename)
+    import_archive(filename)
+
+    assert orm.load_node(uuids['data_out']).base.repository.get_object_content('file', mode='rb') == b'output'
+    assert orm.load_node(uuids['calc']).base.links.get_incoming().one().node.uuid == uuids['data_in']
+    assert {node.uuid for node in orm.load_group('group').nodes} == {uuids['data_in'], uuids['data_out']}
@@ -9,8 +9,9 @@
 """Tests for aiida.tools.graph.graph_traversers"""
 
 import pytest
-from aiida.common.links import LinkType
-from aiida.tools.graph.graph_traversers import get_nodes_delete, traverse_graph
+from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.tools.graph.graph_traversers import get_nodes_delete, traverse_graph, validate_traversal_rules
+from numpy import inf
 
 
 def create_minimal_graph():
@@ -344,6 +345,23 @@ class TestTraverseGraph:
         ]
         assert obtained_nodes == expected_nodes
 
+    @pytest.mark.parametrize('ruleset', (GraphTraversalRules.DELETE, GraphTraversalRules.EXPORT))
+    def test_traversal_storage_backend(self, ruleset):
+        """Test that the traversal by the storage backend gives the same result as iterating the rules."""
+        nodes_dict = create_minimal_graph()
+        traverse_links = validate_traversal_rules(ruleset)
+
+        for node in nodes_dict.values():
+            kwargs = {
+                'links_forward': traverse_links['forward'],
+                'links_backward': traverse_links['backward'],
+                'get_links': True,
+            }
+            expected = traverse_graph([node.pk], max_iterations=inf, **kwargs)
+            obtained = traverse_graph([node.pk], **kwargs)
+            assert obtained['nodes'] == expected['nodes']
+            assert obtained['links'] == expected['links']
+
     def test_traversal_errors(self):
         """This will test the errors of the traversers."""
         from aiida import orm
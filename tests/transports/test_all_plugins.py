@@ -1343,3 +1343,47 @@ def test_asynchronous_execution(custom_transport):
             except FileNotFoundError:
                 # If the file wasn't even created, I just ignore this error
                 pass
+
+
+@pytest.mark.asyncio
+async def test_put_and_get_file_async(custom_transport, tmp_path):
+    """Test putting and getting files through the asynchronous API."""
+    text = 'Viva Verdi\n'
+    local_file = tmp_path / 'file.txt'
+    local_file.write_text(text)
+    retrieved_file = tmp_path / 'file_retrieved.txt'
+
+    await custom_transport.open_async()
+    try:
+        remote_dir = tempfile.mkdtemp()
+        remote_file = os.path.join(remote_dir, 'file_remote.txt')
+
+        await custom_transport.putfile_async(str(local_file), remote_file)
+        assert await custom_transport.isfile_async(remote_file)
+        assert 'file_remote.txt' in await custom_transport.listdir_async(remote_dir)
+
+        await custom_transport.getfile_async(remote_file, str(retrieved_file))
+        assert retrieved_file.read_text() == text
+
+        await custom_transport.rmtree_async(remote_dir)
+        assert not await custom_transport.path_exists_async(remote_dir)
+    finally:
+        await custom_transport.close_async()
+
+    assert not custom_transport.is_open
+
+
+@pytest.mark.asyncio
+async def test_exec_with_stdin_async(custom_transport):
+    """Test command execution with a stdin through the asynchronous API."""
+    test_string = b'some_test bytes with non-unicode -> \xfa'
+    with custom_transport as transport:
+        retcode, stdout, stderr = await transport.exec_command_wait_bytes_async('cat', stdin=test_string)
+        assert retcode == 0
+        assert stdout == test_string
+        assert stderr == b''
+
+        retcode, stdout, stderr = await transport.exec_command_wait_async('cat', stdin='some_test String')
+        assert retcode == 0
+        assert stdout == 'some_test String'
+        assert stderr == ''